@@ -3,20 +3,98 @@ Core framework para el sistema de evaluación automática FastAPI.
 Proporciona componentes reutilizables para evaluadores semanales.
 """
 
-from .base_evaluator import BaseEvaluator
-from .common_checks import CommonChecks, create_common_checks
-from .scoring_engine import ScoringEngine, create_scoring_engine
-from .report_generator import ReportGenerator, create_report_generator
+import importlib
+
+# Componente público -> módulo que lo define. Los módulos se importan al
+# acceder al nombre por primera vez (PEP 562), así ``import core`` no carga
+# yaml, sqlite3 ni el pool de procesos si el CLI no los necesita.
+_LAZY_EXPORTS = {
+    "BaseEvaluator": ".base_evaluator",
+    "CommonChecks": ".common_checks",
+    "create_common_checks": ".common_checks",
+    "ScoringEngine": ".scoring_engine",
+    "create_scoring_engine": ".scoring_engine",
+    "ReportGenerator": ".report_generator",
+    "create_report_generator": ".report_generator",
+    "get_template": ".template_cache",
+    "AstCache": ".ast_cache",
+    "ContentCache": ".content_cache",
+    "RepoIndex": ".repo_index",
+    "create_repo_index": ".repo_index",
+    "PatternScanner": ".pattern_scanner",
+    "ResultCache": ".result_cache",
+    "CheckCache": ".check_cache",
+    "MirrorCache": ".mirror_cache",
+    "MetricsRecorder": ".metrics",
+    "TraceRecorder": ".profiling",
+    "ProfileCollector": ".profiling",
+    "EvaluationDaemon": ".daemon",
+    "JobQueue": ".job_queue",
+    "depends_on": ".check_cache",
+    "CheckResolver": ".check_resolver",
+    "get_check_resolver": ".check_resolver",
+    "discover_weeks": ".week_registry",
+    "get_evaluator_class": ".week_registry",
+    "lazy_check": ".week_registry",
+    "load_criteria": ".criteria_bundle",
+    "compile_criteria_bundle": ".criteria_bundle",
+    "compact_result": ".result_stream",
+    "load_manifest": ".batch",
+    "run_batch": ".batch",
+    "generate_synthetic_repo": ".benchmark",
+    "run_benchmarks": ".benchmark",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "1.0.0"
 __all__ = [
     "BaseEvaluator",
-    "CommonChecks", 
+    "CommonChecks",
     "create_common_checks",
     "ScoringEngine",
-    "create_scoring_engine", 
+    "create_scoring_engine",
     "ReportGenerator",
-    "create_report_generator"
+    "create_report_generator",
+    "get_template",
+    "AstCache",
+    "ContentCache",
+    "RepoIndex",
+    "create_repo_index",
+    "PatternScanner",
+    "ResultCache",
+    "CheckCache",
+    "MirrorCache",
+    "MetricsRecorder",
+    "TraceRecorder",
+    "ProfileCollector",
+    "EvaluationDaemon",
+    "JobQueue",
+    "depends_on",
+    "CheckResolver",
+    "get_check_resolver",
+    "discover_weeks",
+    "get_evaluator_class",
+    "lazy_check",
+    "load_criteria",
+    "compile_criteria_bundle",
+    "compact_result",
+    "load_manifest",
+    "run_batch",
+    "generate_synthetic_repo",
+    "run_benchmarks"
 ]
 
 # Constantes del framework
@@ -0,0 +1,131 @@
+"""
+Caché de árboles AST para una evaluación.
+Cada fuente se parsea y compila una sola vez; el check de sintaxis y los
+checks basados en AST comparten el mismo ``ast.Module`` (o los mismos
+detalles de error).
+"""
+import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any
+
+
+# Número máximo de árboles retenidos por defecto
+DEFAULT_MAX_TREES = 2048
+
+
+def _syntax_error_details(error: SyntaxError) -> Dict[str, Any]:
+    """Extrae los datos de un SyntaxError sin retener el traceback"""
+    return {
+        "message": error.msg,
+        "filename": error.filename,
+        "line_number": error.lineno,
+        "column": error.offset,
+        "text": error.text,
+        "description": str(error)
+    }
+
+
+class AstCache:
+    """
+    Caché LRU de resultados de parseo indexada por ruta y hash del contenido.
+
+    Los árboles devueltos se comparten entre checks y deben tratarse como de
+    solo lectura.
+    """
+
+    def __init__(self, max_trees: int = DEFAULT_MAX_TREES):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_trees: Número máximo de resultados retenidos
+        """
+        self.max_trees = max_trees
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+        # Estadísticas de uso
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, source: str, filename: str = "<unknown>") -> Dict[str, Any]:
+        """
+        Parsea una fuente o devuelve el resultado ya calculado.
+
+        Args:
+            source: Código fuente
+            filename: Ruta o etiqueta de la fuente (parte de la clave)
+
+        Returns:
+            Dict con ``tree`` (``ast.Module`` o None si no se pudo parsear) y
+            ``error`` (detalles del SyntaxError o None). El árbol también se
+            compila, así que errores como ``return`` fuera de una función
+            quedan en ``error`` aunque ``tree`` exista.
+        """
+        digest = hashlib.sha1(source.encode("utf-8", errors="surrogatepass")).hexdigest()
+        key = (filename, digest)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        try:
+            tree = ast.parse(source, filename=filename)
+        except SyntaxError as e:
+            entry = {"tree": None, "error": _syntax_error_details(e)}
+        else:
+            try:
+                compile(tree, filename, "exec", dont_inherit=True)
+                entry = {"tree": tree, "error": None}
+            except SyntaxError as e:
+                entry = {"tree": tree, "error": _syntax_error_details(e)}
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_trees:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def parse_tree(self, source: str, filename: str = "<unknown>") -> ast.Module:
+        """
+        Igual que ``ast.parse`` pero a través de la caché.
+
+        Los errores que solo detecta el compilador (ver ``parse``) no impiden
+        obtener el árbol.
+
+        Args:
+            source: Código fuente
+            filename: Ruta o etiqueta de la fuente
+
+        Returns:
+            Árbol AST del módulo
+
+        Raises:
+            SyntaxError: Si la fuente no es válida
+        """
+        entry = self.parse(source, filename)
+        error = entry["error"]
+        if entry["tree"] is None:
+            raise SyntaxError(error["message"],
+                              (error["filename"], error["line_number"], error["column"], error["text"]))
+        return entry["tree"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas de uso de la caché"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
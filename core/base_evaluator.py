@@ -4,14 +4,109 @@ Proporciona funcionalidad común y define la interfaz que deben implementar los
 """
 import os
 import sys
-import yaml
 import json
 import time
+import hashlib
+import inspect
+import functools
+import queue
+import threading
 from abc import ABC, abstractmethod
+from contextlib import ExitStack, nullcontext
+from concurrent.futures import Future, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 
+from .repo_index import RepoIndex
+from .result_cache import compute_repo_key, compute_evaluator_fingerprint, get_default_result_cache
+from .week_registry import resolve_check
+from .criteria_bundle import load_criteria, validate_criteria
+from .template_cache import find_template, get_template
+from .result_policy import DEFAULT_RESULT_SIZE_POLICIES, apply_result_policy, merge_result_policy
+from .check_resolver import get_check_resolver, flatten_results, all_of, score_above_zero
+from .check_cache import (
+    get_check_dependencies, get_check_id, compute_check_fingerprint,
+    hash_dependencies, get_default_check_cache
+)
+from .metrics import current_scope, get_default_metrics_recorder
+
+
+# Tiempo máximo por check si criteria.yaml no define automation.check_timeout_seconds
+DEFAULT_CHECK_TIMEOUT = 120
+
+# Presupuesto total de una evaluación si criteria.yaml no define automation.timeout_seconds
+DEFAULT_EVALUATION_TIMEOUT = 300
+
+# Hilos máximos para ejecutar checks de forma concurrente
+DEFAULT_MAX_CHECK_WORKERS = 8
+
+# Margen tras el plazo global para puntuar y generar el reporte
+DEFAULT_DEADLINE_GRACE = 5
+
+
+class EvaluationTimeoutError(TimeoutError):
+    """La evaluación no terminó dentro de su presupuesto total"""
+
+
+class _DaemonThreadPool:
+    """
+    Pool mínimo de hilos daemon para ejecutar checks.
+    
+    Los hilos de ThreadPoolExecutor se esperan al salir del intérprete, así que
+    un check colgado retrasaría el fin del proceso hasta terminar. Aquí los
+    hilos son daemon: un check abandonado por exceder su plazo no impide salir.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._tasks: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._started = 0
+    
+    def submit(self, fn: Callable, *args) -> Future:
+        """Encola ``fn(*args)``; empieza a ejecutarse al llamar a ``start``"""
+        future: Future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+    
+    def start(self):
+        """Arranca los hilos (no más que las tareas encoladas)"""
+        for _ in range(min(self.max_workers, self._tasks.qsize())):
+            self.add_worker()
+    
+    def add_worker(self):
+        """Agrega un hilo, ej: para reemplazar a uno ocupado por un check abandonado"""
+        if self._tasks.empty():
+            return
+        self._started += 1
+        threading.Thread(target=self._work, name=f"{self.thread_name_prefix}_{self._started}",
+                         daemon=True).start()
+    
+    def _work(self):
+        while True:
+            try:
+                future, fn, args = self._tasks.get_nowait()
+            except queue.Empty:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_repo_index(check_function: Callable) -> bool:
+    """Indica si un check acepta el parámetro ``repo_index``"""
+    try:
+        return "repo_index" in inspect.signature(check_function).parameters
+    except (TypeError, ValueError):
+        return False
+
 
 class BaseEvaluator(ABC):
     """
@@ -23,24 +118,113 @@ class BaseEvaluator(ABC):
     - Sistema de puntuación configurable
     - Generación de reportes
     - Manejo de errores estandarizado
+    - Ejecución concurrente de checks independientes
     """
     
-    def __init__(self, week_number: int, student_repo_path: str):
+    # Hilos usados por run_checks (1 = ejecución secuencial)
+    max_check_workers = DEFAULT_MAX_CHECK_WORKERS
+    
+    # Segundos tras el plazo global antes de abandonar la evaluación completa
+    deadline_grace = DEFAULT_DEADLINE_GRACE
+    
+    # Reglas nombre de check (criteria.yaml) -> resultado; las subclases las
+    # amplían o reemplazan con su propio CHECK_MAPPINGS
+    CHECK_MAPPINGS = {
+        # Checks de estructura (Week 1)
+        "requirements_txt": ("structure", "files", "requirements_txt"),
+        "main_py_exists": ("structure", "files", "main_py"),
+        "readme_exists": ("structure", "files", "readme_md"),
+        
+        # Checks de dependencias (Week 1)
+        "fastapi_dependency": ("requirements", "fastapi"),
+        "uvicorn_dependency": ("requirements", "uvicorn"),
+        
+        # Checks de app (Week 1)
+        "app_import": all_of(("app_import", "import_ok"), ("app_import", "has_app")),
+        
+        # Checks de endpoints (Week 1)
+        "root_endpoint": ("endpoints", "root_working"),
+        "docs_accessible": ("endpoints", "docs_accessible"),
+        "parametric_endpoint": ("endpoints", "parametric_endpoint"),
+        
+        # Checks de documentación (Week 1)
+        "json_responses": ("endpoints", "root_returns_json"),
+        "readme_reflection": ("readme", "has_reflection"),
+        "setup_commands": ("readme", "has_commands"),
+        
+        # Checks generales (Week 1)
+        "project_structure": ("structure", "ok"),
+        "code_quality": ("app_import", "import_ok"),
+        
+        # Week 3 mappings
+        **{name: (name, "passed") for name in [
+            "sqlalchemy_dependencies", "database_connection", "models_definition",
+            "create_with_db", "read_with_db", "update_with_db", "delete_with_db",
+            "relationships", "constraints", "migrations", "session_handling",
+            "connection_pooling"
+        ]},
+        
+        # Week 5 mappings - using score-based checks
+        **{name: score_above_zero(name) for name in [
+            "pytest_configuration", "test_dependencies", "test_structure",
+            "test_database_config", "model_tests", "utility_function_tests",
+            "business_logic_tests", "endpoint_tests", "database_integration_tests",
+            "error_handling_tests", "openapi_customization", "api_examples",
+            "deployment_readme"
+        ]},
+    }
+    
+    # Política de tamaño de resultados por formato de salida (ver core.result_policy);
+    # criteria.yaml puede ajustarla con automation.result_size_policy.<formato>
+    RESULT_SIZE_POLICIES = DEFAULT_RESULT_SIZE_POLICIES
+    
+    def __init__(self, week_number: int, student_repo_path: str,
+                 repo_index: Optional[RepoIndex] = None):
         """
         Inicializa el evaluador base.
         
         Args:
             week_number: Número de semana (1-11)
             student_repo_path: Ruta al repositorio del estudiante
+            repo_index: Índice de archivos compartido (se crea uno si no se indica)
         """
         self.week_number = week_number
         self.repo_path = Path(student_repo_path).resolve()
         self.week_dir = self._get_week_directory()
         
+        # Índice de archivos compartido por todos los checks de esta evaluación
+        self.repo_index = repo_index if repo_index is not None else RepoIndex(self.repo_path)
+        
         # Cargar configuración de la semana
         self.criteria = self._load_criteria()
         self.config = self.criteria.get('automation', {})
         
+        # Caché persistente de resultados (activada vía FASTAPI_EVALUATOR_CACHE_DIR)
+        self.result_cache = get_default_result_cache()
+        self.check_cache = get_default_check_cache()
+        
+        # Huella del código ya cargado (la fija quien lo precargó, ej: el daemon);
+        # None la recalcula desde disco
+        self.evaluator_fingerprint: Optional[str] = None
+        self.reused_checks: List[str] = []
+        self.check_durations: Dict[str, float] = {}
+        
+        # Instrumentación por check y etapa (activada vía FASTAPI_EVALUATOR_METRICS)
+        self.metrics = None
+        
+        # Traza (core.profiling.TraceRecorder) y perfil (ProfileCollector) opcionales
+        self.tracer = None
+        self.profiler = None
+        
+        # Plazo global (time.monotonic) y checks que lo excedieron
+        self.deadline: Optional[float] = None
+        self.timed_out_checks: List[str] = []
+        
+        # Resolver precompilado de checks (cacheado por proceso) y problemas detectados
+        self.check_resolver = get_check_resolver(type(self), self.week_dir / "criteria.yaml", self.criteria)
+        self.check_resolution: Dict[str, List[str]] = {"missing": [], "ambiguous": []}
+        self._results_index = None
+        
         # Resultados de evaluación
         self.results = {}
         self.start_time = None
@@ -66,20 +250,15 @@ class BaseEvaluator(ABC):
         if not criteria_file.exists():
             raise FileNotFoundError(f"Criteria file not found: {criteria_file}")
         
-        try:
-            with open(criteria_file, 'r', encoding='utf-8') as f:
-                criteria = yaml.safe_load(f)
-            
-            # Validar estructura básica
-            required_keys = ['week_info', 'categories']
-            for key in required_keys:
-                if key not in criteria:
-                    raise ValueError(f"Missing required key '{key}' in criteria.yaml")
-            
-            return criteria
-            
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in criteria file: {e}")
+        # Usa el bundle precompilado si está vigente (ver core.criteria_bundle)
+        criteria = load_criteria(criteria_file)
+        
+        # Validar estructura básica
+        errors = validate_criteria(criteria)
+        if errors:
+            raise ValueError(errors[0])
+        
+        return criteria
     
     def _validate_setup(self):
         """Valida que el setup básico sea correcto"""
@@ -101,22 +280,26 @@ class BaseEvaluator(ABC):
         """
         self.start_time = datetime.now()
         
+        # 0. Reutilizar el resultado guardado si ni el repositorio ni el evaluador cambiaron
+        # Las métricas describen una ejecución real: con instrumentación no se usa la caché de resultados
+        self.metrics = get_default_metrics_recorder(self.repo_path)
+        cache_key = self._get_result_cache_key() if self.metrics is None else None
+        if cache_key is not None:
+            try:
+                cached = self.result_cache.get(*cache_key)
+            except Exception:
+                cached = None
+            if cached is not None:
+                cached["cache_hit"] = True
+                return cached
+        
+        # Presupuesto global: los checks que no terminen a tiempo se marcan timed_out
+        timeout_seconds = self.config.get('timeout_seconds', DEFAULT_EVALUATION_TIMEOUT)
+        self.deadline = time.monotonic() + timeout_seconds
+        
         try:
-            # 1. Ejecutar checks comunes
-            self.results.update(self._run_common_checks())
-            
-            # 2. Ejecutar checks específicos de la semana
-            specific_results = self.run_specific_checks()
-            self.results.update(specific_results)
-            
-            # 3. Calcular puntuación
-            scoring = self._calculate_score()
-            
-            # 4. Generar reporte
-            report = self._generate_report(scoring)
-            
-            # 5. Determinar si aprobó
-            passed = self._determine_pass_status(scoring)
+            # 1-5. Checks, puntuación, reporte y aprobación, acotados por el plazo global
+            scoring, report, passed = self._run_within_deadline(self._run_pipeline, timeout_seconds)
             
             self.end_time = datetime.now()
             
@@ -128,7 +311,7 @@ class BaseEvaluator(ABC):
             # Redondear score a 1 decimal para consistencia
             final_score = round(float(final_score), 1)
             
-            return {
+            result = {
                 "week": self.week_number,
                 "student_repo": str(self.repo_path),
                 "evaluation_time": self.end_time.isoformat(),
@@ -138,12 +321,150 @@ class BaseEvaluator(ABC):
                 "scoring": scoring,
                 "report": report,
                 "passed": passed,
-                "passing_threshold": self.criteria['week_info'].get('passing_threshold', 70)
+                "passing_threshold": self.criteria['week_info'].get('passing_threshold', 70),
+                "timed_out": bool(self.timed_out_checks),
+                "timed_out_checks": list(self.timed_out_checks),
+                "check_resolution": self.check_resolution
             }
+            if self.metrics is not None:
+                result["metrics"] = self.metrics.as_dict()
+            
+            # Un resultado parcial no se guarda: la próxima evaluación debe reintentarlo
+            if cache_key is not None and not self.timed_out_checks:
+                try:
+                    self.result_cache.put(*cache_key, result)
+                except Exception:
+                    # Un fallo de la caché nunca debe invalidar la evaluación
+                    pass
+            
+            return result
+            
+        except EvaluationTimeoutError as e:
+            self.end_time = datetime.now()
+            result = self._handle_evaluation_error(e)
+            result["timed_out"] = True
+            result["timed_out_checks"] = list(self.timed_out_checks)
+            return result
             
         except Exception as e:
             self.end_time = datetime.now()
             return self._handle_evaluation_error(e)
+        
+        finally:
+            if self.metrics is not None:
+                self.metrics.close()
+    
+    def _stage(self, name: str):
+        """Etapa medida por la instrumentación (no hace nada si está desactivada)"""
+        if self.metrics is None and self.tracer is None:
+            return nullcontext()
+        stack = ExitStack()
+        if self.tracer is not None:
+            stack.enter_context(self.tracer.span(name, "stage", {"week": self.week_number}))
+        if self.metrics is not None:
+            stack.enter_context(self.metrics.measure("stages", name))
+        return stack
+    
+    def _instrument_check(self, name: str, parent_scope) -> ExitStack:
+        """Instrumentación activa alrededor de un check en su hilo (métricas, traza, perfil)"""
+        stack = ExitStack()
+        if self.tracer is not None:
+            stack.enter_context(self.tracer.span(name, "check"))
+        if self.profiler is not None:
+            stack.enter_context(self.profiler.profile_thread(f"check {name}"))
+        if self.metrics is not None:
+            stack.enter_context(self.metrics.measure("checks", name, parent_scope))
+        return stack
+    
+    def _run_pipeline(self) -> tuple:
+        """
+        Ejecuta los checks, calcula la puntuación y genera el reporte.
+        
+        Returns:
+            Tupla (scoring, reporte, aprobó)
+        """
+        with self._stage("checks"):
+            # 1. Ejecutar checks comunes
+            self.results.update(self._run_common_checks())
+            
+            # 2. Ejecutar checks específicos de la semana
+            specific_results = self.run_specific_checks()
+            self.results.update(specific_results)
+        
+        # 3. Calcular puntuación
+        with self._stage("scoring"):
+            scoring = self._calculate_score()
+        
+        # 4. Generar reporte
+        with self._stage("report"):
+            report = self._generate_report(scoring)
+        
+        # 5. Determinar si aprobó
+        passed = self._determine_pass_status(scoring)
+        return scoring, report, passed
+    
+    def _run_within_deadline(self, pipeline: Callable[[], Any], timeout_seconds: float) -> Any:
+        """
+        Ejecuta ``pipeline`` en un hilo daemon y lo abandona si no termina
+        antes del plazo global más ``deadline_grace``.
+        
+        ``run_checks`` ya respeta el plazo; esto acota además los checks comunes,
+        el código propio de cada evaluador, la puntuación y el reporte. Como el
+        hilo es daemon, una evaluación abandonada no impide que el proceso termine.
+        
+        Args:
+            pipeline: Callable sin argumentos
+            timeout_seconds: Presupuesto total (solo para el mensaje de error)
+            
+        Returns:
+            Resultado de ``pipeline``
+            
+        Raises:
+            EvaluationTimeoutError: Si el plazo venció antes de terminar
+        """
+        outcome: Future = Future()
+        profiler = self.profiler
+        
+        def target():
+            outcome.set_running_or_notify_cancel()
+            try:
+                with (profiler.profile_thread("evaluación") if profiler is not None else nullcontext()):
+                    result = pipeline()
+            except BaseException as e:
+                outcome.set_exception(e)
+            else:
+                outcome.set_result(result)
+        
+        threading.Thread(target=target, name=f"week{self.week_number:02d}-evaluate", daemon=True).start()
+        remaining = None
+        if self.deadline is not None:
+            remaining = max(0.0, self.deadline + self.deadline_grace - time.monotonic())
+        try:
+            return outcome.result(timeout=remaining)
+        except FutureTimeoutError:
+            raise EvaluationTimeoutError(
+                f"La evaluación excedió su presupuesto de {timeout_seconds}s"
+            ) from None
+    
+    def _get_result_cache_key(self) -> Optional[tuple]:
+        """
+        Calcula la clave de la caché de resultados.
+        
+        Returns:
+            Tupla (clave del repositorio, semana, huella del evaluador) o None
+            si la caché está desactivada o la clave no se pudo calcular
+        """
+        if self.result_cache is None:
+            return None
+        
+        try:
+            return (
+                compute_repo_key(self.repo_path, self.repo_index),
+                self.week_number,
+                self.evaluator_fingerprint or compute_evaluator_fingerprint(self.week_dir)
+            )
+        except Exception:
+            return None
     
     def _run_common_checks(self) -> Dict[str, Any]:
         """
@@ -154,7 +475,7 @@ class BaseEvaluator(ABC):
         # o usar CommonChecks del core
         try:
             from core.common_checks import CommonChecks
-            common_checks = CommonChecks(self.repo_path)
+            common_checks = CommonChecks(self.repo_path, self.repo_index)
             
             common_results = {}
             # Los common checks básicos se pueden implementar aquí si es necesario
@@ -176,6 +497,180 @@ class BaseEvaluator(ABC):
         """
         pass
     
+    def run_check(self, check_function: Callable, **kwargs) -> Dict[str, Any]:
+        """
+        Ejecuta ``check_function(repo_path, **kwargs)`` sobre el repositorio.
+        
+        Si el check declaró sus archivos con ``@depends_on`` y la caché de checks
+        está activa, se reutiliza su resultado anterior cuando ni esos archivos
+        ni el código del check cambiaron.
+        
+        Args:
+            check_function: Función del check (o LazyCheck, que se importa aquí)
+            **kwargs: Argumentos adicionales; ``repo_index`` se pasa automáticamente
+                si el check lo acepta
+            
+        Returns:
+            Resultado del check
+        """
+        check_function = resolve_check(check_function)
+        repo_path = str(self.repo_path)
+        if "repo_index" not in kwargs and _accepts_repo_index(check_function):
+            kwargs["repo_index"] = self.repo_index
+        dependencies = get_check_dependencies(check_function)
+        
+        # Solo se cachea la invocación estándar: repo_path y, opcionalmente, repo_index
+        if self.check_cache is None or dependencies is None or set(kwargs) - {"repo_index"}:
+            return check_function(repo_path, **kwargs)
+        
+        try:
+            check_id = get_check_id(check_function)
+            if self.evaluator_fingerprint is not None:
+                # El código en disco puede ser más nuevo que el cargado: se usa la huella fijada
+                fingerprint = hashlib.sha256(f"{self.evaluator_fingerprint}\0{check_id}".encode("utf-8")).hexdigest()
+            else:
+                fingerprint = compute_check_fingerprint(check_function)
+            file_hashes = hash_dependencies(dependencies, self.repo_index)
+            cached = self.check_cache.get(repo_path, check_id, fingerprint, file_hashes)
+        except Exception:
+            return check_function(repo_path, **kwargs)
+        
+        if cached is not None:
+            self.reused_checks.append(check_id)
+            return cached
+        
+        result = check_function(repo_path, **kwargs)
+        
+        try:
+            self.check_cache.put(repo_path, check_id, fingerprint, file_hashes, result)
+        except Exception:
+            # Un fallo de la caché nunca debe invalidar el check
+            pass
+        
+        return result
+    
+    def run_checks(self, checks: Dict[str, Callable[[], Dict[str, Any]]],
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Ejecuta checks independientes de forma concurrente en un pool de hilos daemon.
+        
+        Los resultados se devuelven en el orden en que se registraron, sin importar
+        cuál termine primero. Un check que lanza una excepción o excede su tiempo
+        se reporta como fallido sin afectar a los demás. Un hilo que excede su
+        tiempo no puede interrumpirse: se abandona, su resultado se descarta y
+        no impide que el proceso termine.
+        
+        Cada check tiene su propio plazo (``automation.check_timeouts`` por nombre,
+        o ``timeout``) contado desde que empieza, acotado por el plazo global de la
+        evaluación. Los checks que no alcanzan a empezar antes del plazo global se
+        cancelan. En ambos casos el resultado lleva ``"timed_out": True``.
+        
+        Con la instrumentación activa (``self.metrics``) cada check se mide y
+        los checks se ejecutan de a uno; con ``self.tracer`` o ``self.profiler``
+        cada check se registra como span o se perfila en su hilo.
+        
+        Args:
+            checks: Mapeo nombre del resultado -> callable sin argumentos
+            timeout: Segundos por check desde que empieza a ejecutarse
+                (default: automation.check_timeout_seconds o DEFAULT_CHECK_TIMEOUT)
+            
+        Returns:
+            Dict nombre -> resultado, en orden de registro
+        """
+        if timeout is None:
+            timeout = self.config.get('check_timeout_seconds', DEFAULT_CHECK_TIMEOUT)
+        budgets = {name: self.config.get('check_timeouts', {}).get(name, timeout) for name in checks}
+        
+        started: Dict[str, float] = {}
+        metrics = self.metrics
+        parent_scope = current_scope() if metrics is not None else None
+        instrumented = metrics is not None or self.tracer is not None or self.profiler is not None
+        
+        def run(name: str, check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+            started[name] = time.monotonic()
+            try:
+                if not instrumented:
+                    return check()
+                with self._instrument_check(name, parent_scope):
+                    return check()
+            finally:
+                self.check_durations[name] = round(time.monotonic() - started[name], 3)
+        
+        def deadline_for(name: str) -> Optional[float]:
+            """Plazo absoluto de un check, o None si aún no empezó y no hay plazo global"""
+            if name in started:
+                check_deadline = started[name] + budgets[name]
+                return check_deadline if self.deadline is None else min(check_deadline, self.deadline)
+            return self.deadline
+        
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        # Con métricas activas los checks corren de a uno: el pico de memoria es global al proceso
+        workers = 1 if metrics is not None else max(1, min(self.max_check_workers, len(checks)))
+        executor = _DaemonThreadPool(max_workers=workers,
+                                     thread_name_prefix=f"week{self.week_number:02d}-check")
+        futures: Dict[Any, str] = {}
+        try:
+            for name, check in checks.items():
+                futures[executor.submit(run, name, check)] = name
+            executor.start()
+            pending = set(futures)
+            
+            while pending:
+                # Esperar hasta que termine un check o venza el siguiente plazo
+                now = time.monotonic()
+                deadlines = [d for d in (deadline_for(futures[f]) for f in pending) if d is not None]
+                wait_for = max(0.01, min(deadlines) - now) if deadlines else 0.05
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    name = futures[future]
+                    error = future.exception()
+                    if error is None:
+                        outcomes[name] = future.result()
+                    else:
+                        outcomes[name] = {"error": str(error), "passed": False, "score": 0}
+                
+                now = time.monotonic()
+                abandoned = 0
+                for future in [f for f in futures if f in pending]:
+                    name = futures[future]
+                    deadline = deadline_for(name)
+                    if deadline is not None and now >= deadline:
+                        pending.discard(future)
+                        if not future.cancel():
+                            abandoned += 1
+                        outcomes[name] = self._timed_out_result(name, budgets[name], name in started)
+                
+                # Cada check abandonado deja su hilo ocupado: otros toman los que faltan
+                if pending:
+                    for _ in range(abandoned):
+                        executor.add_worker()
+        finally:
+            # Los checks que no alcanzaron a empezar no se ejecutan
+            for future in futures:
+                future.cancel()
+        
+        return {name: outcomes[name] for name in checks}
+    
+    def _timed_out_result(self, name: str, budget: float, started: bool) -> Dict[str, Any]:
+        """
+        Construye el resultado de un check que excedió su plazo y lo registra.
+        
+        Args:
+            name: Nombre del resultado
+            budget: Segundos asignados al check
+            started: Si el check llegó a empezar
+            
+        Returns:
+            Resultado fallido con ``timed_out``
+        """
+        self.timed_out_checks.append(name)
+        if started and (self.deadline is None or time.monotonic() < self.deadline):
+            error = f"Check excedió el tiempo límite de {budget}s"
+        else:
+            error = "La evaluación excedió su tiempo límite total antes de completar el check"
+        return {"error": error, "passed": False, "score": 0, "timed_out": True}
+    
     def _calculate_score(self) -> Dict[str, Any]:
         """
         Calcula la puntuación basada en los criterios configurados.
@@ -227,8 +722,8 @@ class BaseEvaluator(ABC):
             check_points = check.get('points', 0)
             check_required = check.get('required', True)
             
-            # Obtener resultado del check
-            check_result = self._get_check_result(check_name)
+            # Obtener resultado del check (si excedió su tiempo cuenta como fallido)
+            check_result = False if self._is_timed_out(check_name) else self._get_check_result(check_name)
             
             if check_result:
                 earned_points += check_points
@@ -243,100 +738,32 @@ class BaseEvaluator(ABC):
         max_points = category_config.get('weight', 0)
         return min(earned_points, max_points)
     
+    def _is_timed_out(self, check_name: str) -> bool:
+        """Indica si algún resultado del que depende un check excedió su tiempo"""
+        return any(source in self.timed_out_checks
+                   for source in self.check_resolver.sources(check_name))
+    
     def _get_check_result(self, check_name: str) -> bool:
         """
         Obtiene el resultado de un check específico desde los resultados.
         
+        Usa el resolver precompilado de la semana (``CHECK_MAPPINGS`` +
+        criteria.yaml). Los checks sin regla que no aparecen en los resultados,
+        o que aparecen en varios lugares, se registran en ``self.check_resolution``.
+        
         Args:
             check_name: Nombre del check a evaluar
             
         Returns:
             True si el check pasó, False si falló
         """
-        # Mapeo de nombres de checks a rutas en results
-        check_mappings = {
-            # Checks de estructura (Week 1)
-            "requirements_txt": lambda r: r.get("structure", {}).get("files", {}).get("requirements_txt", False),
-            "main_py_exists": lambda r: r.get("structure", {}).get("files", {}).get("main_py", False),
-            "readme_exists": lambda r: r.get("structure", {}).get("files", {}).get("readme_md", False),
-            
-            # Checks de dependencias (Week 1)
-            "fastapi_dependency": lambda r: r.get("requirements", {}).get("fastapi", False),
-            "uvicorn_dependency": lambda r: r.get("requirements", {}).get("uvicorn", False),
-            
-            # Checks de app (Week 1)
-            "app_import": lambda r: r.get("app_import", {}).get("import_ok", False) and r.get("app_import", {}).get("has_app", False),
-            
-            # Checks de endpoints (Week 1)
-            "root_endpoint": lambda r: r.get("endpoints", {}).get("root_working", False),
-            "docs_accessible": lambda r: r.get("endpoints", {}).get("docs_accessible", False),
-            "parametric_endpoint": lambda r: r.get("endpoints", {}).get("parametric_endpoint", False),
-            
-            # Checks de documentación (Week 1)
-            "json_responses": lambda r: r.get("endpoints", {}).get("root_returns_json", False),
-            "readme_reflection": lambda r: r.get("readme", {}).get("has_reflection", False),
-            "setup_commands": lambda r: r.get("readme", {}).get("has_commands", False),
-            
-            # Checks generales (Week 1)
-            "project_structure": lambda r: r.get("structure", {}).get("ok", False),
-            "code_quality": lambda r: r.get("app_import", {}).get("import_ok", False),
-            
-            # Week 3 mappings
-            "sqlalchemy_dependencies": lambda r: r.get("sqlalchemy_dependencies", {}).get("passed", False),
-            "database_connection": lambda r: r.get("database_connection", {}).get("passed", False),
-            "models_definition": lambda r: r.get("models_definition", {}).get("passed", False),
-            "create_with_db": lambda r: r.get("create_with_db", {}).get("passed", False),
-            "read_with_db": lambda r: r.get("read_with_db", {}).get("passed", False),
-            "update_with_db": lambda r: r.get("update_with_db", {}).get("passed", False),
-            "delete_with_db": lambda r: r.get("delete_with_db", {}).get("passed", False),
-            "relationships": lambda r: r.get("relationships", {}).get("passed", False),
-            "constraints": lambda r: r.get("constraints", {}).get("passed", False),
-            "migrations": lambda r: r.get("migrations", {}).get("passed", False),
-            "session_handling": lambda r: r.get("session_handling", {}).get("passed", False),
-            "connection_pooling": lambda r: r.get("connection_pooling", {}).get("passed", False),
-            
-            # Week 5 mappings - using score-based checks
-            "pytest_configuration": lambda r: self._score_based_check(r, "pytest_configuration"),
-            "test_dependencies": lambda r: self._score_based_check(r, "test_dependencies"),
-            "test_structure": lambda r: self._score_based_check(r, "test_structure"),
-            "test_database_config": lambda r: self._score_based_check(r, "test_database_config"),
-            "model_tests": lambda r: self._score_based_check(r, "model_tests"),
-            "utility_function_tests": lambda r: self._score_based_check(r, "utility_function_tests"),
-            "business_logic_tests": lambda r: self._score_based_check(r, "business_logic_tests"),
-            "endpoint_tests": lambda r: self._score_based_check(r, "endpoint_tests"),
-            "database_integration_tests": lambda r: self._score_based_check(r, "database_integration_tests"),
-            "error_handling_tests": lambda r: self._score_based_check(r, "error_handling_tests"),
-            "openapi_customization": lambda r: self._score_based_check(r, "openapi_customization"),
-            "api_examples": lambda r: self._score_based_check(r, "api_examples"),
-            "deployment_readme": lambda r: self._score_based_check(r, "deployment_readme"),
-        }
-        
-        # Buscar el mapping correspondiente
-        if check_name in check_mappings:
-            try:
-                return check_mappings[check_name](self.results)
-            except (KeyError, TypeError):
-                return False
-        
-        # Si no hay mapping específico, buscar directamente en results
-        return self._search_result_by_name(check_name)
-    
-    def _search_result_by_name(self, check_name: str) -> bool:
-        """
-        Busca un resultado por nombre en toda la estructura de results.
-        """
-        def search_recursive(obj, target):
-            if isinstance(obj, dict):
-                if target in obj:
-                    return bool(obj[target])
-                for value in obj.values():
-                    result = search_recursive(value, target)
-                    if result is not None:
-                        return result
-            return None
+        marker = (id(self.results), len(self.results))
+        if self._results_index is None or self._results_index[0] != marker:
+            self._results_index = (marker, flatten_results(self.results))
         
-        result = search_recursive(self.results, check_name)
-        return result if result is not None else False
+        return self.check_resolver.resolve(check_name, self.results,
+                                           index=self._results_index[1],
+                                           issues=self.check_resolution)
     
     def _generate_report(self, scoring: Dict[str, Any]) -> str:
         """
@@ -349,9 +776,9 @@ class BaseEvaluator(ABC):
             Reporte formateado en Markdown
         """
         try:
-            # Intentar cargar template personalizado
+            # Intentar cargar template personalizado (compilado una sola vez por proceso)
             template_path = self.week_dir / "templates" / "feedback.md"
-            if template_path.exists():
+            if find_template(template_path) is not None:
                 return self._generate_custom_report(template_path, scoring)
         except Exception:
             pass
@@ -362,8 +789,7 @@ class BaseEvaluator(ABC):
     def _generate_custom_report(self, template_path: Path, scoring: Dict[str, Any]) -> str:
         """Genera reporte usando template personalizado"""
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
+            template = get_template(template_path)
             
             # Variables para el template
             week_info = self.criteria.get('week_info', {})
@@ -377,7 +803,7 @@ class BaseEvaluator(ABC):
             next_steps = self._generate_next_steps()
             
             # Reemplazar variables en el template
-            template = template.format(
+            return template.render(dict(
                 status="✅ APROBADO" if passed else "🕐 PENDIENTE",
                 total_score=int(total_score),
                 pass_status="APROBADO" if passed else "PENDIENTE",
@@ -389,9 +815,7 @@ class BaseEvaluator(ABC):
                 improvement_feedback=improvement_feedback,
                 next_steps=next_steps,
                 evaluation_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            )
-            
-            return template
+            ))
             
         except Exception as e:
             return self._generate_basic_report(scoring)
@@ -538,6 +962,32 @@ class BaseEvaluator(ABC):
         """Retorna los resultados de evaluación"""
         return self.results
     
+    def get_result_policy(self, output_format: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene la política de tamaño de resultados de un formato de salida.
+        
+        Args:
+            output_format: Formato de salida (json, jsonl, markdown, summary)
+            
+        Returns:
+            Política a aplicar, o None si el formato usa el resultado completo
+        """
+        overrides = self.config.get('result_size_policy', {}).get(output_format)
+        return merge_result_policy(self.RESULT_SIZE_POLICIES.get(output_format), overrides)
+    
+    def apply_result_policy(self, result: Dict[str, Any], output_format: str = "json") -> Dict[str, Any]:
+        """
+        Reduce un resultado antes de serializarlo (ver ``core.result_policy``).
+        
+        Args:
+            result: Resultado de ``evaluate()``
+            output_format: Formato de salida
+            
+        Returns:
+            Copia reducida del resultado (o el mismo si el formato no tiene política)
+        """
+        return apply_result_policy(result, self.get_result_policy(output_format))
+    
     def _analyze_results_for_feedback(self, successful_items: List[str], improvement_items: List[str]) -> None:
         """Analiza los resultados para categorizar elementos exitosos y mejoras necesarias"""
         
@@ -637,20 +1087,3 @@ class BaseEvaluator(ABC):
                 successful_items.append("Documentación básica presente en README")
             if documentation.get("score", 0) >= 5:
                 successful_items.append("README con buena estructura y contenido")
-    
-    def _score_based_check(self, results: Dict, check_name: str) -> bool:
-        """
-        Evalúa un check basado en score/max_score.
-        
-        Args:
-            results: Resultados de los checks
-            check_name: Nombre del check
-            
-        Returns:
-            True si el check tiene una puntuación > 0
-        """
-        check_result = results.get(check_name, {})
-        if isinstance(check_result, dict):
-            score = check_result.get('score', 0)
-            return score > 0
-        return False
@@ -0,0 +1,544 @@
+"""
+Evaluación por lotes de múltiples repositorios de estudiantes.
+Reparte un manifiesto (CSV o JSONL) entre un pool de procesos y escribe
+un flujo JSONL de resultados compactos más un resumen agregado. Los repos
+remotos (URLs git) se descargan en una etapa asyncio que se solapa con la
+evaluación. Con una cola persistente (ver ``core.job_queue``) el lote se
+puede interrumpir y retomar sin repetir los jobs terminados.
+"""
+import asyncio
+import csv
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from contextlib import ExitStack, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Callable, Union
+
+from .week_registry import get_evaluator_class
+from .result_stream import DEFAULT_MAX_INLINE_BYTES, JsonlWriter, compact_result
+from .repo_fetch import fetch_repository, is_remote_repo
+from .job_queue import (JobQueue, resolve_commit, DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS,
+                        DEFAULT_MAX_LEASE_LIFETIME)
+
+
+# Descargas simultáneas de repos remotos
+DEFAULT_FETCH_CONCURRENCY = 8
+
+# Segundos entre consultas de un worker que espera jobs con lease de otro worker
+QUEUE_POLL_SECONDS = 1.0
+
+
+def load_manifest(manifest_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Carga un manifiesto de evaluaciones.
+
+    Formatos soportados:
+    - CSV con columnas ``repo`` y ``week`` (``id`` opcional)
+    - JSONL con objetos ``{"repo": ..., "week": ..., "id": ...}``
+
+    Args:
+        manifest_path: Ruta al manifiesto
+
+    Returns:
+        Lista de jobs con claves ``id``, ``repo`` y ``week``
+    """
+    path = Path(manifest_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Manifest not found: {path}")
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    jobs = []
+    for index, row in enumerate(rows, 1):
+        repo = str(row.get('repo') or '').strip()
+        week = row.get('week')
+        if not repo or week in (None, ''):
+            raise ValueError(f"Invalid manifest entry #{index}: 'repo' and 'week' are required")
+
+        jobs.append({
+            "id": str(row.get('id') or index),
+            "repo": repo,
+            "week": int(week)
+        })
+
+    return jobs
+
+
+def _init_worker(weeks: List[int]):
+    """Precarga los evaluadores requeridos al arrancar cada worker"""
+    for week in weeks:
+        try:
+            get_evaluator_class(week)
+        except Exception:
+            # El error se reporta por job al evaluar
+            pass
+
+
+def evaluate_job(job: Dict[str, Any], max_inline_bytes: Optional[int] = DEFAULT_MAX_INLINE_BYTES,
+                 blob_dir: Optional[str] = None, full_results: bool = False,
+                 trace: bool = False, profile: bool = False) -> Dict[str, Any]:
+    """
+    Evalúa un job del manifiesto dentro de un worker.
+
+    El resultado se reduce con la política ``jsonl`` del evaluador y se
+    compacta en el worker (ver ``compact_result``), así los textos grandes no
+    viajan al proceso principal.
+
+    Args:
+        job: Job con claves ``id``, ``repo`` y ``week`` (y ``path`` si el repo se descargó)
+        max_inline_bytes: Tamaño máximo de un texto en línea (None o 0: sin límite)
+        blob_dir: Directorio donde guardar los textos omitidos (opcional)
+        full_results: True para no aplicar la política de tamaño de resultados
+        trace: True para registrar spans (se devuelven en ``record["trace_events"]``)
+        profile: True para perfilar con cProfile (``record["profile_folded"]``)
+
+    Returns:
+        Registro con metadatos del job y el resultado de evaluación
+    """
+    started = time.time()
+    tracer = collector = None
+    if trace or profile:
+        from .profiling import TraceRecorder, ProfileCollector
+        tracer = TraceRecorder() if trace else None
+        collector = ProfileCollector() if profile else None
+
+    with ExitStack() as stack:
+        if tracer is not None:
+            stack.enter_context(tracer.span(f"job {job['id']}", "job", {"repo": job["repo"], "week": job["week"]}))
+        if collector is not None:
+            stack.enter_context(collector.profile_thread(f"semana {job['week']}"))
+        try:
+            evaluator = get_evaluator_class(job["week"])(job.get("path", job["repo"]))
+            evaluator.tracer, evaluator.profiler = tracer, collector
+            result = evaluator.evaluate()
+            if not full_results:
+                result = evaluator.apply_result_policy(result, "jsonl")
+        except Exception as e:
+            result = _error_result(job, e)
+        result = compact_result(result, max_inline_bytes, blob_dir)
+
+    record = _make_record(job, started, result)
+    # Los spans y perfiles viajan al proceso principal, que los une y los quita del registro
+    if tracer is not None:
+        record["trace_events"] = tracer.events
+    if collector is not None:
+        record["profile_folded"] = collector.to_folded()
+    return record
+
+
+def _error_result(job: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+    """Resultado de un job que no se pudo descargar o evaluar"""
+    return {
+        "week": job["week"],
+        "student_repo": job["repo"],
+        "error": True,
+        "error_type": type(error).__name__,
+        "error_message": str(error),
+        "passed": False
+    }
+
+
+def _make_record(job: Dict[str, Any], started: float, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Registro JSONL de un job"""
+    return {
+        "id": job["id"],
+        "repo": job["repo"],
+        "week": job["week"],
+        "worker_pid": os.getpid(),
+        "wall_seconds": round(time.time() - started, 3),
+        "result": result
+    }
+
+
+def _summarize(summary: Dict[str, Any], record: Dict[str, Any]):
+    """Acumula un registro en el resumen sin retener el resultado completo"""
+    result = record.get("result", {})
+    summary["total"] += 1
+    if result.get("error"):
+        summary["errors"] += 1
+    elif result.get("passed"):
+        summary["passed"] += 1
+    else:
+        summary["failed"] += 1
+    if result.get("timed_out"):
+        summary["timed_out"] += 1
+
+    week_stats = summary["by_week"].setdefault(str(record["week"]), {"total": 0, "passed": 0, "score_sum": 0.0})
+    week_stats["total"] += 1
+    week_stats["passed"] += 1 if result.get("passed") else 0
+    week_stats["score_sum"] += float(result.get("final_score", 0) or 0)
+
+
+def _new_summary(workers: int) -> Dict[str, Any]:
+    """Resumen vacío de un lote"""
+    return {
+        "total": 0,
+        "passed": 0,
+        "failed": 0,
+        "errors": 0,
+        "timed_out": 0,
+        "fetched": 0,
+        "fetch_seconds": 0.0,
+        "workers": workers,
+        "by_week": {}
+    }
+
+
+def _finish_summary(summary: Dict[str, Any], started: float,
+                    summary_path: Optional[Union[str, Path]]) -> Dict[str, Any]:
+    """Calcula promedios y tasas del resumen y lo guarda si se pidió"""
+    for week_stats in summary["by_week"].values():
+        week_stats["average_score"] = round(week_stats.pop("score_sum") / week_stats["total"], 1)
+
+    summary["fetch_seconds"] = round(summary["fetch_seconds"], 3)
+    summary["duration_seconds"] = round(time.time() - started, 3)
+    summary["repos_per_second"] = round(summary["total"] / summary["duration_seconds"], 3) if summary["duration_seconds"] > 0 else 0
+
+    if summary_path:
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    return summary
+
+
+async def _run_pipeline(jobs: Iterable[Dict[str, Any]], pool: ProcessPoolExecutor,
+                        on_record: Callable[[Dict[str, Any]], None], workers: int,
+                        fetch_concurrency: int, mirror_cache, evaluate_args: tuple,
+                        summary: Dict[str, Any], tracer=None, profile_collector=None):
+    """
+    Pipeline productor/consumidor: descargas asyncio -> pool de evaluación.
+
+    Hay a lo sumo ``fetch_concurrency`` descargas en curso y ``workers`` repos
+    descargados esperando evaluación; si la evaluación se atrasa, la cola
+    llena detiene las descargas (backpressure). Cada clon se elimina en
+    cuanto termina su evaluación. Con ``tracer`` las descargas se registran
+    como spans y los spans de los workers se unen a la misma traza.
+    """
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Queue = asyncio.Queue(maxsize=workers)
+    fetch_slots = asyncio.Semaphore(fetch_concurrency)
+    eval_slots = asyncio.Semaphore(workers)
+
+    with ThreadPoolExecutor(max_workers=fetch_concurrency, thread_name_prefix="fetch") as io_pool:
+
+        def traced_fetch(job: Dict[str, Any]):
+            span = tracer.span(f"fetch {job['id']}", "fetch", {"repo": job["repo"]}) \
+                if tracer is not None else nullcontext()
+            with span:
+                return fetch_repository(job["repo"], mirror_cache)
+
+        async def fetch(job: Dict[str, Any]):
+            started = time.time()
+            try:
+                if is_remote_repo(job["repo"]):
+                    path, cleanup = await loop.run_in_executor(io_pool, traced_fetch, job)
+                    summary["fetched"] += 1
+                    summary["fetch_seconds"] += time.time() - started
+                    await ready.put((dict(job, path=path), cleanup))
+                else:
+                    await ready.put((job, None))
+            except Exception as e:
+                on_record(_make_record(job, started, _error_result(job, e)))
+            finally:
+                # El cupo se libera recién cuando el repo entró a la cola
+                fetch_slots.release()
+
+        async def evaluate(job: Dict[str, Any], cleanup: Optional[Callable[[], None]]):
+            try:
+                record = await loop.run_in_executor(pool, evaluate_job, job, *evaluate_args)
+            finally:
+                if cleanup is not None:
+                    await loop.run_in_executor(io_pool, cleanup)
+                eval_slots.release()
+            trace_events = record.pop("trace_events", None)
+            if tracer is not None and trace_events is not None:
+                tracer.name_process(record["worker_pid"], f"worker {record['worker_pid']}")
+                tracer.add_events(trace_events)
+            folded = record.pop("profile_folded", None)
+            if profile_collector is not None and folded is not None:
+                profile_collector.add_folded(folded)
+            on_record(record)
+
+        async def produce():
+            fetches = set()
+            for job in jobs:
+                await fetch_slots.acquire()
+                task = asyncio.ensure_future(fetch(job))
+                fetches.add(task)
+                task.add_done_callback(fetches.discard)
+            await asyncio.gather(*fetches)
+            await ready.put(None)
+
+        async def consume():
+            evaluations = set()
+            while True:
+                item = await ready.get()
+                if item is None:
+                    break
+                await eval_slots.acquire()
+                task = asyncio.ensure_future(evaluate(*item))
+                evaluations.add(task)
+                task.add_done_callback(evaluations.discard)
+            await asyncio.gather(*evaluations)
+
+        await asyncio.gather(produce(), consume())
+
+
+def run_batch(jobs: Iterable[Dict[str, Any]], output_path: Union[str, Path],
+              workers: Optional[int] = None,
+              summary_path: Optional[Union[str, Path]] = None,
+              max_inline_bytes: Optional[int] = DEFAULT_MAX_INLINE_BYTES,
+              blob_dir: Optional[Union[str, Path]] = None,
+              full_results: bool = False,
+              fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+              mirror_cache=None, tracer=None, profile_collector=None) -> Dict[str, Any]:
+    """
+    Ejecuta una evaluación por lotes en un pool de procesos.
+
+    Los jobs cuyo ``repo`` es una URL git se descargan en una etapa asyncio
+    que se solapa con la evaluación (ver ``_run_pipeline``), de modo que el
+    tiempo total tiende al mayor entre descarga y evaluación y no a su suma.
+    Cada resultado se escribe como una línea JSON compacta en cuanto termina
+    y no se retiene después de escribirlo, así que la memoria no crece con el
+    tamaño del lote. No debe llamarse desde un event loop en ejecución.
+
+    Args:
+        jobs: Jobs a evaluar (ver ``load_manifest``)
+        output_path: Archivo JSONL de resultados
+        workers: Número de procesos (default: ``os.cpu_count()``)
+        summary_path: Archivo JSON opcional para el resumen
+        max_inline_bytes: Tamaño máximo de un texto en línea (None o 0: resultados completos)
+        blob_dir: Directorio donde guardar los textos omitidos (opcional)
+        full_results: True para no aplicar la política de tamaño de resultados
+        fetch_concurrency: Descargas simultáneas de repos remotos
+        mirror_cache: MirrorCache para las descargas (opcional, ver core.mirror_cache)
+        tracer: TraceRecorder donde unir los spans de descargas y workers (opcional)
+        profile_collector: ProfileCollector donde sumar los perfiles de los workers (opcional)
+
+    Returns:
+        Resumen agregado de la ejecución
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    weeks = sorted({job["week"] for job in jobs})
+
+    summary = _new_summary(workers)
+    started = time.time()
+    evaluate_args = (max_inline_bytes, str(blob_dir) if blob_dir is not None else None, full_results,
+                     tracer is not None, profile_collector is not None)
+
+    # Los workers no se crean con fork mientras hay descargas en curso: heredarían
+    # los pipes de los procesos git y los locks de la caché de mirrors
+    mp_context = multiprocessing.get_context("forkserver") \
+        if "forkserver" in multiprocessing.get_all_start_methods() else None
+
+    with JsonlWriter(output_path) as out, \
+            ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                initializer=_init_worker, initargs=(weeks,)) as pool:
+
+        def on_record(record: Dict[str, Any]):
+            out.write(record)
+            _summarize(summary, record)
+
+        asyncio.run(_run_pipeline(jobs, pool, on_record, workers, fetch_concurrency,
+                                  mirror_cache, evaluate_args, summary, tracer, profile_collector))
+
+    return _finish_summary(summary, started, summary_path)
+
+
+def _renew_lease(queue: JobQueue, key: str, owner: str, lease_seconds: float, stop: threading.Event,
+                 max_lifetime: float = DEFAULT_MAX_LEASE_LIFETIME):
+    """
+    Renueva el lease de un job mientras se evalúa (hilo de fondo del worker).
+
+    Deja de renovarlo a los ``max_lifetime`` segundos: si el intento sigue
+    colgado, el lease vence y otro worker puede retomar el job.
+    """
+    deadline = time.time() + max_lifetime
+    while not stop.wait(lease_seconds / 3):
+        if time.time() >= deadline or not queue.renew(key, owner, lease_seconds):
+            return
+
+
+def _check_local_version(job: Dict[str, Any]):
+    """
+    Verifica que un repo local siga en la versión con la que se encoló.
+
+    Raises:
+        RuntimeError: Si su contenido cambió (el resultado no correspondería a ``commit_id``)
+    """
+    current = resolve_commit(job["repo"])
+    if current != job["commit_id"]:
+        raise RuntimeError(f"El repositorio cambió desde que se encoló ({job['commit_id'][:12]} -> {current[:12]})")
+
+
+def drain_queue(queue_path: Union[str, Path], evaluate_args: tuple = (), mirror_cache=None,
+                lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                poll_seconds: float = QUEUE_POLL_SECONDS,
+                max_lease_lifetime: float = DEFAULT_MAX_LEASE_LIFETIME) -> int:
+    """
+    Evalúa jobs de una cola persistente hasta que no quede ninguno sin terminar.
+
+    Cada worker es un proceso independiente que toma jobs directamente de
+    SQLite, así que varios procesos (del mismo lote o de otra terminal)
+    pueden vaciar la misma cola. Mientras otro worker tiene jobs en curso,
+    este espera por si su lease vence y hay que reintentarlos.
+
+    Se evalúa la versión encolada: los repos remotos se descargan en
+    ``commit_id`` y un repo local que cambió desde que se encoló falla en vez
+    de guardar un resultado con la clave de otra versión.
+
+    Args:
+        queue_path: Archivo SQLite de la cola
+        evaluate_args: Argumentos extra de ``evaluate_job`` (sin trazas ni perfiles)
+        mirror_cache: MirrorCache para los repos remotos (opcional)
+        lease_seconds: Duración del lease de cada job
+        poll_seconds: Espera entre consultas cuando no hay jobs disponibles
+        max_lease_lifetime: Segundos máximos que se renueva el lease de un intento
+
+    Returns:
+        Número de jobs evaluados por este worker
+    """
+    queue = JobQueue(queue_path)
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+    processed = 0
+
+    while True:
+        job = queue.claim(owner, lease_seconds)
+        if job is None:
+            if not queue.has_unfinished():
+                return processed
+            time.sleep(poll_seconds)
+            continue
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=_renew_lease,
+                                     args=(queue, job["key"], owner, lease_seconds, stop, max_lease_lifetime),
+                                     daemon=True)
+        heartbeat.start()
+        started = time.time()
+        cleanup = None
+        try:
+            fetch_seconds = None
+            if is_remote_repo(job["repo"]):
+                path, cleanup = fetch_repository(job["repo"], mirror_cache, job["commit_id"] or None)
+                fetch_seconds = round(time.time() - started, 3)
+                job = dict(job, path=path)
+            elif job["commit_id"]:
+                _check_local_version(job)
+            record = evaluate_job(job, *evaluate_args)
+            if not is_remote_repo(job["repo"]) and job["commit_id"]:
+                _check_local_version(job)
+            if fetch_seconds is not None:
+                record["fetch_seconds"] = fetch_seconds
+        except Exception as e:
+            record = _make_record(job, started, _error_result(job, e))
+        finally:
+            if cleanup is not None:
+                cleanup()
+            stop.set()
+            heartbeat.join()
+
+        record["attempts"] = job["attempts"]
+        result = record["result"]
+        if result.get("error"):
+            queue.fail(job["key"], owner, result.get("error_message", ""), record)
+        else:
+            queue.complete(job["key"], owner, record)
+        processed += 1
+
+
+def run_queued_batch(jobs: Iterable[Dict[str, Any]], queue_path: Union[str, Path],
+                     output_path: Union[str, Path], workers: Optional[int] = None,
+                     summary_path: Optional[Union[str, Path]] = None,
+                     max_inline_bytes: Optional[int] = DEFAULT_MAX_INLINE_BYTES,
+                     blob_dir: Optional[Union[str, Path]] = None,
+                     full_results: bool = False,
+                     fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+                     mirror_cache=None, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                     max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                     max_lease_lifetime: float = DEFAULT_MAX_LEASE_LIFETIME) -> Dict[str, Any]:
+    """
+    Ejecuta una evaluación por lotes sobre una cola persistente.
+
+    Los jobs se encolan con clave repositorio + commit + semana (los commits
+    se resuelven con hasta ``fetch_concurrency`` consultas en paralelo), así
+    que al retomar un lote interrumpido los jobs ya terminados no se vuelven
+    a evaluar. Luego ``workers`` procesos vacían la cola (ver ``drain_queue``)
+    y al final se escribe el JSONL completo del manifiesto desde la cola.
+
+    Args:
+        jobs: Jobs a evaluar (ver ``load_manifest``)
+        queue_path: Archivo SQLite de la cola (se crea si no existe)
+        output_path: Archivo JSONL de resultados
+        workers: Número de procesos (default: ``os.cpu_count()``)
+        summary_path: Archivo JSON opcional para el resumen
+        max_inline_bytes: Tamaño máximo de un texto en línea (None o 0: resultados completos)
+        blob_dir: Directorio donde guardar los textos omitidos (opcional)
+        full_results: True para no aplicar la política de tamaño de resultados
+        fetch_concurrency: Consultas simultáneas al resolver commits remotos
+        mirror_cache: MirrorCache para las descargas (opcional)
+        lease_seconds: Duración del lease de cada job
+        max_attempts: Intentos por job antes de darlo por fallido
+        max_lease_lifetime: Segundos máximos que un worker retiene un intento
+
+    Returns:
+        Resumen agregado; incluye ``resumed`` (jobs ya terminados antes de
+        esta ejecución) y ``pending`` (jobs que quedaron sin terminar)
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    summary = _new_summary(workers)
+    started = time.time()
+    queue = JobQueue(queue_path)
+
+    with ThreadPoolExecutor(max_workers=max(1, fetch_concurrency)) as io_pool:
+        commits = list(io_pool.map(lambda job: resolve_commit(job["repo"]), jobs))
+    keys = [queue.enqueue(job, commit_id, max_attempts) for job, commit_id in zip(jobs, commits)]
+    resumed = {key for key in set(keys) if queue.get(key)["status"] in ("done", "failed")}
+    summary["resumed"] = len(resumed)
+
+    evaluate_args = (max_inline_bytes, str(blob_dir) if blob_dir is not None else None, full_results)
+    mp_context = multiprocessing.get_context("forkserver") \
+        if "forkserver" in multiprocessing.get_all_start_methods() else multiprocessing.get_context()
+    processes = [
+        mp_context.Process(target=drain_queue,
+                           args=(str(queue_path), evaluate_args, mirror_cache, lease_seconds,
+                                 QUEUE_POLL_SECONDS, max_lease_lifetime),
+                           name=f"queue-worker-{index}")
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    summary["pending"] = 0
+    with JsonlWriter(output_path) as out:
+        for job, key in zip(jobs, keys):
+            entry = queue.get(key)
+            if entry["status"] not in ("done", "failed"):
+                summary["pending"] += 1
+                continue
+            if entry["record"] is None:
+                # Agotó sus intentos sin que ningún worker terminara (lease vencido)
+                record = _make_record(job, time.time(), _error_result(job, RuntimeError(entry["error"])))
+            else:
+                # El registro guardado puede venir de otro manifiesto con otro id
+                record = dict(entry["record"], id=job["id"])
+                if key not in resumed and "fetch_seconds" in record:
+                    summary["fetched"] += 1
+                    summary["fetch_seconds"] += record["fetch_seconds"]
+            out.write(record)
+            _summarize(summary, record)
+
+    return _finish_summary(summary, started, summary_path)
@@ -0,0 +1,912 @@
+"""
+Benchmarks de los evaluadores sobre repositorios sintéticos.
+Genera repositorios de estudiante de distintos tamaños (desde el hello world
+de la semana 1 hasta miles de archivos con paquetes profundos, carpetas de
+tests grandes y un ``venv/`` commiteado) con lo que evalúa cada semana
+(modelos, migraciones, tests, auth, Docker), mide cuánto tarda cada
+evaluador semanal y cada uno de sus checks, y compara el resultado con una
+línea base guardada para detectar regresiones de rendimiento.
+"""
+import json
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple, Union
+
+
+# Tamaños de repositorio sintético:
+# - modules: módulos de la aplicación (cada uno con router, schemas y endpoints)
+# - depth: niveles de subpaquetes en los que se reparten los módulos
+# - tests: archivos de tests
+# - venv_files: archivos de un venv/ commiteado por error
+BENCHMARK_SIZES: Dict[str, Dict[str, int]] = {
+    "minimal": {"modules": 0, "depth": 0, "tests": 0, "venv_files": 0},
+    "small": {"modules": 20, "depth": 2, "tests": 10, "venv_files": 0},
+    "medium": {"modules": 250, "depth": 4, "tests": 100, "venv_files": 150},
+    "large": {"modules": 2500, "depth": 6, "tests": 1500, "venv_files": 1000},
+}
+
+# Regresión: más de este porcentaje por sobre la línea base
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+
+# Diferencias menores a esto (segundos) se consideran ruido
+MIN_REGRESSION_SECONDS = 0.005
+
+BENCHMARK_FORMAT_VERSION = 1
+
+MAIN_TEMPLATE = '''from fastapi import FastAPI, HTTPException, status
+from pydantic import BaseModel
+
+app = FastAPI(title="API del estudiante", version="1.0.0")
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.get("/")
+async def root():
+    return {{"message": "Hello World"}}
+
+
+@app.get("/items/{{item_id}}")
+async def read_item(item_id: int, q: str = None):
+    if item_id < 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item no encontrado")
+    return {{"item_id": item_id, "q": q}}
+
+
+@app.post("/items", status_code=status.HTTP_201_CREATED)
+async def create_item(item: Item):
+    return item
+{routers}'''
+
+MODULE_TEMPLATE = '''"""Módulo {name} generado para benchmarks"""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+
+router = APIRouter(prefix="/{name}", tags=["{name}"])
+
+
+class {model}Base(BaseModel):
+    title: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = None
+    quantity: int = Field(0, ge=0)
+
+
+class {model}Create({model}Base):
+    pass
+
+
+class {model}({model}Base):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+
+_DB: dict = {{}}
+
+
+def get_db() -> dict:
+    return _DB
+
+
+@router.get("/", response_model=List[{model}])
+async def list_{name}(skip: int = 0, limit: int = 10, db: dict = Depends(get_db)):
+    return list(db.values())[skip:skip + limit]
+
+
+@router.get("/{{item_id}}", response_model={model})
+async def get_{name}(item_id: int, db: dict = Depends(get_db)):
+    if item_id not in db:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No encontrado")
+    return db[item_id]
+
+
+@router.post("/", response_model={model}, status_code=status.HTTP_201_CREATED)
+async def create_{name}(payload: {model}Create, db: dict = Depends(get_db)):
+    item_id = len(db) + 1
+    db[item_id] = {model}(id=item_id, **payload.dict())
+    return db[item_id]
+
+
+@router.delete("/{{item_id}}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_{name}(item_id: int, db: dict = Depends(get_db)):
+    db.pop(item_id, None)
+'''
+
+TEST_TEMPLATE = '''from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_root_{index}():
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.json() == {{"message": "Hello World"}}
+
+
+def test_create_item_{index}():
+    response = client.post("/items", json={{"name": "item {index}", "price": {index}.5}})
+    assert response.status_code == 201
+'''
+
+VENV_TEMPLATE = '''# Archivo de dependencia instalada en un venv commiteado
+def helper_{index}(value):
+    return value * {index}
+'''
+
+README_TEMPLATE = """# Proyecto FastAPI
+
+API construida con FastAPI para el curso.
+
+## Instalación
+
+```bash
+pip install -r requirements.txt
+```
+
+## Ejecución
+
+```bash
+uvicorn main:app --reload
+```
+
+La documentación interactiva queda disponible en http://localhost:8000/docs
+"""
+
+# Archivos que agrega cada overlay: ruta relativa -> contenido
+DATABASE_OVERLAY: Dict[str, str] = {
+    "database.py": '''from sqlalchemy import create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, pool_pre_ping=True)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base = declarative_base()
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+''',
+    "models/__init__.py": "from .user import User\nfrom .order import Order, OrderItem\n",
+    "models/user.py": '''from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy.orm import relationship
+
+from database import Base
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True, index=True)
+    email = Column(String(255), unique=True, nullable=False, index=True)
+    hashed_password = Column(String(255), nullable=False)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    orders = relationship("Order", back_populates="owner", cascade="all, delete-orphan")
+''',
+    "models/order.py": '''from sqlalchemy import Column, Integer, Numeric, ForeignKey, CheckConstraint, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from database import Base
+
+
+class Order(Base):
+    __tablename__ = "orders"
+    __table_args__ = (CheckConstraint("total >= 0", name="ck_order_total"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    total = Column(Numeric(10, 2), nullable=False, default=0)
+
+    owner = relationship("User", back_populates="orders")
+    items = relationship("OrderItem", back_populates="order")
+
+
+class OrderItem(Base):
+    __tablename__ = "order_items"
+    __table_args__ = (UniqueConstraint("order_id", "sku", name="uq_order_item_sku"),)
+
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
+    sku = Column(Integer, nullable=False)
+    quantity = Column(Integer, nullable=False, default=1)
+
+    order = relationship("Order", back_populates="items")
+''',
+    "schemas/__init__.py": "",
+    "schemas/user.py": '''from pydantic import BaseModel, EmailStr
+
+
+class UserCreate(BaseModel):
+    email: EmailStr
+    password: str
+
+
+class UserRead(BaseModel):
+    id: int
+    email: EmailStr
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+''',
+    "services/__init__.py": "",
+    "services/user_service.py": '''from sqlalchemy.orm import Session, joinedload
+
+from models import User, Order
+
+
+def list_users_with_orders(db: Session, skip: int = 0, limit: int = 10):
+    return (
+        db.query(User)
+        .options(joinedload(User.orders))
+        .join(Order, isouter=True)
+        .filter(User.is_active == True)
+        .order_by(User.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_user(db: Session, user_id: int):
+    return db.query(User).filter(User.id == user_id).first()
+''',
+    "routers/__init__.py": "",
+    "routers/users.py": '''from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import User
+from schemas.user import UserCreate, UserRead
+from services.user_service import get_user, list_users_with_orders
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+@router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+def create_user(payload: UserCreate, db: Session = Depends(get_db)):
+    user = User(email=payload.email, hashed_password=payload.password + "-hash")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+@router.get("/", response_model=List[UserRead])
+def read_users(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
+    return list_users_with_orders(db, skip, limit)
+
+
+@router.put("/{user_id}", response_model=UserRead)
+def update_user(user_id: int, payload: UserCreate, db: Session = Depends(get_db)):
+    db.query(User).filter(User.id == user_id).update({"email": payload.email})
+    db.commit()
+    return get_user(db, user_id)
+
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_user(user_id: int, db: Session = Depends(get_db)):
+    user = get_user(db, user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Usuario no encontrado")
+    db.delete(user)
+    db.commit()
+''',
+    "alembic.ini": "[alembic]\nscript_location = alembic\nsqlalchemy.url = sqlite:///./app.db\n",
+    "alembic/env.py": '''from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from database import Base
+import models  # noqa: F401
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+target_metadata = Base.metadata
+
+
+def run_migrations_online():
+    connectable = engine_from_config(config.get_section(config.config_ini_section), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+run_migrations_online()
+''',
+    "alembic/versions/0001_create_users.py": '''"""create users
+
+Revision ID: 0001
+Revises:
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), default=True),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_users_email", "users", ["email"])
+
+
+def downgrade():
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+''',
+    "alembic/versions/0002_create_orders.py": '''"""create orders
+
+Revision ID: 0002
+Revises: 0001
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+
+
+def upgrade():
+    op.create_table(
+        "orders",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("total", sa.Numeric(10, 2), nullable=False),
+        sa.CheckConstraint("total >= 0", name="ck_order_total"),
+    )
+
+
+def downgrade():
+    op.drop_table("orders")
+''',
+}
+
+TESTING_OVERLAY: Dict[str, str] = {
+    "pytest.ini": "[pytest]\ntestpaths = tests\naddopts = -v --cov=. --cov-report=term-missing\n"
+                  "markers =\n    integration: tests con base de datos\n",
+    "tests/__init__.py": "",
+    "tests/conftest.py": '''import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, get_db
+from main import app
+
+TEST_DATABASE_URL = "sqlite:///./test.db"
+engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def test_db():
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def client(test_db):
+    app.dependency_overrides[get_db] = lambda: test_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+''',
+    "tests/test_models.py": '''from models import User, Order
+
+
+def test_user_model_creation(test_db):
+    user = User(email="a@example.com", hashed_password="x")
+    test_db.add(user)
+    test_db.commit()
+    assert user.id is not None
+
+
+def test_order_belongs_to_user(test_db):
+    user = User(email="b@example.com", hashed_password="x")
+    user.orders.append(Order(total=10))
+    test_db.add(user)
+    test_db.commit()
+    assert user.orders[0].owner_id == user.id
+''',
+    "tests/test_endpoints.py": '''import pytest
+
+
+def test_create_user_endpoint(client):
+    response = client.post("/users/", json={"email": "c@example.com", "password": "secreto"})
+    assert response.status_code == 201
+    assert response.json()["email"] == "c@example.com"
+
+
+def test_delete_missing_user_returns_404(client):
+    response = client.delete("/users/999")
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_list_users_endpoint(client):
+    client.post("/users/", json={"email": "d@example.com", "password": "secreto"})
+    response = client.get("/users/")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+''',
+    "tests/test_services.py": '''from services.user_service import get_user, list_users_with_orders
+
+
+def test_get_user_missing_returns_none(test_db):
+    assert get_user(test_db, 1) is None
+
+
+def test_list_users_empty(test_db):
+    assert list_users_with_orders(test_db) == []
+''',
+}
+
+DEPLOYMENT_OVERLAY: Dict[str, str] = {
+    "auth.py": '''from datetime import datetime, timedelta
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+
+from config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def create_access_token(subject: str) -> str:
+    expire = datetime.utcnow() + timedelta(minutes=settings.access_token_minutes)
+    return jwt.encode({"sub": subject, "exp": expire}, settings.secret_key, algorithm="HS256")
+
+
+def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+    except JWTError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token inválido")
+    return payload["sub"]
+''',
+    "config.py": '''from pydantic_settings import BaseSettings
+
+
+class Settings(BaseSettings):
+    database_url: str = "postgresql://app:app@db:5432/app"
+    redis_url: str = "redis://redis:6379/0"
+    secret_key: str = "cambiar-en-produccion"
+    access_token_minutes: int = 30
+
+    class Config:
+        env_file = ".env"
+
+
+settings = Settings()
+''',
+    ".env.example": "DATABASE_URL=postgresql://app:app@db:5432/app\nREDIS_URL=redis://redis:6379/0\nSECRET_KEY=cambiar\n",
+    "services/__init__.py": "",
+    "services/notifications.py": '''import httpx
+from celery import Celery
+
+from config import settings
+
+celery_app = Celery("worker", broker=settings.redis_url)
+
+
+@celery_app.task
+def send_welcome_email(email: str):
+    return {"sent_to": email}
+
+
+async def notify_orders_service(user_id: int):
+    async with httpx.AsyncClient(timeout=5) as client:
+        response = await client.post("http://orders:8001/events", json={"user_id": user_id})
+        response.raise_for_status()
+        return response.json()
+''',
+    "Dockerfile": '''FROM python:3.11-slim
+WORKDIR /app
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+COPY . .
+EXPOSE 8000
+HEALTHCHECK CMD curl -f http://localhost:8000/health || exit 1
+CMD ["gunicorn", "main:app", "-k", "uvicorn.workers.UvicornWorker", "-b", "0.0.0.0:8000"]
+''',
+    "docker-compose.yml": '''services:
+  api:
+    build: .
+    ports:
+      - "8000:8000"
+    env_file: .env
+    depends_on:
+      - db
+      - redis
+  worker:
+    build: .
+    command: celery -A services.notifications worker
+    depends_on:
+      - redis
+  db:
+    image: postgres:16
+    environment:
+      POSTGRES_USER: app
+      POSTGRES_PASSWORD: app
+  redis:
+    image: redis:7
+''',
+}
+
+# Dependencias extra de cada overlay (se agregan a requirements.txt)
+OVERLAY_REQUIREMENTS: Dict[str, List[str]] = {
+    "database": ["sqlalchemy==2.0.23", "alembic==1.13.0", "psycopg2-binary==2.9.9", "email-validator==2.1.0"],
+    "testing": ["pytest==7.4.3", "pytest-cov==4.1.0", "httpx==0.25.2"],
+    "deployment": ["python-jose[cryptography]==3.3.0", "passlib[bcrypt]==1.7.4", "pydantic-settings==2.1.0",
+                   "gunicorn==21.2.0", "celery==5.3.6", "redis==5.0.1", "aioredis==2.0.1",
+                   "websockets==12.0", "httpx==0.25.2", "aiohttp==3.9.1", "strawberry-graphql==0.215.1",
+                   "graphene==3.3", "docker==7.0.0"],
+}
+
+# Líneas que cada overlay agrega al final de main.py y secciones del README
+OVERLAY_MAIN: Dict[str, str] = {
+    "database": "\nfrom routers.users import router as users_router\napp.include_router(users_router)\n",
+    "deployment": '''
+from fastapi import BackgroundTasks, Depends, WebSocket
+
+from auth import get_current_user
+from services.notifications import send_welcome_email
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
+
+
+@app.post("/notify")
+async def notify(background_tasks: BackgroundTasks, user: str = Depends(get_current_user)):
+    background_tasks.add_task(send_welcome_email.delay, user)
+    return {"queued": True}
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    await websocket.accept()
+    await websocket.send_json({"status": "connected"})
+''',
+}
+
+OVERLAY_README: Dict[str, str] = {
+    "database": "\n## Migraciones\n\n```bash\nalembic upgrade head\n```\n",
+    "testing": "\n## Tests\n\n```bash\npytest --cov\n```\n",
+    "deployment": "\n## Docker\n\n```bash\ncp .env.example .env\ndocker compose up --build\n```\n",
+}
+
+OVERLAYS: Dict[str, Dict[str, str]] = {
+    "database": DATABASE_OVERLAY,
+    "testing": TESTING_OVERLAY,
+    "deployment": DEPLOYMENT_OVERLAY,
+}
+
+# Overlays de cada semana: lo que sus checks buscan (modelos y Alembic en las
+# semanas 3-4, tests en la 5, auth, Docker y servicios de la 6 en adelante)
+WEEK_OVERLAYS: Dict[int, Tuple[str, ...]] = {
+    3: ("database",),
+    4: ("database",),
+    5: ("database", "testing"),
+    **{week: ("database", "deployment") for week in range(6, 11)},
+    11: ("database", "testing", "deployment"),
+}
+
+
+def _write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _package_path(root: Path, index: int, depth: int) -> Path:
+    """Subpaquete de un módulo: los módulos se reparten en un árbol de ``depth`` niveles"""
+    path = root
+    for level in range(depth):
+        path = path / f"pkg{(index >> level) % 4}"
+    return path
+
+
+def generate_synthetic_repo(dest: Union[str, Path], size: Union[str, Dict[str, int]] = "minimal",
+                            week: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Genera un repositorio de estudiante sintético y determinista.
+
+    El tamaño ``minimal`` es el hello world de la semana 1 (``main.py``,
+    ``requirements.txt`` y ``README.md``); los demás agregan módulos con
+    routers y schemas en subpaquetes, tests y un ``venv/`` commiteado. Con
+    ``week`` se agregan además los overlays de esa semana (``WEEK_OVERLAYS``)
+    para que sus checks encuentren lo que analizan.
+
+    Args:
+        dest: Directorio del repositorio (se crea)
+        size: Nombre en ``BENCHMARK_SIZES`` o dict con las mismas claves
+        week: Semana cuyos overlays se agregan (default: ninguno)
+
+    Returns:
+        Dict con la ruta, el número de archivos, los bytes generados y los overlays
+    """
+    spec = BENCHMARK_SIZES[size] if isinstance(size, str) else size
+    overlays = WEEK_OVERLAYS.get(week, ())
+    root = Path(dest)
+    root.mkdir(parents=True, exist_ok=True)
+
+    modules = spec.get("modules", 0)
+    depth = spec.get("depth", 0)
+    imports = []
+    for index in range(modules):
+        package = _package_path(root / "app", index, depth)
+        name = f"resource{index:04d}"
+        _write(package / f"{name}.py", MODULE_TEMPLATE.format(name=name, model=f"Resource{index:04d}"))
+        module_path = ".".join(package.relative_to(root).parts + (name,))
+        imports.append(f"from {module_path} import router as {name}_router\n"
+                       f"app.include_router({name}_router)\n")
+
+    if modules:
+        # Cada directorio de la aplicación es un paquete
+        for directory in [root / "app", *(root / "app").rglob("*")]:
+            if directory.is_dir():
+                _write(directory / "__init__.py", "")
+
+    main = MAIN_TEMPLATE.format(routers="\n" + "".join(imports) if imports else "")
+    _write(root / "main.py", main + "".join(OVERLAY_MAIN.get(overlay, "") for overlay in overlays))
+    requirements = ["fastapi==0.104.1", "uvicorn[standard]==0.24.0", "pydantic==2.5.0"]
+    if spec.get("tests"):
+        requirements += ["pytest==7.4.3", "httpx==0.25.2"]
+    for overlay in overlays:
+        requirements += OVERLAY_REQUIREMENTS[overlay]
+    _write(root / "requirements.txt", "".join(f"{line}\n" for line in dict.fromkeys(requirements)))
+    _write(root / "README.md", README_TEMPLATE + "".join(OVERLAY_README.get(overlay, "") for overlay in overlays))
+
+    for index in range(spec.get("tests", 0)):
+        _write(root / "tests" / f"test_api_{index:04d}.py", TEST_TEMPLATE.format(index=index))
+    if spec.get("tests"):
+        _write(root / "tests" / "__init__.py", "")
+        _write(root / "pytest.ini", "[pytest]\ntestpaths = tests\n")
+
+    for overlay in overlays:
+        for rel_path, text in OVERLAYS[overlay].items():
+            _write(root / rel_path, text)
+
+    for index in range(spec.get("venv_files", 0)):
+        package = f"package{index % 25:02d}"
+        _write(root / "venv" / "lib" / "python3.11" / "site-packages" / package / f"module{index:04d}.py",
+               VENV_TEMPLATE.format(index=index))
+
+    files = [path for path in root.rglob("*") if path.is_file()]
+    return {
+        "path": str(root),
+        "files": len(files),
+        "bytes": sum(path.stat().st_size for path in files),
+        "overlays": list(overlays)
+    }
+
+
+def time_evaluation(week_number: int, repo_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Evalúa un repositorio una vez midiendo el total y cada check.
+
+    Las cachés persistentes de resultados y de checks se desactivan para que
+    cada medición ejecute todos los checks.
+
+    Args:
+        week_number: Semana a evaluar
+        repo_path: Ruta del repositorio
+
+    Returns:
+        Dict con ``seconds`` (total), ``checks`` (segundos por check) y ``final_score``
+    """
+    from .week_registry import create_evaluator
+
+    started = time.perf_counter()
+    evaluator = create_evaluator(week_number, str(repo_path))
+    evaluator.result_cache = None
+    evaluator.check_cache = None
+    result = evaluator.evaluate()
+    return {
+        "seconds": time.perf_counter() - started,
+        "checks": dict(evaluator.check_durations),
+        "final_score": result.get("final_score", 0)
+    }
+
+
+def run_benchmarks(weeks: Optional[Iterable[int]] = None, sizes: Optional[Iterable[str]] = None,
+                   repeats: int = 3, work_dir: Union[str, Path, None] = None,
+                   progress=None) -> Dict[str, Any]:
+    """
+    Mide cada evaluador semanal sobre repositorios sintéticos de cada tamaño.
+
+    Cada repositorio se genera una vez por tamaño y se evalúa ``repeats``
+    veces por semana (más una evaluación inicial descartada por semana); se
+    guarda la mediana del total y de cada check.
+
+    Args:
+        weeks: Semanas a medir (default: todas las descubiertas)
+        sizes: Tamaños de ``BENCHMARK_SIZES`` (default: todos)
+        repeats: Evaluaciones por semana y tamaño
+        work_dir: Directorio donde generar los repositorios (default: temporal)
+        progress: Callable opcional ``(clave, resultado)`` llamado tras cada medición
+
+    Returns:
+        Línea base: ``{"version", "created", "python", "repeats", "results"}``,
+        con ``results["weekNN/tamaño"] = {"files", "bytes", "seconds", "runs", "checks", "final_score"}``
+    """
+    from .week_registry import discover_weeks
+
+    weeks = sorted(weeks) if weeks is not None else sorted(discover_weeks())
+    sizes = list(sizes) if sizes is not None else list(BENCHMARK_SIZES)
+    repeats = max(1, repeats)
+
+    baseline = {
+        "version": BENCHMARK_FORMAT_VERSION,
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "repeats": repeats,
+        "results": {}
+    }
+
+    warmed = set()
+    with tempfile.TemporaryDirectory(prefix="eval_bench_") as tmp_dir:
+        root = Path(work_dir) if work_dir is not None else Path(tmp_dir)
+        for size in sizes:
+            # Un repositorio por combinación de overlays: las semanas que comparten overlays lo reutilizan
+            repos: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+            for week in weeks:
+                overlays = WEEK_OVERLAYS.get(week, ())
+                if overlays not in repos:
+                    name = "-".join((size,) + overlays)
+                    repos[overlays] = generate_synthetic_repo(root / name, size, week)
+                repo = repos[overlays]
+                if week not in warmed:
+                    # La primera evaluación de cada semana importa sus checks y compila criteria: no se mide
+                    time_evaluation(week, repo["path"])
+                    warmed.add(week)
+                runs = [time_evaluation(week, repo["path"]) for _ in range(repeats)]
+                check_names = dict.fromkeys(name for run in runs for name in run["checks"])
+                entry = {
+                    "files": repo["files"],
+                    "bytes": repo["bytes"],
+                    "seconds": round(statistics.median(run["seconds"] for run in runs), 4),
+                    "runs": [round(run["seconds"], 4) for run in runs],
+                    "checks": {
+                        name: round(statistics.median(run["checks"].get(name, 0.0) for run in runs), 4)
+                        for name in check_names
+                    },
+                    "final_score": runs[-1]["final_score"]
+                }
+                key = f"week{week:02d}/{size}"
+                baseline["results"][key] = entry
+                if progress is not None:
+                    progress(key, entry)
+
+    return baseline
+
+
+def compare_benchmarks(baseline: Dict[str, Any], current: Dict[str, Any],
+                       threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+                       min_seconds: float = MIN_REGRESSION_SECONDS) -> List[Dict[str, Any]]:
+    """
+    Compara una medición con la línea base.
+
+    Se compara el total de cada semana/tamaño y cada check presente en ambas.
+    Es regresión si el tiempo actual supera al de la línea base en más de
+    ``threshold`` (proporción) y en más de ``min_seconds``.
+
+    Args:
+        baseline: Línea base (resultado de ``run_benchmarks``)
+        current: Medición actual
+        threshold: Aumento relativo tolerado (0.25 = 25%)
+        min_seconds: Aumento absoluto por debajo del cual se ignora la diferencia
+
+    Returns:
+        Lista de regresiones ``{"key", "metric", "baseline", "current", "ratio"}``
+    """
+    regressions = []
+    for key, entry in current.get("results", {}).items():
+        base_entry = baseline.get("results", {}).get(key)
+        if base_entry is None:
+            continue
+
+        metrics = [("total", base_entry.get("seconds", 0.0), entry.get("seconds", 0.0))]
+        for name, seconds in entry.get("checks", {}).items():
+            if name in base_entry.get("checks", {}):
+                metrics.append((name, base_entry["checks"][name], seconds))
+
+        for metric, before, after in metrics:
+            if after - before > min_seconds and after > before * (1 + threshold):
+                regressions.append({
+                    "key": key,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": round(after / before, 2) if before > 0 else None
+                })
+    return regressions
+
+
+def load_benchmark(path: Union[str, Path]) -> Dict[str, Any]:
+    """Lee una línea base guardada"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_benchmark(baseline: Dict[str, Any], path: Union[str, Path]):
+    """Guarda una línea base como JSON"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def format_benchmark_report(baseline: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]] = None,
+                            top_checks: int = 3) -> str:
+    """
+    Formatea una medición como texto para la terminal.
+
+    Args:
+        baseline: Medición (resultado de ``run_benchmarks``)
+        regressions: Regresiones detectadas por ``compare_benchmarks`` (opcional)
+        top_checks: Checks más lentos a mostrar por semana/tamaño
+
+    Returns:
+        Reporte de texto
+    """
+    lines = ["=== BENCHMARK DE EVALUADORES ===",
+             f"{'Semana/tamaño':<22}{'Archivos':>10}{'Mediana':>12}  Checks más lentos"]
+    for key, entry in baseline.get("results", {}).items():
+        slowest = sorted(entry.get("checks", {}).items(), key=lambda item: item[1], reverse=True)[:top_checks]
+        checks = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in slowest)
+        lines.append(f"{key:<22}{entry.get('files', 0):>10}{entry.get('seconds', 0.0) * 1000:>9.0f} ms  {checks}")
+
+    if regressions is not None:
+        lines.append("")
+        if not regressions:
+            lines.append("✅ Sin regresiones respecto a la línea base")
+        for regression in regressions:
+            ratio = f"x{regression['ratio']}" if regression["ratio"] is not None else "nuevo costo"
+            lines.append(f"❌ {regression['key']} {regression['metric']}: "
+                         f"{regression['baseline'] * 1000:.0f} ms -> {regression['current'] * 1000:.0f} ms ({ratio})")
+    return "\n".join(lines)
@@ -0,0 +1,198 @@
+"""
+Caché incremental por check.
+Cada check puede declarar los archivos que lee (``@depends_on``); su resultado
+anterior se reutiliza mientras ninguno de esos archivos cambie ni cambie el
+código del propio check.
+"""
+import hashlib
+import inspect
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable, Union
+
+from .repo_index import RepoIndex
+from .result_cache import CACHE_DIR_ENV, CACHE_DB_NAME, CORE_DIR, connect_cache_db
+
+
+# Atributo donde ``depends_on`` guarda los patrones declarados
+DEPENDENCIES_ATTR = "__check_dependencies__"
+
+
+def depends_on(*patterns: str) -> Callable:
+    """
+    Declara los archivos (patrones glob relativos a la raíz) que lee un check.
+
+    Ejemplo::
+
+        @depends_on("README.md", "readme.md")
+        def check_documentation(repo_path, repo_index=None): ...
+
+    Args:
+        patterns: Patrones glob con soporte para ``**`` (ver ``RepoIndex.glob``)
+
+    Returns:
+        Decorador que registra los patrones sin modificar la función
+    """
+    def decorator(func: Callable) -> Callable:
+        setattr(func, DEPENDENCIES_ATTR, tuple(patterns))
+        return func
+    return decorator
+
+
+def get_check_dependencies(check_function: Callable) -> Optional[Tuple[str, ...]]:
+    """Retorna los patrones declarados por un check, o None si no declaró ninguno"""
+    return getattr(check_function, DEPENDENCIES_ATTR, None)
+
+
+def get_check_id(check_function: Callable) -> str:
+    """Identificador estable de un check (ruta del módulo + nombre)"""
+    source_file = inspect.getsourcefile(check_function) or check_function.__module__
+    try:
+        source_file = str(Path(source_file).resolve().relative_to(CORE_DIR.parent))
+    except ValueError:
+        pass
+    return f"{source_file}:{check_function.__qualname__}"
+
+
+def compute_check_fingerprint(check_function: Callable) -> str:
+    """
+    Huella del código de un check: el archivo fuente de su módulo y los de ``core``.
+
+    Args:
+        check_function: Función del check
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    digest = hashlib.sha256()
+    sources = sorted(CORE_DIR.glob("*.py"))
+    source_file = inspect.getsourcefile(check_function)
+    if source_file:
+        sources.insert(0, Path(source_file))
+
+    for path in sources:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def hash_dependencies(patterns: Tuple[str, ...], repo_index: RepoIndex) -> Dict[str, str]:
+    """
+    Calcula el hash de cada archivo que coincide con los patrones declarados.
+
+    Args:
+        patterns: Patrones glob declarados por el check
+        repo_index: Índice del repositorio del estudiante
+
+    Returns:
+        Dict ruta relativa -> SHA-256 del contenido
+    """
+    hashes = {}
+    for pattern in patterns:
+        for path in repo_index.glob(pattern):
+            rel_path = path.relative_to(repo_index.repo_path).as_posix()
+            if rel_path not in hashes:
+                try:
+                    hashes[rel_path] = hashlib.sha256(path.read_bytes()).hexdigest()
+                except OSError:
+                    hashes[rel_path] = "<unreadable>"
+    return dict(sorted(hashes.items()))
+
+
+class CheckCache:
+    """
+    Resultados de checks individuales en la misma base SQLite que ``ResultCache``.
+
+    Se guarda el último resultado de cada check por repositorio junto con el
+    hash de cada archivo del que depende.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Inicializa la caché y crea la tabla si no existe.
+
+        Args:
+            cache_dir: Directorio de la caché (compartido con ResultCache)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / CACHE_DB_NAME
+
+        with connect_cache_db(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS check_results (
+                    repo_path TEXT NOT NULL,
+                    check_id TEXT NOT NULL,
+                    check_fingerprint TEXT NOT NULL,
+                    file_hashes TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (repo_path, check_id)
+                )
+            """)
+
+    def get(self, repo_path: str, check_id: str, check_fingerprint: str,
+            file_hashes: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Busca el resultado anterior de un check.
+
+        Args:
+            repo_path: Ruta del repositorio del estudiante
+            check_id: Identificador del check
+            check_fingerprint: Huella actual del código del check
+            file_hashes: Hashes actuales de sus archivos dependientes
+
+        Returns:
+            Resultado guardado si nada cambió, None en otro caso
+        """
+        with connect_cache_db(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT check_fingerprint, file_hashes, result FROM check_results "
+                "WHERE repo_path = ? AND check_id = ?",
+                (repo_path, check_id)
+            ).fetchone()
+
+        if row is None or row[0] != check_fingerprint or json.loads(row[1]) != file_hashes:
+            return None
+        return json.loads(row[2])
+
+    def put(self, repo_path: str, check_id: str, check_fingerprint: str,
+            file_hashes: Dict[str, str], result: Dict[str, Any]) -> bool:
+        """
+        Guarda el resultado de un check.
+
+        Solo se guardan resultados que sobreviven intactos a la serialización
+        JSON, para que la reutilización sea indistinguible de una ejecución nueva.
+
+        Returns:
+            True si el resultado se guardó
+        """
+        try:
+            payload = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False
+        if json.loads(payload) != result:
+            return False
+
+        with connect_cache_db(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO check_results VALUES (?, ?, ?, ?, ?, ?)",
+                (repo_path, check_id, check_fingerprint, json.dumps(file_hashes),
+                 payload, datetime.now().isoformat())
+            )
+        return True
+
+
+def get_default_check_cache() -> Optional[CheckCache]:
+    """
+    Obtiene la caché de checks configurada por entorno.
+
+    Returns:
+        CheckCache en ``$FASTAPI_EVALUATOR_CACHE_DIR`` o None si no está activada
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return CheckCache(cache_dir)
@@ -0,0 +1,232 @@
+"""
+Resolución precompilada de checks de criteria.yaml a resultados.
+Cada evaluador declara cómo se obtiene cada check (``CHECK_MAPPINGS``); el
+resolver compila esas reglas una sola vez por semana y responde cada consulta
+con un acceso directo, sin reconstruir mapeos ni recorrer todo ``results``.
+"""
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Callable, Iterable, Optional, Union
+
+from .criteria_bundle import load_criteria
+
+
+# Una regla es una ruta (tupla de claves) o un dict creado con los helpers de abajo
+MappingSpec = Union[Tuple[str, ...], Dict[str, Any]]
+
+
+def all_of(*paths: Tuple[str, ...]) -> Dict[str, Any]:
+    """Regla que pasa si todas las rutas tienen un valor verdadero"""
+    return {"all": [tuple(p) for p in paths]}
+
+
+def value_in(path: Tuple[str, ...], choices: Iterable[Any]) -> Dict[str, Any]:
+    """Regla que pasa si el valor en la ruta es uno de ``choices``"""
+    return {"in": tuple(path), "choices": frozenset(choices)}
+
+
+def score_above_zero(result_name: str) -> Dict[str, Any]:
+    """Regla que pasa si ``results[result_name]["score"]`` es mayor que 0"""
+    return {"score": result_name}
+
+
+def _lookup(results: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Sigue una ruta de claves; devuelve None si algún nivel no existe"""
+    value = results
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _compile_spec(spec: MappingSpec) -> Tuple[Callable[[Dict[str, Any]], bool], Tuple[str, ...]]:
+    """
+    Compila una regla a un accesor.
+
+    Returns:
+        Tupla (accesor results -> bool, claves de primer nivel que consulta)
+    """
+    if isinstance(spec, tuple):
+        path = spec
+        return (lambda r: bool(_lookup(r, path))), (path[0],)
+
+    if "all" in spec:
+        paths = spec["all"]
+        return ((lambda r: all(_lookup(r, p) for p in paths)),
+                tuple(dict.fromkeys(p[0] for p in paths)))
+
+    if "in" in spec:
+        path, choices = spec["in"], spec["choices"]
+
+        def accessor(r):
+            try:
+                return _lookup(r, path) in choices
+            except TypeError:
+                return False
+        return accessor, (path[0],)
+
+    if "score" in spec:
+        name = spec["score"]
+
+        def accessor(r):
+            try:
+                return (_lookup(r, (name, "score")) or 0) > 0
+            except TypeError:
+                return False
+        return accessor, (name,)
+
+    raise ValueError(f"Regla de check no soportada: {spec!r}")
+
+
+def flatten_results(results: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Aplana ``results`` en un índice clave -> valor.
+
+    Reproduce la prioridad de la antigua búsqueda recursiva: las claves de un
+    dict ganan sobre las de sus descendientes, y entre hermanos gana el primero.
+
+    Args:
+        results: Resultados de la evaluación
+
+    Returns:
+        Tupla (índice clave -> valor, número de apariciones de cada clave)
+    """
+    occurrences: Dict[str, int] = {}
+
+    def flatten(obj: Dict[str, Any]) -> Dict[str, Any]:
+        index: Dict[str, Any] = {}
+        for value in reversed(list(obj.values())):
+            if isinstance(value, dict):
+                index.update(flatten(value))
+        for key in obj:
+            occurrences[key] = occurrences.get(key, 0) + 1
+        index.update(obj)
+        return index
+
+    return flatten(results), occurrences
+
+
+class CheckResolver:
+    """
+    Resolver compilado para los checks de una semana.
+
+    Los checks con regla explícita se resuelven con su accesor. Los demás se
+    buscan por nombre en el índice aplanado de ``results`` (ver
+    ``flatten_results``); si el nombre no aparece o aparece en varios lugares
+    se registra en ``issues``. El resolver no guarda estado de ninguna
+    evaluación, por lo que se comparte entre instancias e hilos.
+    """
+
+    def __init__(self, check_names: Iterable[str], mappings: Dict[str, MappingSpec]):
+        """
+        Compila las reglas de los checks.
+
+        Args:
+            check_names: Nombres de checks definidos en criteria.yaml
+            mappings: Reglas disponibles (nombre -> regla)
+        """
+        self.check_names = list(dict.fromkeys(check_names))
+        self._accessors: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+        self._sources: Dict[str, Tuple[str, ...]] = {}
+
+        for name, spec in mappings.items():
+            self._accessors[name], self._sources[name] = _compile_spec(spec)
+
+        # Checks de criteria.yaml sin regla: se resuelven por nombre
+        self.unmapped = [name for name in self.check_names if name not in self._accessors]
+
+    def resolve(self, check_name: str, results: Dict[str, Any],
+                index: Optional[Tuple[Dict[str, Any], Dict[str, int]]] = None,
+                issues: Optional[Dict[str, List[str]]] = None) -> bool:
+        """
+        Resuelve si un check pasó.
+
+        Args:
+            check_name: Nombre del check en criteria.yaml
+            results: Resultados de la evaluación
+            index: Resultado de ``flatten_results(results)`` ya calculado
+                (se calcula si hace falta y no se indica)
+            issues: Dict ``{"missing": [...], "ambiguous": [...]}`` donde se
+                registran los checks sin resultado o con varios candidatos
+
+        Returns:
+            True si el check pasó
+        """
+        accessor = self._accessors.get(check_name)
+        if accessor is not None:
+            return accessor(results)
+
+        flat, occurrences = index if index is not None else flatten_results(results)
+        if check_name not in flat:
+            if issues is not None and check_name not in issues["missing"]:
+                issues["missing"].append(check_name)
+            return False
+
+        if occurrences.get(check_name, 0) > 1 and issues is not None \
+                and check_name not in issues["ambiguous"]:
+            issues["ambiguous"].append(check_name)
+        return bool(flat[check_name])
+
+    def sources(self, check_name: str) -> Tuple[str, ...]:
+        """Claves de primer nivel de ``results`` que determinan un check"""
+        return self._sources.get(check_name, (check_name,))
+
+
+_RESOLVERS: Dict[tuple, CheckResolver] = {}
+_RESOLVERS_LOCK = threading.Lock()
+
+
+def collect_check_mappings(evaluator_class: type) -> Dict[str, MappingSpec]:
+    """
+    Reúne ``CHECK_MAPPINGS`` de la jerarquía de un evaluador.
+
+    Las reglas de una subclase reemplazan a las de sus clases base.
+    """
+    mappings: Dict[str, MappingSpec] = {}
+    for klass in reversed(evaluator_class.__mro__):
+        mappings.update(klass.__dict__.get("CHECK_MAPPINGS", {}))
+    return mappings
+
+
+def get_check_resolver(evaluator_class: type, criteria_file: Union[str, Path],
+                       criteria: Optional[Dict[str, Any]] = None) -> CheckResolver:
+    """
+    Obtiene el resolver compilado de un evaluador, cacheado por proceso.
+
+    La caché se indexa por clase, ruta y fecha de modificación de
+    criteria.yaml, así que editar la rúbrica recompila el resolver.
+
+    Args:
+        evaluator_class: Clase del evaluador
+        criteria_file: Ruta a criteria.yaml
+        criteria: Criterios ya cargados (evita volver a leer el archivo)
+
+    Returns:
+        CheckResolver de la semana
+    """
+    criteria_file = Path(criteria_file)
+    try:
+        mtime = criteria_file.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (evaluator_class, str(criteria_file), mtime)
+
+    with _RESOLVERS_LOCK:
+        resolver = _RESOLVERS.get(key)
+    if resolver is not None:
+        return resolver
+
+    if criteria is None:
+        criteria = load_criteria(criteria_file) or {}
+
+    check_names = [
+        check.get('name')
+        for category in criteria.get('categories', {}).values()
+        for check in category.get('checks', [])
+        if check.get('name')
+    ]
+    resolver = CheckResolver(check_names, collect_check_mappings(evaluator_class))
+
+    with _RESOLVERS_LOCK:
+        return _RESOLVERS.setdefault(key, resolver)
@@ -8,20 +8,24 @@ import importlib.util
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
+from .repo_index import RepoIndex
+
 
 class CommonChecks:
     """
     Clase que encapsula checks comunes reutilizables entre semanas.
     """
     
-    def __init__(self, repo_path: Union[str, Path]):
+    def __init__(self, repo_path: Union[str, Path], repo_index: Optional[RepoIndex] = None):
         """
         Inicializa los checks comunes.
         
         Args:
             repo_path: Ruta al repositorio del estudiante
+            repo_index: Índice compartido; sus lecturas pasan por la caché de contenido
         """
         self.repo_path = Path(repo_path).resolve()
+        self.repo_index = repo_index if repo_index is not None else RepoIndex(self.repo_path)
     
     # === FILE STRUCTURE CHECKS ===
     
@@ -78,7 +82,7 @@ class CommonChecks:
             }
         
         try:
-            content = req_file.read_text(encoding="utf-8", errors="ignore")
+            content = self.repo_index.read_text(req_file)
             lines = [line.strip() for line in content.splitlines() if line.strip() and not line.startswith("#")]
             
             packages = []
@@ -184,30 +188,31 @@ class CommonChecks:
             }
         
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            compile(content, str(full_path), 'exec')
-            
-            return {
-                "file_exists": True,
-                "syntax_valid": True,
-                "line_count": len(content.splitlines()),
-                "character_count": len(content)
-            }
-            
-        except SyntaxError as e:
+            content = self.repo_index.read_text(full_path)
+            parsed = self.repo_index.parse_result(full_path)
+        except Exception as e:
             return {
                 "file_exists": True,
                 "syntax_valid": False,
-                "error": f"Syntax error: {e}",
-                "line_number": e.lineno,
-                "column": e.offset
+                "error": f"Error reading file: {e}"
             }
-        except Exception as e:
+        
+        error = parsed["error"]
+        if error is not None:
             return {
                 "file_exists": True,
                 "syntax_valid": False,
-                "error": f"Error reading file: {e}"
+                "error": f"Syntax error: {error['description']}",
+                "line_number": error["line_number"],
+                "column": error["column"]
             }
+        
+        return {
+            "file_exists": True,
+            "syntax_valid": True,
+            "line_count": len(content.splitlines()),
+            "character_count": len(content)
+        }
     
     def check_imports_in_file(self, file_path: str, expected_imports: List[str]) -> Dict[str, bool]:
         """
@@ -226,7 +231,7 @@ class CommonChecks:
             return {import_name: False for import_name in expected_imports}
         
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
+            content = self.repo_index.read_text(full_path)
             content_lower = content.lower()
             
             results = {}
@@ -263,7 +268,7 @@ class CommonChecks:
             return False
         
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
+            content = self.repo_index.read_text(full_path)
             
             # Buscar definiciones de clase o función
             patterns = [
@@ -300,7 +305,7 @@ class CommonChecks:
             }
         
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
+            content = self.repo_index.read_text(full_path)
             
             # Verificar import de FastAPI
             has_fastapi_import = any(
@@ -384,7 +389,7 @@ class CommonChecks:
             }
         
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
+            content = self.repo_index.read_text(full_path)
             content_lower = content.lower()
             
             # Análisis de contenido
@@ -462,7 +467,7 @@ class CommonChecks:
         dockerfile_path = self.repo_path / "Dockerfile"
         
         try:
-            content = dockerfile_path.read_text(encoding="utf-8", errors="ignore")
+            content = self.repo_index.read_text(dockerfile_path)
             content_lower = content.lower()
             
             return {
@@ -491,7 +496,7 @@ class CommonChecks:
             compose_path = self.repo_path / compose_file
             if compose_path.exists():
                 try:
-                    content = compose_path.read_text(encoding="utf-8", errors="ignore")
+                    content = self.repo_index.read_text(compose_path)
                     content_lower = content.lower()
                     
                     return {
@@ -553,14 +558,16 @@ class CommonChecks:
 
 
 # Factory function para facilitar el uso
-def create_common_checks(repo_path: Union[str, Path]) -> CommonChecks:
+def create_common_checks(repo_path: Union[str, Path],
+                         repo_index: Optional[RepoIndex] = None) -> CommonChecks:
     """
     Factory function para crear una instancia de CommonChecks.
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Instancia configurada de CommonChecks
     """
-    return CommonChecks(repo_path)
+    return CommonChecks(repo_path, repo_index)
@@ -0,0 +1,128 @@
+"""
+Caché de contenido de archivos para una evaluación.
+Cada archivo se lee y decodifica una sola vez; todos los checks reciben el mismo texto.
+"""
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Union
+
+
+# Límites por defecto de la caché
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024   # Total retenido en memoria
+DEFAULT_MAX_FILE_BYTES = 4 * 1024 * 1024     # Archivos mayores se leen pero no se retienen
+
+
+class ContentCache:
+    """
+    Caché LRU de contenido de texto con límite de tamaño.
+
+    Política de decodificación única: UTF-8 ignorando bytes inválidos, igual que
+    ``CommonChecks``. Los errores de lectura (archivo inexistente, permisos) se
+    propagan como ``OSError`` para que los checks mantengan su manejo actual.
+
+    Es segura entre hilos: si varios checks concurrentes piden el mismo archivo,
+    uno lo lee y los demás esperan y reciben ese mismo texto.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+                 max_file_bytes: int = DEFAULT_MAX_FILE_BYTES):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_bytes: Tamaño máximo total retenido (en bytes del archivo original)
+            max_file_bytes: Archivos mayores a este tamaño no se retienen
+        """
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._current_bytes = 0
+
+        # Lock por archivo mientras un hilo lo lee
+        self._loading: Dict[str, threading.Lock] = {}
+
+        # Estadísticas de uso
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.evictions = 0
+
+    def read_text(self, path: Union[str, Path]) -> str:
+        """
+        Obtiene el contenido decodificado de un archivo.
+
+        Args:
+            path: Ruta al archivo
+
+        Returns:
+            Contenido del archivo como texto
+        """
+        key = str(path)
+
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            try:
+                with self._lock:
+                    # Otro hilo pudo terminar de leerlo mientras se esperaba
+                    entry = self._lookup(key)
+                    if entry is not None:
+                        return entry
+
+                raw = Path(path).read_bytes()
+                text = raw.decode("utf-8", errors="ignore")
+                size = len(raw)
+
+                with self._lock:
+                    self.misses += 1
+                    self.bytes_read += size
+
+                    if size <= self.max_file_bytes and key not in self._entries:
+                        self._entries[key] = (text, size)
+                        self._current_bytes += size
+                        self._evict()
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+        return text
+
+    def _lookup(self, key: str):
+        """Texto retenido de ``key`` o None (requiere tener ``self._lock``)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _evict(self):
+        """Elimina las entradas menos usadas hasta respetar el límite"""
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._current_bytes -= size
+            self.evictions += 1
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        return str(path) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas de uso de la caché"""
+        return {
+            "entries": len(self._entries),
+            "cached_bytes": self._current_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes_read": self.bytes_read,
+            "evictions": self.evictions
+        }
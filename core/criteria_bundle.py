@@ -0,0 +1,231 @@
+"""
+Bundle precompilado de criterios.
+``criteria.yaml`` sigue siendo la fuente de verdad; ``compile_criteria_bundle``
+valida todas las semanas y guarda su contenido ya parseado en un pickle. Al
+cargar, cada semana del bundle se usa solo si su YAML no cambió (fecha de
+modificación y tamaño, o en su defecto el hash del contenido); si no, se
+parsea el YAML como siempre.
+"""
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+
+WEEKS_DIR = Path(__file__).parent.parent / "weeks"
+DEFAULT_BUNDLE_PATH = WEEKS_DIR / "criteria.bundle.pickle"
+
+# Versión del formato del bundle; un bundle de otra versión se ignora
+BUNDLE_FORMAT_VERSION = 1
+
+# Claves obligatorias de criteria.yaml
+REQUIRED_KEYS = ['week_info', 'categories']
+
+# Criterios ya cargados en este proceso: ruta -> (mtime_ns, tamaño, criterios serializados)
+_LOADED: Dict[str, tuple] = {}
+_BUNDLE: Dict[str, Any] = {}
+_LOCK = threading.Lock()
+
+
+def validate_criteria(criteria: Any, source: str = "criteria.yaml",
+                      week_number: Optional[int] = None) -> List[str]:
+    """
+    Valida la estructura de unos criterios.
+
+    Args:
+        criteria: Contenido parseado de criteria.yaml
+        source: Nombre del archivo para los mensajes
+        week_number: Semana esperada en ``week_info.number`` (opcional)
+
+    Returns:
+        Lista de errores (vacía si los criterios son válidos)
+    """
+    if not isinstance(criteria, dict):
+        return [f"{source}: el contenido debe ser un mapeo"]
+
+    errors = [f"Missing required key '{key}' in {source}" for key in REQUIRED_KEYS if key not in criteria]
+    if errors:
+        return errors
+
+    week_info = criteria['week_info']
+    if week_number is not None and isinstance(week_info, dict) and week_info.get('number') != week_number:
+        errors.append(f"{source}: week_info.number es {week_info.get('number')}, se esperaba {week_number}")
+
+    categories = criteria['categories']
+    if not isinstance(categories, dict) or not categories:
+        return errors + [f"{source}: 'categories' debe ser un mapeo no vacío"]
+
+    seen_checks = set()
+    for category_name, category in categories.items():
+        if not isinstance(category, dict):
+            errors.append(f"{source}: la categoría '{category_name}' debe ser un mapeo")
+            continue
+        if not isinstance(category.get('weight', 0), (int, float)):
+            errors.append(f"{source}: 'weight' de '{category_name}' debe ser numérico")
+        checks = category.get('checks', [])
+        if not isinstance(checks, list):
+            errors.append(f"{source}: 'checks' de '{category_name}' debe ser una lista")
+            continue
+        for check in checks:
+            if not isinstance(check, dict) or not check.get('name'):
+                errors.append(f"{source}: check sin nombre en '{category_name}'")
+                continue
+            if not isinstance(check.get('points', 0), (int, float)):
+                errors.append(f"{source}: 'points' de '{check['name']}' debe ser numérico")
+            if check['name'] in seen_checks:
+                errors.append(f"{source}: el check '{check['name']}' está duplicado")
+            seen_checks.add(check['name'])
+
+    return errors
+
+
+def _file_signature(path: Path) -> tuple:
+    """Firma rápida de un archivo: (mtime_ns, tamaño)"""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_yaml(path: Path) -> Dict[str, Any]:
+    """Parsea un criteria.yaml (yaml se importa solo si hace falta)"""
+    import yaml
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in criteria file: {e}")
+
+
+def _bundle_key(path: Path) -> str:
+    """Clave de una semana en el bundle (ruta relativa a weeks/)"""
+    try:
+        return path.resolve().relative_to(WEEKS_DIR.resolve()).as_posix()
+    except ValueError:
+        return str(path.resolve())
+
+
+def _read_bundle(bundle_path: Path) -> Dict[str, Any]:
+    """Lee el bundle una vez por proceso; un bundle ausente o inválido se ignora"""
+    key = str(bundle_path)
+    with _LOCK:
+        if key in _BUNDLE:
+            return _BUNDLE[key]
+    try:
+        with open(bundle_path, 'rb') as f:
+            bundle = pickle.load(f)
+        if not isinstance(bundle, dict) or bundle.get("format_version") != BUNDLE_FORMAT_VERSION:
+            bundle = {}
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        bundle = {}
+    with _LOCK:
+        _BUNDLE[key] = bundle
+    return bundle
+
+
+def load_criteria(criteria_file: Union[str, Path],
+                  bundle_path: Union[str, Path, None] = DEFAULT_BUNDLE_PATH) -> Dict[str, Any]:
+    """
+    Carga un criteria.yaml usando el bundle precompilado cuando está vigente.
+
+    Cada llamada devuelve una copia independiente, así que los evaluadores
+    pueden modificar sus criterios sin afectar a otros.
+
+    Args:
+        criteria_file: Ruta a criteria.yaml
+        bundle_path: Bundle a consultar (None para parsear siempre el YAML)
+
+    Returns:
+        Criterios parseados
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si el YAML es inválido
+    """
+    path = Path(criteria_file)
+    signature = _file_signature(path)
+    key = str(path.resolve())
+
+    with _LOCK:
+        loaded = _LOADED.get(key)
+    if loaded is not None and loaded[:2] == signature:
+        return pickle.loads(loaded[2])
+
+    payload = None
+    if bundle_path is not None:
+        entry = _read_bundle(Path(bundle_path)).get("weeks", {}).get(_bundle_key(path))
+        if entry is not None:
+            if (entry["mtime_ns"], entry["size"]) == signature:
+                payload = entry["criteria"]
+            elif entry["size"] == signature[1] and \
+                    entry["sha256"] == hashlib.sha256(path.read_bytes()).hexdigest():
+                # El archivo se tocó (ej: checkout) pero su contenido es el mismo
+                payload = entry["criteria"]
+
+    if payload is None:
+        payload = pickle.dumps(_parse_yaml(path), protocol=pickle.HIGHEST_PROTOCOL)
+
+    with _LOCK:
+        _LOADED[key] = (*signature, payload)
+    return pickle.loads(payload)
+
+
+def compile_criteria_bundle(weeks_dir: Union[str, Path] = WEEKS_DIR,
+                            bundle_path: Union[str, Path] = DEFAULT_BUNDLE_PATH,
+                            write: bool = True) -> Dict[str, Any]:
+    """
+    Valida todos los ``weeks/*/criteria.yaml`` y escribe el bundle.
+
+    El bundle solo se escribe si todas las semanas son válidas. La escritura
+    es atómica (archivo temporal + ``os.replace``).
+
+    Args:
+        weeks_dir: Directorio ``weeks``
+        bundle_path: Ruta del bundle
+        write: False para solo validar
+
+    Returns:
+        Dict con ``weeks`` (semana -> número de checks), ``errors`` y ``written``
+    """
+    import yaml
+
+    weeks_dir = Path(weeks_dir)
+    bundle = {"format_version": BUNDLE_FORMAT_VERSION, "weeks": {}}
+    summary = {"weeks": {}, "errors": [], "written": False, "bundle_path": str(bundle_path)}
+
+    for criteria_file in sorted(weeks_dir.glob("week[0-9][0-9]/criteria.yaml")):
+        week_number = int(criteria_file.parent.name[4:])
+        source = criteria_file.relative_to(weeks_dir).as_posix()
+        try:
+            raw = criteria_file.read_bytes()
+            criteria = yaml.safe_load(raw.decode("utf-8"))
+        except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+            summary["errors"].append(f"{source}: {e}")
+            continue
+
+        errors = validate_criteria(criteria, source, week_number)
+        if errors:
+            summary["errors"].extend(errors)
+            continue
+
+        mtime_ns, size = _file_signature(criteria_file)
+        bundle["weeks"][_bundle_key(criteria_file)] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha256": hashlib.sha256(raw).hexdigest(),
+            "criteria": pickle.dumps(criteria, protocol=pickle.HIGHEST_PROTOCOL)
+        }
+        summary["weeks"][week_number] = sum(len(c.get('checks', [])) for c in criteria['categories'].values())
+
+    if write and not summary["errors"]:
+        bundle_path = Path(bundle_path)
+        tmp_path = bundle_path.with_name(f".{bundle_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, bundle_path)
+        with _LOCK:
+            _BUNDLE.pop(str(bundle_path), None)
+        summary["written"] = True
+
+    return summary
@@ -0,0 +1,531 @@
+"""
+Daemon de evaluación de larga duración.
+Mantiene un pool de procesos con los evaluadores de todas las semanas ya
+cargados (clases, criteria.yaml compilados, módulos de checks y templates) y
+recibe jobs por una API HTTP local, en TCP o en un socket Unix. Así cada
+evaluación cuesta lo que tardan sus checks, sin el arranque del intérprete
+ni los imports.
+
+API (JSON):
+- ``POST /jobs`` con ``{"repo", "week", "id"?, "format"?, "full_results"?, "wait"?, "timeout"?}``
+- ``GET /jobs/<id>``: estado y resultado de un job
+- ``GET /health``: workers, jobs en cola y semanas cargadas
+"""
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from .week_registry import WEEKS_DIR, discover_weeks, get_evaluator_class
+from .repo_fetch import fetch_repository, is_remote_repo
+from .result_cache import compute_evaluator_fingerprint
+
+
+# Variable de entorno con la URL del daemon (http://host:puerto o unix:///ruta.sock)
+DAEMON_ENV = "FASTAPI_EVALUATOR_DAEMON"
+
+DEFAULT_DAEMON_HOST = "127.0.0.1"
+DEFAULT_DAEMON_PORT = 8765
+
+# Jobs aceptados sin terminar; por encima el daemon responde 503
+DEFAULT_MAX_QUEUE = 64
+
+# Jobs terminados que se conservan para GET /jobs/<id>
+DEFAULT_RESULT_RETENTION = 1000
+
+# Espera máxima de un POST /jobs con "wait": true (segundos)
+DEFAULT_WAIT_TIMEOUT = 600
+
+# Jobs tras los cuales se reemplaza el pool de workers (equivale a
+# max_tasks_per_child, que solo existe desde Python 3.11)
+DEFAULT_RECYCLE_AFTER = 500
+
+# Huella del código que cargó este worker, por semana (None: cambió mientras se cargaba)
+_loaded_fingerprints: Dict[int, Optional[str]] = {}
+
+
+class DaemonBusyError(RuntimeError):
+    """El daemon tiene su cola llena"""
+
+
+class StaleEvaluatorError(RuntimeError):
+    """El código de evaluación en disco cambió desde que el worker lo cargó"""
+
+
+def _fingerprint(week: int) -> str:
+    """Huella en disco del evaluador de una semana"""
+    return compute_evaluator_fingerprint(WEEKS_DIR / f"week{week:02d}")
+
+
+def _warm_worker(weeks: List[int]):
+    """
+    Carga todo lo que necesita cada semana al arrancar un worker.
+
+    Se evalúa un repositorio vacío por semana (sin cachés persistentes) para
+    importar el evaluador y sus módulos de checks, compilar criteria.yaml, el
+    resolver de checks y el template del reporte. La huella del código se
+    toma antes y después de cargarlo: si difieren, el worker no sabe qué
+    versión cargó y rechaza los jobs de esa semana.
+    """
+    with tempfile.TemporaryDirectory(prefix="eval_warmup_") as empty_repo:
+        for week in weeks:
+            before = _fingerprint(week)
+            try:
+                evaluator = get_evaluator_class(week)(empty_repo)
+                evaluator.result_cache = None
+                evaluator.check_cache = None
+                evaluator.evaluate()
+            except Exception:
+                # El error se reporta por job al evaluar
+                pass
+            _loaded_fingerprints[week] = before if _fingerprint(week) == before else None
+
+
+def _ping() -> int:
+    """Tarea vacía usada para arrancar los workers antes del primer job"""
+    time.sleep(0.05)
+    return os.getpid()
+
+
+def evaluate_in_worker(repo_path: str, week: int, output_format: str = "json",
+                       full_results: bool = False) -> Dict[str, Any]:
+    """
+    Evalúa un repositorio dentro de un worker del daemon.
+
+    Args:
+        repo_path: Ruta local del repositorio
+        week: Semana a evaluar
+        output_format: Formato cuya política de tamaño se aplica (ver core.result_policy)
+        full_results: True para devolver el resultado sin reducir
+
+    Returns:
+        Resultado de evaluación
+
+    Raises:
+        StaleEvaluatorError: Si el código en disco ya no es el que cargó el worker
+    """
+    loaded = _loaded_fingerprints.get(week)
+    if loaded is None or _fingerprint(week) != loaded:
+        raise StaleEvaluatorError(f"El evaluador de la semana {week} cambió desde que se cargó el worker")
+    evaluator = get_evaluator_class(week)(repo_path)
+    # Los resultados se guardan con la huella del código cargado, no con la del disco
+    evaluator.evaluator_fingerprint = loaded
+    result = evaluator.evaluate()
+    if not full_results:
+        result = evaluator.apply_result_policy(result, output_format)
+    return result
+
+
+class EvaluationDaemon:
+    """
+    Pool de evaluación caliente con una cola acotada de jobs.
+
+    Cada job pasa por un hilo de despacho (a lo sumo ``workers`` a la vez) que
+    descarga el repositorio si es una URL, lo evalúa en el pool de procesos y
+    limpia el clon. Los jobs aceptados que aún no terminaron nunca superan
+    ``max_queue``.
+
+    El pool se reemplaza por uno nuevo (los workers viejos terminan sus jobs
+    en curso y salen) cuando se rompe (un worker murió), cuando el código de
+    evaluación en disco cambió, cuando un job dejó checks abandonados por
+    exceder su tiempo (sus hilos siguen vivos en el worker) y cada
+    ``recycle_after`` jobs.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: int = DEFAULT_MAX_QUEUE,
+                 weeks: Optional[List[int]] = None, mirror_cache=None,
+                 result_retention: int = DEFAULT_RESULT_RETENTION,
+                 recycle_after: int = DEFAULT_RECYCLE_AFTER):
+        """
+        Inicializa el daemon (los workers arrancan con ``start``).
+
+        Args:
+            workers: Procesos de evaluación (default: ``os.cpu_count()``)
+            max_queue: Jobs sin terminar aceptados como máximo
+            weeks: Semanas a precargar (default: todas las descubiertas)
+            mirror_cache: MirrorCache para los repos remotos (opcional)
+            result_retention: Jobs terminados que se conservan
+            recycle_after: Jobs evaluados por un pool antes de reemplazarlo
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.weeks = sorted(weeks) if weeks is not None else sorted(discover_weeks())
+        self.mirror_cache = mirror_cache
+        self.result_retention = result_retention
+        self.recycle_after = recycle_after
+
+        self.started_at: Optional[float] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_jobs = 0
+        self._recycled = 0
+        self._pool_lock = threading.Lock()
+        self._dispatch: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._done_events: Dict[str, threading.Event] = {}
+        self._pending = 0
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    def _create_pool(self) -> Tuple[ProcessPoolExecutor, List[Future]]:
+        """
+        Crea un pool y arranca sus workers (precargan las semanas al iniciar).
+
+        Returns:
+            Tupla (pool, tareas vacías que terminan cuando cada worker está listo)
+        """
+        # Igual que en el modo por lotes, los workers no se crean con fork
+        mp_context = multiprocessing.get_context("forkserver") \
+            if "forkserver" in multiprocessing.get_all_start_methods() else None
+        pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp_context,
+                                   initializer=_warm_worker, initargs=(self.weeks,))
+        return pool, [pool.submit(_ping) for _ in range(self.workers)]
+
+    def start(self) -> "EvaluationDaemon":
+        """Arranca los workers y espera a que todos hayan precargado las semanas"""
+        self._pool, warming = self._create_pool()
+        self._dispatch = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="daemon-job")
+        for future in warming:
+            future.result()
+        self.started_at = time.time()
+        return self
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor):
+        """
+        Reemplaza ``pool`` por uno nuevo si sigue siendo el actual.
+
+        El pool viejo no acepta más jobs; sus workers terminan los que tienen
+        en curso y salen (los hilos de checks abandonados son daemon).
+        """
+        with self._pool_lock:
+            if self._pool is not pool:
+                return
+            self._pool, _ = self._create_pool()
+            self._pool_jobs = 0
+            self._recycled += 1
+        pool.shutdown(wait=False)
+
+    def _evaluate(self, path: str, week: int, output_format: str, full_results: bool) -> Dict[str, Any]:
+        """
+        Evalúa un repositorio en el pool, reemplazándolo si hace falta.
+
+        Un pool roto o con código desactualizado se reemplaza y el job se
+        reintenta una vez en el nuevo.
+        """
+        for attempt in range(2):
+            try:
+                with self._pool_lock:
+                    pool = self._pool
+                    future = pool.submit(evaluate_in_worker, path, week, output_format, full_results)
+                result = future.result()
+            except (BrokenProcessPool, StaleEvaluatorError):
+                self._recycle_pool(pool)
+                if attempt:
+                    raise
+                continue
+
+            with self._pool_lock:
+                self._pool_jobs += 1
+                recycle = self._pool_jobs >= self.recycle_after
+            if recycle or result.get("timed_out"):
+                self._recycle_pool(pool)
+            return result
+
+    def submit(self, repo: str, week: int, job_id: Optional[str] = None,
+               output_format: str = "json", full_results: bool = False) -> Dict[str, Any]:
+        """
+        Encola un job.
+
+        Args:
+            repo: Ruta local o URL git del repositorio
+            week: Semana a evaluar
+            job_id: Identificador del job (default: uno aleatorio)
+            output_format: Formato cuya política de tamaño se aplica al resultado
+            full_results: True para no reducir el resultado
+
+        Returns:
+            Estado del job recién encolado
+
+        Raises:
+            ValueError: Si la semana no está cargada o el repositorio local no existe
+            DaemonBusyError: Si la cola está llena
+        """
+        if self._dispatch is None:
+            raise RuntimeError("El daemon no está iniciado")
+        if week not in self.weeks:
+            raise ValueError(f"Semana {week} no está disponible")
+        if not is_remote_repo(repo) and not Path(repo).is_dir():
+            raise ValueError(f"El repositorio {repo} no existe")
+
+        job = {
+            "id": job_id or uuid.uuid4().hex,
+            "repo": repo,
+            "week": week,
+            "status": "queued",
+            "submitted_at": time.time()
+        }
+        with self._lock:
+            if self._pending >= self.max_queue:
+                raise DaemonBusyError(f"Cola llena ({self.max_queue} jobs pendientes)")
+            if job["id"] in self._done_events:
+                raise ValueError(f"Ya existe un job con id {job['id']}")
+            self._pending += 1
+            self._jobs[job["id"]] = job
+            self._done_events[job["id"]] = threading.Event()
+
+        self._dispatch.submit(self._run_job, job, output_format, full_results)
+        return dict(job)
+
+    def _run_job(self, job: Dict[str, Any], output_format: str, full_results: bool):
+        """Descarga (si hace falta), evalúa y limpia un job en un hilo de despacho"""
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        cleanup = None
+        try:
+            path = job["repo"]
+            if is_remote_repo(path):
+                path, cleanup = fetch_repository(path, self.mirror_cache)
+            job["result"] = self._evaluate(str(Path(path).resolve()), job["week"], output_format, full_results)
+            job["status"] = "done"
+        except Exception as e:
+            job["status"] = "error"
+            job["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            if cleanup is not None:
+                cleanup()
+            job["finished_at"] = time.time()
+            job["wall_seconds"] = round(job["finished_at"] - job["started_at"], 3)
+            self._finish(job["id"])
+
+    def _finish(self, job_id: str):
+        """Marca un job como terminado y descarta los más antiguos si excede la retención"""
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._done_events[job_id].set()
+            finished = [key for key, job in self._jobs.items() if job["status"] in ("done", "error")]
+            for key in finished[:max(0, len(finished) - self.result_retention)]:
+                del self._jobs[key]
+                del self._done_events[key]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Estado (y resultado si terminó) de un job, o None si no existe"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Espera a que termine un job.
+
+        Args:
+            job_id: Identificador del job
+            timeout: Segundos máximos de espera (None: sin límite)
+
+        Returns:
+            Estado del job (``status`` sigue en queued/running si venció el plazo),
+            o None si no existe
+        """
+        with self._lock:
+            event = self._done_events.get(job_id)
+        if event is None:
+            return None
+        event.wait(timeout)
+        return self.get(job_id)
+
+    def health(self) -> Dict[str, Any]:
+        """Estado general del daemon"""
+        with self._lock:
+            return {
+                "status": "ok" if self._pool is not None else "stopped",
+                "workers": self.workers,
+                "weeks": self.weeks,
+                "pending": self._pending,
+                "completed": self._completed,
+                "max_queue": self.max_queue,
+                "recycled": self._recycled,
+                "uptime_seconds": round(time.time() - self.started_at, 3) if self.started_at else 0
+            }
+
+    def shutdown(self):
+        """Detiene el daemon esperando los jobs en curso"""
+        if self._dispatch is not None:
+            self._dispatch.shutdown(wait=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        self._dispatch = self._pool = None
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """Handler HTTP de la API de jobs"""
+
+    server_version = "FastAPIEvaluatorDaemon/1.0"
+
+    @property
+    def daemon(self) -> EvaluationDaemon:
+        return self.server.daemon
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, self.daemon.health())
+        elif self.path.startswith("/jobs/"):
+            job = self.daemon.get(self.path[len("/jobs/"):])
+            if job is None:
+                self._send_json(404, {"error": "Job no encontrado"})
+            else:
+                self._send_json(200, job)
+        else:
+            self._send_json(404, {"error": f"Ruta no encontrada: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/jobs":
+            self._send_json(404, {"error": f"Ruta no encontrada: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            job = self.daemon.submit(
+                str(request["repo"]), int(request["week"]), request.get("id"),
+                request.get("format", "json"), bool(request.get("full_results", False))
+            )
+        except DaemonBusyError as e:
+            self._send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+            return
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {"error": f"Job inválido: {e}"})
+            return
+
+        if not request.get("wait", True):
+            self._send_json(202, job)
+            return
+        job = self.daemon.wait(job["id"], float(request.get("timeout", DEFAULT_WAIT_TIMEOUT)))
+        self._send_json(200 if job["status"] in ("done", "error") else 202, job)
+
+    def address_string(self) -> str:
+        # En un socket Unix client_address es una cadena vacía
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """Servidor HTTP sobre un socket Unix"""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        UnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = "localhost", 0
+
+
+def create_daemon_server(daemon: EvaluationDaemon, host: str = DEFAULT_DAEMON_HOST,
+                         port: int = DEFAULT_DAEMON_PORT, socket_path: Optional[str] = None,
+                         verbose: bool = False):
+    """
+    Crea el servidor HTTP del daemon (se atiende con ``serve_forever``).
+
+    Args:
+        daemon: Daemon ya iniciado
+        host: Interfaz TCP (solo si no se indica ``socket_path``)
+        port: Puerto TCP (0: uno libre)
+        socket_path: Socket Unix donde escuchar en lugar de TCP
+        verbose: True para registrar cada request en stderr
+
+    Returns:
+        Servidor (``ThreadingHTTPServer`` o servidor de socket Unix)
+    """
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixHTTPServer(socket_path, _DaemonRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _DaemonRequestHandler)
+    server.daemon = daemon
+    server.verbose = verbose
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection sobre un socket Unix"""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def _connect(daemon_url: str, timeout: Optional[float]) -> http.client.HTTPConnection:
+    """Conexión a ``http://host:puerto`` o ``unix:///ruta.sock``"""
+    parsed = urlparse(daemon_url)
+    if parsed.scheme == "unix":
+        return _UnixHTTPConnection(parsed.path, timeout)
+    if parsed.scheme != "http":
+        raise ValueError(f"URL de daemon no soportada: {daemon_url}")
+    return http.client.HTTPConnection(parsed.hostname, parsed.port or DEFAULT_DAEMON_PORT, timeout=timeout)
+
+
+def submit_job(daemon_url: str, repo: Union[str, Path], week: int, output_format: str = "json",
+               full_results: bool = False, timeout: float = DEFAULT_WAIT_TIMEOUT) -> Dict[str, Any]:
+    """
+    Envía un job al daemon y espera su resultado.
+
+    Args:
+        daemon_url: ``http://host:puerto`` o ``unix:///ruta.sock``
+        repo: Ruta local (se envía absoluta) o URL git del repositorio
+        week: Semana a evaluar
+        output_format: Formato cuya política de tamaño aplica el daemon
+        full_results: True para recibir el resultado sin reducir
+        timeout: Segundos máximos de espera
+
+    Returns:
+        Resultado de evaluación
+
+    Raises:
+        RuntimeError: Si el daemon rechaza el job o la evaluación falla
+    """
+    repo = str(repo) if is_remote_repo(str(repo)) else str(Path(repo).resolve())
+    payload = json.dumps({"repo": repo, "week": week, "format": output_format,
+                          "full_results": full_results, "wait": True, "timeout": timeout})
+    # El socket espera un poco más que el daemon, que responde 202 al vencer el plazo
+    connection = _connect(daemon_url, timeout + 10)
+    try:
+        connection.request("POST", "/jobs", body=payload, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        body = json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise RuntimeError(f"El daemon respondió {response.status}: {body.get('error', body.get('status'))}")
+    if body.get("status") != "done":
+        raise RuntimeError(f"La evaluación falló en el daemon: {body.get('error')}")
+    return body["result"]
@@ -0,0 +1,303 @@
+"""
+Cola persistente de evaluaciones.
+Guarda en SQLite (modo WAL) los jobs pendientes, en curso y terminados de una
+evaluación por lotes. Cada job se identifica por repositorio + commit +
+semana, así que volver a encolar el mismo manifiesto no repite el trabajo ya
+hecho. Los workers toman jobs con un lease que renuevan mientras evalúan; si
+un worker muere, el lease vence y el job vuelve a estar disponible hasta
+agotar sus intentos. Varios procesos locales pueden vaciar la misma cola.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+from .repo_fetch import parse_repo_url, list_remote_heads, resolve_branch, is_remote_repo
+
+
+# Segundos que un worker retiene un job sin renovar el lease
+DEFAULT_LEASE_SECONDS = 60
+
+# Tiempo máximo que un worker renueva el lease de un mismo intento (descarga y
+# evaluación, acotada por su propio presupuesto); después el job se da por colgado
+DEFAULT_MAX_LEASE_LIFETIME = 900
+
+# Intentos por job (incluye los interrumpidos por la caída de un worker)
+DEFAULT_MAX_ATTEMPTS = 3
+
+JOB_STATUSES = ("pending", "running", "done", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    week INTEGER NOT NULL,
+    commit_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    record TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claimable ON jobs (status, lease_expires);
+"""
+
+
+def compute_job_key(repo: str, commit_id: str, week: int) -> str:
+    """Clave idempotente de un job (repositorio + commit + semana)"""
+    return hashlib.sha256(f"{repo}\0{commit_id}\0{week}".encode("utf-8")).hexdigest()
+
+
+def resolve_commit(repo: str) -> str:
+    """
+    Identifica la versión del repositorio a evaluar.
+
+    Para una URL git es el commit del branch que se descargaría (una sola
+    consulta ``ls-remote``); para una ruta local es la clave de contenido de
+    la caché de resultados (árbol git o hash de los archivos).
+
+    Args:
+        repo: Ruta local o URL git (puede incluir ``/tree/<branch>/<carpeta>``)
+
+    Returns:
+        Identificador de la versión, o "" si no se pudo resolver (la clave
+        queda determinada solo por repositorio y semana)
+    """
+    try:
+        if is_remote_repo(repo):
+            base_repo_url, tree_path = parse_repo_url(repo)
+            default_branch, heads = list_remote_heads(base_repo_url)
+            branch, _ = resolve_branch(tree_path, default_branch, list(heads))
+            return heads.get(branch, "")
+        from .result_cache import compute_repo_key
+        return compute_repo_key(repo)
+    except (OSError, RuntimeError):
+        return ""
+
+
+@contextmanager
+def _transaction(db_path: Path):
+    """
+    Transacción de escritura sobre la cola.
+
+    ``BEGIN IMMEDIATE`` toma el lock de escritura al empezar, así dos workers
+    no pueden leer el mismo job disponible y luego tomarlo los dos.
+    """
+    conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+class JobQueue:
+    """
+    Cola de jobs de evaluación en un archivo SQLite.
+
+    Estados: ``pending`` -> ``running`` (con lease) -> ``done`` o ``failed``.
+    Un job ``running`` cuyo lease venció se considera de un worker caído y
+    se puede volver a tomar; si ya agotó sus intentos pasa a ``failed``.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Abre (o crea) la cola.
+
+        Args:
+            db_path: Archivo SQLite de la cola
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with _transaction(self.db_path) as conn:
+            # executescript confirmaría la transacción abierta: se ejecuta sentencia por sentencia
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+
+    def enqueue(self, job: Dict[str, Any], commit_id: Optional[str] = None,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> str:
+        """
+        Agrega un job si no existe otro con la misma clave.
+
+        Args:
+            job: Job con claves ``id``, ``repo`` y ``week`` (ver ``load_manifest``)
+            commit_id: Versión del repositorio (default: ``resolve_commit(job["repo"])``)
+            max_attempts: Intentos antes de marcarlo como fallido
+
+        Returns:
+            Clave del job (nuevo o existente)
+        """
+        if commit_id is None:
+            commit_id = resolve_commit(job["repo"])
+        key = compute_job_key(job["repo"], commit_id, job["week"])
+        now = time.time()
+        with _transaction(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs (key, id, repo, week, commit_id, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, str(job["id"]), job["repo"], int(job["week"]), commit_id, max_attempts, now, now)
+            )
+        return key
+
+    def claim(self, owner: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Dict[str, Any]]:
+        """
+        Toma el job disponible más antiguo.
+
+        Args:
+            owner: Identificador del worker (ej: ``"host:pid"``)
+            lease_seconds: Duración del lease
+
+        Returns:
+            Job (``key``, ``id``, ``repo``, ``week``, ``commit_id``, ``attempts``) o None si no hay
+        """
+        now = time.time()
+        with _transaction(self.db_path) as conn:
+            # Jobs de workers caídos que ya no tienen intentos
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', lease_owner = NULL, updated_at = ?, "
+                "error = COALESCE(error, 'Lease vencido sin terminar') "
+                "WHERE status = 'running' AND lease_expires < ? AND attempts >= max_attempts",
+                (now, now)
+            )
+            row = conn.execute(
+                "SELECT key FROM jobs WHERE status = 'pending' OR (status = 'running' AND lease_expires < ?) "
+                "ORDER BY created_at, rowid LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_owner = ?, "
+                "lease_expires = ?, updated_at = ? WHERE key = ?",
+                (owner, now + lease_seconds, now, row["key"])
+            )
+            job = conn.execute(
+                "SELECT key, id, repo, week, commit_id, attempts FROM jobs WHERE key = ?", (row["key"],)
+            ).fetchone()
+        return dict(job)
+
+    def renew(self, key: str, owner: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """
+        Extiende el lease de un job en curso.
+
+        Returns:
+            False si el job ya no pertenece a ``owner`` (venció y lo tomó otro worker)
+        """
+        now = time.time()
+        with _transaction(self.db_path) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE key = ? AND lease_owner = ? AND status = 'running'",
+                (now + lease_seconds, now, key, owner)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, key: str, owner: str, record: Dict[str, Any]) -> bool:
+        """
+        Marca un job como terminado y guarda su registro.
+
+        Returns:
+            False si el job ya no pertenece a ``owner`` (el registro se descarta)
+        """
+        return self._finish(key, owner, "done", record, None)
+
+    def fail(self, key: str, owner: str, error: str, record: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Registra un intento fallido: el job vuelve a ``pending`` o, si agotó
+        sus intentos, queda ``failed`` con el último registro.
+
+        Returns:
+            False si el job ya no pertenece a ``owner``
+        """
+        return self._finish(key, owner, None, record, error)
+
+    def _finish(self, key: str, owner: str, status: Optional[str],
+                record: Optional[Dict[str, Any]], error: Optional[str]) -> bool:
+        now = time.time()
+        status_sql = "?" if status else "CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'pending' END"
+        params = ([status] if status else []) + [
+            json.dumps(record, ensure_ascii=False) if record is not None else None, error, now, key, owner
+        ]
+        with _transaction(self.db_path) as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = {status_sql}, record = ?, error = ?, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE key = ? AND lease_owner = ? AND status = 'running'",
+                params
+            )
+            return cursor.rowcount == 1
+
+    def has_unfinished(self) -> bool:
+        """True si quedan jobs pendientes o en curso"""
+        with _transaction(self.db_path) as conn:
+            row = conn.execute("SELECT 1 FROM jobs WHERE status IN ('pending', 'running') LIMIT 1").fetchone()
+        return row is not None
+
+    def counts(self) -> Dict[str, int]:
+        """Número de jobs por estado"""
+        with _transaction(self.db_path) as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Estado de un job.
+
+        Returns:
+            Job con ``status``, ``attempts``, ``error`` y ``record`` (dict o None), o None si no existe
+        """
+        with _transaction(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT key, id, repo, week, commit_id, status, attempts, error, record FROM jobs WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["record"] = json.loads(job["record"]) if job["record"] else None
+        return job
+
+    def requeue_failed(self) -> int:
+        """
+        Devuelve los jobs fallidos a ``pending`` con sus intentos en cero.
+
+        Returns:
+            Número de jobs reencolados
+        """
+        with _transaction(self.db_path) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'pending', attempts = 0, error = NULL, updated_at = ? "
+                "WHERE status = 'failed'",
+                (time.time(),)
+            )
+            return cursor.rowcount
+
+
+def create_job_queue(db_path: Union[str, Path]) -> JobQueue:
+    """
+    Crea (o abre) una cola de jobs.
+
+    Args:
+        db_path: Archivo SQLite de la cola
+
+    Returns:
+        JobQueue
+    """
+    return JobQueue(db_path)
@@ -0,0 +1,184 @@
+"""
+Instrumentación de evaluaciones.
+Mide cada check y cada etapa de la evaluación (tiempo real, tiempo de CPU,
+archivos leídos, bytes leídos y pico de memoria trazada) y lo expone en la
+sección ``metrics`` del resultado. Está desactivada por defecto: sin
+``$FASTAPI_EVALUATOR_METRICS`` el evaluador no crea el recorder y no hay
+ningún costo adicional.
+"""
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+
+
+# tracemalloc (y pickle, que importa) se cargan solo con la instrumentación activa
+
+# Variable de entorno que activa la instrumentación
+METRICS_ENV = "FASTAPI_EVALUATOR_METRICS"
+
+# Flags de os.open que indican escritura
+_WRITE_FLAGS = os.O_WRONLY | os.O_RDWR | os.O_APPEND | os.O_CREAT | os.O_TRUNC
+
+_local = threading.local()
+_hook_lock = threading.Lock()
+_hook_installed = False
+
+
+def _is_read_open(mode: Any, flags: Any) -> bool:
+    """True si un evento ``open`` de auditoría corresponde a una lectura"""
+    if isinstance(mode, str):
+        return not any(char in mode for char in "wax+")
+    if isinstance(flags, int):
+        return not flags & _WRITE_FLAGS
+    return True
+
+
+def _audit_hook(event: str, args: tuple):
+    """Cuenta los archivos abiertos para lectura por los scopes medidos del hilo actual"""
+    if event != "open":
+        return
+    scopes = getattr(_local, "scopes", None)
+    if not scopes:
+        return
+    path = args[0]
+    if not isinstance(path, (str, bytes, os.PathLike)) or not _is_read_open(args[1], args[2]):
+        return
+    path = os.path.abspath(os.fsdecode(path))
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return
+    for counters in scopes:
+        # Solo cuentan los archivos del repositorio (no los módulos de checks que se importan)
+        if counters["root"] and not path.startswith(counters["root"]):
+            continue
+        counters["files_read"] += 1
+        counters["bytes_read"] += size
+
+
+def _install_audit_hook():
+    """Instala el hook de auditoría una sola vez por proceso (no se puede desinstalar)"""
+    global _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+def current_scope() -> Tuple[Dict[str, Any], ...]:
+    """Scopes medidos del hilo actual, para heredarlos en un hilo de trabajo"""
+    return getattr(_local, "scopes", ())
+
+
+class MetricsRecorder:
+    """
+    Métricas de una evaluación.
+
+    Los archivos leídos se cuentan con un hook de auditoría (``open``), así
+    que incluyen tanto las lecturas de ``ContentCache`` como los ``open``
+    directos de los checks; los bytes leídos son el tamaño de esos archivos.
+    Mientras no haya un bloque medido en el hilo, el hook retorna de inmediato.
+    El pico de memoria se mide con ``tracemalloc``, que es global al proceso:
+    con métricas activas los checks se ejecutan de a uno para que cada pico
+    corresponda a un solo check. Requiere ``tracemalloc.reset_peak`` (Python
+    3.9+); en versiones anteriores el pico se reporta como 0.
+    """
+
+    def __init__(self, root: Union[str, Path, None] = None):
+        """
+        Inicializa el recorder y empieza a trazar memoria si no se estaba trazando.
+
+        Args:
+            root: Solo se cuentan las lecturas de archivos dentro de este directorio
+                (el repositorio evaluado); None cuenta todas
+        """
+        import tracemalloc
+        _install_audit_hook()
+        self.root = os.path.join(os.path.abspath(root), "") if root is not None else None
+        # Sin tracemalloc.reset_peak (Python < 3.9) no hay picos por bloque: no se traza
+        self._started_tracing = hasattr(tracemalloc, "reset_peak") and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self.checks: Dict[str, Dict[str, Any]] = {}
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def measure(self, section: str, name: str, parent_scope: Optional[Tuple[Dict[str, Any], ...]] = None):
+        """
+        Mide un bloque y guarda sus métricas en ``section`` ("checks" o "stages").
+
+        Las lecturas y el pico de memoria de los bloques anidados se suman a
+        los bloques que los contienen, incluso si se ejecutan en otro hilo
+        (``parent_scope``, obtenido con ``current_scope()`` en el hilo que lanzó el trabajo).
+
+        Args:
+            section: Sección del resultado
+            name: Nombre del check o etapa
+            parent_scope: Scopes del hilo padre (default: los del hilo actual)
+        """
+        import tracemalloc
+        counters = {"files_read": 0, "bytes_read": 0, "memory_high": 0, "root": self.root}
+        previous = current_scope()
+        scopes = (parent_scope if parent_scope is not None else previous) + (counters,)
+        _local.scopes = scopes
+
+        tracing = tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak")
+        if tracing:
+            memory_base, memory_high = tracemalloc.get_traced_memory()
+            # El pico alcanzado hasta ahora se conserva en los bloques que contienen a este
+            for outer in scopes[:-1]:
+                outer["memory_high"] = max(outer["memory_high"], memory_high)
+            tracemalloc.reset_peak()
+        # Las etapas abarcan varios hilos (checks): su CPU es la del proceso
+        cpu_clock = time.thread_time if section == "checks" else time.process_time
+        wall_started, cpu_started = time.perf_counter(), cpu_clock()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall_started, cpu_clock() - cpu_started
+            peak = 0
+            if tracing and tracemalloc.is_tracing():
+                memory_high = max(tracemalloc.get_traced_memory()[1], counters["memory_high"])
+                peak = max(0, memory_high - memory_base)
+                # El pico de este bloque cuenta para los bloques que lo contienen
+                for outer in scopes[:-1]:
+                    outer["memory_high"] = max(outer["memory_high"], memory_high)
+            _local.scopes = previous
+
+            getattr(self, section)[name] = {
+                "wall_seconds": round(wall, 4),
+                "cpu_seconds": round(cpu, 4),
+                "files_read": counters["files_read"],
+                "bytes_read": counters["bytes_read"],
+                "peak_memory_bytes": peak
+            }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Sección ``metrics`` del resultado"""
+        return {"checks": dict(self.checks), "stages": dict(self.stages)}
+
+    def close(self):
+        """Deja de trazar memoria si la trazó este recorder"""
+        import tracemalloc
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+
+def get_default_metrics_recorder(root: Union[str, Path, None] = None) -> Optional[MetricsRecorder]:
+    """
+    Obtiene un recorder si la instrumentación está activada por entorno.
+
+    Args:
+        root: Directorio cuyas lecturas se cuentan (ver ``MetricsRecorder``)
+
+    Returns:
+        MetricsRecorder si ``$FASTAPI_EVALUATOR_METRICS`` está definida (y no es "0"), o None
+    """
+    if os.environ.get(METRICS_ENV, "0") in ("", "0"):
+        return None
+    return MetricsRecorder(root)
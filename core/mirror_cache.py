@@ -0,0 +1,218 @@
+"""
+Caché persistente de mirrors de repositorios de estudiantes.
+La primera evaluación de un repositorio crea un mirror bare parcial
+(``--filter=blob:none``); las siguientes solo hacen ``git fetch`` y cada
+evaluación trabaja en un worktree del mirror. Los mirrors menos usados se
+eliminan cuando la caché excede su presupuesto de disco.
+"""
+import hashlib
+import os
+import re
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo entre procesos
+    fcntl = None
+
+from .repo_fetch import run_git
+
+
+# Variable de entorno que activa la caché de mirrors
+MIRROR_DIR_ENV = "FASTAPI_EVALUATOR_MIRROR_DIR"
+
+# Presupuesto de disco por defecto de la caché (bytes)
+DEFAULT_MIRROR_BUDGET_BYTES = 2 * 1024 ** 3
+
+# Archivo dentro de cada mirror cuya fecha de modificación marca el último uso
+LAST_USED_FILE = "evaluator-last-used"
+
+
+def _dir_size(path: Path) -> int:
+    """Tamaño en bytes de los archivos de un directorio"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class MirrorCache:
+    """
+    Mirrors bare de repositorios remotos con worktrees por evaluación.
+
+    Cada mirror se protege con un lock de archivo, así que varios procesos
+    (modo por lotes) pueden compartir la caché.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MIRROR_BUDGET_BYTES):
+        """
+        Inicializa la caché.
+
+        Args:
+            cache_dir: Directorio de la caché (se crea si no existe)
+            max_bytes: Presupuesto de disco para todos los mirrors
+        """
+        self.cache_dir = Path(cache_dir)
+        self.mirrors_dir = self.cache_dir / "mirrors"
+        self.mirrors_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def mirror_path(self, repo_url: str) -> Path:
+        """Ruta del mirror de una URL (hash + nombre legible)"""
+        digest = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[:16]
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", repo_url.rstrip("/").rsplit("/", 1)[-1])[:40]
+        return self.mirrors_dir / f"{digest}-{name or 'repo'}"
+
+    @contextmanager
+    def _locked(self, mirror: Path, blocking: bool = True):
+        """Lock exclusivo de un mirror; con ``blocking=False`` produce False si está ocupado"""
+        if fcntl is None:
+            yield True
+            return
+        with open(f"{mirror}.lock", "a") as lock_file:
+            flags = fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB)
+            try:
+                fcntl.flock(lock_file, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _sync_mirror(self, repo_url: str, mirror: Path) -> bool:
+        """Crea o actualiza un mirror (con su lock tomado); True si se creó"""
+        created = not (mirror / "HEAD").exists()
+        if created:
+            shutil.rmtree(mirror, ignore_errors=True)
+            run_git(["clone", "--quiet", "--bare", "--filter=blob:none", repo_url, str(mirror)])
+            # Solo branches: los refs de PRs u otros namespaces no se descargan
+            run_git(["config", "remote.origin.fetch", "+refs/heads/*:refs/heads/*"], cwd=mirror)
+        else:
+            run_git(["fetch", "--quiet", "--prune", "origin"], cwd=mirror)
+            run_git(["worktree", "prune"], cwd=mirror)
+        (mirror / LAST_USED_FILE).touch()
+        return created
+
+    def checkout(self, repo_url: str, branch: str, dest: Union[str, Path], subfolder: str = "",
+                 commit: Optional[str] = None) -> Path:
+        """
+        Crea un worktree de ``branch`` (o de ``commit``) en ``dest`` a partir del mirror.
+
+        El mirror se crea en el primer uso y se actualiza con ``git fetch`` en
+        los siguientes. Si se indica ``subfolder``, el worktree usa
+        sparse-checkout y solo descarga esa carpeta.
+
+        Args:
+            repo_url: URL del repositorio remoto
+            branch: Branch a usar
+            dest: Directorio del worktree (no debe existir o debe estar vacío)
+            subfolder: Subcarpeta a la que se limita el checkout (opcional)
+            commit: Commit exacto (default: el último de ``branch``); si el
+                branch se reescribió y ya no lo contiene, se pide al remoto
+
+        Returns:
+            Ruta del worktree
+        """
+        mirror = self.mirror_path(repo_url)
+        dest = Path(dest)
+        ref = commit or f"refs/heads/{branch}"
+
+        with self._locked(mirror):
+            self._sync_mirror(repo_url, mirror)
+            if commit is not None:
+                try:
+                    run_git(["cat-file", "-e", f"{commit}^{{commit}}"], cwd=mirror)
+                except RuntimeError:
+                    run_git(["fetch", "--quiet", "origin", commit], cwd=mirror)
+            run_git(["worktree", "add", "--quiet", "--detach", "--no-checkout", str(dest), ref], cwd=mirror)
+            if subfolder:
+                run_git(["sparse-checkout", "set", "--no-cone", f"/{subfolder}/"], cwd=dest)
+            # Los blobs que faltan se descargan al mirror, así que los comparten todos sus worktrees
+            run_git(["checkout", "--quiet", "--detach", ref], cwd=dest)
+
+        self.evict(keep=[mirror])
+        return dest
+
+    def release(self, repo_url: str, worktree: Union[str, Path]):
+        """
+        Elimina un worktree y lo desregistra de su mirror.
+
+        Args:
+            repo_url: URL del repositorio remoto
+            worktree: Ruta del worktree creado con ``checkout``
+        """
+        shutil.rmtree(worktree, ignore_errors=True)
+        mirror = self.mirror_path(repo_url)
+        if mirror.exists():
+            with self._locked(mirror):
+                run_git(["worktree", "prune"], cwd=mirror)
+
+    def evict(self, keep: Optional[List[Path]] = None) -> List[Path]:
+        """
+        Elimina los mirrors menos usados hasta respetar el presupuesto de disco.
+
+        Los mirrors en uso (con lock tomado o con worktrees vivos) y los de
+        ``keep`` no se eliminan.
+
+        Args:
+            keep: Mirrors que deben conservarse
+
+        Returns:
+            Mirrors eliminados
+        """
+        keep = {Path(path) for path in keep or []}
+        mirrors = []
+        for mirror in self.mirrors_dir.iterdir():
+            if not mirror.is_dir():
+                continue
+            stamp = mirror / LAST_USED_FILE
+            last_used = stamp.stat().st_mtime if stamp.exists() else 0.0
+            mirrors.append((last_used, mirror, _dir_size(mirror)))
+
+        total = sum(size for _, _, size in mirrors)
+        evicted = []
+        for _, mirror, size in sorted(mirrors, key=lambda m: m[0]):
+            if total <= self.max_bytes:
+                break
+            if mirror in keep:
+                continue
+            with self._locked(mirror, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                # Un mirror con worktrees vivos está en uso por otra evaluación
+                run_git(["worktree", "prune"], cwd=mirror)
+                if any((mirror / "worktrees").glob("*")):
+                    continue
+                shutil.rmtree(mirror, ignore_errors=True)
+            total -= size
+            evicted.append(mirror)
+        return evicted
+
+    def total_bytes(self) -> int:
+        """Tamaño actual de todos los mirrors"""
+        return sum(_dir_size(mirror) for mirror in self.mirrors_dir.iterdir() if mirror.is_dir())
+
+
+def get_default_mirror_cache(max_bytes: Optional[int] = None) -> Optional[MirrorCache]:
+    """
+    Obtiene la caché de mirrors configurada por entorno.
+
+    Args:
+        max_bytes: Presupuesto de disco (default: ``DEFAULT_MIRROR_BUDGET_BYTES``)
+
+    Returns:
+        MirrorCache en ``$FASTAPI_EVALUATOR_MIRROR_DIR`` o None si no está activada
+    """
+    cache_dir = os.environ.get(MIRROR_DIR_ENV)
+    if not cache_dir:
+        return None
+    return MirrorCache(cache_dir, max_bytes or DEFAULT_MIRROR_BUDGET_BYTES)
@@ -0,0 +1,112 @@
+"""
+Escáner de múltiples patrones.
+Los checks declaran sus patrones una vez (a nivel de módulo) y reciben, por
+archivo, el número de coincidencias y las líneas donde aparece cada patrón.
+"""
+import bisect
+import re
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Union, Iterable, Optional
+
+from .repo_index import RepoIndex
+
+
+PatternSpec = Union[str, List[str]]
+
+
+class PatternScanner:
+    """
+    Matcher compilado para un conjunto de patrones con nombre.
+
+    Cada nombre agrupa uno o varios patrones alternativos; el conteo de un grupo
+    es la suma de las coincidencias de sus patrones, igual que sumar
+    ``len(re.findall(p, content))`` sobre la lista.
+
+    Los patrones se aplican sobre el texto completo, como ``re.findall``: una
+    coincidencia puede abarcar varias líneas (ej: ``select\\s*\\(`` con el
+    paréntesis en la línea siguiente) y se reporta en la línea donde empieza.
+    Una expresión combinada descarta primero, en una sola búsqueda, los textos
+    sin ninguna coincidencia; por eso los patrones no deben usar referencias
+    numéricas (``\\1``).
+    """
+
+    def __init__(self, patterns: Dict[str, PatternSpec], flags: int = 0):
+        """
+        Compila los patrones.
+
+        Args:
+            patterns: Mapeo nombre -> patrón o lista de patrones alternativos
+            flags: Flags de ``re`` aplicados a todos los patrones (ej: re.IGNORECASE)
+        """
+        self._groups = []
+        sources = []
+        for name, spec in patterns.items():
+            alternatives = [spec] if isinstance(spec, str) else list(spec)
+            self._groups.append((name, [re.compile(p, flags) for p in alternatives]))
+            sources.extend(alternatives)
+
+        self.names = [name for name, _ in self._groups]
+        self._combined = re.compile("|".join(f"(?:{p})" for p in sources), flags)
+
+    def scan(self, text: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Escanea un texto.
+
+        Args:
+            text: Contenido a analizar
+
+        Returns:
+            Dict nombre -> ``{"count": int, "lines": [números de línea]}``
+        """
+        results = {name: {"count": 0, "lines": []} for name in self.names}
+        if self._combined.search(text) is None:
+            return results
+
+        # Offsets donde empieza cada línea, para ubicar cada coincidencia
+        line_starts = [0] + [match.end() for match in re.finditer("\n", text)]
+
+        for name, regexes in self._groups:
+            lines = set()
+            for regex in regexes:
+                for match in regex.finditer(text):
+                    results[name]["count"] += 1
+                    lines.add(bisect.bisect_right(line_starts, match.start()))
+            results[name]["lines"] = sorted(lines)
+
+        return results
+
+    def scan_files(self, paths: Iterable[Union[str, Path]],
+                   repo_index: Optional[RepoIndex] = None,
+                   on_error: Optional[Callable[[Path, Exception], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Escanea varios archivos y agrega los resultados.
+
+        Los archivos que no se pueden leer se omiten (y se informan a ``on_error``).
+
+        Args:
+            paths: Rutas a escanear
+            repo_index: Índice cuyo contenido cacheado se reutiliza (opcional)
+            on_error: Función ``(ruta, excepción)`` llamada por cada archivo ilegible (opcional)
+
+        Returns:
+            Dict nombre -> ``{"count": int, "files": {ruta: [números de línea]}}``
+        """
+        totals = {name: {"count": 0, "files": {}} for name in self.names}
+
+        for path in paths:
+            try:
+                if repo_index is not None:
+                    text = repo_index.read_text(path)
+                else:
+                    text = Path(path).read_text(encoding="utf-8", errors="ignore")
+            except Exception as e:
+                if on_error is not None:
+                    on_error(Path(path), e)
+                continue
+
+            for name, hit in self.scan(text).items():
+                if hit["count"]:
+                    totals[name]["count"] += hit["count"]
+                    totals[name]["files"][str(path)] = hit["lines"]
+
+        return totals
@@ -0,0 +1,238 @@
+"""
+Trazas y perfiles de evaluaciones para herramientas externas.
+``TraceRecorder`` registra spans de cada etapa y cada check en el formato
+trace-event de Chrome (chrome://tracing, Perfetto), con timestamps de reloj
+de pared para que los spans de varios procesos se unan en una sola línea de
+tiempo. ``ProfileCollector`` junta datos de cProfile de todos los hilos de
+una evaluación y los exporta como stacks colapsados (``a;b;c 123``) para
+generar flamegraphs.
+"""
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple, Union
+
+
+# Contribuciones menores a esto (microsegundos) no se exportan en los stacks colapsados
+MIN_FOLDED_MICROSECONDS = 1
+
+# Profundidad máxima de un stack colapsado
+MAX_FOLDED_DEPTH = 64
+
+
+class TraceRecorder:
+    """
+    Spans en formato trace-event de Chrome.
+
+    Cada span es un evento completo (``"ph": "X"``) con el pid del proceso y
+    el id nativo del hilo que lo ejecutó. Los eventos de otros procesos (los
+    workers del modo por lotes) se agregan con ``add_events``.
+    """
+
+    def __init__(self, process_name: Optional[str] = None):
+        """
+        Inicializa el recorder.
+
+        Args:
+            process_name: Nombre del proceso en el visor (opcional)
+        """
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._thread_names: Dict[Any, str] = {}
+        if process_name:
+            self.name_process(self.pid, process_name)
+
+    def _metadata(self, kind: str, pid: int, tid: int, name: str):
+        self.events.append({"name": kind, "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Optional[Dict[str, Any]] = None):
+        """
+        Registra un span alrededor de un bloque.
+
+        Args:
+            name: Nombre del span (etapa o check)
+            category: Categoría ("stage", "check", "fetch", "job"...)
+            args: Datos extra visibles al seleccionar el span
+        """
+        tid = threading.get_native_id()
+        started = time.time_ns() // 1000
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": started,
+                "dur": max(1, time.time_ns() // 1000 - started),
+                "pid": self.pid,
+                "tid": tid
+            }
+            if args:
+                event["args"] = args
+            with self._lock:
+                if tid not in self._thread_names:
+                    self._thread_names[tid] = threading.current_thread().name
+                    self._metadata("thread_name", self.pid, tid, self._thread_names[tid])
+                self.events.append(event)
+
+    def name_process(self, pid: int, name: str):
+        """Nombra un proceso en el visor (una sola vez por pid)"""
+        with self._lock:
+            if ("pid", pid) not in self._thread_names:
+                self._thread_names[("pid", pid)] = name
+                self._metadata("process_name", pid, 0, name)
+
+    def add_events(self, events: Iterable[Dict[str, Any]]):
+        """Agrega eventos registrados en otro proceso"""
+        with self._lock:
+            self.events.extend(events)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Traza completa en formato JSON de Chrome"""
+        with self._lock:
+            events = list(self.events)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, Path]):
+        """Escribe la traza como JSON (abrir en chrome://tracing o ui.perfetto.dev)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False)
+
+
+def _frame_label(func: Tuple[str, int, str]) -> str:
+    """Etiqueta de una función de pstats para un stack colapsado"""
+    filename, lineno, name = func
+    if filename == "~":
+        # Built-ins: pstats los registra como ("~", 0, "<built-in method ...>")
+        return name.replace(";", ":")
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(";", ":")
+
+
+def stats_to_folded(stats: pstats.Stats, min_microseconds: int = MIN_FOLDED_MICROSECONDS,
+                    max_depth: int = MAX_FOLDED_DEPTH) -> Dict[str, int]:
+    """
+    Convierte estadísticas de cProfile en stacks colapsados.
+
+    cProfile solo guarda pares llamador -> llamado, así que los stacks se
+    reconstruyen desde las funciones raíz repartiendo el tiempo de cada
+    función entre sus llamadores en proporción al tiempo acumulado de cada
+    arista. Los ciclos (recursión) se cortan al repetirse una función.
+
+    Args:
+        stats: Estadísticas de cProfile
+        min_microseconds: Contribuciones menores se descartan
+        max_depth: Profundidad máxima de un stack
+
+    Returns:
+        Dict stack (``"raíz;...;hoja"``) -> microsegundos de tiempo propio
+    """
+    raw = stats.stats  # func -> (cc, nc, tt, ct, callers)
+    callees: Dict[tuple, Dict[tuple, float]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    folded: Dict[str, int] = {}
+
+    def walk(func: tuple, path: Tuple[str, ...], on_path: frozenset, scale: float):
+        _, _, own, cumulative, _ = raw[func]
+        path = path + (_frame_label(func),)
+        micros = int(own * scale * 1_000_000)
+        if micros >= min_microseconds:
+            key = ";".join(path)
+            folded[key] = folded.get(key, 0) + micros
+        if len(path) >= max_depth:
+            return
+        for callee, edge_cumulative in callees.get(func, {}).items():
+            if callee in on_path or callee not in raw:
+                continue
+            callee_cumulative = raw[callee][3]
+            if callee_cumulative <= 0:
+                continue
+            callee_scale = scale * min(1.0, edge_cumulative / callee_cumulative)
+            if callee_cumulative * callee_scale * 1_000_000 < min_microseconds:
+                continue
+            walk(callee, path, on_path | {callee}, callee_scale)
+
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    for root in roots:
+        walk(root, (), frozenset([root]), 1.0)
+    return folded
+
+
+class ProfileCollector:
+    """
+    Perfiles de cProfile de todos los hilos de una evaluación.
+
+    cProfile solo mide el hilo que lo activa, así que cada hilo (el principal
+    y cada hilo de checks) usa su propio ``cProfile.Profile`` dentro de
+    ``profile_thread``. Al exportar, los stacks de cada perfil cuelgan de su
+    etiqueta (el check o la etapa), de modo que el flamegraph los separa.
+    """
+
+    def __init__(self):
+        self.profiles: List[Tuple[str, cProfile.Profile]] = []
+        self.folded: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def profile_thread(self, label: str):
+        """
+        Perfila un bloque en el hilo actual (sin efecto si el hilo ya se está perfilando).
+
+        Args:
+            label: Raíz de los stacks de este perfil (ej: ``"check endpoints"``)
+        """
+        if getattr(self._local, "active", False):
+            yield
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+: cProfile usa sys.monitoring, que es global al proceso y ya
+            # está midiendo este hilo desde el perfil activo en otro hilo
+            yield
+            return
+        self._local.active = True
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._local.active = False
+            with self._lock:
+                self.profiles.append((label, profile))
+
+    def add_folded(self, folded: Dict[str, int]):
+        """Suma stacks colapsados (ej: de otro proceso)"""
+        with self._lock:
+            for stack, micros in folded.items():
+                self.folded[stack] = self.folded.get(stack, 0) + micros
+
+    def to_folded(self) -> Dict[str, int]:
+        """Stacks colapsados de todos los perfiles y de los agregados con ``add_folded``"""
+        with self._lock:
+            profiles = list(self.profiles)
+            folded = dict(self.folded)
+        for label, profile in profiles:
+            root = label.replace(";", ":")
+            for stack, micros in stats_to_folded(pstats.Stats(profile)).items():
+                key = f"{root};{stack}"
+                folded[key] = folded.get(key, 0) + micros
+        return folded
+
+    def write(self, path: Union[str, Path]):
+        """Escribe los stacks colapsados (entrada de flamegraph.pl, speedscope, inferno)"""
+        folded = self.to_folded()
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, micros in sorted(folded.items()):
+                f.write(f"{stack} {micros}\n")
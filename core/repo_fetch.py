@@ -0,0 +1,235 @@
+"""
+Descarga de repositorios de estudiantes desde git.
+Resuelve el branch con una sola consulta al remoto y clona de forma shallow y
+parcial; si la URL apunta a una subcarpeta (``/tree/<branch>/<carpeta>``) solo
+se descargan los archivos de esa carpeta. Opcionalmente usa la caché de
+mirrors (ver ``core.mirror_cache``).
+"""
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Prefijo de los directorios temporales de cada clon
+CLONE_DIR_PREFIX = "eval_repo_"
+
+# Prefijos de URL que se descargan con git (el resto son rutas locales)
+REMOTE_URL_PREFIXES = ("http://", "https://", "ssh://", "git://", "git@", "file://")
+
+# Segundos máximos de un comando git (un remoto colgado no bloquea al worker)
+DEFAULT_GIT_TIMEOUT = 300
+
+
+def run_git(args: List[str], cwd: Optional[str] = None, timeout: Optional[float] = DEFAULT_GIT_TIMEOUT) -> str:
+    """
+    Ejecuta un comando git y retorna su salida estándar
+
+    Raises:
+        RuntimeError: Si git termina con error (incluye su stderr) o no termina en ``timeout`` segundos
+    """
+    try:
+        result = subprocess.run(["git"] + args, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"git {args[0]} no terminó en {timeout}s") from None
+    if result.returncode != 0:
+        raise RuntimeError(f"git {args[0]} falló: {result.stderr.strip()}")
+    return result.stdout
+
+
+def parse_repo_url(repo_url: str) -> Tuple[str, str]:
+    """
+    Separa la URL del repositorio de la ruta ``/tree/...``
+
+    Args:
+        repo_url: URL del repositorio (ej: https://github.com/user/repo/tree/branch/subfolder)
+
+    Returns:
+        Tupla (URL base del repositorio, ruta después de /tree/ o "")
+    """
+    if "/tree/" in repo_url:
+        base_repo_url, tree_path = repo_url.split("/tree/", 1)
+        return base_repo_url, tree_path.strip("/")
+    return repo_url.rstrip("/"), ""
+
+
+def list_remote_heads(base_repo_url: str) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    Consulta el remoto una sola vez con ``git ls-remote --symref``
+
+    Args:
+        base_repo_url: URL del repositorio
+
+    Returns:
+        Tupla (branch por defecto del remoto o None, dict branch -> commit)
+    """
+    output = run_git(["ls-remote", "--symref", base_repo_url, "HEAD", "refs/heads/*"])
+
+    default_branch = None
+    heads = {}
+    for line in output.splitlines():
+        if line.startswith("ref: ") and line.endswith("\tHEAD"):
+            default_branch = line[5:-5].strip()[len("refs/heads/"):]
+        elif "\trefs/heads/" in line:
+            commit, branch = line.split("\trefs/heads/", 1)
+            heads[branch] = commit.strip()
+
+    return default_branch, heads
+
+
+def list_remote_branches(base_repo_url: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Consulta el remoto una sola vez con ``git ls-remote --symref``
+
+    Args:
+        base_repo_url: URL del repositorio
+
+    Returns:
+        Tupla (branch por defecto del remoto o None, branches disponibles)
+    """
+    default_branch, heads = list_remote_heads(base_repo_url)
+    return default_branch, list(heads)
+
+
+def resolve_branch(tree_path: str, default_branch: Optional[str], branches: List[str]) -> Tuple[str, str]:
+    """
+    Determina branch y subcarpeta a partir de la ruta ``/tree/...``
+
+    Los nombres de branch pueden contener "/", así que se elige el branch
+    existente más largo que sea prefijo de la ruta. Si ninguno coincide se usa
+    el branch por defecto del remoto.
+
+    Args:
+        tree_path: Ruta después de /tree/ ("" si la URL no tiene)
+        default_branch: Branch por defecto del remoto
+        branches: Branches disponibles en el remoto
+
+    Returns:
+        Tupla (branch, subcarpeta o "")
+    """
+    fallback = default_branch or ("main" if "main" in branches else "master")
+    if not tree_path:
+        return fallback, ""
+
+    for branch in sorted(branches, key=len, reverse=True):
+        if tree_path == branch or tree_path.startswith(branch + "/"):
+            return branch, tree_path[len(branch) + 1:]
+
+    # El branch de la URL no existe: la subcarpeta es lo que sigue al primer segmento
+    requested, _, subfolder = tree_path.partition("/")
+    print(f"⚠️  Branch {requested} no encontrado, usando {fallback}")
+    return fallback, subfolder
+
+
+def clone_repository(repo_url: str, mirror_cache=None, commit: Optional[str] = None) -> str:
+    """
+    Clona un repositorio de GitHub y retorna la ruta local
+
+    El branch se resuelve con una sola consulta al remoto; el clon es shallow
+    y parcial (``--filter=blob:none``) y, si la URL apunta a una subcarpeta,
+    solo se descargan los archivos de esa subcarpeta (sparse-checkout).
+    Con ``mirror_cache`` el repositorio se actualiza en un mirror persistente
+    y la ruta retornada es un worktree de ese mirror.
+
+    Args:
+        repo_url: URL del repositorio (puede incluir subcarpeta)
+        mirror_cache: MirrorCache a usar (opcional, ver core.mirror_cache)
+        commit: Commit exacto a descargar (default: el último del branch)
+
+    Returns:
+        Ruta local al repositorio clonado
+
+    Raises:
+        RuntimeError: Si ``commit`` ya no se puede obtener del remoto
+    """
+    # Crear directorio temporal
+    temp_dir = tempfile.mkdtemp(prefix=CLONE_DIR_PREFIX)
+
+    try:
+        base_repo_url, tree_path = parse_repo_url(repo_url)
+        default_branch, branches = list_remote_branches(base_repo_url)
+        branch, subfolder = resolve_branch(tree_path, default_branch, branches)
+
+        print(f"🔄 Clonando repositorio: {base_repo_url} (branch {branch})")
+        if subfolder:
+            print(f"📁 Subcarpeta: {subfolder}")
+
+        if mirror_cache is not None:
+            mirror_cache.checkout(base_repo_url, branch, temp_dir, subfolder, commit)
+        else:
+            # Clon shallow y sin blobs; los blobs se descargan al hacer checkout
+            run_git([
+                "clone",
+                "--depth", "1",
+                "--filter=blob:none",
+                "--no-checkout",
+                "--branch", branch,
+                base_repo_url,
+                temp_dir
+            ])
+
+            if subfolder:
+                # Solo la subcarpeta pedida (sin los archivos de la raíz)
+                run_git(["sparse-checkout", "set", "--no-cone", f"/{subfolder}/"], cwd=temp_dir)
+            if commit is not None and run_git(["rev-parse", "HEAD"], cwd=temp_dir).strip() != commit:
+                # El branch avanzó desde que se resolvió el commit: se descarga ese commit
+                run_git(["fetch", "--quiet", "--depth", "1", "--filter=blob:none", "origin", commit], cwd=temp_dir)
+                run_git(["checkout", "--quiet", "--detach", commit], cwd=temp_dir)
+            else:
+                run_git(["checkout", "--quiet", branch], cwd=temp_dir)
+
+        if commit is not None:
+            head = run_git(["rev-parse", "HEAD"], cwd=temp_dir).strip()
+            if head != commit:
+                raise RuntimeError(f"Se descargó el commit {head} en lugar de {commit}")
+
+        # Si hay subcarpeta, apuntar a ella
+        if subfolder:
+            subfolder_path = Path(temp_dir) / subfolder
+            if not subfolder_path.exists():
+                raise Exception(f"Subcarpeta no encontrada: {subfolder}")
+            return str(subfolder_path)
+
+        return temp_dir
+
+    except Exception as e:
+        # Limpiar directorio temporal si hay error
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise e
+
+
+def is_remote_repo(repo: str) -> bool:
+    """Indica si ``repo`` es una URL git (y no una ruta local)"""
+    return repo.startswith(REMOTE_URL_PREFIXES)
+
+
+def fetch_repository(repo_url: str, mirror_cache=None,
+                     commit: Optional[str] = None) -> Tuple[str, Callable[[], None]]:
+    """
+    Descarga un repositorio y retorna su ruta junto con la función que lo limpia.
+
+    Args:
+        repo_url: URL del repositorio (puede incluir subcarpeta)
+        mirror_cache: MirrorCache a usar (opcional)
+        commit: Commit exacto a descargar (default: el último del branch)
+
+    Returns:
+        Tupla (ruta local, función sin argumentos que elimina el clon)
+    """
+    repo_path = clone_repository(repo_url, mirror_cache, commit)
+
+    # Si es una subcarpeta, se limpia el directorio temporal raíz
+    clone_root = Path(repo_path)
+    while not clone_root.name.startswith(CLONE_DIR_PREFIX) and clone_root.parent != clone_root:
+        clone_root = clone_root.parent
+    base_repo_url = parse_repo_url(repo_url)[0]
+
+    def cleanup():
+        if mirror_cache is not None:
+            # El mirror se conserva para la próxima evaluación; solo se elimina el worktree
+            mirror_cache.release(base_repo_url, clone_root)
+        else:
+            shutil.rmtree(clone_root, ignore_errors=True)
+
+    return repo_path, cleanup
@@ -0,0 +1,266 @@
+"""
+Índice de archivos del repositorio del estudiante.
+Recorre el repositorio una sola vez por evaluación, aplica una política única
+de directorios ignorados y permite consultar archivos por extensión o directorio.
+También expone la lectura de contenido a través de una ContentCache compartida
+y el parseo de código Python a través de una AstCache compartida.
+"""
+import ast
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, Iterable
+
+from .ast_cache import AstCache
+from .content_cache import ContentCache
+
+
+# Directorios que nunca forman parte de la entrega del estudiante
+DEFAULT_IGNORED_DIRS = frozenset({
+    ".git",
+    "__pycache__",
+    "venv",
+    ".venv",
+    "env",
+    "node_modules",
+    "site-packages",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+})
+
+
+def _glob_to_regex(pattern: str) -> "re.Pattern":
+    """Convierte un patrón glob con soporte para ``**`` en una expresión regular"""
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(regex + r"\Z")
+
+
+class RepoIndex:
+    """
+    Índice perezoso de los archivos de un repositorio.
+
+    El recorrido del sistema de archivos ocurre en la primera consulta y se
+    reutiliza en todas las siguientes. Las rutas se almacenan relativas a la
+    raíz en formato POSIX y se devuelven como ``Path`` absolutos.
+    """
+
+    def __init__(self, repo_path: Union[str, Path], ignored_dirs: Optional[Iterable[str]] = None,
+                 content_cache: Optional[ContentCache] = None,
+                 ast_cache: Optional[AstCache] = None):
+        """
+        Inicializa el índice.
+
+        Args:
+            repo_path: Ruta al repositorio del estudiante
+            ignored_dirs: Nombres de directorio a excluir (default: DEFAULT_IGNORED_DIRS)
+            content_cache: Caché de contenido a usar (se crea una si no se indica)
+            ast_cache: Caché de AST a usar (se crea una si no se indica)
+        """
+        self.repo_path = Path(repo_path).resolve()
+        self.ignored_dirs = frozenset(ignored_dirs) if ignored_dirs is not None else DEFAULT_IGNORED_DIRS
+        self.content_cache = content_cache if content_cache is not None else ContentCache()
+        self.ast_cache = ast_cache if ast_cache is not None else AstCache()
+
+        self._lock = threading.Lock()
+        self._files: Optional[List[str]] = None
+        self._by_extension: Dict[str, List[str]] = {}
+        self._by_directory: Dict[str, List[str]] = {}
+
+    # === CONSTRUCCIÓN ===
+
+    def _is_ignored_dir(self, name: str) -> bool:
+        return name in self.ignored_dirs or name.endswith(".egg-info")
+
+    def _ensure_built(self) -> List[str]:
+        """Recorre el repositorio una única vez"""
+        if self._files is not None:
+            return self._files
+
+        with self._lock:
+            if self._files is None:
+                files: List[str] = []
+                by_extension: Dict[str, List[str]] = {}
+                by_directory: Dict[str, List[str]] = {}
+
+                # followlinks=False evita ciclos de symlinks
+                for dirpath, dirnames, filenames in os.walk(self.repo_path, followlinks=False):
+                    dirnames[:] = sorted(d for d in dirnames if not self._is_ignored_dir(d))
+                    rel_dir = os.path.relpath(dirpath, self.repo_path).replace(os.sep, "/")
+                    rel_dir = "" if rel_dir == "." else rel_dir
+
+                    for filename in sorted(filenames):
+                        rel_path = f"{rel_dir}/{filename}" if rel_dir else filename
+                        files.append(rel_path)
+                        by_extension.setdefault(os.path.splitext(filename)[1].lower(), []).append(rel_path)
+                        by_directory.setdefault(rel_dir, []).append(rel_path)
+
+                self._by_extension = by_extension
+                self._by_directory = by_directory
+                self._files = files
+
+        return self._files
+
+    def _full_path(self, path: Union[str, Path]) -> Path:
+        full_path = Path(path)
+        if not full_path.is_absolute():
+            full_path = self.repo_path / full_path
+        return full_path
+
+    def _to_paths(self, rel_paths: Iterable[str]) -> List[Path]:
+        return [self.repo_path / rel_path for rel_path in rel_paths]
+
+    # === CONSULTAS ===
+
+    def files(self, extension: Optional[str] = None, under: Optional[str] = None,
+              recursive: bool = True) -> List[Path]:
+        """
+        Lista archivos del repositorio.
+
+        Args:
+            extension: Extensión a filtrar (ej: ".py"); None para todas
+            under: Directorio relativo donde buscar; None para todo el repositorio
+            recursive: Si False, solo archivos directamente dentro de ``under``
+
+        Returns:
+            Lista de rutas absolutas ordenadas
+        """
+        self._ensure_built()
+        directory = (under or "").strip("/").replace(os.sep, "/")
+
+        if not recursive:
+            candidates = self._by_directory.get(directory, [])
+        elif extension is not None:
+            candidates = self._by_extension.get(extension.lower(), [])
+        else:
+            candidates = self._files
+
+        if extension is not None:
+            extension = extension.lower()
+            candidates = [p for p in candidates if p.lower().endswith(extension)]
+
+        if directory and recursive:
+            prefix = directory + "/"
+            candidates = [p for p in candidates if p.startswith(prefix)]
+
+        return self._to_paths(candidates)
+
+    def python_files(self, under: Optional[str] = None, recursive: bool = True) -> List[Path]:
+        """Atajo para listar archivos ``.py``"""
+        return self.files(".py", under=under, recursive=recursive)
+
+    def glob(self, pattern: str) -> List[Path]:
+        """
+        Busca archivos que coincidan con un patrón glob relativo a la raíz.
+        Soporta ``*``, ``?`` y ``**`` (cualquier número de directorios).
+
+        Args:
+            pattern: Patrón glob (ej: "tests/**/test_*.py", "**/versions/*.py")
+
+        Returns:
+            Lista de rutas absolutas ordenadas
+        """
+        regex = _glob_to_regex(pattern)
+        candidates = self._ensure_built()
+
+        # Reducir candidatos por extensión cuando el patrón la fija
+        extension = os.path.splitext(pattern)[1]
+        if extension and "*" not in extension and "?" not in extension:
+            candidates = self._by_extension.get(extension.lower(), [])
+
+        return self._to_paths(p for p in candidates if regex.match(p))
+
+    # === CONTENIDO ===
+
+    def read_text(self, path: Union[str, Path]) -> str:
+        """
+        Lee un archivo del repositorio a través de la caché de contenido.
+
+        Args:
+            path: Ruta absoluta o relativa a la raíz del repositorio
+
+        Returns:
+            Contenido decodificado del archivo
+        """
+        return self.content_cache.read_text(self._full_path(path))
+
+    def parse_result(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Parsea un archivo Python una sola vez por contenido.
+
+        Args:
+            path: Ruta absoluta o relativa a la raíz del repositorio
+
+        Returns:
+            Dict con ``tree`` y ``error`` (ver ``AstCache.parse``)
+        """
+        full_path = self._full_path(path)
+        return self.ast_cache.parse(self.content_cache.read_text(full_path), str(full_path))
+
+    def parse(self, path: Union[str, Path]) -> ast.Module:
+        """
+        Equivalente cacheado de ``ast.parse`` sobre un archivo del repositorio.
+
+        Args:
+            path: Ruta absoluta o relativa a la raíz del repositorio
+
+        Returns:
+            Árbol AST del módulo
+
+        Raises:
+            SyntaxError: Si el archivo no es código Python válido
+        """
+        full_path = self._full_path(path)
+        return self.ast_cache.parse_tree(self.content_cache.read_text(full_path), str(full_path))
+
+    def parse_source(self, source: str, label: str = "<unknown>") -> ast.Module:
+        """
+        Equivalente cacheado de ``ast.parse`` para código ya combinado en memoria.
+
+        Args:
+            source: Código fuente
+            label: Etiqueta que identifica la fuente en la caché
+
+        Returns:
+            Árbol AST del módulo
+
+        Raises:
+            SyntaxError: Si la fuente no es código Python válido
+        """
+        return self.ast_cache.parse_tree(source, label)
+
+    def __len__(self) -> int:
+        return len(self._ensure_built())
+
+
+def create_repo_index(repo_path: Union[str, Path]) -> RepoIndex:
+    """
+    Factory function para crear un RepoIndex con la política por defecto.
+
+    Args:
+        repo_path: Ruta al repositorio del estudiante
+
+    Returns:
+        Instancia de RepoIndex
+    """
+    return RepoIndex(repo_path)
@@ -6,7 +6,8 @@ import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
-from string import Template
+
+from .template_cache import CompiledTemplate, find_template, get_template
 
 
 class ReportGenerator:
@@ -38,11 +39,11 @@ class ReportGenerator:
         Returns:
             Reporte formateado en Markdown
         """
-        # Intentar usar template personalizado
-        custom_template_path = self.templates_dir / template_name
-        if custom_template_path.exists():
+        # Intentar usar template personalizado (compilado una sola vez por proceso)
+        custom_template = find_template(self.templates_dir / template_name)
+        if custom_template is not None:
             try:
-                return self._generate_from_template(custom_template_path, evaluation_result)
+                return self._render_template(custom_template, evaluation_result)
             except Exception as e:
                 # Fallback a reporte automático si el template falla
                 pass
@@ -62,21 +63,29 @@ class ReportGenerator:
         Returns:
             Reporte renderizado
         """
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
+        return self._render_template(get_template(template_path), evaluation_result)
+    
+    def _render_template(self, template: CompiledTemplate,
+                         evaluation_result: Dict[str, Any]) -> str:
+        """
+        Renderiza un template ya compilado.
         
+        Args:
+            template: Template compilado
+            evaluation_result: Resultado de evaluación
+            
+        Returns:
+            Reporte renderizado
+        """
         # Preparar variables para el template
         template_vars = self._prepare_template_variables(evaluation_result)
         
-        # Usar Template de Python para reemplazos seguros
-        template = Template(template_content)
-        
         try:
             # Intentar reemplazo con Template
             return template.safe_substitute(template_vars)
         except Exception:
             # Fallback a format string
-            return template_content.format(**template_vars)
+            return template.render(template_vars)
     
     def _prepare_template_variables(self, evaluation_result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,257 @@
+"""
+Caché persistente de resultados de evaluación.
+Guarda en SQLite el resultado de cada evaluación indexado por el contenido del
+repositorio del estudiante, la semana y la huella del evaluador (criteria.yaml,
+checks, templates y core). Si nada cambió, la evaluación se devuelve sin
+ejecutar los checks.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+from .repo_index import RepoIndex
+
+
+# Variable de entorno que activa la caché (la heredan los workers del modo por lotes)
+CACHE_DIR_ENV = "FASTAPI_EVALUATOR_CACHE_DIR"
+CACHE_DB_NAME = "results.sqlite3"
+
+CORE_DIR = Path(__file__).parent
+
+
+def _git(repo_path: Path, *args: str) -> Optional[str]:
+    """Ejecuta un comando git y devuelve su salida, o None si falla"""
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(repo_path), *args],
+            capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout
+
+
+@contextmanager
+def connect_cache_db(db_path: Union[str, Path]):
+    """
+    Abre una conexión a la base de datos de la caché.
+
+    La transacción se confirma al salir del bloque y la conexión se cierra.
+    WAL permite lectores concurrentes mientras otro proceso escribe.
+    """
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def _hash_files(repo_index: RepoIndex, rel_paths: Iterable[str]) -> str:
+    """Hash de rutas relativas y contenido de un conjunto de archivos del índice"""
+    digest = hashlib.sha256()
+    for rel_path in rel_paths:
+        digest.update(rel_path.encode("utf-8"))
+        digest.update(b"\0")
+        try:
+            digest.update(hashlib.sha256((repo_index.repo_path / rel_path).read_bytes()).digest())
+        except OSError:
+            digest.update(b"<unreadable>")
+    return digest.hexdigest()
+
+
+def _ignored_indexed_files(repo_path: Path, repo_index: RepoIndex) -> Optional[List[str]]:
+    """
+    Archivos del índice que git ignora (``.env``, ``alembic.ini`` locales...).
+
+    Los checks los leen pero no forman parte del árbol de ``HEAD``, así que la
+    clave ``git:`` no cambiaría al editarlos.
+
+    Returns:
+        Rutas relativas (POSIX), o None si git falló
+    """
+    output = _git(repo_path, "ls-files", "--others", "--ignored", "--exclude-standard",
+                  "--directory", "-z", "--", ".")
+    if output is None:
+        return None
+    entries = [entry for entry in output.split("\0") if entry]
+    ignored_dirs = tuple(entry for entry in entries if entry.endswith("/"))
+    ignored_files = set(entries)
+
+    indexed = (path.relative_to(repo_index.repo_path).as_posix() for path in repo_index.files())
+    return [rel_path for rel_path in indexed
+            if rel_path in ignored_files or (ignored_dirs and rel_path.startswith(ignored_dirs))]
+
+
+def compute_repo_key(repo_path: Union[str, Path], repo_index: Optional[RepoIndex] = None) -> str:
+    """
+    Calcula la clave de contenido del repositorio del estudiante.
+
+    Si el directorio está en git y no tiene cambios, se usa el hash del árbol
+    de ``HEAD`` para ese directorio (``git:<tree>``), más el hash de los
+    archivos indexados que git ignora si los hay (``git:<tree>+ignored:<sha256>``).
+    En otro caso se calcula un hash del contenido de los archivos indexados
+    (``content:<sha256>``).
+
+    Args:
+        repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos a reutilizar (opcional)
+
+    Returns:
+        Clave estable del contenido del repositorio
+    """
+    repo_path = Path(repo_path).resolve()
+    if repo_index is None:
+        repo_index = RepoIndex(repo_path)
+
+    tree_hash = _git(repo_path, "rev-parse", "HEAD:./")
+    if tree_hash:
+        status = _git(repo_path, "status", "--porcelain", "--untracked-files=all", "--", ".")
+        ignored = _ignored_indexed_files(repo_path, repo_index) if status == "" else None
+        if ignored is not None:
+            key = f"git:{tree_hash.strip()}"
+            return f"{key}+ignored:{_hash_files(repo_index, ignored)}" if ignored else key
+
+    rel_paths = [path.relative_to(repo_index.repo_path).as_posix() for path in repo_index.files()]
+    return f"content:{_hash_files(repo_index, rel_paths)}"
+
+
+def compute_evaluator_fingerprint(week_dir: Union[str, Path]) -> str:
+    """
+    Calcula la huella del evaluador de una semana.
+
+    Incluye ``criteria.yaml``, todos los ``.py`` de la semana (evaluador y
+    checks), sus templates y los módulos de ``core``. Cualquier cambio en la
+    rúbrica o en el código de evaluación invalida los resultados guardados.
+
+    Args:
+        week_dir: Directorio ``weeks/weekNN``
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    week_dir = Path(week_dir)
+    sources = [week_dir / "criteria.yaml"]
+    sources.extend(week_dir.rglob("*.py"))
+    sources.extend(p for p in (week_dir / "templates").rglob("*") if p.is_file())
+    sources.extend(CORE_DIR.glob("*.py"))
+
+    digest = hashlib.sha256()
+    for path in sorted(set(sources)):
+        if "__pycache__" in path.parts or not path.exists():
+            continue
+        digest.update(str(path.relative_to(CORE_DIR.parent)).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Caché de resultados en SQLite.
+
+    Cada operación abre su propia conexión, por lo que una misma caché puede
+    usarse desde varios hilos o procesos (modo por lotes).
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Inicializa la caché y crea la base de datos si no existe.
+
+        Args:
+            cache_dir: Directorio donde se guarda ``results.sqlite3``
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / CACHE_DB_NAME
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    repo_key TEXT NOT NULL,
+                    week INTEGER NOT NULL,
+                    evaluator_fingerprint TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (repo_key, week, evaluator_fingerprint)
+                )
+            """)
+
+    def _connect(self):
+        return connect_cache_db(self.db_path)
+
+    def get(self, repo_key: str, week: int, evaluator_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca un resultado guardado.
+
+        Args:
+            repo_key: Clave de contenido del repositorio (ver ``compute_repo_key``)
+            week: Número de semana
+            evaluator_fingerprint: Huella del evaluador
+
+        Returns:
+            Resultado guardado o None si no existe
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM results WHERE repo_key = ? AND week = ? AND evaluator_fingerprint = ?",
+                (repo_key, week, evaluator_fingerprint)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, repo_key: str, week: int, evaluator_fingerprint: str, result: Dict[str, Any]):
+        """
+        Guarda un resultado de evaluación.
+
+        Args:
+            repo_key: Clave de contenido del repositorio
+            week: Número de semana
+            evaluator_fingerprint: Huella del evaluador
+            result: Resultado completo de la evaluación
+        """
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (repo_key, week, evaluator_fingerprint, payload, datetime.now().isoformat())
+            )
+
+    def prune(self, week: int, evaluator_fingerprint: str) -> int:
+        """
+        Elimina los resultados de una semana calculados con otra versión del evaluador.
+
+        Args:
+            week: Número de semana
+            evaluator_fingerprint: Huella vigente que se conserva
+
+        Returns:
+            Número de filas eliminadas
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM results WHERE week = ? AND evaluator_fingerprint != ?",
+                (week, evaluator_fingerprint)
+            )
+            return cursor.rowcount
+
+
+def get_default_result_cache() -> Optional[ResultCache]:
+    """
+    Obtiene la caché configurada por entorno.
+
+    Returns:
+        ResultCache en ``$FASTAPI_EVALUATOR_CACHE_DIR`` o None si no está activada
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return ResultCache(cache_dir)
@@ -0,0 +1,129 @@
+"""
+Política de tamaño de resultados.
+Antes de serializar un resultado se eliminan los fuentes crudos que guardan
+algunos checks, se recortan los textos largos y se reemplazan las
+subestructuras repetidas por una referencia a su primera aparición.
+"""
+import json
+from typing import Dict, Any, Optional
+
+
+# Políticas por formato de salida (None: el resultado se usa sin cambios)
+DEFAULT_RESULT_SIZE_POLICIES: Dict[str, Optional[Dict[str, Any]]] = {
+    "json": {
+        "max_string_chars": 2000,
+        "max_list_items": 100,
+        "drop_keys": ["content"],
+        "dedupe": True,
+        "keep_keys": ["report"]
+    },
+    "jsonl": {
+        "max_string_chars": 1000,
+        "max_list_items": 50,
+        "drop_keys": ["content"],
+        "dedupe": True,
+        "keep_keys": ["report"]
+    },
+    "markdown": None,
+    "summary": None
+}
+
+# Subestructuras más chicas que esto (serializadas) no se deduplican
+MIN_DEDUPE_CHARS = 200
+
+
+def merge_result_policy(base: Optional[Dict[str, Any]],
+                        overrides: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Combina una política con overrides (ej: ``automation.result_size_policy``).
+
+    Args:
+        base: Política por defecto del formato
+        overrides: Claves a reemplazar; ``{"enabled": False}`` desactiva la política
+
+    Returns:
+        Política resultante, o None si queda desactivada
+    """
+    if overrides is None:
+        return base
+    if overrides.get("enabled", True) is False:
+        return None
+    policy = dict(base or {})
+    policy.update({key: value for key, value in overrides.items() if key != "enabled"})
+    return policy
+
+
+def apply_result_policy(result: Dict[str, Any], policy: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Devuelve una copia del resultado reducida según la política.
+
+    La política admite:
+    - ``drop_keys``: claves eliminadas en cualquier nivel (fuentes crudos)
+    - ``max_string_chars``: largo máximo de un texto (los más largos se recortan)
+    - ``max_list_items``: elementos máximos de una lista (el resto se resume)
+    - ``dedupe``: reemplazar subestructuras repetidas por ``{"$same_as": ruta}``
+    - ``keep_keys``: claves de primer nivel que se copian sin cambios
+
+    Lo aplicado se resume en ``result["result_policy"]``.
+
+    Args:
+        result: Resultado de evaluación
+        policy: Política a aplicar (None: sin cambios)
+
+    Returns:
+        Resultado reducido
+    """
+    if not policy:
+        return result
+
+    drop_keys = set(policy.get("drop_keys", []))
+    max_chars = policy.get("max_string_chars")
+    max_items = policy.get("max_list_items")
+    dedupe = policy.get("dedupe", False)
+    keep_keys = set(policy.get("keep_keys", []))
+    stats = {"dropped": 0, "truncated": 0, "deduplicated": 0}
+    seen: Dict[str, str] = {}
+
+    def reduce(item: Any, path: str) -> Any:
+        if isinstance(item, str):
+            if max_chars and len(item) > max_chars:
+                stats["truncated"] += 1
+                return f"{item[:max_chars]}… [+{len(item) - max_chars} caracteres]"
+            return item
+
+        if not isinstance(item, (dict, list, tuple)):
+            return item
+
+        if dedupe:
+            signature = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+            if len(signature) >= MIN_DEDUPE_CHARS:
+                if signature in seen:
+                    stats["deduplicated"] += 1
+                    return {"$same_as": seen[signature]}
+                seen[signature] = path
+
+        if isinstance(item, dict):
+            reduced = {}
+            for key, value in item.items():
+                if key in drop_keys:
+                    stats["dropped"] += 1
+                    continue
+                reduced[key] = reduce(value, f"{path}.{key}")
+            return reduced
+        reduced = [reduce(value, f"{path}[{i}]") for i, value in enumerate(item[:max_items or None])]
+        if max_items and len(item) > max_items:
+            stats["truncated"] += 1
+            reduced.append(f"… [+{len(item) - max_items} elementos]")
+        return reduced
+
+    reduced = {}
+    for key, value in result.items():
+        if key in keep_keys:
+            reduced[key] = value
+        elif key in drop_keys:
+            stats["dropped"] += 1
+        else:
+            reduced[key] = reduce(value, f"$.{key}")
+
+    reduced["result_policy"] = stats
+    return reduced
@@ -0,0 +1,115 @@
+"""
+Salida en streaming de resultados de evaluación.
+Cada resultado se escribe como una línea JSON compacta en cuanto termina, y
+los textos grandes (contenido de archivos, reportes) se reemplazan por una
+referencia por hash, opcionalmente guardando el texto en un directorio de
+blobs. Así la memoria y el tamaño de cada línea no dependen del tamaño del
+repositorio ni del número de repos evaluados.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+
+# Textos de más de este tamaño (en bytes UTF-8) se reemplazan por una referencia
+DEFAULT_MAX_INLINE_BYTES = 4096
+
+
+def _blob_reference(text: str, blob_dir: Optional[Path]) -> Dict[str, Any]:
+    """Crea la referencia a un texto omitido, guardándolo en ``blob_dir`` si se indica"""
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    reference = {"$ref": f"sha256:{digest}", "bytes": len(data)}
+
+    if blob_dir is not None:
+        blob_path = blob_dir / digest[:2] / f"{digest}.txt"
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f".{digest}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, blob_path)
+        reference["path"] = str(blob_path)
+
+    return reference
+
+
+def compact_result(value: Any, max_inline_bytes: Optional[int] = DEFAULT_MAX_INLINE_BYTES,
+                   blob_dir: Union[str, Path, None] = None) -> Any:
+    """
+    Devuelve una copia del resultado sin textos grandes.
+
+    Cada string de más de ``max_inline_bytes`` se reemplaza por
+    ``{"$ref": "sha256:<hash>", "bytes": n}`` (más ``"path"`` si se guardó en
+    ``blob_dir``). Textos iguales comparten referencia y blob.
+
+    Args:
+        value: Resultado (o parte de él) a compactar
+        max_inline_bytes: Tamaño máximo de un texto en línea (None o 0: sin límite)
+        blob_dir: Directorio donde guardar los textos omitidos (opcional)
+
+    Returns:
+        Copia compactada del resultado
+    """
+    if not max_inline_bytes:
+        return value
+    blob_dir = Path(blob_dir) if blob_dir is not None else None
+
+    def compact(item: Any) -> Any:
+        if isinstance(item, str):
+            # Un carácter ocupa a lo sumo 4 bytes: solo se codifican los textos dudosos
+            if len(item) * 4 > max_inline_bytes and len(item.encode("utf-8")) > max_inline_bytes:
+                return _blob_reference(item, blob_dir)
+            return item
+        if isinstance(item, dict):
+            return {key: compact(val) for key, val in item.items()}
+        if isinstance(item, (list, tuple)):
+            return [compact(val) for val in item]
+        return item
+
+    return compact(value)
+
+
+def dumps_line(record: Dict[str, Any]) -> str:
+    """Serializa un registro como una línea JSON compacta (con salto de línea)"""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+
+
+class JsonlWriter:
+    """
+    Escritor de resultados JSONL línea a línea.
+
+    Cada ``write`` escribe y vacía el buffer inmediatamente, de modo que otro
+    proceso puede leer el archivo mientras crece y una interrupción no pierde
+    los resultados ya escritos.
+    """
+
+    def __init__(self, output_path: Union[str, Path], append: bool = False):
+        """
+        Abre el archivo de salida.
+
+        Args:
+            output_path: Archivo JSONL
+            append: True para agregar al final en lugar de sobrescribir
+        """
+        self.output_path = Path(output_path)
+        self._file = open(self.output_path, 'a' if append else 'w', encoding='utf-8')
+        self.lines_written = 0
+
+    def write(self, record: Dict[str, Any]):
+        """Escribe un registro como una línea"""
+        self._file.write(dumps_line(record))
+        self._file.flush()
+        self.lines_written += 1
+
+    def close(self):
+        """Cierra el archivo"""
+        self._file.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
@@ -4,7 +4,6 @@ Proporciona flexibilidad para diferentes tipos de evaluación y pesos.
 """
 from typing import Dict, Any, List, Optional, Callable
 from pathlib import Path
-import yaml
 
 
 class ScoringEngine:
@@ -423,7 +422,4 @@ def create_scoring_engine(criteria_path: Path) -> ScoringEngine:
     Returns:
         Motor de puntuación configurado
     """
-    with open(criteria_path, 'r', encoding='utf-8') as f:
-        criteria = yaml.safe_load(f)
-    
-    return ScoringEngine(criteria)
+    return ScoringEngine(load_criteria(criteria_path))
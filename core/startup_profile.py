@@ -0,0 +1,198 @@
+"""
+Perfil de arranque del CLI.
+Mide, sin depender de ``python -X importtime``, cuánto cuesta importar cada
+módulo (búsqueda + ejecución) y cada fase del arranque, y lo compara con un
+presupuesto de importación.
+"""
+import sys
+import threading
+import time
+from typing import Dict, Any, List
+
+
+# Presupuesto de importación del CLI en milisegundos (imports de primer nivel)
+DEFAULT_STARTUP_BUDGET_MS = 250
+
+# Prefijo de los módulos de checks que se ejecutan de forma diferida
+CHECK_MODULE_PREFIX = "weeks.week"
+
+
+class _TimingFinder:
+    """Meta path finder que delega la búsqueda y cronometra la ejecución de cada módulo"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        started = time.perf_counter()
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        find_ms = (time.perf_counter() - started) * 1000
+
+        loader = spec.loader
+        # Los importadores built-in/frozen son clases compartidas: no se modifican
+        if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+            loader.exec_module = self.profiler._timed_exec(fullname, loader.exec_module, find_ms)
+        return spec
+
+
+class StartupProfiler:
+    """
+    Registra el tiempo de cada import mientras está instalado.
+
+    Por módulo se guarda el tiempo de búsqueda, el tiempo de ejecución propio
+    (sin los imports anidados) y el acumulado, igual que ``-X importtime``.
+    """
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        self.phases: List[Dict[str, Any]] = []
+        self._finder = _TimingFinder(self)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def install(self) -> "StartupProfiler":
+        """Empieza a medir los imports siguientes"""
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+        return self
+
+    def uninstall(self):
+        """Deja de medir imports"""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _timed_exec(self, module_name: str, exec_module, find_ms: float):
+        """Envuelve ``loader.exec_module`` para medir un módulo"""
+        def timed_exec_module(module):
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                # Como en -X importtime, el acumulado incluye la búsqueda del módulo
+                cumulative_ms = (time.perf_counter() - started) * 1000 + find_ms
+                children_ms = stack.pop()
+                if stack:
+                    stack[-1] += cumulative_ms
+                with self._lock:
+                    self.records.append({
+                        "module": module_name,
+                        "kind": "check" if ".checks." in module_name and module_name.startswith(CHECK_MODULE_PREFIX) else "import",
+                        "depth": len(stack),
+                        "find_ms": round(find_ms, 3),
+                        "self_ms": round(cumulative_ms - children_ms, 3),
+                        "cumulative_ms": round(cumulative_ms, 3)
+                    })
+        return timed_exec_module
+
+    def phase(self, name: str) -> "_Phase":
+        """
+        Mide una fase del arranque::
+
+            with profiler.phase("evaluación"):
+                ...
+        """
+        return _Phase(self, name)
+
+    def total_import_ms(self) -> float:
+        """Tiempo total de imports (suma de los imports de primer nivel)"""
+        return round(sum(r["cumulative_ms"] for r in self.records if r["depth"] == 0), 3)
+
+    def get_summary(self, budget_ms: float = DEFAULT_STARTUP_BUDGET_MS) -> Dict[str, Any]:
+        """
+        Resume el perfil.
+
+        Args:
+            budget_ms: Presupuesto de importación en milisegundos
+
+        Returns:
+            Dict con totales, fases, módulos y si se excedió el presupuesto
+        """
+        total_import_ms = self.total_import_ms()
+        return {
+            "elapsed_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "total_import_ms": total_import_ms,
+            "budget_ms": budget_ms,
+            "over_budget": total_import_ms > budget_ms,
+            "modules_imported": len(self.records),
+            "check_modules": [r["module"] for r in self.records if r["kind"] == "check"],
+            "phases": list(self.phases),
+            "modules": sorted(self.records, key=lambda r: r["cumulative_ms"], reverse=True)
+        }
+
+    def format_report(self, budget_ms: float = DEFAULT_STARTUP_BUDGET_MS, top: int = 25) -> str:
+        """
+        Genera el reporte legible del perfil.
+
+        Args:
+            budget_ms: Presupuesto de importación en milisegundos
+            top: Número de módulos a listar
+
+        Returns:
+            Reporte en texto plano
+        """
+        summary = self.get_summary(budget_ms)
+        lines = [
+            "",
+            "=== PERFIL DE ARRANQUE ===",
+            f"Tiempo total: {summary['elapsed_ms']:.1f} ms",
+            f"Imports: {summary['total_import_ms']:.1f} ms en {summary['modules_imported']} módulos "
+            f"(presupuesto: {budget_ms:.0f} ms)",
+        ]
+        if summary["over_budget"]:
+            lines.append(f"⚠️  Los imports exceden el presupuesto por {summary['total_import_ms'] - budget_ms:.1f} ms")
+        else:
+            lines.append("✅ Imports dentro del presupuesto")
+
+        if summary["phases"]:
+            lines.append("")
+            lines.append("Fases:")
+            for phase in summary["phases"]:
+                lines.append(f"  {phase['name']:<32} {phase['elapsed_ms']:>9.1f} ms")
+
+        check_records = [r for r in self.records if r["kind"] == "check"]
+        if check_records:
+            lines.append("")
+            lines.append("Módulos de checks (carga diferida):")
+            for record in check_records:
+                lines.append(f"  {record['module']:<46} {record['cumulative_ms']:>9.1f} ms")
+
+        lines.append("")
+        lines.append(f"{'Módulo':<48} {'propio':>9} {'acumulado':>10} {'búsqueda':>9}")
+        for record in summary["modules"][:top]:
+            lines.append(f"{record['module'][:48]:<48} {record['self_ms']:>9.1f} {record['cumulative_ms']:>10.1f} "
+                         f"{record['find_ms']:>9.1f}")
+        return "\n".join(lines)
+
+
+class _Phase:
+    """Context manager de ``StartupProfiler.phase``"""
+
+    def __init__(self, profiler: StartupProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.phases.append({
+            "name": self.name,
+            "elapsed_ms": round((time.perf_counter() - self._started) * 1000, 3)
+        })
+        return False
+
+
+def create_startup_profiler() -> StartupProfiler:
+    """Factory function para crear e instalar un perfilador de arranque"""
+    return StartupProfiler().install()
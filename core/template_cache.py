@@ -0,0 +1,137 @@
+"""
+Caché de templates de reporte compilados.
+Cada ``templates/feedback.md`` se lee y se compila una sola vez por proceso
+(mientras no cambie su fecha de modificación ni su tamaño), y cada reporte se
+renderiza contra la versión compilada en lugar de volver a leer el archivo.
+"""
+import string
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+
+_FORMATTER = string.Formatter()
+
+
+class CompiledTemplate:
+    """
+    Template de reporte ya parseado.
+
+    Soporta las dos sintaxis que usan los reportes: campos de ``str.format``
+    (``{total_score}``), con la misma semántica que ``text.format(**variables)``,
+    y placeholders de ``string.Template`` (``$total_score``) con ``safe_substitute``.
+    """
+
+    def __init__(self, text: str, source: str = "<template>"):
+        """
+        Compila el template.
+
+        Args:
+            text: Contenido del template
+            source: Origen del template (para mensajes)
+        """
+        self.text = text
+        self.source = source
+        self._string_template = string.Template(text)
+        # Segmentos (literal, campo, conversión, formato); None si hace falta str.format completo
+        self._segments: Optional[List[Tuple[str, Optional[str], Optional[str], str]]] = []
+        self._error: Optional[ValueError] = None
+        self.fields: List[str] = []
+
+        try:
+            for literal, field_name, format_spec, conversion in _FORMATTER.parse(text):
+                if field_name is not None:
+                    self.fields.append(field_name)
+                    if not field_name.isidentifier() or "{" in format_spec:
+                        # Índices, atributos o formatos anidados: se delega en str.format
+                        self._segments = None
+                if self._segments is not None:
+                    self._segments.append((literal, field_name, conversion, format_spec))
+        except ValueError as e:
+            self._error = e
+            self._segments = None
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        Renderiza los campos ``{nombre}`` del template.
+
+        Args:
+            variables: Valores de los campos
+
+        Returns:
+            Texto renderizado
+
+        Raises:
+            KeyError: Si falta una variable usada por el template
+            ValueError: Si el template no es un format string válido
+        """
+        if self._error is not None:
+            raise ValueError(f"{self.source}: {self._error}")
+        if self._segments is None:
+            return self.text.format(**variables)
+
+        parts = []
+        for literal, field_name, conversion, format_spec in self._segments:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            value = variables[field_name]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+        return "".join(parts)
+
+    def safe_substitute(self, variables: Dict[str, Any]) -> str:
+        """Reemplaza los placeholders ``$nombre`` dejando intactos los desconocidos"""
+        return self._string_template.safe_substitute(variables)
+
+
+_TEMPLATES: Dict[str, Tuple[int, int, CompiledTemplate]] = {}
+_LOCK = threading.Lock()
+
+
+def get_template(template_path: Union[str, Path]) -> CompiledTemplate:
+    """
+    Obtiene un template compilado, cacheado por proceso.
+
+    La caché se indexa por ruta y se invalida si cambian la fecha de
+    modificación o el tamaño del archivo.
+
+    Args:
+        template_path: Ruta al template
+
+    Returns:
+        CompiledTemplate
+
+    Raises:
+        FileNotFoundError: Si el template no existe
+    """
+    path = Path(template_path)
+    stat = path.stat()
+    key = str(path)
+
+    with _LOCK:
+        cached = _TEMPLATES.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        compiled = CompiledTemplate(f.read(), source=key)
+
+    with _LOCK:
+        _TEMPLATES[key] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+
+def find_template(template_path: Union[str, Path]) -> Optional[CompiledTemplate]:
+    """Como ``get_template``, pero devuelve None si el template no existe"""
+    try:
+        return get_template(template_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def clear_template_cache():
+    """Descarta todos los templates compilados"""
+    with _LOCK:
+        _TEMPLATES.clear()
@@ -0,0 +1,180 @@
+"""
+Registro de evaluadores semanales.
+Las semanas se descubren a partir de los directorios ``weeks/weekNN``; el
+evaluador de cada semana y sus módulos de checks se importan la primera vez que
+se usan y quedan cacheados en el proceso.
+"""
+import importlib
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Union
+
+
+WEEKS_DIR = Path(__file__).parent.parent / "weeks"
+
+# Directorios de semana: weeks/week01, weeks/week02, ...
+WEEK_DIR_PATTERN = re.compile(r"^week(\d{2})$")
+
+# Resultado de un check cuyo módulo no se pudo importar
+DEFAULT_UNAVAILABLE_RESULT = {"error": "Module not available"}
+
+_EVALUATOR_CLASSES: Dict[int, type] = {}
+_LOCK = threading.RLock()
+
+
+def discover_weeks(weeks_dir: Union[str, Path] = WEEKS_DIR) -> Dict[int, Path]:
+    """
+    Descubre las semanas disponibles.
+
+    Una semana está disponible si su directorio tiene ``evaluator.py`` y
+    ``criteria.yaml``. Solo se lista el directorio; no se importa nada.
+
+    Args:
+        weeks_dir: Directorio ``weeks``
+
+    Returns:
+        Dict número de semana -> directorio, ordenado por semana
+    """
+    weeks = {}
+    for entry in Path(weeks_dir).iterdir():
+        match = WEEK_DIR_PATTERN.match(entry.name)
+        if match and (entry / "evaluator.py").is_file() and (entry / "criteria.yaml").is_file():
+            weeks[int(match.group(1))] = entry
+    return dict(sorted(weeks.items()))
+
+
+def get_evaluator_class(week_number: int) -> type:
+    """
+    Obtiene la clase evaluadora de una semana, importándola una sola vez por proceso.
+
+    Args:
+        week_number: Número de semana (1-11)
+
+    Returns:
+        Clase ``WeekNNEvaluator`` correspondiente
+
+    Raises:
+        ValueError: Si la semana no tiene evaluador
+    """
+    evaluator_class = _EVALUATOR_CLASSES.get(week_number)
+    if evaluator_class is not None:
+        return evaluator_class
+
+    with _LOCK:
+        evaluator_class = _EVALUATOR_CLASSES.get(week_number)
+        if evaluator_class is None:
+            if week_number not in discover_weeks():
+                raise ValueError(f"Semana {week_number} no está implementada")
+            module = importlib.import_module(f"weeks.week{week_number:02d}.evaluator")
+            evaluator_class = getattr(module, f"Week{week_number:02d}Evaluator")
+            _EVALUATOR_CLASSES[week_number] = evaluator_class
+    return evaluator_class
+
+
+def create_evaluator(week_number: int, student_repo_path: str, **kwargs):
+    """
+    Factory function para crear el evaluador de una semana.
+
+    Args:
+        week_number: Número de semana
+        student_repo_path: Ruta al repositorio del estudiante
+        **kwargs: Argumentos adicionales del evaluador (ej: ``repo_index``)
+
+    Returns:
+        Instancia del evaluador
+    """
+    return get_evaluator_class(week_number)(student_repo_path, **kwargs)
+
+
+class LazyCheck:
+    """
+    Referencia a una función de check que se importa al usarse por primera vez.
+
+    El módulo se importa como ``weeks.weekNN.checks.<módulo>``, así que cada
+    semana tiene su propio espacio de nombres y el módulo se ejecuta una sola
+    vez por proceso aunque lo usen varios evaluadores o tests. Si el módulo no
+    se puede importar, el check devuelve ``default_return``.
+    """
+
+    def __init__(self, week_number: int, module_name: str, function_name: Optional[str] = None,
+                 default_return: Optional[Dict[str, Any]] = None):
+        """
+        Declara el check sin importarlo.
+
+        Args:
+            week_number: Semana a la que pertenece el check
+            module_name: Nombre del archivo en ``weeks/weekNN/checks`` (sin ``.py``)
+            function_name: Función del check (default: ``check_<módulo>``)
+            default_return: Resultado si el módulo no está disponible
+        """
+        self.week_number = week_number
+        self.module_name = module_name
+        self.function_name = function_name or f"check_{module_name}"
+        self.default_return = default_return if default_return is not None else DEFAULT_UNAVAILABLE_RESULT
+        self._function: Optional[Callable] = None
+
+    @property
+    def qualified_module(self) -> str:
+        """Nombre completo del módulo del check"""
+        return f"weeks.week{self.week_number:02d}.checks.{self.module_name}"
+
+    def load(self) -> Callable:
+        """
+        Importa el módulo (una sola vez) y devuelve la función del check.
+
+        Returns:
+            Función del check, o una función que devuelve ``default_return``
+        """
+        if self._function is not None:
+            return self._function
+
+        with _LOCK:
+            if self._function is None:
+                try:
+                    module = importlib.import_module(self.qualified_module)
+                    self._function = getattr(module, self.function_name)
+                except Exception as e:
+                    print(f"Warning: Could not import {self.module_name} check: {e}")
+                    self._function = self._unavailable(str(e))
+        return self._function
+
+    def _unavailable(self, error: str) -> Callable:
+        """Función de reemplazo para un check que no se pudo importar"""
+        default_return = dict(self.default_return)
+        if "error" in default_return:
+            default_return["error"] = f"{default_return['error']}: {error}"
+
+        def unavailable_check(repo_path, **kwargs):
+            return dict(default_return)
+        return unavailable_check
+
+    def __call__(self, *args, **kwargs) -> Dict[str, Any]:
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyCheck({self.qualified_module}.{self.function_name})"
+
+
+def lazy_check(week_number: int, module_name: str, function_name: Optional[str] = None,
+               default_return: Optional[Dict[str, Any]] = None) -> LazyCheck:
+    """
+    Declara un check que se importa de forma diferida (ver ``LazyCheck``).
+
+    Args:
+        week_number: Semana a la que pertenece el check
+        module_name: Nombre del archivo en ``weeks/weekNN/checks``
+        function_name: Función del check (default: ``check_<módulo>``)
+        default_return: Resultado si el módulo no está disponible
+
+    Returns:
+        LazyCheck
+    """
+    return LazyCheck(week_number, module_name, function_name, default_return)
+
+
+def resolve_check(check_function: Callable) -> Callable:
+    """Devuelve la función real de un check, importándola si es un LazyCheck"""
+    if isinstance(check_function, LazyCheck):
+        return check_function.load()
+    return check_function
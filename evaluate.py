@@ -5,34 +5,21 @@ Punto de entrada principal para evaluaciones via CLI
 """
 
 import argparse
+import os
 import sys
 import json
 from pathlib import Path
-from typing import Dict, Any
+from contextlib import ExitStack, nullcontext
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio actual al Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 def get_evaluator_for_week(week_number: int, student_repo_path: str):
-    """Obtiene el evaluador correcto para la semana especificada"""
+    """Obtiene el evaluador correcto para la semana especificada (ver core.week_registry)"""
+    from core.week_registry import create_evaluator
     try:
-        if week_number == 1:
-            from weeks.week01.evaluator import Week01Evaluator
-            return Week01Evaluator(student_repo_path)
-        elif week_number == 2:
-            from weeks.week02.evaluator import Week02Evaluator
-            return Week02Evaluator(student_repo_path)
-        elif week_number == 3:
-            from weeks.week03.evaluator import Week03Evaluator
-            return Week03Evaluator(student_repo_path)
-        elif week_number == 4:
-            from weeks.week04.evaluator import Week04Evaluator
-            return Week04Evaluator(student_repo_path)
-        elif week_number == 5:
-            from weeks.week05.evaluator import Week05Evaluator
-            return Week05Evaluator(student_repo_path)
-        else:
-            raise ValueError(f"Semana {week_number} no está implementada")
+        return create_evaluator(week_number, student_repo_path)
     except ImportError as e:
         raise ImportError(f"No se pudo cargar el evaluador para la semana {week_number}: {e}")
 
@@ -40,12 +27,24 @@ def format_output(result: Dict[str, Any], format_type: str) -> str:
     """Formatea el resultado según el tipo especificado"""
     if format_type == "json":
         return json.dumps(result, indent=2, ensure_ascii=False)
+    elif format_type == "jsonl":
+        from core.result_stream import dumps_line
+        return dumps_line(result).rstrip("\n")
     elif format_type == "markdown":
         return result.get('report', '# Error: No se pudo generar el reporte')
     elif format_type == "summary":
         final_score = result.get('final_score', 0)
         passed = result.get('passed', False)
         status = "✅ APROBADO" if passed else "❌ NO APROBADO"
+        timed_out = ""
+        if result.get('timed_out'):
+            timed_out = f"⏱️ Checks sin completar (tiempo límite): {', '.join(result.get('timed_out_checks', []))}\n"
+        slowest = ""
+        if result.get('metrics'):
+            checks = sorted(result['metrics']['checks'].items(), key=lambda item: item[1]['wall_seconds'], reverse=True)[:3]
+            slowest = "Checks más lentos: " + ", ".join(
+                f"{name} {m['wall_seconds'] * 1000:.0f} ms ({m['files_read']} archivos, {m['peak_memory_bytes'] // 1024} KiB)"
+                for name, m in checks) + "\n"
         
         return f"""
 === RESUMEN DE EVALUACIÓN ===
@@ -54,12 +53,229 @@ Puntuación Final: {final_score:.1f}%
 Estado: {status}
 Umbral de Aprobación: {result.get('passing_threshold', 70)}%
 Duración: {result.get('duration_seconds', 0):.2f} segundos
-"""
+{timed_out}{slowest}"""
     else:
         return str(result)
 
-def main():
-    """Función principal del CLI"""
+def create_instrumentation(args):
+    """Crea el TraceRecorder y el ProfileCollector pedidos con --trace y --profile"""
+    if not args.trace and not args.profile:
+        return None, None
+    from core.profiling import TraceRecorder, ProfileCollector
+    tracer = TraceRecorder("evaluate.py") if args.trace else None
+    collector = ProfileCollector() if args.profile else None
+    return tracer, collector
+
+def write_instrumentation(args, tracer, collector):
+    """Escribe la traza y el perfil en los archivos indicados"""
+    if tracer is not None:
+        tracer.write(args.trace)
+        print(f"🧭 Traza guardada en: {args.trace} (abrir en chrome://tracing o ui.perfetto.dev)", file=sys.stderr)
+    if collector is not None:
+        collector.write(args.profile)
+        print(f"🔥 Perfil guardado en: {args.profile} (stacks colapsados para flamegraph)", file=sys.stderr)
+
+def run_batch_mode(args) -> int:
+    """Ejecuta el modo por lotes a partir de un manifiesto"""
+    from core.batch import load_manifest, run_batch, DEFAULT_FETCH_CONCURRENCY
+    
+    if not args.output:
+        print("❌ Error: --output es requerido en modo por lotes (archivo JSONL)", file=sys.stderr)
+        return 2
+    
+    try:
+        jobs = load_manifest(args.batch)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error leyendo el manifiesto: {e}", file=sys.stderr)
+        return 2
+    
+    if args.verbose:
+        print(f"📦 Evaluando {len(jobs)} repositorios con {args.workers or 'auto'} workers")
+    
+    mirror_cache = None
+    if args.mirror_cache:
+        from core.mirror_cache import MirrorCache
+        mirror_cache = MirrorCache(args.mirror_cache)
+    
+    if args.queue:
+        # Los workers de la cola son procesos independientes: sin trazas ni perfiles
+        from core.batch import run_queued_batch
+        summary = run_queued_batch(jobs, args.queue, args.output, workers=args.workers, summary_path=args.summary,
+                                   max_inline_bytes=args.max_inline_bytes, blob_dir=args.blob_dir,
+                                   full_results=args.full_results,
+                                   fetch_concurrency=args.fetch_concurrency or DEFAULT_FETCH_CONCURRENCY,
+                                   mirror_cache=mirror_cache, max_attempts=args.max_attempts)
+        if summary['resumed']:
+            print(f"♻️  {summary['resumed']} jobs ya estaban terminados en la cola {args.queue}")
+        if summary['pending']:
+            print(f"⚠️  {summary['pending']} jobs quedaron sin terminar; vuelve a ejecutar el lote para retomarlos",
+                  file=sys.stderr)
+    else:
+        tracer, collector = create_instrumentation(args)
+        summary = run_batch(jobs, args.output, workers=args.workers, summary_path=args.summary,
+                            max_inline_bytes=args.max_inline_bytes, blob_dir=args.blob_dir,
+                            full_results=args.full_results, fetch_concurrency=args.fetch_concurrency or DEFAULT_FETCH_CONCURRENCY,
+                            mirror_cache=mirror_cache, tracer=tracer, profile_collector=collector)
+        write_instrumentation(args, tracer, collector)
+    
+    print(f"""
+=== RESUMEN DE LOTE ===
+Repositorios: {summary['total']}
+Aprobados: {summary['passed']}
+No aprobados: {summary['failed']}
+Errores: {summary['errors']}
+Con tiempo límite excedido: {summary['timed_out']}
+Descargados: {summary['fetched']} ({summary['fetch_seconds']:.2f} s de descarga acumulada)
+Duración: {summary['duration_seconds']:.2f} segundos ({summary['repos_per_second']} repos/s)
+""")
+    return 0 if summary['errors'] == 0 and not summary.get('pending') else 1
+
+def compile_criteria_command(argv: List[str]) -> int:
+    """Subcomando ``compile-criteria``: valida los criteria.yaml y genera el bundle precompilado"""
+    from core.criteria_bundle import compile_criteria_bundle, DEFAULT_BUNDLE_PATH
+    
+    parser = argparse.ArgumentParser(
+        prog="evaluate.py compile-criteria",
+        description="Valida weeks/*/criteria.yaml y genera el bundle precompilado que usan los evaluadores"
+    )
+    parser.add_argument('--output', '-o', type=str, default=str(DEFAULT_BUNDLE_PATH),
+                        help=f'Ruta del bundle (default: {DEFAULT_BUNDLE_PATH})')
+    parser.add_argument('--check', action='store_true',
+                        help='Solo validar, sin escribir el bundle')
+    args = parser.parse_args(argv)
+    
+    summary = compile_criteria_bundle(bundle_path=args.output, write=not args.check)
+    for error in summary['errors']:
+        print(f"❌ {error}", file=sys.stderr)
+    if summary['errors']:
+        return 1
+    
+    for week, checks in summary['weeks'].items():
+        print(f"✅ Semana {week}: {checks} checks")
+    if summary['written']:
+        print(f"📦 Bundle generado en: {summary['bundle_path']}")
+    return 0
+
+def benchmark_command(argv: List[str]) -> int:
+    """Subcomando ``benchmark``: mide los evaluadores sobre repos sintéticos y detecta regresiones"""
+    from core.benchmark import (
+        BENCHMARK_SIZES, DEFAULT_REGRESSION_THRESHOLD, run_benchmarks, compare_benchmarks,
+        load_benchmark, save_benchmark, format_benchmark_report
+    )
+    
+    parser = argparse.ArgumentParser(
+        prog="evaluate.py benchmark",
+        description="Mide cada evaluador semanal y cada check sobre repositorios sintéticos de varios tamaños"
+    )
+    parser.add_argument('--weeks', type=str,
+                        help='Semanas separadas por coma (default: todas)')
+    parser.add_argument('--sizes', type=str, default=",".join(BENCHMARK_SIZES),
+                        help=f'Tamaños separados por coma (default: {",".join(BENCHMARK_SIZES)})')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Evaluaciones por semana y tamaño; se guarda la mediana (default: 3)')
+    parser.add_argument('--output', '-o', type=str,
+                        help='Archivo JSON donde guardar la medición (línea base)')
+    parser.add_argument('--compare', type=str, metavar='BASELINE',
+                        help='Línea base contra la que comparar; sale con código 1 si hay regresiones')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help=f'Aumento relativo tolerado antes de marcar regresión (default: {DEFAULT_REGRESSION_THRESHOLD})')
+    parser.add_argument('--work-dir', type=str,
+                        help='Directorio donde generar los repositorios sintéticos (default: temporal)')
+    args = parser.parse_args(argv)
+    
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in BENCHMARK_SIZES]
+    if unknown:
+        parser.error(f"Tamaños desconocidos: {', '.join(unknown)}")
+    weeks = [int(week) for week in args.weeks.split(',')] if args.weeks else None
+    
+    def progress(key, entry):
+        print(f"⏱️  {key}: {entry['seconds'] * 1000:.0f} ms ({entry['files']} archivos)", file=sys.stderr)
+    
+    current = run_benchmarks(weeks, sizes, repeats=args.repeats, work_dir=args.work_dir, progress=progress)
+    regressions = compare_benchmarks(load_benchmark(args.compare), current, args.threshold) if args.compare else None
+    print(format_benchmark_report(current, regressions))
+    
+    if args.output:
+        save_benchmark(current, args.output)
+        print(f"📦 Medición guardada en: {args.output}")
+    return 1 if regressions else 0
+
+def serve_command(argv: List[str]) -> int:
+    """Subcomando ``serve``: daemon con los evaluadores precargados que recibe jobs por HTTP local"""
+    from core.daemon import (
+        EvaluationDaemon, create_daemon_server, DEFAULT_DAEMON_HOST, DEFAULT_DAEMON_PORT, DEFAULT_MAX_QUEUE,
+        DEFAULT_RECYCLE_AFTER
+    )
+    
+    parser = argparse.ArgumentParser(
+        prog="evaluate.py serve",
+        description="Mantiene los evaluadores cargados y atiende evaluaciones por HTTP (TCP o socket Unix)"
+    )
+    parser.add_argument('--host', type=str, default=DEFAULT_DAEMON_HOST,
+                        help=f'Interfaz donde escuchar (default: {DEFAULT_DAEMON_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_DAEMON_PORT,
+                        help=f'Puerto TCP (default: {DEFAULT_DAEMON_PORT})')
+    parser.add_argument('--socket', type=str,
+                        help='Escuchar en un socket Unix en lugar de TCP')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Procesos de evaluación (default: número de CPUs)')
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help=f'Jobs pendientes máximos antes de responder 503 (default: {DEFAULT_MAX_QUEUE})')
+    parser.add_argument('--recycle-after', type=int, default=DEFAULT_RECYCLE_AFTER,
+                        help=f'Jobs tras los cuales se renuevan los workers (default: {DEFAULT_RECYCLE_AFTER})')
+    parser.add_argument('--mirror-cache', type=str,
+                        help='Directorio de mirrors git para los repos remotos')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Registrar cada request en stderr')
+    args = parser.parse_args(argv)
+    
+    mirror_cache = None
+    if args.mirror_cache:
+        from core.mirror_cache import MirrorCache
+        mirror_cache = MirrorCache(args.mirror_cache)
+    
+    daemon = EvaluationDaemon(args.workers, args.max_queue, mirror_cache=mirror_cache,
+                              recycle_after=max(1, args.recycle_after))
+    print(f"🔥 Precargando semanas {', '.join(str(week) for week in daemon.weeks)} en {daemon.workers} workers...",
+          file=sys.stderr)
+    daemon.start()
+    server = create_daemon_server(daemon, args.host, args.port, args.socket, verbose=args.verbose)
+    address = f"unix://{args.socket}" if args.socket else f"http://{args.host}:{server.server_address[1]}"
+    print(f"🚀 Daemon escuchando en {address} (usa --daemon {address} o ${{FASTAPI_EVALUATOR_DAEMON}})",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Deteniendo daemon...", file=sys.stderr)
+    finally:
+        server.server_close()
+        daemon.shutdown()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Función principal del CLI.
+    
+    Args:
+        argv: Argumentos (default: sys.argv[1:]); permite invocar el CLI en el mismo proceso
+        
+    Returns:
+        Exit code
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "compile-criteria":
+        return compile_criteria_command(argv[1:])
+    if argv and argv[0] == "benchmark":
+        return benchmark_command(argv[1:])
+    if argv and argv[0] == "serve":
+        return serve_command(argv[1:])
+    
+    from core.result_stream import DEFAULT_MAX_INLINE_BYTES
+    
     parser = argparse.ArgumentParser(
         description="Sistema de Evaluación Automática FastAPI Course",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -68,28 +284,115 @@ Ejemplos de uso:
   python evaluate.py --week 1 --repo /path/to/student/repo
   python evaluate.py -w 5 -r /path/to/repo --format json
   python evaluate.py --week 3 --repo /path/to/repo --output results.md --format markdown
+  python evaluate.py --batch manifest.csv --workers 8 --output results.jsonl --summary summary.json
+  python evaluate.py --batch manifest.csv --queue jobs.sqlite3 --output results.jsonl
+  python evaluate.py --week 1 --repo /path/to/repo --format jsonl --output results.jsonl --blob-dir blobs/
+  python evaluate.py --week 2 --repo /path/to/repo --cache-dir ~/.cache/fastapi-evaluator
+  python evaluate.py --week 1 --repo /path/to/repo --profile-startup
+  python evaluate.py --week 3 --repo /path/to/repo --metrics --format json
+  python evaluate.py --week 5 --repo /path/to/repo --trace trace.json --profile profile.folded
+  python evaluate.py compile-criteria
+  python evaluate.py benchmark --weeks 1,2 --output benchmarks/baseline.json
+  python evaluate.py benchmark --compare benchmarks/baseline.json --threshold 0.25
+  python evaluate.py serve --port 8765 --workers 4
+  python evaluate.py --week 2 --repo /path/to/repo --daemon http://127.0.0.1:8765
         """
     )
     
     parser.add_argument(
         '-w', '--week',
         type=int,
-        required=True,
         help='Número de semana a evaluar (1-11)'
     )
     
     parser.add_argument(
         '-r', '--repo',
         type=str,
-        required=True,
         help='Ruta al repositorio del estudiante'
     )
     
+    parser.add_argument(
+        '--batch',
+        type=str,
+        metavar='MANIFEST',
+        help='Manifiesto CSV/JSONL (columnas repo, week) para evaluación por lotes; repo puede ser una ruta o una URL git'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Procesos para el modo por lotes (default: número de CPUs)'
+    )
+    
+    parser.add_argument(
+        '--fetch-concurrency',
+        type=int,
+        help='Descargas simultáneas de repos remotos (URLs git) en modo por lotes (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--mirror-cache',
+        type=str,
+        help='Directorio de mirrors persistentes para los repos remotos del modo por lotes'
+    )
+    
+    parser.add_argument(
+        '--queue',
+        type=str,
+        metavar='QUEUE_DB',
+        help='Cola SQLite persistente del modo por lotes: al repetir el lote se retoma sin reevaluar lo terminado'
+    )
+    
+    parser.add_argument(
+        '--max-attempts',
+        type=int,
+        default=3,
+        help='Intentos por job en la cola persistente, incluidos los de workers caídos (default: 3)'
+    )
+    
+    parser.add_argument(
+        '--summary',
+        type=str,
+        help='Archivo JSON con el resumen del modo por lotes'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Directorio de la caché de resultados; reutiliza evaluaciones de repos sin cambios'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignorar la caché de resultados aunque esté configurada por entorno'
+    )
+    
     parser.add_argument(
         '--format',
-        choices=['json', 'markdown', 'summary'],
+        choices=['json', 'jsonl', 'markdown', 'summary'],
         default='summary',
-        help='Formato de salida (default: summary)'
+        help='Formato de salida (default: summary); jsonl agrega una línea compacta al archivo de salida'
+    )
+    
+    parser.add_argument(
+        '--max-inline-bytes',
+        type=int,
+        default=DEFAULT_MAX_INLINE_BYTES,
+        help=f'En jsonl y modo por lotes, textos más grandes se reemplazan por una referencia sha256 '
+             f'(default: {DEFAULT_MAX_INLINE_BYTES}; 0 = resultados completos)'
+    )
+    
+    parser.add_argument(
+        '--full-results',
+        action='store_true',
+        help='No aplicar la política de tamaño de resultados (fuentes crudos, textos largos, duplicados)'
+    )
+    
+    parser.add_argument(
+        '--blob-dir',
+        type=str,
+        help='Directorio donde guardar los textos reemplazados por referencias'
     )
     
     parser.add_argument(
@@ -104,16 +407,108 @@ Ejemplos de uso:
         help='Mostrar información detallada'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help='Incluir en el resultado métricas por check y etapa (tiempo, CPU, archivos y bytes leídos, pico de memoria)'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        type=str,
+        metavar='TRACE_JSON',
+        help='Guardar spans de cada etapa y check en formato trace-event de Chrome (en lotes, todos los workers en una línea de tiempo)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        type=str,
+        metavar='FOLDED',
+        help='Perfilar con cProfile y guardar stacks colapsados para flamegraphs'
+    )
+    
+    parser.add_argument(
+        '--daemon',
+        type=str,
+        metavar='URL',
+        default=os.environ.get('FASTAPI_EVALUATOR_DAEMON'),
+        help='Evaluar en un daemon ya iniciado con "evaluate.py serve" (http://host:puerto o unix:///ruta.sock; '
+             'default: $FASTAPI_EVALUATOR_DAEMON). --metrics, --trace y --profile evalúan localmente'
+    )
+    
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='Reportar en stderr el tiempo de cada import, de cada módulo de checks y de cada fase'
+    )
+    
+    parser.add_argument(
+        '--startup-budget-ms',
+        type=float,
+        default=None,
+        help='Presupuesto de imports para --profile-startup (default: 250 ms)'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    profiler = None
+    if args.profile_startup:
+        from core.startup_profile import create_startup_profiler, DEFAULT_STARTUP_BUDGET_MS
+        profiler = create_startup_profiler()
+    
+    try:
+        return run_cli(args, parser, profiler)
+    finally:
+        if profiler is not None:
+            profiler.uninstall()
+            budget_ms = args.startup_budget_ms if args.startup_budget_ms is not None else DEFAULT_STARTUP_BUDGET_MS
+            print(profiler.format_report(budget_ms), file=sys.stderr)
+
+def _phase(profiler, name: str):
+    """Fase medida por --profile-startup (no hace nada si no está activo)"""
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+def _instrumented(tracer, collector, name: str, category: str):
+    """Span de --trace y perfil de --profile alrededor de un bloque del hilo principal"""
+    stack = ExitStack()
+    if tracer is not None:
+        stack.enter_context(tracer.span(name, category))
+    if collector is not None:
+        stack.enter_context(collector.profile_thread(name))
+    return stack
+
+def run_cli(args, parser, profiler=None) -> int:
+    """
+    Ejecuta el CLI con argumentos ya parseados.
+    
+    Returns:
+        Exit code (0 aprobado, 1 no aprobado o argumentos inválidos, 2 error)
+    """
+    # La caché se configura por entorno para que la hereden los workers del modo por lotes
+    from core.result_cache import CACHE_DIR_ENV
+    if args.no_cache:
+        os.environ.pop(CACHE_DIR_ENV, None)
+    elif args.cache_dir:
+        os.environ[CACHE_DIR_ENV] = args.cache_dir
+    
+    if args.metrics:
+        from core.metrics import METRICS_ENV
+        os.environ[METRICS_ENV] = "1"
+    
+    if args.batch:
+        return run_batch_mode(args)
+    
+    if args.week is None or args.repo is None:
+        parser.error("--week y --repo son requeridos (o usa --batch)")
     
     # Validar argumentos
     if not Path(args.repo).exists():
         print(f"❌ Error: El repositorio {args.repo} no existe", file=sys.stderr)
-        sys.exit(1)
+        return 1
     
     if args.week < 1 or args.week > 11:
         print(f"❌ Error: Semana {args.week} no válida (debe ser 1-11)", file=sys.stderr)
-        sys.exit(1)
+        return 1
     
     try:
         # Mostrar información inicial si es verbose
@@ -123,31 +518,72 @@ Ejemplos de uso:
             print(f"📄 Formato: {args.format}")
             print("-" * 50)
         
+        # La instrumentación mide el proceso actual, así que con ella se evalúa localmente
+        if args.daemon and not (args.metrics or args.trace or args.profile):
+            # Los evaluadores ya están cargados en el daemon, que aplica la política de tamaño
+            from core.daemon import submit_job
+            with _phase(profiler, "evaluación en daemon"):
+                result = submit_job(args.daemon, args.repo, args.week, args.format, args.full_results)
+            return _write_result(args, result, profiler)
+        
         # Obtener evaluador y ejecutar
-        evaluator = get_evaluator_for_week(args.week, args.repo)
-        result = evaluator.evaluate()
+        tracer, collector = create_instrumentation(args)
+        with _phase(profiler, "carga del evaluador"), \
+                _instrumented(tracer, collector, "carga del evaluador", "setup"):
+            evaluator = get_evaluator_for_week(args.week, args.repo)
+        evaluator.tracer, evaluator.profiler = tracer, collector
+        with _phase(profiler, "evaluación"), \
+                _instrumented(tracer, collector, "evaluación", "evaluate"):
+            result = evaluator.evaluate()
+        write_instrumentation(args, tracer, collector)
         
-        # Formatear salida
-        output = format_output(result, args.format)
+        if args.verbose and result.get('cache_hit'):
+            print("♻️  Resultado reutilizado de la caché (sin cambios en el repositorio ni en la rúbrica)")
         
-        # Escribir resultado
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output)
-            if args.verbose:
-                print(f"✅ Resultado guardado en: {args.output}")
-        else:
-            print(output)
+        if args.verbose:
+            resolution = result.get('check_resolution', {})
+            if resolution.get('missing'):
+                print(f"⚠️  Checks de criteria.yaml sin resultado: {', '.join(resolution['missing'])}", file=sys.stderr)
+            if resolution.get('ambiguous'):
+                print(f"⚠️  Checks con resultado ambiguo: {', '.join(resolution['ambiguous'])}", file=sys.stderr)
         
-        # Exit code basado en si pasó o no
-        sys.exit(0 if result.get('passed', False) else 1)
+        if not args.full_results:
+            result = evaluator.apply_result_policy(result, args.format)
+        return _write_result(args, result, profiler)
         
     except Exception as e:
         print(f"❌ Error durante la evaluación: {e}", file=sys.stderr)
         if args.verbose:
             import traceback
             traceback.print_exc()
-        sys.exit(2)
+        return 2
+
+def _write_result(args, result: Dict[str, Any], profiler=None) -> int:
+    """
+    Formatea y escribe el resultado de una evaluación.
+    
+    Returns:
+        Exit code (0 aprobado, 1 no aprobado)
+    """
+    # Formatear salida
+    with _phase(profiler, "formato de salida"):
+        if args.format == "jsonl":
+            from core.result_stream import compact_result
+            output = format_output(compact_result(result, args.max_inline_bytes, args.blob_dir), args.format)
+        else:
+            output = format_output(result, args.format)
+    
+    # Escribir resultado (en jsonl se agrega una línea por repo evaluado)
+    if args.output:
+        with open(args.output, 'a' if args.format == "jsonl" else 'w', encoding='utf-8') as f:
+            f.write(output + "\n" if args.format == "jsonl" else output)
+        if args.verbose:
+            print(f"✅ Resultado guardado en: {args.output}")
+    else:
+        print(output)
+    
+    # Exit code basado en si pasó o no
+    return 0 if result.get('passed', False) else 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,97 +1,64 @@
 #!/usr/bin/env python3
 """
 Script de compatibilidad para GitHub Actions
-Redirige al evaluate.py principal con los argumentos correctos
+Traduce los argumentos al formato de evaluate.py y ejecuta la evaluación
+en el mismo proceso (sin lanzar un segundo intérprete)
 """
 import sys
-import subprocess
-import tempfile
-import shutil
 import os
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import List, Optional
 
-def clone_repository(repo_url: str) -> str:
+# Agregar la raíz del proyecto al path para importar evaluate.py
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.repo_fetch import fetch_repository
+
+def run_evaluation(args: list) -> int:
     """
-    Clona un repositorio de GitHub y retorna la ruta local
+    Ejecuta evaluate.py en este mismo proceso.
     
     Args:
-        repo_url: URL del repositorio (puede incluir subcarpeta)
+        args: Argumentos para evaluate.py
         
     Returns:
-        Ruta local al repositorio clonado
+        Exit code de la evaluación
     """
-    # Crear directorio temporal
-    temp_dir = tempfile.mkdtemp(prefix="eval_repo_")
+    from evaluate import main as evaluate_main
     
     try:
-        # Extraer la URL base del repositorio y la subcarpeta
-        if "/tree/" in repo_url:
-            # URL con subcarpeta: https://github.com/user/repo/tree/branch/subfolder
-            parts = repo_url.split("/tree/")
-            base_repo_url = parts[0]
-            tree_path = parts[1]
-            
-            # Extraer branch y subfolder
-            tree_parts = tree_path.split("/", 1)
-            branch = tree_parts[0]
-            subfolder = tree_parts[1] if len(tree_parts) > 1 else ""
-        else:
-            # URL simple: https://github.com/user/repo
-            base_repo_url = repo_url
-            branch = "main"
-            subfolder = ""
-        
-        print(f"🔄 Clonando repositorio: {base_repo_url}")
-        if subfolder:
-            print(f"📁 Subcarpeta: {subfolder}")
-        
-        # Clonar el repositorio
-        clone_cmd = [
-            "git", "clone", 
-            "--depth", "1",  # Clone shallow para mayor velocidad
-            "--branch", branch,
-            base_repo_url, 
-            temp_dir
-        ]
-        
-        result = subprocess.run(clone_cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            # Si falla con la branch especificada, intentar con main/master
-            for default_branch in ["main", "master"]:
-                if default_branch != branch:
-                    print(f"🔄 Intentando con branch {default_branch}...")
-                    clone_cmd[5] = default_branch  # Reemplazar el branch
-                    result = subprocess.run(clone_cmd, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        break
-            
-            if result.returncode != 0:
-                raise Exception(f"Error clonando repositorio: {result.stderr}")
-        
-        # Si hay subcarpeta, apuntar a ella
-        if subfolder:
-            subfolder_path = Path(temp_dir) / subfolder
-            if not subfolder_path.exists():
-                raise Exception(f"Subcarpeta no encontrada: {subfolder}")
-            return str(subfolder_path)
-        
-        return temp_dir
-        
-    except Exception as e:
-        # Limpiar directorio temporal si hay error
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        raise e
+        return evaluate_main(args)
+    except SystemExit as e:
+        # argparse termina con SystemExit ante argumentos inválidos
+        return e.code if isinstance(e.code, int) else 1
 
-def main():
-    """Redirige al evaluate.py principal"""
-    # Ruta al script principal
-    main_script = Path(__file__).parent.parent / "evaluate.py"
+def get_mirror_cache(argv: List[str]):
+    """
+    Obtiene la caché de mirrors de ``--mirror-cache DIR`` o de
+    ``$FASTAPI_EVALUATOR_MIRROR_DIR`` (None si no está configurada)
+    
+    ``--mirror-budget-mb N`` fija el presupuesto de disco de la caché.
+    """
+    from core.mirror_cache import MirrorCache, MIRROR_DIR_ENV, DEFAULT_MIRROR_BUDGET_BYTES
+    
+    def option(name: str) -> Optional[str]:
+        if name in argv and argv.index(name) + 1 < len(argv):
+            return argv[argv.index(name) + 1]
+        return None
     
+    cache_dir = option("--mirror-cache") or os.environ.get(MIRROR_DIR_ENV)
+    if not cache_dir:
+        return None
+    budget_mb = option("--mirror-budget-mb")
+    max_bytes = int(float(budget_mb) * 1024 ** 2) if budget_mb else DEFAULT_MIRROR_BUDGET_BYTES
+    return MirrorCache(cache_dir, max_bytes)
+
+def main():
+    """Traduce los argumentos y ejecuta la evaluación"""
     # Argumentos por defecto para Semana 1 si no se especifican
     args = []
-    cloned_repo_path = None
+    cleanup_clone = None
+    mirror_cache = get_mirror_cache(sys.argv)
     
     # Procesar argumentos del estilo GitHub Actions
     i = 1
@@ -106,8 +73,7 @@ def main():
             else:
                 # Clonar repositorio remoto
                 try:
-                    repo_path = clone_repository(repo_url)
-                    cloned_repo_path = repo_path  # Guardar para limpieza posterior
+                    repo_path, cleanup_clone = fetch_repository(repo_url, mirror_cache)
                     print(f"✅ Repositorio clonado en: {repo_path}")
                 except Exception as e:
                     print(f"❌ Error clonando repositorio: {e}")
@@ -132,6 +98,12 @@ def main():
             json_file = sys.argv[i + 1]
             args.extend(["--output", json_file.replace('.json', '_full.json'), "--format", "json"])
             i += 2
+        elif arg == "--profile-startup":
+            args.append(arg)
+            i += 1
+        elif arg in ("--mirror-cache", "--mirror-budget-mb"):
+            # Ya procesados por get_mirror_cache
+            i += 2
         else:
             i += 1
     
@@ -140,34 +112,22 @@ def main():
         args = ["--week", "1"] + args
     
     try:
-        # Ejecutar el script principal
-        cmd = [sys.executable, str(main_script)] + args
-        result = subprocess.run(cmd, capture_output=False)
+        # Ejecutar la evaluación en este proceso
+        exit_code = run_evaluation(args)
+        sys.stdout.flush()
         
         # Si se pidió un archivo JSON específico, crear el formato esperado por GitHub Actions
         if "--out-json" in sys.argv:
             json_index = sys.argv.index("--out-json") + 1
             if json_index < len(sys.argv):
                 output_file = sys.argv[json_index]
-                create_github_actions_json(output_file, result.returncode == 0)
-        
-        exit_code = result.returncode
+                create_github_actions_json(output_file, exit_code == 0)
         
     finally:
         # Limpiar repositorio clonado si existe
-        if cloned_repo_path and os.path.exists(cloned_repo_path):
-            # Si es una subcarpeta, limpiar el directorio padre
-            cleanup_path = cloned_repo_path
-            if "/tmp/" in cloned_repo_path:
-                # Buscar el directorio temporal raíz
-                parts = cloned_repo_path.split("/")
-                for i, part in enumerate(parts):
-                    if part.startswith("eval_repo_"):
-                        cleanup_path = "/".join(parts[:i+1])
-                        break
-            
-            print(f"🧹 Limpiando repositorio temporal: {cleanup_path}")
-            shutil.rmtree(cleanup_path, ignore_errors=True)
+        if cleanup_clone is not None:
+            print("🧹 Limpiando repositorio temporal")
+            cleanup_clone()
     
     sys.exit(exit_code)
 
@@ -5,10 +5,32 @@ Script para re-evaluar issues existentes en GitHub
 """
 import os
 import sys
-import json
+import time
+import threading
 import requests
 import argparse
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional
+
+# URL base de la API (se puede cambiar con --api-url o $GITHUB_API_URL, ej: un servidor stub local)
+DEFAULT_API_URL = 'https://api.github.com'
+
+# Comentarios publicados en paralelo por defecto
+DEFAULT_CONCURRENCY = 4
+
+# Con menos requests restantes que esto se espera al reinicio de la ventana de rate limit
+RATE_LIMIT_RESERVE = 10
+
+# Reintentos de un request rechazado por rate limit
+MAX_RETRIES = 5
+
+COMMENT_BODY = (
+    "🔄 **Re-evaluación solicitada**\n\n"
+    "Esta evaluación fue activada por el script de re-evaluación.\n\n"
+    "/evaluar"
+)
+
 
 def get_github_token() -> str:
     """Obtiene el token de GitHub desde variables de entorno"""
@@ -19,56 +41,170 @@ def get_github_token() -> str:
         sys.exit(1)
     return token
 
-def get_issues(owner: str, repo: str, week: int, token: str, additional_labels: List[str] = None) -> List[Dict[str, Any]]:
-    """Obtiene issues que necesitan re-evaluación"""
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
+
+class GitHubClient:
+    """
+    Cliente mínimo de la API de GitHub.
+
+    Usa una sola ``requests.Session`` con un pool de conexiones del tamaño de
+    la concurrencia, y comparte entre hilos el estado del rate limit: cuando
+    quedan pocos requests (``X-RateLimit-Remaining``) o GitHub pide esperar
+    (``Retry-After``), todos los hilos se pausan hasta poder continuar.
+    """
+
+    def __init__(self, token: str, api_url: str = DEFAULT_API_URL, pool_size: int = DEFAULT_CONCURRENCY):
+        """
+        Inicializa el cliente.
+
+        Args:
+            token: Token de GitHub
+            api_url: URL base de la API
+            pool_size: Conexiones simultáneas máximas
+        """
+        self.api_url = api_url.rstrip('/')
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json'
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def _wait_for_rate_limit(self):
+        """Espera si algún request anterior agotó el rate limit"""
+        with self._lock:
+            delay = self._resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause_until(self, resume_at: float, reason: str):
+        """Pausa todos los requests hasta ``resume_at`` (epoch)"""
+        with self._lock:
+            if resume_at <= self._resume_at:
+                return
+            self._resume_at = resume_at
+        print(f"  ⏳ {reason}: esperando {max(0, resume_at - time.time()):.0f}s")
+
+    def _update_rate_limit(self, response: requests.Response) -> bool:
+        """
+        Registra el rate limit informado por una respuesta.
+
+        Returns:
+            True si la respuesta fue rechazada por rate limit y hay que reintentar
+        """
+        retry_after = response.headers.get('Retry-After')
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+
+        if retry_after is not None and response.status_code in (403, 429):
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = 60.0
+            self._pause_until(time.time() + delay, "GitHub pidió esperar (Retry-After)")
+            return True
+
+        if remaining is not None and reset is not None:
+            try:
+                remaining, reset = int(remaining), float(reset)
+            except ValueError:
+                return False
+            if remaining < RATE_LIMIT_RESERVE:
+                self._pause_until(reset + 1, f"Rate limit casi agotado ({remaining} restantes)")
+            if remaining == 0 and response.status_code in (403, 429):
+                return True
+
+        return False
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Hace un request respetando el rate limit y reintentando si GitHub lo rechaza.
+
+        Args:
+            method: Método HTTP
+            url: URL absoluta o ruta relativa a ``api_url``
+            **kwargs: Argumentos de ``requests.Session.request``
+
+        Returns:
+            Respuesta final
+        """
+        if not url.startswith(('http://', 'https://')):
+            url = f"{self.api_url}/{url.lstrip('/')}"
+        kwargs.setdefault('timeout', 30)
+
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_for_rate_limit()
+            response = self.session.request(method, url, **kwargs)
+            if not self._update_rate_limit(response) or attempt == MAX_RETRIES:
+                return response
+        return response
+
+    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None,
+                 limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene todos los elementos de un listado siguiendo el header ``Link``.
+
+        Args:
+            path: Ruta del listado
+            params: Parámetros del primer request
+            limit: Elementos máximos a obtener (None: todos)
+
+        Returns:
+            Lista de elementos
+        """
+        items = []
+        url, params = path, dict(params or {}, per_page=100)
+        while url:
+            response = self.request('GET', url, params=params)
+            if response.status_code != 200:
+                print(f"❌ Error obteniendo {url}: {response.status_code}")
+                print(response.text)
+                sys.exit(1)
+            items.extend(response.json())
+            if limit is not None and len(items) >= limit:
+                return items[:limit]
+            # La URL de la página siguiente ya incluye los parámetros
+            url = response.links.get('next', {}).get('url')
+            params = None
+        return items
+
+    def close(self):
+        """Cierra las conexiones del pool"""
+        self.session.close()
+
+
+def get_issues(client: GitHubClient, owner: str, repo: str, week: int,
+               additional_labels: List[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Obtiene issues que necesitan re-evaluación (todas las páginas)"""
     # Labels base para la búsqueda
     labels = ['evaluacion', f'semana-{week}']
     if additional_labels:
         labels.extend(additional_labels)
-    
-    url = f'https://api.github.com/repos/{owner}/{repo}/issues'
+
     params = {
         'labels': ','.join(labels),
-        'state': 'open',
-        'per_page': 100
+        'state': 'open'
     }
-    
-    response = requests.get(url, headers=headers, params=params)
-    
-    if response.status_code != 200:
-        print(f"❌ Error obteniendo issues: {response.status_code}")
-        print(response.text)
-        sys.exit(1)
-    
-    return response.json()
+    return client.paginate(f'repos/{owner}/{repo}/issues', params, limit=limit)
+
 
-def trigger_reevaluation(owner: str, repo: str, issue_number: int, token: str, dry_run: bool = False) -> bool:
+def trigger_reevaluation(client: GitHubClient, owner: str, repo: str, issue_number: int,
+                         dry_run: bool = False) -> bool:
     """Activa la re-evaluación de un issue específico"""
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
-    }
-    
-    comment_body = (
-        "🔄 **Re-evaluación solicitada**\n\n"
-        "Esta evaluación fue activada por el script de re-evaluación.\n\n"
-        "/evaluar"
-    )
-    
     if dry_run:
         print(f"  🧪 [DRY RUN] Comentaría en issue #{issue_number}")
         return True
-    
-    url = f'https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments'
-    data = {'body': comment_body}
-    
-    response = requests.post(url, headers=headers, json=data)
-    
+
+    try:
+        response = client.request('POST', f'repos/{owner}/{repo}/issues/{issue_number}/comments',
+                                  json={'body': COMMENT_BODY})
+    except requests.RequestException as e:
+        print(f"  ❌ Error en issue #{issue_number}: {e}")
+        return False
+
     if response.status_code == 201:
         print(f"  ✅ Re-evaluación activada para issue #{issue_number}")
         return True
@@ -76,6 +212,7 @@ def trigger_reevaluation(owner: str, repo: str, issue_number: int, token: str, d
         print(f"  ❌ Error en issue #{issue_number}: {response.status_code}")
         return False
 
+
 def main():
     parser = argparse.ArgumentParser(
         description="Re-evalúa issues existentes en GitHub",
@@ -85,73 +222,85 @@ Ejemplos de uso:
   python scripts/reevaluate_issues.py --owner epti --repo bc-channel --week 1
   python scripts/reevaluate_issues.py --owner epti --repo bc-channel --week 1 --dry-run
   python scripts/reevaluate_issues.py --owner epti --repo bc-channel --week 1 --labels revisar,pendiente
+  python scripts/reevaluate_issues.py --owner epti --repo bc-channel --week 1 --max-issues 0 --concurrency 8
+  python scripts/reevaluate_issues.py --owner epti --repo bc-channel --week 1 --api-url http://localhost:8080
         """
     )
-    
+
     parser.add_argument('--owner', required=True, help='Owner del repositorio de GitHub')
     parser.add_argument('--repo', required=True, help='Nombre del repositorio')
-    parser.add_argument('--week', type=int, required=True, choices=range(1, 12), 
+    parser.add_argument('--week', type=int, required=True, choices=range(1, 12),
                        help='Semana a re-evaluar (1-11)')
     parser.add_argument('--labels', help='Labels adicionales separados por coma')
-    parser.add_argument('--dry-run', action='store_true', 
+    parser.add_argument('--dry-run', action='store_true',
                        help='Modo de prueba (no realizar cambios reales)')
     parser.add_argument('--max-issues', type=int, default=50,
-                       help='Máximo número de issues a procesar (default: 50)')
-    
+                       help='Máximo número de issues a procesar, 0 para todos (default: 50)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                       help=f'Comentarios publicados en paralelo (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--api-url', default=os.getenv('GITHUB_API_URL', DEFAULT_API_URL),
+                       help=f'URL base de la API de GitHub (default: $GITHUB_API_URL o {DEFAULT_API_URL})')
+
     args = parser.parse_args()
-    
+
     print(f"🔄 Re-evaluación de Issues - Semana {args.week}")
     print("=" * 50)
-    
+
     # Verificar token
     token = get_github_token()
-    
+    concurrency = max(1, args.concurrency)
+    client = GitHubClient(token, args.api_url, pool_size=concurrency)
+
     # Labels adicionales
     additional_labels = []
     if args.labels:
         additional_labels = [label.strip() for label in args.labels.split(',')]
-    
+
     # Obtener issues
     print(f"🔍 Buscando issues en {args.owner}/{args.repo}")
-    print(f"📋 Labels: evaluacion, semana-{args.week}" + 
+    print(f"📋 Labels: evaluacion, semana-{args.week}" +
           (f", {', '.join(additional_labels)}" if additional_labels else ""))
-    
-    issues = get_issues(args.owner, args.repo, args.week, token, additional_labels)
-    
+
+    issues = get_issues(client, args.owner, args.repo, args.week, additional_labels)
+
     if not issues:
         print("📭 No se encontraron issues para re-evaluar")
+        client.close()
         return
-    
+
     print(f"📊 Encontrados {len(issues)} issues")
-    
+
     if args.dry_run:
         print("🧪 MODO DE PRUEBA - No se realizarán cambios reales")
-    
+
     # Procesar issues
-    issues_to_process = issues[:args.max_issues]
+    issues_to_process = issues[:args.max_issues] if args.max_issues > 0 else issues
+    if len(issues_to_process) < len(issues):
+        print(f"⚠️  Se procesarán solo {len(issues_to_process)} de {len(issues)} issues "
+              f"(usa --max-issues 0 para procesarlos todos)")
     success_count = 0
-    
-    print(f"\n🚀 Procesando {len(issues_to_process)} issues...")
-    
-    for i, issue in enumerate(issues_to_process, 1):
+
+    print(f"\n🚀 Procesando {len(issues_to_process)} issues ({concurrency} en paralelo)...")
+
+    def process(position: int, issue: Dict[str, Any]) -> bool:
         issue_number = issue['number']
         title = issue['title'][:50] + "..." if len(issue['title']) > 50 else issue['title']
-        
-        print(f"\n📝 [{i}/{len(issues_to_process)}] Issue #{issue_number}: {title}")
-        
-        if trigger_reevaluation(args.owner, args.repo, issue_number, token, args.dry_run):
-            success_count += 1
-        
-        # Pausa para evitar rate limiting
-        if not args.dry_run and i < len(issues_to_process):
-            import time
-            time.sleep(1)
-    
+        print(f"\n📝 [{position}/{len(issues_to_process)}] Issue #{issue_number}: {title}")
+        return trigger_reevaluation(client, args.owner, args.repo, issue_number, args.dry_run)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(process, i, issue) for i, issue in enumerate(issues_to_process, 1)]
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
+
+    client.close()
+
     print(f"\n✅ Resumen:")
     print(f"   📊 Issues procesados: {len(issues_to_process)}")
     print(f"   ✅ Exitosos: {success_count}")
     print(f"   ❌ Fallidos: {len(issues_to_process) - success_count}")
-    
+
     if args.dry_run:
         print(f"\n💡 Para ejecutar realmente, quita el flag --dry-run")
     else:
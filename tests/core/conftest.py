@@ -0,0 +1,27 @@
+"""
+Fixtures compartidas de los tests de core
+"""
+from pathlib import Path
+
+import pytest
+
+SAMPLE_MAIN = """from fastapi import FastAPI
+app = FastAPI()
+@app.get('/')
+def root():
+    return {'message': 'Hello World'}
+"""
+
+
+def _make_week01_repo(path: Path) -> Path:
+    path.mkdir()
+    (path / 'main.py').write_text(SAMPLE_MAIN)
+    (path / 'requirements.txt').write_text('fastapi\nuvicorn\n')
+    (path / 'README.md').write_text('# Week1\nuvicorn main:app --reload\n')
+    return path
+
+
+@pytest.fixture
+def make_week01_repo():
+    """Crea en la ruta indicada el hello world de la semana 1 (main.py, requirements.txt y README.md)"""
+    return _make_week01_repo
@@ -0,0 +1,70 @@
+"""
+Tests de la caché de AST compartida
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.ast_cache import AstCache
+from core.common_checks import CommonChecks
+from core.repo_index import RepoIndex
+
+
+def test_ast_cache_parses_each_source_once():
+    cache = AstCache()
+    first = cache.parse("x = 1\n", "main.py")
+    second = cache.parse("x = 1\n", "main.py")
+
+    assert first["tree"] is second["tree"]
+    assert first["error"] is None
+    assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    # Contenido distinto para la misma ruta es una entrada nueva
+    cache.parse("x = 2\n", "main.py")
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_ast_cache_keeps_syntax_error_details():
+    cache = AstCache()
+    result = cache.parse("def broken(:\n    pass\n", "main.py")
+
+    assert result["tree"] is None
+    assert result["error"]["line_number"] == 1
+
+    with pytest.raises(SyntaxError):
+        cache.parse_tree("def broken(:\n    pass\n", "main.py")
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_syntax_check_and_ast_checks_share_the_parse():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        (root / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+
+        index = RepoIndex(root)
+        syntax = CommonChecks(root, index).check_python_syntax("main.py")
+        tree = index.parse("main.py")
+
+        assert syntax["syntax_valid"] is True
+        assert tree is index.parse_result(root / "main.py")["tree"]
+        assert index.ast_cache.get_stats()["misses"] == 1
+
+
+def test_syntax_check_reports_errors_found_by_the_compiler():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        (root / "main.py").write_text("return 5\nbreak\n")
+
+        index = RepoIndex(root)
+        syntax = CommonChecks(root, index).check_python_syntax("main.py")
+
+        assert syntax["syntax_valid"] is False
+        assert "'return' outside function" in syntax["error"]
+        assert syntax["line_number"] == 1
+        # Los checks basados en AST siguen teniendo el árbol
+        assert index.parse("main.py").body[0].__class__.__name__ == "Return"
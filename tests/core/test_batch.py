@@ -0,0 +1,97 @@
+"""
+Tests del modo de evaluación por lotes
+"""
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from core.batch import load_manifest, run_batch
+
+
+def test_load_manifest_csv_and_jsonl():
+    with tempfile.TemporaryDirectory() as td:
+        p = Path(td)
+        (p / 'm.csv').write_text('repo,week\n/a,1\n/b,2\n')
+        (p / 'm.jsonl').write_text('{"repo": "/a", "week": 1, "id": "alice"}\n\n')
+
+        csv_jobs = load_manifest(p / 'm.csv')
+        assert [(j['repo'], j['week']) for j in csv_jobs] == [('/a', 1), ('/b', 2)]
+        assert csv_jobs[0]['id'] == '1'
+
+        jsonl_jobs = load_manifest(p / 'm.jsonl')
+        assert jsonl_jobs == [{"id": "alice", "repo": "/a", "week": 1}]
+
+
+def test_load_manifest_rejects_incomplete_rows():
+    with tempfile.TemporaryDirectory() as td:
+        manifest = Path(td) / 'm.csv'
+        manifest.write_text('repo,week\n/a,\n')
+        with pytest.raises(ValueError):
+            load_manifest(manifest)
+
+
+def test_run_batch_writes_jsonl_and_summary(make_week01_repo):
+    with tempfile.TemporaryDirectory() as td:
+        p = Path(td)
+        make_week01_repo(p / 'alice')
+        make_week01_repo(p / 'bob')
+        jobs = [
+            {"id": "alice", "repo": str(p / 'alice'), "week": 1},
+            {"id": "bob", "repo": str(p / 'bob'), "week": 1},
+            {"id": "ghost", "repo": str(p / 'missing'), "week": 1},
+        ]
+
+        summary = run_batch(jobs, p / 'out.jsonl', workers=2, summary_path=p / 'summary.json')
+
+        records = [json.loads(line) for line in (p / 'out.jsonl').read_text().splitlines()]
+        assert sorted(r['id'] for r in records) == ['alice', 'bob', 'ghost']
+        assert summary['total'] == 3
+        assert summary['errors'] == 1
+        assert summary['by_week']['1']['total'] == 3
+        assert json.loads((p / 'summary.json').read_text())['total'] == 3
+
+
+@pytest.mark.parametrize("use_mirror", [False, True])
+def test_run_batch_fetches_remote_repos_and_cleans_up(monkeypatch, use_mirror, make_week01_repo):
+    import subprocess
+    import tempfile as tempfile_module
+    from core.mirror_cache import MirrorCache
+
+    with tempfile.TemporaryDirectory() as td:
+        p = Path(td)
+        source = p / 'source'
+        make_week01_repo(source)
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q", "-b", "main"], cwd=source, check=True)
+        subprocess.run(git + ["add", "."], cwd=source, check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], cwd=source, check=True)
+        subprocess.run(["git", "clone", "-q", "--bare", str(source), str(p / 'remote.git')], check=True)
+
+        clones_dir = p / 'clones'
+        clones_dir.mkdir()
+        monkeypatch.setattr(tempfile_module, "tempdir", str(clones_dir))
+
+        jobs = [
+            {"id": "remote", "repo": f"file://{p / 'remote.git'}", "week": 1},
+            {"id": "missing", "repo": f"file://{p / 'missing.git'}", "week": 1},
+            {"id": "local", "repo": str(source), "week": 1},
+            {"id": "remote-again", "repo": f"file://{p / 'remote.git'}", "week": 1},
+        ]
+        mirror_cache = MirrorCache(p / 'mirrors') if use_mirror else None
+        summary = run_batch(jobs, p / 'out.jsonl', workers=2, fetch_concurrency=2,
+                            mirror_cache=mirror_cache)
+
+        records = {r['id']: r for r in map(json.loads, (p / 'out.jsonl').read_text().splitlines())}
+        assert records['remote']['repo'] == jobs[0]['repo']
+        assert records['remote']['result']['final_score'] == records['local']['result']['final_score']
+        assert records['missing']['result']['error'] is True
+        assert records['remote-again']['result']['final_score'] == records['remote']['result']['final_score']
+        assert summary['fetched'] == 2 and summary['errors'] == 1
+        # Los clones se eliminan al terminar su evaluación
+        assert list(clones_dir.iterdir()) == []
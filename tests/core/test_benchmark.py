@@ -0,0 +1,74 @@
+"""
+Tests del benchmark de evaluadores
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.benchmark import generate_synthetic_repo, run_benchmarks, compare_benchmarks
+
+
+def test_generate_synthetic_repo_sizes():
+    with tempfile.TemporaryDirectory() as td:
+        minimal = generate_synthetic_repo(Path(td) / 'minimal', 'minimal')
+        assert minimal['files'] == 3
+
+        spec = {"modules": 6, "depth": 2, "tests": 2, "venv_files": 3}
+        repo = generate_synthetic_repo(Path(td) / 'custom', spec)
+        root = Path(repo['path'])
+        modules = list((root / 'app').rglob('resource*.py'))
+        assert len(modules) == 6
+        assert all(len(m.relative_to(root / 'app').parts) == 3 for m in modules)
+        assert len(list((root / 'tests').glob('test_*.py'))) == 2
+        assert len(list((root / 'venv').rglob('*.py'))) == 3
+        # main.py incluye el router de cada módulo y sigue siendo Python válido
+        main = (root / 'main.py').read_text()
+        compile(main, 'main.py', 'exec')
+        assert main.count('app.include_router(') == 6
+
+
+def test_week_overlays_add_what_each_week_evaluates():
+    with tempfile.TemporaryDirectory() as td:
+        assert generate_synthetic_repo(Path(td) / 'week01', 'minimal', week=1)['files'] == 3
+
+        repo = generate_synthetic_repo(Path(td) / 'week11', 'minimal', week=11)
+        root = Path(repo['path'])
+        assert repo['overlays'] == ['database', 'testing', 'deployment']
+        for rel_path in ['models/user.py', 'alembic/versions/0001_create_users.py', 'tests/conftest.py',
+                         'auth.py', 'Dockerfile', 'docker-compose.yml', 'services/notifications.py']:
+            assert (root / rel_path).is_file(), rel_path
+        for path in root.rglob('*.py'):
+            compile(path.read_text(), str(path), 'exec')
+        requirements = (root / 'requirements.txt').read_text().splitlines()
+        assert len(requirements) == len(set(requirements))
+
+        # Los checks de la semana 3 encuentran modelos, conexión y migraciones
+        baseline = run_benchmarks([3], ['minimal'], repeats=1, work_dir=td)
+        assert baseline['results']['week03/minimal']['final_score'] > 50
+
+
+def test_run_benchmarks_times_each_check():
+    with tempfile.TemporaryDirectory() as td:
+        baseline = run_benchmarks([1], ['minimal'], repeats=2, work_dir=td)
+        entry = baseline['results']['week01/minimal']
+        assert entry['files'] == 3
+        assert len(entry['runs']) == 2
+        assert entry['seconds'] > 0
+        assert 'endpoints' in entry['checks']
+
+
+def test_compare_benchmarks_flags_regressions_above_threshold():
+    baseline = {"results": {"week01/small": {"seconds": 0.1, "checks": {"endpoints": 0.05, "documentation": 0.001}}}}
+    current = {"results": {
+        "week01/small": {"seconds": 0.11, "checks": {"endpoints": 0.09, "documentation": 0.003}},
+        "week02/small": {"seconds": 5.0, "checks": {}}
+    }}
+
+    regressions = compare_benchmarks(baseline, current, threshold=0.25)
+    # El total subió 10% y documentation solo 2 ms (ruido); week02 no tiene línea base
+    assert [(r['key'], r['metric']) for r in regressions] == [('week01/small', 'endpoints')]
+    assert regressions[0]['ratio'] == 1.8
+    assert compare_benchmarks(baseline, current, threshold=1.0) == []
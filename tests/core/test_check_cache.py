@@ -0,0 +1,62 @@
+"""
+Tests de la caché incremental por check
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.check_cache import CheckCache, depends_on, get_check_dependencies
+from weeks.week02.evaluator import Week02Evaluator
+
+MAIN_PY = '''from fastapi import FastAPI
+from pydantic import BaseModel
+
+app = FastAPI()
+
+class Item(BaseModel):
+    name: str
+
+@app.post("/items")
+def create_item(item: Item):
+    return item
+'''
+
+
+def _evaluate(repo: Path, cache_dir: Path) -> Week02Evaluator:
+    evaluator = Week02Evaluator(str(repo))
+    evaluator.check_cache = CheckCache(cache_dir)
+    evaluator.evaluate()
+    return evaluator
+
+
+def test_depends_on_registers_patterns():
+    @depends_on("README.md", "docs/**")
+    def check_docs(repo_path):
+        return {}
+
+    assert get_check_dependencies(check_docs) == ("README.md", "docs/**")
+    assert check_docs("x") == {}
+
+
+def test_readme_edit_does_not_rerun_code_checks():
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td) / "repo"
+        repo.mkdir()
+        (repo / "main.py").write_text(MAIN_PY)
+        (repo / "README.md").write_text("# API\n")
+        cache_dir = Path(td) / "cache"
+
+        first = _evaluate(repo, cache_dir)
+        assert first.reused_checks == []
+
+        (repo / "README.md").write_text("# API\n\nActualizado\n")
+        second = _evaluate(repo, cache_dir)
+        assert len(second.reused_checks) == 3
+        assert second.results["models"] == first.results["models"]
+
+        (repo / "main.py").write_text(MAIN_PY + "\n@app.get('/items')\ndef list_items():\n    return []\n")
+        third = _evaluate(repo, cache_dir)
+        assert third.reused_checks == []
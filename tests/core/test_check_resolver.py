@@ -0,0 +1,64 @@
+"""
+Tests del resolver precompilado de checks
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.check_resolver import (
+    CheckResolver, flatten_results, get_check_resolver, all_of, value_in, score_above_zero
+)
+from weeks.week01.evaluator import Week01Evaluator
+
+
+def test_rules_resolve_paths_and_report_issues():
+    resolver = CheckResolver(
+        ["root", "app", "quality", "tests", "nested", "dup", "absent"],
+        {
+            "root": ("endpoints", "root_working"),
+            "app": all_of(("app", "import_ok"), ("app", "has_app")),
+            "quality": value_in(("code_quality", "overall"), ["good"]),
+            "tests": score_above_zero("tests"),
+        }
+    )
+    results = {
+        "endpoints": {"root_working": True},
+        "app": {"import_ok": True, "has_app": False},
+        "code_quality": {"overall": "good"},
+        "tests": {"score": 3},
+        "a": {"nested": 1, "dup": 0},
+        "b": {"dup": 1},
+    }
+    issues = {"missing": [], "ambiguous": []}
+
+    assert resolver.unmapped == ["nested", "dup", "absent"]
+    assert [resolver.resolve(n, results, issues=issues) for n in resolver.check_names] == \
+        [True, False, True, True, True, False, False]
+    assert issues == {"missing": ["absent"], "ambiguous": ["dup"]}
+    assert resolver.sources("app") == ("app",)
+    assert resolver.sources("absent") == ("absent",)
+
+
+def test_flatten_results_matches_recursive_search_priority():
+    # Las claves propias ganan sobre las de los hijos; entre hijos gana el primero
+    flat, occurrences = flatten_results({"a": {"x": 1, "b": {"y": 2}}, "c": {"y": 3}, "x": 0})
+    assert flat["x"] == 0
+    assert flat["y"] == 2
+    assert occurrences["y"] == 2
+
+
+def test_resolver_is_compiled_once_per_week():
+    with tempfile.TemporaryDirectory() as td:
+        (Path(td) / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+        first = Week01Evaluator(td)
+        second = Week01Evaluator(td)
+
+        assert first.check_resolver is second.check_resolver
+        assert first.check_resolver is get_check_resolver(Week01Evaluator, first.week_dir / "criteria.yaml")
+        assert first.check_resolver.unmapped == []
+
+        result = first.evaluate()
+        assert result["check_resolution"] == {"missing": [], "ambiguous": []}
@@ -0,0 +1,175 @@
+"""
+Tests del ejecutor concurrente de checks de BaseEvaluator
+"""
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from weeks.week02.evaluator import Week02Evaluator
+
+
+def _evaluator(td: str) -> Week02Evaluator:
+    (Path(td) / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+    return Week02Evaluator(td)
+
+
+def test_run_checks_merges_in_registration_order():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = _evaluator(td)
+
+        def slow():
+            time.sleep(0.1)
+            return {"score": 1}
+
+        def broken():
+            raise RuntimeError("boom")
+
+        results = evaluator.run_checks({
+            "slow": slow,
+            "broken": broken,
+            "fast": lambda: {"score": 2}
+        })
+
+        assert list(results) == ["slow", "broken", "fast"]
+        assert results["slow"] == {"score": 1}
+        assert results["broken"] == {"error": "boom", "passed": False, "score": 0}
+        assert set(evaluator.check_durations) == {"slow", "broken", "fast"}
+
+
+def test_run_checks_runs_concurrently_and_enforces_timeout():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = _evaluator(td)
+        release = threading.Event()
+        barrier = threading.Barrier(2, timeout=2)
+
+        def paired():
+            barrier.wait()  # Solo pasa si ambos checks corren a la vez
+            return {"passed": True}
+
+        def stuck():
+            release.wait(5)
+            return {"passed": True}
+
+        started = time.monotonic()
+        results = evaluator.run_checks({"a": paired, "b": paired, "stuck": stuck}, timeout=0.3)
+        release.set()
+
+        assert results["a"] == results["b"] == {"passed": True}
+        assert results["stuck"]["passed"] is False
+        assert "tiempo límite" in results["stuck"]["error"]
+        assert time.monotonic() - started < 2
+
+
+def test_run_checks_marks_timed_out_and_respects_global_deadline():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = _evaluator(td)
+        evaluator.max_check_workers = 1
+        evaluator.config["check_timeouts"] = {"slow": 0.2}
+        evaluator.deadline = time.monotonic() + 0.5
+        release = threading.Event()
+
+        def stuck():
+            release.wait(5)
+            return {"passed": True}
+
+        started = time.monotonic()
+        results = evaluator.run_checks({"slow": stuck, "stuck": stuck, "never": lambda: {"passed": True}},
+                                       timeout=10)
+        release.set()
+
+        assert results["slow"]["timed_out"] is True
+        assert "0.2s" in results["slow"]["error"]
+        # "stuck" agota el plazo global y "never" no alcanza a empezar
+        assert results["stuck"]["timed_out"] is True
+        assert results["never"]["timed_out"] is True
+        assert "never" not in evaluator.check_durations
+        assert evaluator.timed_out_checks == ["slow", "stuck", "never"]
+        assert time.monotonic() - started < 2
+
+
+def test_timed_out_check_scores_as_failed_and_is_reported():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = _evaluator(td)
+        evaluator.config["timeout_seconds"] = 0.3
+        release = threading.Event()
+
+        def run_specific_checks():
+            return evaluator.run_checks({"readme": lambda: release.wait(5) or {"passed": True}})
+
+        evaluator.run_specific_checks = run_specific_checks
+        # El check de criteria.yaml se lee de results["readme"] (otro nombre)
+        category = {"weight": 10, "checks": [{"name": "readme_reflection", "points": 10, "required": False}]}
+        evaluator.criteria["categories"] = {"docs": category}
+
+        result = evaluator.evaluate()
+        release.set()
+
+        assert result["timed_out"] is True
+        assert result["timed_out_checks"] == ["readme"]
+        # Check opcional: como cualquier fallo, solo el 10% por el intento
+        assert result["scoring"]["total"]["earned"] == 1
+
+
+def test_timed_out_optional_check_keeps_the_partial_credit_of_a_failure():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = _evaluator(td)
+        evaluator.results = {"readme": {"has_reflection": True}}
+        category = {"weight": 10, "checks": [{"name": "readme_reflection", "points": 10, "required": False}]}
+        assert evaluator._calculate_category_score("docs", category) == 10
+
+        # Aunque su resultado pasara, el check que excedió su tiempo puntúa como fallido
+        evaluator.timed_out_checks = ["readme"]
+        assert evaluator._calculate_category_score("docs", category) == 1
+
+
+def test_evaluation_budget_covers_code_outside_run_checks():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = _evaluator(td)
+        evaluator.config["timeout_seconds"] = 0.2
+        evaluator.deadline_grace = 0.1
+        release = threading.Event()
+
+        def run_specific_checks():
+            release.wait(5)  # Código propio del evaluador, fuera de run_checks
+            return {}
+
+        evaluator.run_specific_checks = run_specific_checks
+
+        started = time.monotonic()
+        result = evaluator.evaluate()
+        release.set()
+
+        assert result["error"] is True
+        assert result["timed_out"] is True
+        assert result["error_type"] == "EvaluationTimeoutError"
+        assert time.monotonic() - started < 2
+
+
+def test_abandoned_check_does_not_delay_process_exit():
+    script = textwrap.dedent("""
+        import sys, tempfile, time
+        from pathlib import Path
+        sys.path.insert(0, sys.argv[1])
+        from weeks.week02.evaluator import Week02Evaluator
+
+        td = tempfile.mkdtemp()
+        (Path(td) / "main.py").write_text("app = None\\n")
+        evaluator = Week02Evaluator(td)
+        evaluator.config["timeout_seconds"] = 0.3
+        evaluator.run_specific_checks = lambda: evaluator.run_checks({"slow": lambda: time.sleep(8) or {}})
+        print(evaluator.evaluate()["timed_out"])
+    """)
+    root = str(Path(__file__).parent.parent.parent)
+
+    started = time.monotonic()
+    completed = subprocess.run([sys.executable, "-c", script, root], capture_output=True, text=True, timeout=30)
+
+    assert completed.stdout.strip() == "True", completed.stderr
+    assert time.monotonic() - started < 5
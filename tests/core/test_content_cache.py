@@ -0,0 +1,113 @@
+"""
+Tests de la caché de contenido de archivos
+"""
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.content_cache import ContentCache
+from core.repo_index import RepoIndex
+
+
+def test_content_cache_reads_each_file_once():
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "main.py"
+        path.write_bytes(b"from fastapi import FastAPI\n\xff")
+
+        cache = ContentCache()
+        first = cache.read_text(path)
+        second = cache.read_text(path)
+
+        assert first == second == "from fastapi import FastAPI\n"
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hits"] == 1
+
+
+def test_concurrent_reads_of_the_same_file_read_it_once(monkeypatch):
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "main.py"
+        path.write_text("app = FastAPI()\n")
+        read_bytes = Path.read_bytes
+
+        def slow_read_bytes(self):
+            time.sleep(0.05)
+            return read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", slow_read_bytes)
+        cache = ContentCache()
+        texts = []
+        threads = [threading.Thread(target=lambda: texts.append(cache.read_text(path))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert texts == ["app = FastAPI()\n"] * 4
+        assert cache.get_stats()["misses"] == 1
+        assert cache.get_stats()["hits"] == 3
+
+
+def test_content_cache_respects_size_limits():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        for name in ("a.py", "b.py", "c.py"):
+            (root / name).write_text("x" * 10)
+        (root / "big.py").write_text("x" * 100)
+
+        cache = ContentCache(max_bytes=25, max_file_bytes=50)
+        cache.read_text(root / "a.py")
+        cache.read_text(root / "b.py")
+        cache.read_text(root / "a.py")   # a pasa a ser el más reciente
+        cache.read_text(root / "c.py")   # expulsa b
+        cache.read_text(root / "big.py")  # se lee pero no se retiene
+
+        assert (root / "a.py") in cache
+        assert (root / "c.py") in cache
+        assert (root / "b.py") not in cache
+        assert (root / "big.py") not in cache
+        assert cache.get_stats()["evictions"] == 1
+
+
+def test_repo_index_reads_relative_paths_through_cache():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        (root / "README.md").write_text("# Proyecto")
+
+        index = RepoIndex(root)
+        assert index.read_text("README.md") == "# Proyecto"
+        assert index.read_text(root.resolve() / "README.md") == "# Proyecto"
+        assert index.content_cache.get_stats()["misses"] == 1
+
+
+_opened = []
+
+
+def _record_open(event, args):
+    if event == "open" and _opened and isinstance(args[0], str):
+        _opened[-1].append(args[0])
+
+
+def test_week01_evaluation_reads_each_file_once():
+    from weeks.week01.evaluator import Week01Evaluator
+
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td).resolve()
+        (repo / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+        (repo / "requirements.txt").write_text("fastapi\nuvicorn\n")
+        (repo / "README.md").write_text("# Week1\nuvicorn main:app --reload\n")
+
+        evaluator = Week01Evaluator(str(repo))
+        sys.addaudithook(_record_open)
+        _opened.append([])
+        try:
+            evaluator.evaluate()
+        finally:
+            reads = _opened.pop()
+
+        for name in ("main.py", "README.md", "requirements.txt"):
+            assert reads.count(str(repo / name)) == 1, name
@@ -0,0 +1,78 @@
+"""
+Tests del bundle precompilado de criterios
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core import criteria_bundle
+from core.criteria_bundle import compile_criteria_bundle, load_criteria, validate_criteria
+
+
+CRITERIA = """week_info:
+  number: 1
+  title: 'Demo'
+categories:
+  setup:
+    weight: 100
+    checks:
+      - name: 'main_py_exists'
+        points: 100
+"""
+
+
+def _weeks_dir(td: str) -> Path:
+    week_dir = Path(td) / "weeks" / "week01"
+    week_dir.mkdir(parents=True)
+    (week_dir / "criteria.yaml").write_text(CRITERIA)
+    return week_dir.parent
+
+
+def test_bundle_is_used_while_yaml_is_unchanged(monkeypatch):
+    with tempfile.TemporaryDirectory() as td:
+        weeks_dir = _weeks_dir(td)
+        bundle_path = Path(td) / "criteria.bundle.pickle"
+        criteria_file = weeks_dir / "week01" / "criteria.yaml"
+
+        summary = compile_criteria_bundle(weeks_dir, bundle_path)
+        assert summary["written"] and summary["weeks"] == {1: 1}
+
+        def no_yaml(path):
+            raise AssertionError("No debió parsear el YAML")
+
+        monkeypatch.setattr(criteria_bundle, "_parse_yaml", no_yaml)
+        criteria = load_criteria(criteria_file, bundle_path)
+        assert criteria["week_info"]["title"] == "Demo"
+
+        # Cada carga es una copia independiente
+        criteria["week_info"]["title"] = "Modificado"
+        assert load_criteria(criteria_file, bundle_path)["week_info"]["title"] == "Demo"
+
+        # Mismo contenido con otra fecha: el hash confirma que el bundle sigue vigente
+        criteria_bundle._LOADED.clear()
+        stat = criteria_file.stat()
+        os.utime(criteria_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert load_criteria(criteria_file, bundle_path)["week_info"]["title"] == "Demo"
+
+        # El YAML es la fuente de verdad: si cambia, se vuelve a parsear
+        monkeypatch.undo()
+        criteria_file.write_text(CRITERIA.replace("'Demo'", "'Nuevo título'"))
+        assert load_criteria(criteria_file, bundle_path)["week_info"]["title"] == "Nuevo título"
+
+
+def test_invalid_criteria_are_reported_and_not_bundled():
+    with tempfile.TemporaryDirectory() as td:
+        weeks_dir = _weeks_dir(td)
+        (weeks_dir / "week01" / "criteria.yaml").write_text(CRITERIA.replace("number: 1", "number: 2"))
+        bundle_path = Path(td) / "criteria.bundle.pickle"
+
+        summary = compile_criteria_bundle(weeks_dir, bundle_path)
+
+        assert not summary["written"]
+        assert not bundle_path.exists()
+        assert "se esperaba 1" in summary["errors"][0]
+        assert validate_criteria({"week_info": {}}) == ["Missing required key 'categories' in criteria.yaml"]
@@ -0,0 +1,128 @@
+"""
+Tests del daemon de evaluación (API HTTP local con evaluadores precargados)
+"""
+import os
+import sys
+import signal
+import json
+import socket
+import tempfile
+import threading
+import http.client
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from core.daemon import EvaluationDaemon, create_daemon_server, submit_job, DaemonBusyError
+from core.week_registry import create_evaluator
+
+
+@pytest.fixture(scope="module")
+def daemon():
+    daemon = EvaluationDaemon(workers=1, max_queue=4, weeks=[1]).start()
+    yield daemon
+    daemon.shutdown()
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_daemon_matches_direct_evaluation(daemon, make_week01_repo):
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / 'repo'
+        make_week01_repo(repo)
+        server = create_daemon_server(daemon, port=0)
+        _serve(server)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            result = submit_job(url, repo, 1)
+
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+            connection.request("GET", "/health")
+            health = json.loads(connection.getresponse().read())
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        direct = create_evaluator(1, str(repo)).evaluate()
+        assert result['final_score'] == direct['final_score']
+        assert result['passed'] == direct['passed']
+        assert health['weeks'] == [1]
+        assert health['completed'] >= 1
+
+
+def test_daemon_over_unix_socket(daemon, make_week01_repo):
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / 'repo'
+        make_week01_repo(repo)
+        socket_path = str(Path(tmp) / 'daemon.sock')
+        server = create_daemon_server(daemon, socket_path=socket_path)
+        _serve(server)
+        try:
+            result = submit_job(f"unix://{socket_path}", repo, 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result['week'] == 1
+        assert 'final_score' in result
+
+
+def test_daemon_rejects_invalid_and_excess_jobs(daemon, make_week01_repo):
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / 'repo'
+        make_week01_repo(repo)
+
+        with pytest.raises(ValueError):
+            daemon.submit(str(repo), 7)
+        with pytest.raises(ValueError):
+            daemon.submit(str(Path(tmp) / 'missing'), 1)
+        assert daemon.get('no-existe') is None
+
+        busy = EvaluationDaemon(workers=1, max_queue=0, weeks=[1])
+        busy._dispatch = object()
+        with pytest.raises(DaemonBusyError):
+            busy.submit(str(repo), 1)
+
+
+def test_daemon_replaces_stale_broken_and_used_up_pools(make_week01_repo):
+    weeks_dir = Path(__file__).parent.parent.parent / 'weeks' / 'week01'
+    daemon = EvaluationDaemon(workers=1, max_queue=4, weeks=[1], recycle_after=2).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / 'repo'
+        make_week01_repo(repo)
+        try:
+            def evaluate():
+                job = daemon.wait(daemon.submit(str(repo), 1)['id'], timeout=60)
+                assert job['status'] == 'done', job.get('error')
+                return job['result']
+
+            expected = evaluate()['final_score']
+
+            # Cambia el código en disco: el worker cargado lo detecta y se reemplaza
+            probe = weeks_dir / '_stale_probe.py'
+            probe.write_text("# cambio\n")
+            try:
+                assert evaluate()['final_score'] == expected
+            finally:
+                probe.unlink()
+            assert daemon.health()['recycled'] == 1
+
+            # Un worker muerto rompe el pool: se reemplaza y el job se reintenta
+            pid = daemon._pool.submit(os.getpid).result()
+            os.kill(pid, signal.SIGKILL)
+            assert evaluate()['final_score'] == expected
+            assert daemon.health()['recycled'] == 2
+
+            # Cada recycle_after jobs el pool se renueva
+            evaluate()
+            assert daemon.health()['recycled'] == 3
+        finally:
+            daemon.shutdown()
@@ -0,0 +1,101 @@
+"""
+Tests de la cola persistente de evaluaciones (SQLite WAL)
+"""
+import sys
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.job_queue import JobQueue
+from core.batch import run_queued_batch, drain_queue, _renew_lease
+
+
+def test_enqueue_is_idempotent_and_leases_expire():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(Path(tmp) / 'jobs.sqlite3')
+        job = {"id": "a", "repo": "/repo", "week": 1}
+        key = queue.enqueue(job, commit_id="abc", max_attempts=2)
+        assert queue.enqueue(dict(job, id="b"), commit_id="abc") == key
+        assert queue.enqueue(job, commit_id="def") != key
+
+        claimed = queue.claim("worker-1", lease_seconds=0.05)
+        assert claimed["key"] == key and claimed["attempts"] == 1
+        # Con lease vigente nadie más lo toma; al vencer se reintenta
+        assert queue.claim("worker-2")["key"] != key
+        time.sleep(0.1)
+        retried = queue.claim("worker-3", lease_seconds=0.05)
+        assert retried["key"] == key and retried["attempts"] == 2
+        assert not queue.complete(key, "worker-1", {"late": True})
+
+        # Agotados los intentos, un lease vencido deja el job como fallido
+        time.sleep(0.1)
+        queue.claim("worker-4")
+        assert queue.get(key)["status"] == "failed"
+
+
+def test_queued_batch_resumes_and_recovers_crashed_jobs(make_week01_repo):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        make_week01_repo(tmp / 'repo_a')
+        main = make_week01_repo(tmp / 'repo_b') / 'main.py'
+        main.write_text(main.read_text() + "\n# otra versión\n")
+        jobs = [
+            {"id": "a", "repo": str(tmp / 'repo_a'), "week": 1},
+            {"id": "b", "repo": str(tmp / 'repo_b'), "week": 1}
+        ]
+        queue_path = tmp / 'jobs.sqlite3'
+
+        # Un worker "muere" con el primer job tomado
+        queue = JobQueue(queue_path)
+        for job in jobs:
+            queue.enqueue(job)
+        crashed = queue.claim("dead-worker", lease_seconds=0.01)
+        time.sleep(0.05)
+
+        summary = run_queued_batch(jobs, queue_path, tmp / 'out.jsonl', workers=2)
+        records = [json.loads(line) for line in (tmp / 'out.jsonl').read_text().splitlines()]
+        assert summary['total'] == 2 and summary['pending'] == 0 and summary['errors'] == 0
+        assert [record['id'] for record in records] == ['a', 'b']
+        assert queue.get(crashed['key'])['attempts'] == 2
+
+        # Al retomar no se reevalúa nada
+        summary = run_queued_batch(jobs, queue_path, tmp / 'again.jsonl', workers=2)
+        assert summary['resumed'] == 2
+        assert (tmp / 'again.jsonl').read_text() == (tmp / 'out.jsonl').read_text()
+
+
+def test_lease_renewal_stops_after_max_lifetime():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(Path(tmp) / 'jobs.sqlite3')
+        key = queue.enqueue({"id": "a", "repo": "/repo", "week": 1}, commit_id="abc")
+        queue.claim("worker-1", lease_seconds=0.06)
+
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=_renew_lease, args=(queue, key, "worker-1", 0.06, stop, 0.15))
+        heartbeat.start()
+        time.sleep(0.1)
+        assert queue.claim("worker-2") is None
+        # Pasado el máximo deja de renovar aunque el intento siga en curso
+        heartbeat.join(timeout=1)
+        assert not heartbeat.is_alive()
+        time.sleep(0.1)
+        assert queue.claim("worker-2")["key"] == key
+        stop.set()
+
+
+def test_worker_rejects_a_local_repo_that_changed_since_enqueued(make_week01_repo):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        main = make_week01_repo(tmp / 'repo') / 'main.py'
+        queue = JobQueue(tmp / 'jobs.sqlite3')
+        key = queue.enqueue({"id": "a", "repo": str(tmp / 'repo'), "week": 1}, max_attempts=1)
+        main.write_text(main.read_text() + "\n# cambio posterior\n")
+
+        assert drain_queue(tmp / 'jobs.sqlite3') == 1
+        job = queue.get(key)
+        assert job['status'] == 'failed' and "cambió" in job['error']
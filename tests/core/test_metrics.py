@@ -0,0 +1,87 @@
+"""
+Tests de la instrumentación por check y etapa
+"""
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import METRICS_ENV, MetricsRecorder, current_scope
+from core.week_registry import create_evaluator
+
+
+def test_metrics_disabled_by_default(monkeypatch, make_week01_repo):
+    monkeypatch.delenv(METRICS_ENV, raising=False)
+    with tempfile.TemporaryDirectory() as td:
+        make_week01_repo(Path(td) / 'repo')
+        evaluator = create_evaluator(1, str(Path(td) / 'repo'))
+        result = evaluator.evaluate()
+        assert 'metrics' not in result
+        assert evaluator.metrics is None
+
+
+def test_metrics_per_check_and_stage(monkeypatch, make_week01_repo):
+    monkeypatch.setenv(METRICS_ENV, "1")
+    with tempfile.TemporaryDirectory() as td:
+        make_week01_repo(Path(td) / 'repo')
+        result = create_evaluator(1, str(Path(td) / 'repo')).evaluate()
+
+    metrics = result['metrics']
+    assert set(metrics['stages']) == {'checks', 'scoring', 'report'}
+    assert 'endpoints' in metrics['checks']
+    for values in [*metrics['stages'].values(), *metrics['checks'].values()]:
+        assert set(values) == {'wall_seconds', 'cpu_seconds', 'files_read', 'bytes_read', 'peak_memory_bytes'}
+    # main.py lo lee al menos un check, y la etapa de checks acumula sus lecturas
+    assert any(m['files_read'] for m in metrics['checks'].values())
+    assert metrics['stages']['checks']['bytes_read'] >= sum(m['bytes_read'] for m in metrics['checks'].values())
+
+
+def test_nested_measure_in_worker_thread_counts_for_parent():
+    with tempfile.TemporaryDirectory() as td:
+        data = Path(td) / 'data.txt'
+        data.write_text('x' * 1000)
+        recorder = MetricsRecorder(td)
+        try:
+            with recorder.measure("stages", "outer"):
+                parent = current_scope()
+
+                def work():
+                    with recorder.measure("checks", "inner", parent):
+                        data.read_text()
+                        blob = bytearray(2_000_000)
+                        del blob
+
+                thread = threading.Thread(target=work)
+                thread.start()
+                thread.join()
+                # Lecturas fuera del directorio raíz no cuentan
+                Path(__file__).read_text()
+        finally:
+            recorder.close()
+
+    assert recorder.checks['inner']['files_read'] == 1
+    assert recorder.checks['inner']['bytes_read'] == 1000
+    assert recorder.checks['inner']['peak_memory_bytes'] >= 2_000_000
+    assert recorder.stages['outer']['files_read'] == 1
+    assert recorder.stages['outer']['peak_memory_bytes'] >= 2_000_000
+
+
+def test_measure_without_reset_peak_reports_no_peak(monkeypatch):
+    # Python 3.8 no tiene tracemalloc.reset_peak: se mide todo menos el pico
+    import tracemalloc
+    monkeypatch.delattr(tracemalloc, "reset_peak")
+    with tempfile.TemporaryDirectory() as td:
+        recorder = MetricsRecorder(td)
+        try:
+            with recorder.measure("checks", "check"):
+                (Path(td) / 'data.txt').write_text('x' * 10)
+                (Path(td) / 'data.txt').read_text()
+        finally:
+            recorder.close()
+
+    assert not tracemalloc.is_tracing()
+    assert recorder.checks['check']['files_read'] == 1
+    assert recorder.checks['check']['peak_memory_bytes'] == 0
@@ -0,0 +1,84 @@
+"""
+Tests de la caché de mirrors usando repositorios bare locales como remotos
+"""
+import sys
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from core.mirror_cache import MirrorCache
+
+
+def _git(*args, cwd=None):
+    return subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com"] + list(args),
+                          cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+def _make_remote(base: Path, name: str) -> tuple:
+    source = base / f"{name}-source"
+    (source / "week1").mkdir(parents=True)
+    (source / "week1" / "main.py").write_text("app = None\n")
+    (source / "README.md").write_text(f"# {name}\n")
+    _git("init", "-q", "-b", "main", str(source))
+    _git("add", ".", cwd=source)
+    _git("commit", "-qm", "init", cwd=source)
+    remote = base / f"{name}.git"
+    _git("clone", "-q", "--bare", str(source), str(remote))
+    _git("config", "uploadpack.allowFilter", "true", cwd=remote)
+    _git("remote", "add", "origin", str(remote), cwd=source)
+    return source, f"file://{remote}"
+
+
+@pytest.fixture
+def workspace():
+    with tempfile.TemporaryDirectory() as td:
+        yield Path(td)
+
+
+def test_mirror_is_created_once_and_fetched_afterwards(workspace):
+    source, url = _make_remote(workspace, "alice")
+    cache = MirrorCache(workspace / "cache")
+
+    first = cache.checkout(url, "main", workspace / "wt1")
+    assert (first / "README.md").read_text() == "# alice\n"
+    mirror = cache.mirror_path(url)
+    assert (mirror / "HEAD").exists()
+    cache.release(url, first)
+    assert not first.exists()
+    assert not any((mirror / "worktrees").glob("*"))
+
+    # Nuevo commit en el remoto: el mirror se actualiza con fetch
+    (source / "README.md").write_text("# alice v2\n")
+    _git("commit", "-qam", "v2", cwd=source)
+    _git("push", "-q", "origin", "main", cwd=source)
+
+    second = cache.checkout(url, "main", workspace / "wt2", subfolder="week1")
+    assert cache.mirror_path(url) == mirror
+    assert (second / "week1" / "main.py").exists()
+    assert not (second / "README.md").exists()
+    assert _git("log", "-1", "--format=%s", cwd=second).strip() == "v2"
+    cache.release(url, second)
+
+
+def test_least_recently_used_mirrors_are_evicted_over_budget(workspace):
+    _, alice = _make_remote(workspace, "alice")
+    _, bob = _make_remote(workspace, "bob")
+    cache = MirrorCache(workspace / "cache", max_bytes=1)
+
+    cache.release(alice, cache.checkout(alice, "main", workspace / "a"))
+    assert cache.mirror_path(alice).exists()
+
+    # bob excede el presupuesto: se elimina alice (sin worktrees) y bob se conserva
+    bob_worktree = cache.checkout(bob, "main", workspace / "b")
+    assert not cache.mirror_path(alice).exists()
+    assert cache.mirror_path(bob).exists()
+
+    # Un mirror con un worktree vivo no se elimina
+    assert cache.evict() == []
+    cache.release(bob, bob_worktree)
+    assert cache.evict() == [cache.mirror_path(bob)]
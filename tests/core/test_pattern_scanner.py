@@ -0,0 +1,66 @@
+"""
+Tests del escáner de múltiples patrones
+"""
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.pattern_scanner import PatternScanner
+from core.repo_index import RepoIndex
+
+SOURCE = '''def test_db_session(client):
+    response = client.get("/items/999")
+    assert response.status_code == 404
+
+def test_create_item():
+    with pytest.raises(ValueError):
+        pass
+'''
+
+
+def test_scan_counts_match_per_pattern_findall():
+    patterns = [r'def test.*db', r'def test.*session', r'pytest\.raises']
+    scanner = PatternScanner({"hits": patterns, "status": r'status_code.*4\d\d'}, re.IGNORECASE)
+
+    result = scanner.scan(SOURCE)
+
+    expected = sum(len(re.findall(p, SOURCE.lower())) for p in patterns)
+    assert result["hits"]["count"] == expected == 3
+    assert result["hits"]["lines"] == [1, 6]
+    assert result["status"] == {"count": 1, "lines": [3]}
+
+
+def test_scan_files_aggregates_through_repo_index():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        (root / "tests").mkdir()
+        (root / "tests" / "test_a.py").write_text(SOURCE)
+        (root / "tests" / "test_b.py").write_text("def test_database():\n    pass\n")
+
+        index = RepoIndex(root)
+        scanner = PatternScanner({"db": [r'def test.*db', r'def test.*database']})
+        files = index.glob("tests/test*.py")
+        hits = scanner.scan_files(files, index)
+
+        assert hits["db"]["count"] == 2
+        assert sorted(Path(p).name for p in hits["db"]["files"]) == ["test_a.py", "test_b.py"]
+
+
+def test_scan_matches_across_lines_and_reports_unreadable_files():
+    scanner = PatternScanner({"select": r'select\s*\(', "order": r'\.order_by\s*\('})
+
+    result = scanner.scan("stmt = select\n(User)\nrows = stmt.order_by(\n    User.id)\n")
+
+    assert result["select"] == {"count": 1, "lines": [1]}
+    assert result["order"] == {"count": 1, "lines": [3]}
+
+    with tempfile.TemporaryDirectory() as td:
+        errors = []
+        missing = Path(td) / "missing.py"
+        hits = scanner.scan_files([missing], RepoIndex(td), on_error=lambda path, e: errors.append(path))
+        assert hits["select"]["count"] == 0
+        assert errors == [missing]
@@ -0,0 +1,75 @@
+"""
+Tests de trazas (Chrome trace-event) y perfiles en stacks colapsados
+"""
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.profiling import TraceRecorder, ProfileCollector
+from core.week_registry import create_evaluator
+from core.batch import run_batch
+
+
+def _leaf():
+    return sum(i * i for i in range(20000))
+
+
+def _outer():
+    return [_leaf() for _ in range(3)]
+
+
+def test_profile_collector_folds_call_stacks():
+    collector = ProfileCollector()
+    with collector.profile_thread("bloque"):
+        _outer()
+
+    folded = collector.to_folded()
+    assert all(stack.startswith("bloque;") for stack in folded)
+    leaf_stacks = [stack for stack in folded if "_leaf (test_profiling.py" in stack]
+    assert leaf_stacks
+    assert all("_outer (test_profiling.py" in stack.split("_leaf")[0] for stack in leaf_stacks)
+
+    with tempfile.TemporaryDirectory() as td:
+        collector.write(Path(td) / 'out.folded')
+        lines = (Path(td) / 'out.folded').read_text().splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_evaluator_records_stage_and_check_spans(make_week01_repo):
+    with tempfile.TemporaryDirectory() as td:
+        make_week01_repo(Path(td) / 'repo')
+        evaluator = create_evaluator(1, str(Path(td) / 'repo'))
+        evaluator.tracer = TraceRecorder("test")
+        evaluator.evaluate()
+
+    spans = [e for e in evaluator.tracer.as_dict()["traceEvents"] if e["ph"] == "X"]
+    assert {e["name"] for e in spans if e["cat"] == "stage"} == {"checks", "scoring", "report"}
+    assert "endpoints" in {e["name"] for e in spans if e["cat"] == "check"}
+    stage = next(e for e in spans if e["name"] == "checks")
+    # Los checks quedan dentro de la etapa en la línea de tiempo
+    for check in (e for e in spans if e["cat"] == "check"):
+        assert stage["ts"] <= check["ts"] <= stage["ts"] + stage["dur"]
+
+
+def test_run_batch_merges_worker_spans_into_one_trace(make_week01_repo):
+    with tempfile.TemporaryDirectory() as td:
+        p = Path(td)
+        make_week01_repo(p / 'alice')
+        make_week01_repo(p / 'bob')
+        jobs = [{"id": "alice", "repo": str(p / 'alice'), "week": 1},
+                {"id": "bob", "repo": str(p / 'bob'), "week": 1}]
+        tracer, collector = TraceRecorder("main"), ProfileCollector()
+        run_batch(jobs, p / 'out.jsonl', workers=2, tracer=tracer, profile_collector=collector)
+        records = [json.loads(line) for line in (p / 'out.jsonl').read_text().splitlines()]
+
+    spans = [e for e in tracer.as_dict()["traceEvents"] if e["ph"] == "X"]
+    assert sorted(e["name"] for e in spans if e["cat"] == "job") == ["job alice", "job bob"]
+    assert all(e["pid"] != os.getpid() for e in spans)
+    assert any(stack.startswith("semana 1;") for stack in collector.to_folded())
+    # Los spans y perfiles no quedan en el JSONL de resultados
+    assert all("trace_events" not in r and "profile_folded" not in r for r in records)
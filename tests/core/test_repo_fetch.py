@@ -0,0 +1,134 @@
+"""
+Tests de la descarga de repositorios usando un repositorio bare local como remoto
+"""
+import sys
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+
+from core.repo_fetch import (clone_repository, fetch_repository, list_remote_branches, list_remote_heads,
+                             resolve_branch, run_git)
+from core.job_queue import resolve_commit
+
+
+def _git(*args, cwd=None):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com"] + list(args),
+                   cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def remote_url():
+    """Remoto bare con branch por defecto ``trunk``, un branch con "/" y un monorepo por semana"""
+    with tempfile.TemporaryDirectory() as td:
+        source = Path(td) / "source"
+        (source / "week1").mkdir(parents=True)
+        (source / "week2").mkdir()
+        (source / "week1" / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+        (source / "week2" / "data.bin").write_bytes(b"x" * 50000)
+        (source / "README.md").write_text("# Monorepo\n")
+        _git("init", "-q", "-b", "trunk", str(source))
+        _git("add", ".", cwd=source)
+        _git("commit", "-qm", "init", cwd=source)
+        _git("branch", "feature/week1", cwd=source)
+
+        remote = Path(td) / "remote.git"
+        _git("clone", "-q", "--bare", str(source), str(remote))
+        _git("config", "uploadpack.allowFilter", "true", cwd=remote)
+        yield f"file://{remote}"
+
+
+def _cleanup(path: str):
+    root = Path(path)
+    while not root.name.startswith("eval_repo_"):
+        root = root.parent
+    shutil.rmtree(root, ignore_errors=True)
+
+
+def test_resolves_default_branch_and_slashed_branches(remote_url):
+    default_branch, branches = list_remote_branches(remote_url)
+
+    assert default_branch == "trunk"
+    assert sorted(branches) == ["feature/week1", "trunk"]
+    assert resolve_branch("", default_branch, branches) == ("trunk", "")
+    assert resolve_branch("feature/week1/week1", default_branch, branches) == ("feature/week1", "week1")
+    assert resolve_branch("missing/week1", default_branch, branches) == ("trunk", "week1")
+
+
+def test_clone_subfolder_downloads_only_that_folder(remote_url):
+    path = clone_repository(f"{remote_url}/tree/trunk/week1")
+    try:
+        clone_root = Path(path).parent
+        assert (Path(path) / "main.py").exists()
+        assert not (clone_root / "week2").exists()
+        assert not (clone_root / "README.md").exists()
+
+        # Clon parcial: los blobs fuera de la subcarpeta no se descargaron
+        objects = subprocess.run(["git", "rev-list", "--objects", "--missing=print", "HEAD"],
+                                 cwd=clone_root, capture_output=True, text=True, check=True).stdout
+        assert any(line.startswith("?") for line in objects.splitlines())
+    finally:
+        _cleanup(path)
+
+
+def test_fetch_without_tree_uses_remote_default_branch(remote_url):
+    path, cleanup = fetch_repository(remote_url)
+    assert (Path(path) / "README.md").exists()
+    assert (Path(path) / "week1" / "main.py").exists()
+    cleanup()
+    assert not Path(path).exists()
+
+
+def test_clone_through_mirror_cache_reuses_the_mirror(remote_url):
+    from core.mirror_cache import MirrorCache
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = MirrorCache(cache_dir)
+        for _ in range(2):
+            path = clone_repository(f"{remote_url}/tree/trunk/week1", cache)
+            assert (Path(path) / "main.py").exists()
+            assert not (Path(path).parent / "README.md").exists()
+            cache.release(remote_url, Path(path).parent)
+
+        assert [p.name for p in Path(cache_dir, "mirrors").iterdir() if p.is_dir()] == \
+            [cache.mirror_path(remote_url).name]
+
+
+def _advance_trunk(remote_url: str) -> str:
+    """Publica un commit nuevo en ``trunk`` y retorna el commit anterior"""
+    source = Path(remote_url[len("file://"):]).parent / "source"
+    previous = run_git(["rev-parse", "HEAD"], cwd=str(source)).strip()
+    (source / "week1" / "main.py").write_text("# versión nueva\n")
+    _git("commit", "-qam", "update", cwd=source)
+    _git("push", "-q", remote_url, "trunk", cwd=source)
+    return previous
+
+
+def test_clone_checks_out_the_requested_commit_after_the_branch_moved(remote_url):
+    from core.mirror_cache import MirrorCache
+
+    assert resolve_commit(f"{remote_url}/tree/trunk/week1") == list_remote_heads(remote_url)[1]["trunk"]
+    previous = _advance_trunk(remote_url)
+    assert resolve_commit(remote_url) != previous
+
+    path = clone_repository(f"{remote_url}/tree/trunk/week1", commit=previous)
+    try:
+        assert "FastAPI" in (Path(path) / "main.py").read_text()
+    finally:
+        _cleanup(path)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = MirrorCache(cache_dir)
+        path = clone_repository(f"{remote_url}/tree/trunk/week1", cache, commit=previous)
+        assert "FastAPI" in (Path(path) / "main.py").read_text()
+        cache.release(remote_url, Path(path).parent)
+
+
+def test_git_commands_time_out():
+    with pytest.raises(RuntimeError, match="no terminó"):
+        run_git(["-c", "alias.wait=!sleep 5", "wait"], timeout=0.2)
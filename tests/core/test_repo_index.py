@@ -0,0 +1,66 @@
+"""
+Tests del índice de archivos compartido
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.repo_index import RepoIndex
+
+
+def _write(root: Path, rel: str, content: str = ""):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_repo_index_ignores_virtualenvs_and_caches():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        _write(root, "main.py")
+        _write(root, "app/models.py")
+        _write(root, "venv/lib/site.py")
+        _write(root, "node_modules/pkg/index.js")
+        _write(root, "app/__pycache__/models.cpython-311.pyc")
+
+        index = RepoIndex(root)
+        rel = sorted(str(p.relative_to(root.resolve())) for p in index.files())
+        assert rel == ["app/models.py", "main.py"]
+
+
+def test_repo_index_queries_by_extension_directory_and_glob():
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        _write(root, "README.md")
+        _write(root, "tests/test_api.py")
+        _write(root, "tests/unit/test_models.py")
+        _write(root, "tests/unit/helpers.py")
+        _write(root, "alembic/versions/001_init.py")
+
+        index = RepoIndex(root)
+        base = root.resolve()
+        names = lambda paths: sorted(str(p.relative_to(base)) for p in paths)
+
+        assert names(index.python_files("tests", recursive=False)) == ["tests/test_api.py"]
+        assert names(index.python_files("tests")) == ["tests/test_api.py", "tests/unit/helpers.py", "tests/unit/test_models.py"]
+        assert names(index.glob("tests/**/test_*.py")) == ["tests/test_api.py", "tests/unit/test_models.py"]
+        assert names(index.glob("**/versions/*.py")) == ["alembic/versions/001_init.py"]
+        assert names(index.files(".md")) == ["README.md"]
+
+
+def test_shared_index_is_kept_even_when_empty_and_not_walked():
+    from weeks.week02.evaluator import Week02Evaluator
+    from weeks.week05.checks.test_structure import check_test_structure
+
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        index = RepoIndex(root, ignored_dirs={"custom"})
+
+        assert Week02Evaluator(str(root), repo_index=index).repo_index is index
+        # Recibir el índice no lo recorre; solo los checks que listan archivos lo hacen
+        assert index._files is None
+        check_test_structure(str(root), index)
+        assert len(index) == 0 and index.ignored_dirs == frozenset({"custom"})
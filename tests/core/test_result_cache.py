@@ -0,0 +1,95 @@
+"""
+Tests de la caché persistente de resultados
+"""
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.result_cache import ResultCache, compute_repo_key
+from weeks.week02.evaluator import Week02Evaluator
+
+MAIN_PY = '''from fastapi import FastAPI
+from pydantic import BaseModel
+
+app = FastAPI()
+
+class Item(BaseModel):
+    name: str
+
+@app.get("/items")
+def list_items():
+    return []
+'''
+
+
+def _make_repo(root: Path):
+    (root / "main.py").write_text(MAIN_PY)
+    (root / "requirements.txt").write_text("fastapi\nuvicorn\npydantic\n")
+    (root / "README.md").write_text("# API\n")
+
+
+def _evaluate(repo: Path, cache_dir: Path):
+    evaluator = Week02Evaluator(str(repo))
+    evaluator.result_cache = ResultCache(cache_dir)
+    return evaluator.evaluate()
+
+
+def test_result_cache_reuses_result_until_repo_changes():
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td) / "repo"
+        repo.mkdir()
+        _make_repo(repo)
+        cache_dir = Path(td) / "cache"
+
+        first = _evaluate(repo, cache_dir)
+        second = _evaluate(repo, cache_dir)
+        assert "cache_hit" not in first
+        assert second["cache_hit"] is True
+        assert second["final_score"] == first["final_score"]
+
+        (repo / "README.md").write_text("# API\n\nNueva sección\n")
+        third = _evaluate(repo, cache_dir)
+        assert "cache_hit" not in third
+
+
+def test_repo_key_uses_git_tree_only_when_clean():
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td)
+        _make_repo(repo)
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], check=True)
+
+        assert compute_repo_key(repo).startswith("git:")
+
+        (repo / "extra.py").write_text("x = 1\n")
+        assert compute_repo_key(repo).startswith("content:")
+
+
+def test_repo_key_tracks_gitignored_files_read_by_checks():
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(td)
+        _make_repo(repo)
+        (repo / ".gitignore").write_text(".env\nvenv/\n")
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], check=True)
+        clean_key = compute_repo_key(repo)
+
+        # Los archivos ignorados fuera del índice (venv/) no cambian la clave
+        (repo / "venv").mkdir()
+        (repo / "venv" / "lib.py").write_text("x = 1\n")
+        assert compute_repo_key(repo) == clean_key
+
+        (repo / ".env").write_text("DATABASE_URL=sqlite:///a.db\n")
+        with_env = compute_repo_key(repo)
+        assert with_env.startswith(clean_key + "+ignored:")
+
+        (repo / ".env").write_text("DATABASE_URL=sqlite:///b.db\n")
+        assert compute_repo_key(repo) != with_env
@@ -0,0 +1,57 @@
+"""
+Tests de la política de tamaño de resultados
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.result_policy import apply_result_policy
+from core.week_registry import create_evaluator
+
+
+POLICY = {"max_string_chars": 20, "max_list_items": 3, "drop_keys": ["content"],
+          "dedupe": True, "keep_keys": ["report"]}
+
+
+def test_policy_drops_sources_caps_and_dedupes():
+    endpoints = [{"path": f"/items/{i}", "method": "GET", "params": ["item_id"]} for i in range(5)]
+    result = {
+        "report": "r" * 100,
+        "results": {
+            "app_import": {"import_ok": True, "content": "print('hola')\n" * 50},
+            "endpoints": {"details": endpoints, "note": "x" * 50},
+            "crud": {"details": list(endpoints)},
+            "items": list(range(10))
+        }
+    }
+
+    reduced = apply_result_policy(result, POLICY)
+    results = reduced["results"]
+
+    assert reduced["report"] == result["report"]
+    assert results["app_import"] == {"import_ok": True}
+    assert results["endpoints"]["note"].startswith("x" * 20 + "… [+30")
+    assert results["crud"]["details"] == {"$same_as": "$.results.endpoints.details"}
+    assert results["items"] == [0, 1, 2, "… [+7 elementos]"]
+    assert reduced["result_policy"] == {"dropped": 1, "truncated": 3, "deduplicated": 1}
+    # El resultado original no se modifica
+    assert "content" in result["results"]["app_import"]
+
+
+def test_evaluator_policy_per_format_and_criteria_override():
+    with tempfile.TemporaryDirectory() as td:
+        evaluator = create_evaluator(1, td)
+
+        assert evaluator.get_result_policy("markdown") is None
+        assert evaluator.get_result_policy("json")["drop_keys"] == ["content"]
+
+        evaluator.config["result_size_policy"] = {"json": {"max_string_chars": 10},
+                                                  "jsonl": {"enabled": False}}
+        assert evaluator.get_result_policy("json")["max_string_chars"] == 10
+        assert evaluator.get_result_policy("json")["drop_keys"] == ["content"]
+        assert evaluator.get_result_policy("jsonl") is None
+        result = {"results": {}}
+        assert evaluator.apply_result_policy(result, "jsonl") is result
@@ -0,0 +1,47 @@
+"""
+Tests de la salida JSONL compacta
+"""
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.result_stream import JsonlWriter, compact_result
+
+
+def test_compact_result_replaces_large_strings_with_references():
+    content = "from fastapi import FastAPI\n" * 100
+    result = {"results": {"app_import": {"import_ok": True, "content": content}},
+              "report": content, "tags": ["ok", content]}
+
+    with tempfile.TemporaryDirectory() as td:
+        compact = compact_result(result, max_inline_bytes=256, blob_dir=td)
+
+        reference = compact["results"]["app_import"]["content"]
+        assert reference["$ref"].startswith("sha256:")
+        assert reference["bytes"] == len(content.encode("utf-8"))
+        assert compact["results"]["app_import"]["import_ok"] is True
+        # Textos iguales comparten referencia y blob
+        assert compact["report"] == reference and compact["tags"] == ["ok", reference]
+        assert Path(reference["path"]).read_text() == content
+        assert len(list(Path(td).rglob("*.txt"))) == 1
+
+    # El original no se modifica y 0 desactiva la compactación
+    assert result["report"] == content
+    assert compact_result(result, max_inline_bytes=0) is result
+
+
+def test_jsonl_writer_appends_one_line_per_record():
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "results.jsonl"
+        with JsonlWriter(path) as out:
+            out.write({"id": "alice", "score": 90})
+        with JsonlWriter(path, append=True) as out:
+            out.write({"id": "bob", "note": "ñandú"})
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["alice", "bob"]
+        assert lines[0] == '{"id":"alice","score":90}'
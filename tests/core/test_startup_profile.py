@@ -0,0 +1,52 @@
+"""
+Tests del perfil de arranque y de la ejecución del CLI en el mismo proceso
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.startup_profile import StartupProfiler
+
+
+def test_profiler_records_nested_imports():
+    with tempfile.TemporaryDirectory() as td:
+        (Path(td) / "profiled_outer.py").write_text("import time\nimport profiled_inner\ntime.sleep(0.02)\n")
+        (Path(td) / "profiled_inner.py").write_text("import time\ntime.sleep(0.02)\n")
+        sys.path.insert(0, td)
+        profiler = StartupProfiler().install()
+        try:
+            with profiler.phase("import"):
+                import profiled_outer  # noqa: F401
+        finally:
+            profiler.uninstall()
+            sys.path.remove(td)
+            sys.modules.pop("profiled_outer", None)
+            sys.modules.pop("profiled_inner", None)
+
+    records = {r["module"]: r for r in profiler.records}
+    assert records["profiled_inner"]["depth"] == 1
+    assert records["profiled_outer"]["depth"] == 0
+    assert records["profiled_outer"]["cumulative_ms"] >= records["profiled_inner"]["cumulative_ms"] + 15
+    assert records["profiled_outer"]["self_ms"] < records["profiled_outer"]["cumulative_ms"] - 15
+
+    summary = profiler.get_summary(budget_ms=1)
+    assert summary["over_budget"] is True
+    assert summary["phases"][0]["name"] == "import"
+    assert "PERFIL DE ARRANQUE" in profiler.format_report(budget_ms=1)
+
+
+def test_cli_main_runs_in_process_and_returns_exit_code(capsys):
+    from evaluate import main
+
+    with tempfile.TemporaryDirectory() as td:
+        (Path(td) / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+        exit_code = main(["--week", "1", "--repo", td, "--format", "summary", "--profile-startup"])
+
+    captured = capsys.readouterr()
+    assert exit_code in (0, 1)
+    assert "RESUMEN DE EVALUACIÓN" in captured.out
+    assert "PERFIL DE ARRANQUE" in captured.err
+    assert "evaluación" in captured.err
@@ -0,0 +1,53 @@
+"""
+Tests de la caché de templates compilados
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.template_cache import CompiledTemplate, find_template, get_template
+
+
+VARIABLES = {"status": "✅", "total_score": 87, "ratio": 0.456, "items": ["a", "b"]}
+
+
+@pytest.mark.parametrize("text", [
+    "Estado: {status} — {total_score}/100",
+    "{{literal}} {ratio:.1%} {status!r} {total_score:>5}",
+    "Primer item: {items[0]}",
+    "Sin campos",
+])
+def test_render_matches_str_format(text):
+    assert CompiledTemplate(text).render(VARIABLES) == text.format(**VARIABLES)
+
+
+def test_render_errors_match_str_format():
+    with pytest.raises(KeyError):
+        CompiledTemplate("{missing}").render(VARIABLES)
+    with pytest.raises(ValueError):
+        CompiledTemplate("{status").render(VARIABLES)
+
+
+def test_templates_are_compiled_once_until_the_file_changes():
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "feedback.md"
+        path.write_text("Puntaje: {total_score}")
+
+        first = get_template(path)
+        assert get_template(path) is first
+        assert first.render(VARIABLES) == "Puntaje: 87"
+
+        path.write_text("Total: {total_score}")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = get_template(path)
+        assert second is not first
+        assert second.render(VARIABLES) == "Total: 87"
+
+        assert find_template(Path(td) / "missing.md") is None
@@ -0,0 +1,54 @@
+"""
+Tests del registro de evaluadores y la carga diferida de checks
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.week_registry import discover_weeks, get_evaluator_class, lazy_check, resolve_check
+
+
+def test_discover_weeks_lists_all_evaluators():
+    weeks = discover_weeks()
+    assert list(weeks) == list(range(1, 12))
+    assert weeks[6].name == "week06"
+
+
+def test_evaluator_class_is_cached_and_unknown_week_fails():
+    evaluator_class = get_evaluator_class(6)
+    assert evaluator_class.__name__ == "Week06Evaluator"
+    assert get_evaluator_class(6) is evaluator_class
+
+    try:
+        get_evaluator_class(42)
+        assert False, "Debió fallar"
+    except ValueError as e:
+        assert "42" in str(e)
+
+
+def test_checks_load_lazily_in_their_own_week_namespace():
+    week02 = get_evaluator_class(2)
+    week03 = get_evaluator_class(3)
+    module_name = "weeks.week03.checks.migrations"
+
+    from weeks.week03 import evaluator as week03_module
+    if not week03_module.check_migrations._function:
+        assert module_name not in sys.modules
+
+    # Ambas semanas tienen checks/crud_operations.py; cada una usa el suyo
+    crud02 = resolve_check(sys.modules[week02.__module__].check_crud_operations)
+    crud03 = resolve_check(week03_module.check_crud_operations)
+    assert crud02.__module__ == "weeks.week02.checks.crud_operations"
+    assert crud03.__module__ == "weeks.week03.checks.crud_operations"
+
+    resolve_check(week03_module.check_migrations)
+    assert module_name in sys.modules
+
+
+def test_missing_check_module_returns_default():
+    check = lazy_check(1, "does_not_exist", default_return={"error": "no", "passed": False})
+    result = check("/tmp")
+    assert result["passed"] is False
+    assert result["error"].startswith("no:")
@@ -0,0 +1,137 @@
+"""
+Tests de scripts/reevaluate_issues.py contra un servidor stub de la API de GitHub
+"""
+import sys
+import json
+import time
+import threading
+import importlib.util
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+pytest.importorskip("requests")
+
+SCRIPT = Path(__file__).parent.parent.parent / "scripts" / "reevaluate_issues.py"
+
+ISSUES_PER_PAGE = 25
+PAGES = 3
+POST_SECONDS = 0.02
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("reevaluate_issues", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _GitHubStub(BaseHTTPRequestHandler):
+    """
+    Listado de issues en PAGES páginas enlazadas con ``Link``. La primera
+    página responde 429 una vez, la segunda avisa que queda poco rate limit y
+    el primer comentario se rechaza con 403; todos piden esperar.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        state = self.server.state
+        url = urlsplit(self.path)
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        with state["lock"]:
+            state["gets"].append((page, time.time()))
+            first_attempt = sum(1 for p, _ in state["gets"] if p == page) == 1
+        if page == 1 and first_attempt:
+            return self._send(429, {"message": "slow down"}, {"Retry-After": "0.3"})
+
+        headers = {}
+        if page < PAGES:
+            base = f"http://{self.headers['Host']}{url.path}"
+            headers["Link"] = f'<{base}?page={page + 1}>; rel="next", <{base}?page={PAGES}>; rel="last"'
+        if page == 2:
+            # Quedan pocos requests y la ventana ya se reinició: pausa de ~1 s (reset + 1)
+            headers["X-RateLimit-Remaining"] = "3"
+            headers["X-RateLimit-Reset"] = str(time.time() - 0.2)
+            state["rate_limited_at"] = time.time()
+        first = (page - 1) * ISSUES_PER_PAGE + 1
+        issues = [{"number": n, "title": f"Semana 1 #{n}"} for n in range(first, first + ISSUES_PER_PAGE)]
+        self._send(200, issues, headers)
+
+    def do_POST(self):
+        state = self.server.state
+        number = int(self.path.split("/")[-2])
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with state["lock"]:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+            rejected = not state["rejected"]
+            state["rejected"] = True
+        try:
+            if rejected:
+                return self._send(403, {"message": "secondary rate limit"}, {"Retry-After": "0.2"})
+            time.sleep(POST_SECONDS)
+            with state["lock"]:
+                state["comments"].append(number)
+            self._send(201, {"id": number})
+        finally:
+            with state["lock"]:
+                state["active"] -= 1
+
+
+@pytest.fixture
+def github_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GitHubStub)
+    server.daemon_threads = True
+    server.state = {"lock": threading.Lock(), "gets": [], "comments": [], "active": 0,
+                    "max_active": 0, "rejected": False, "rate_limited_at": None}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", server.state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_reevaluates_every_page_respecting_rate_limits(github_stub, monkeypatch, capsys):
+    api_url, state = github_stub
+    script = _load_script()
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setattr(sys, "argv", [
+        "reevaluate_issues.py", "--owner", "epti", "--repo", "bc-channel", "--week", "1",
+        "--max-issues", "0", "--concurrency", "3", "--api-url", api_url
+    ])
+
+    script.main()
+    output = capsys.readouterr().out
+
+    # Todas las páginas, sin truncar: cada issue recibe exactamente un comentario
+    total = ISSUES_PER_PAGE * PAGES
+    assert f"Encontrados {total} issues" in output
+    assert sorted(state["comments"]) == list(range(1, total + 1))
+    assert f"Exitosos: {total}" in output
+
+    # El 429 con Retry-After se reintenta después de la espera pedida
+    page_1 = [at for page, at in state["gets"] if page == 1]
+    assert len(page_1) == 2 and page_1[1] - page_1[0] >= 0.3
+
+    # Con X-RateLimit-Remaining bajo se espera al reinicio antes de la página siguiente
+    page_3 = [at for page, at in state["gets"] if page == 3]
+    assert len(page_3) == 1 and page_3[0] - state["rate_limited_at"] >= 0.7
+
+    # Comentarios en paralelo, sin pasar de --concurrency
+    assert 1 < state["max_active"] <= 3
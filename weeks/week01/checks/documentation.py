@@ -2,14 +2,19 @@
 Verificaciones de documentación específicas para Week 1 - Versión autocontenida
 """
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_readme_exists_and_content(repo_path: str) -> Dict[str, Any]:
+
+def check_readme_exists_and_content(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica que README.md existe y tiene contenido adecuado
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     readme_path = repo_root / "README.md"
     
     if not readme_path.exists():
@@ -21,7 +26,7 @@ def check_readme_exists_and_content(repo_path: str) -> Dict[str, Any]:
         }
     
     try:
-        content = readme_path.read_text(encoding="utf-8", errors="ignore")
+        content = repo_index.read_text(readme_path)
         content_lower = content.lower()
         
         # Verificaciones básicas de contenido
@@ -59,21 +64,27 @@ def check_readme_exists_and_content(repo_path: str) -> Dict[str, Any]:
         }
 
 
-def check_documentation(repo_path: str) -> Dict[str, Any]:
+@depends_on("README.md")
+def check_documentation(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la documentación específica para Week 1
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice compartido del repositorio (opcional)
         
     Returns:
         Dict con resultados de verificación de documentación
     """
+    # README.md se lee una sola vez: ambos análisis usan el contenido cacheado
+    if repo_index is None:
+        repo_index = RepoIndex(repo_path)
+    
     # Usar el check de README autocontenido
-    readme_results = check_readme_exists_and_content(repo_path)
+    readme_results = check_readme_exists_and_content(repo_path, repo_index)
     
     # Verificaciones adicionales específicas de Week 1
-    additional_checks = check_week1_specific_docs(repo_path)
+    additional_checks = check_week1_specific_docs(repo_path, repo_index)
     
     # Combinar resultados
     return {
@@ -88,11 +99,13 @@ def check_documentation(repo_path: str) -> Dict[str, Any]:
     }
 
 
-def check_week1_specific_docs(repo_path: str) -> Dict[str, Any]:
+def check_week1_specific_docs(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verificaciones específicas de documentación para Week 1
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     readme_path = repo_root / "README.md"
     
     if not readme_path.exists():
@@ -104,7 +117,7 @@ def check_week1_specific_docs(repo_path: str) -> Dict[str, Any]:
         }
     
     try:
-        content = readme_path.read_text(encoding="utf-8", errors="ignore").lower()
+        content = repo_index.read_text(readme_path).lower()
         
         # Verificar explicación de FastAPI
         has_fastapi_explanation = any(term in content for term in [
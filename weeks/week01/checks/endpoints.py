@@ -2,14 +2,19 @@
 Verificaciones de endpoints específicas para Week 1 - Versión autocontenida
 """
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def safe_import_app(repo_path: str) -> Dict[str, Any]:
+
+def safe_import_app(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Intenta importar la aplicación FastAPI de manera segura usando análisis estático
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     main_py = repo_root / "main.py"
     
     if not main_py.exists():
@@ -17,8 +22,7 @@ def safe_import_app(repo_path: str) -> Dict[str, Any]:
     
     try:
         # Verificar sintaxis básica
-        with open(main_py, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = repo_index.read_text(main_py)
         
         # Intentar compilar para verificar sintaxis
         try:
@@ -43,11 +47,13 @@ def safe_import_app(repo_path: str) -> Dict[str, Any]:
         return {"import_ok": False, "has_app": False, "error": f"Error procesando main.py: {str(e)}"}
 
 
-def analyze_endpoints_static(repo_path: str) -> Dict[str, Any]:
+def analyze_endpoints_static(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Analiza los endpoints usando análisis estático del código
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     
     # Verificar que requirements.txt existe y tiene las dependencias
     requirements_file = repo_root / "requirements.txt"
@@ -56,8 +62,7 @@ def analyze_endpoints_static(repo_path: str) -> Dict[str, Any]:
     
     try:
         # Verificar dependencias en requirements.txt
-        with open(requirements_file, 'r') as f:
-            req_content = f.read().lower()
+        req_content = repo_index.read_text(requirements_file).lower()
         
         if "fastapi" not in req_content:
             return {"error": "FastAPI no está en requirements.txt", "analysis_ok": False}
@@ -70,8 +75,7 @@ def analyze_endpoints_static(repo_path: str) -> Dict[str, Any]:
         if not main_py.exists():
             return {"error": "main.py no encontrado", "analysis_ok": False}
         
-        with open(main_py, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = repo_index.read_text(main_py)
         
         # Buscar endpoints definidos
         endpoints_found = {}
@@ -118,18 +122,24 @@ def analyze_endpoints_static(repo_path: str) -> Dict[str, Any]:
         return {"error": f"Error en análisis: {str(e)}", "analysis_ok": False}
 
 
-def check_endpoints(repo_path: str) -> Dict[str, Any]:
+@depends_on("main.py", "requirements.txt")
+def check_endpoints(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica que los endpoints básicos de Week 1 funcionen correctamente
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice compartido del repositorio (opcional)
         
     Returns:
         Dict con resultados de verificación de endpoints
     """
+    # main.py se lee una sola vez: el análisis estático reutiliza el contenido cacheado
+    if repo_index is None:
+        repo_index = RepoIndex(repo_path)
+    
     # Primero intentar importar la app de manera segura
-    app_import_result = safe_import_app(repo_path)
+    app_import_result = safe_import_app(repo_path, repo_index)
     
     if not app_import_result.get("import_ok"):
         return {
@@ -143,7 +153,7 @@ def check_endpoints(repo_path: str) -> Dict[str, Any]:
         }
     
     # Analizar endpoints usando análisis estático
-    endpoint_analysis = analyze_endpoints_static(repo_path)
+    endpoint_analysis = analyze_endpoints_static(repo_path, repo_index)
     
     if not endpoint_analysis.get("analysis_ok"):
         return {
@@ -185,12 +195,12 @@ def check_endpoints(repo_path: str) -> Dict[str, Any]:
     }
 
 
-def check_hello_world_endpoint(repo_path: str) -> Dict[str, Any]:
+def check_hello_world_endpoint(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verificación específica del endpoint raíz (Hello World)
     """
     try:
-        endpoint_results = check_endpoints(repo_path)
+        endpoint_results = check_endpoints(repo_path, repo_index)
         
         if not endpoint_results.get("root_working"):
             return {
@@ -218,12 +228,12 @@ def check_hello_world_endpoint(repo_path: str) -> Dict[str, Any]:
         }
 
 
-def check_docs_accessibility(repo_path: str) -> Dict[str, Any]:
+def check_docs_accessibility(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica que la documentación automática sea accesible
     """
     try:
-        app_import_result = safe_import_app(repo_path)
+        app_import_result = safe_import_app(repo_path, repo_index)
         
         if not app_import_result.get("import_ok"):
             return {
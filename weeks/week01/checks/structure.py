@@ -2,7 +2,9 @@
 Verificaciones de estructura de proyecto específicas para Week 1 - Versión autocontenida
 """
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from core.repo_index import RepoIndex
 
 
 def check_required_files(repo_path: str) -> Dict[str, Any]:
@@ -35,11 +37,13 @@ def check_required_files(repo_path: str) -> Dict[str, Any]:
     }
 
 
-def check_requirements_dependencies(repo_path: str) -> Dict[str, Any]:
+def check_requirements_dependencies(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica que requirements.txt tenga las dependencias necesarias
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     requirements_file = repo_root / "requirements.txt"
     
     if not requirements_file.exists():
@@ -53,7 +57,7 @@ def check_requirements_dependencies(repo_path: str) -> Dict[str, Any]:
         }
     
     try:
-        content = requirements_file.read_text(encoding="utf-8", errors="ignore").lower()
+        content = repo_index.read_text(requirements_file).lower()
         
         has_fastapi = "fastapi" in content
         has_uvicorn = "uvicorn" in content
@@ -84,22 +88,26 @@ def check_requirements_dependencies(repo_path: str) -> Dict[str, Any]:
         }
 
 
-def check_project_structure(repo_path: str) -> Dict[str, Any]:
+def check_project_structure(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la estructura del proyecto específica para Week 1
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice compartido del repositorio (opcional)
         
     Returns:
         Dict con resultados de verificación de estructura
     """
+    if repo_index is None:
+        repo_index = RepoIndex(repo_path)
+    
     # Usar checks autocontenidos
     files_check = check_required_files(repo_path)
-    requirements_check = check_requirements_dependencies(repo_path)
+    requirements_check = check_requirements_dependencies(repo_path, repo_index)
     
     # Verificaciones adicionales específicas de Week 1
-    week1_structure = check_week1_structure_details(repo_path)
+    week1_structure = check_week1_structure_details(repo_path, repo_index)
     
     # Calcular score general
     overall_score = (
@@ -124,11 +132,13 @@ def check_project_structure(repo_path: str) -> Dict[str, Any]:
     }
 
 
-def check_week1_structure_details(repo_path: str) -> Dict[str, Any]:
+def check_week1_structure_details(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verificaciones específicas de estructura para Week 1
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     optional_files = [".gitignore", "Dockerfile", "docker-compose.yml"]
     
     # Verificar archivos opcionales
@@ -147,7 +157,7 @@ def check_week1_structure_details(repo_path: str) -> Dict[str, Any]:
             unexpected_dirs.append(item.name)
     
     # Verificar contenido de main.py
-    main_py_analysis = analyze_main_py_content(repo_root / "main.py")
+    main_py_analysis = analyze_main_py_content(repo_root / "main.py", repo_index)
     
     # Calcular score
     structure_score = 50  # Base score
@@ -212,10 +222,12 @@ def check_week1_structure_details(repo_path: str) -> Dict[str, Any]:
     }
 
 
-def analyze_main_py_content(main_py_path: Path) -> Dict[str, Any]:
+def analyze_main_py_content(main_py_path: Path, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Analiza el contenido de main.py para Week 1
     """
+    if repo_index is None:
+        repo_index = RepoIndex(main_py_path.parent)
     if not main_py_path.exists():
         return {
             "exists": False,
@@ -227,7 +239,7 @@ def analyze_main_py_content(main_py_path: Path) -> Dict[str, Any]:
         }
     
     try:
-        content = main_py_path.read_text(encoding="utf-8", errors="ignore")
+        content = repo_index.read_text(main_py_path)
         
         # Verificaciones básicas de contenido
         has_fastapi_import = any(line.strip().startswith(("from fastapi import", "import fastapi")) 
@@ -292,7 +304,7 @@ def analyze_main_py_content(main_py_path: Path) -> Dict[str, Any]:
         }
     
     try:
-        content = main_py_path.read_text(encoding="utf-8", errors="ignore")
+        content = repo_index.read_text(main_py_path)
         
         # Verificaciones básicas de contenido
         has_fastapi_import = any(line.strip().startswith(("from fastapi import", "import fastapi")) 
@@ -3,55 +3,25 @@ Evaluador específico para Semana 1 - Hello World API
 Migrado al nuevo framework core.
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.check_resolver import all_of, value_in
+from core.week_registry import lazy_check
 
-def safe_import_check(check_name: str, default_return: Dict[str, Any] = None):
-    """Helper para importar checks de manera segura"""
-    if default_return is None:
-        default_return = {"error": f"Check {check_name} not available", "passed": False, "score": 0}
-    
-    try:
-        current_dir = Path(__file__).parent
-        check_file = current_dir / "checks" / f"{check_name}.py"
-        
-        if not check_file.exists():
-            return lambda repo_path: default_return
-        
-        spec = importlib.util.spec_from_file_location(f"{check_name}_check", str(check_file))
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
-        # Buscar la función principal del check
-        function_name = f"check_{check_name}" if check_name != "endpoints" else "check_endpoints"
-        if check_name == "structure":
-            function_name = "check_project_structure"
-        
-        if hasattr(module, function_name):
-            return getattr(module, function_name)
-        else:
-            # Buscar cualquier función que empiece con "check_"
-            for attr_name in dir(module):
-                if attr_name.startswith("check_") and callable(getattr(module, attr_name)):
-                    return getattr(module, attr_name)
-        
-        return lambda repo_path: default_return
-        
-    except Exception as e:
-        print(f"Warning: Could not import {check_name} check: {e}")
-        return lambda repo_path: {**default_return, "error": str(e)}
+def _unavailable_result(check_name: str) -> Dict[str, Any]:
+    """Resultado de un check cuyo módulo no se pudo importar"""
+    return {"error": f"Check {check_name} not available", "passed": False, "score": 0}
 
-# Importar checks con manejo de errores
-check_endpoints = safe_import_check("endpoints")
-check_documentation = safe_import_check("documentation") 
-check_project_structure = safe_import_check("structure")
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_endpoints = lazy_check(1, "endpoints", default_return=_unavailable_result("endpoints"))
+check_documentation = lazy_check(1, "documentation", default_return=_unavailable_result("documentation"))
+check_project_structure = lazy_check(1, "structure", "check_project_structure",
+                                     default_return=_unavailable_result("structure"))
 
 
 class Week01Evaluator(BaseEvaluator):
@@ -65,50 +35,62 @@ class Week01Evaluator(BaseEvaluator):
     - Estructura del proyecto
     """
     
-    def __init__(self, student_repo_path: str):
+    # Mapeo de checks del criteria.yaml a resultados del evaluador
+    CHECK_MAPPINGS = {
+        # Setup category
+        "requirements_txt": ("project_structure", "required_files", "requirements.txt"),
+        "fastapi_dependency": ("project_structure", "required_packages", "fastapi"),
+        "uvicorn_dependency": ("project_structure", "required_packages", "uvicorn"),
+        "main_py_exists": ("project_structure", "required_files", "main.py"),
+        "readme_exists": ("project_structure", "required_files", "README.md"),
+        
+        # Functionality category
+        "app_import": all_of(("fastapi_app", "has_fastapi_import"), ("fastapi_app", "has_app_instance")),
+        "root_endpoint": ("endpoints", "root_working"),
+        "docs_accessible": ("endpoints", "docs_accessible"),
+        "parametric_endpoint": ("endpoints", "parametric_endpoint"),
+        
+        # Documentation category
+        "json_responses": ("endpoints", "root_working"),  # Si funciona el endpoint, devuelve JSON
+        "readme_reflection": ("documentation", "has_reflection"),
+        "setup_commands": ("documentation", "has_setup_commands"),
+        
+        # Deliverables category
+        "project_structure": ("project_structure", "all_files_present"),
+        "code_quality": value_in(("code_quality", "overall_quality"), ["excellent", "good"]),
+        
+        # Understanding category
+        "demonstrates_understanding": ("documentation", "week1_specific", "appears_complete"),
+    }
+    
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=1,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
         # Inicializar common checks para esta semana
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 1
         """
-        results = {}
-        
-        # Check de endpoints específicos usando el nuevo framework
-        try:
-            results["endpoints"] = check_endpoints(str(self.repo_path))
-        except Exception as e:
-            results["endpoints"] = {"error": str(e), "passed": False, "score": 0}
-        
-        # Check de documentación
-        try:
-            results["documentation"] = check_documentation(str(self.repo_path))
-        except Exception as e:
-            results["documentation"] = {"error": str(e), "passed": False, "score": 0}
-        
-        # Check de estructura del proyecto usando common checks
-        try:
-            results["project_structure"] = self._check_week01_structure()
-        except Exception as e:
-            results["project_structure"] = {"error": str(e), "passed": False, "score": 0}
-        
-        # Checks adicionales con common checks
-        try:
-            results["fastapi_app"] = self._check_fastapi_app_setup()
-        except Exception as e:
-            results["fastapi_app"] = {"error": str(e), "passed": False, "score": 0}
+        # Los errores de cada check se reportan como check fallido (ver BaseEvaluator.run_checks)
+        return self.run_checks({
+            # Check de endpoints específicos usando el nuevo framework
+            "endpoints": lambda: self.run_check(check_endpoints),
             
-        try:
-            results["code_quality"] = self._check_code_quality()
-        except Exception as e:
-            results["code_quality"] = {"error": str(e), "passed": False, "score": 0}
-        
-        return results
+            # Check de documentación
+            "documentation": lambda: self.run_check(check_documentation),
+            
+            # Check de estructura del proyecto usando common checks
+            "project_structure": self._check_week01_structure,
+            
+            # Checks adicionales con common checks
+            "fastapi_app": self._check_fastapi_app_setup,
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week01_structure(self) -> Dict[str, Any]:
         """
@@ -155,7 +137,7 @@ class Week01Evaluator(BaseEvaluator):
         
         # Análisis estático del código (sin importar)
         try:
-            main_content = (self.repo_path / "main.py").read_text(encoding='utf-8')
+            main_content = self.repo_index.read_text("main.py")
             
             has_fastapi_import = "from fastapi import" in main_content or "import fastapi" in main_content
             has_app_instance = "app = FastAPI" in main_content or "app=FastAPI" in main_content
@@ -363,50 +345,6 @@ class Week01Evaluator(BaseEvaluator):
                 endpoints.get("root_working", False)
             ])
         }
-    
-    def _get_check_result(self, check_name: str) -> bool:
-        """
-        Mapea los nombres de checks del criteria.yaml a los resultados reales
-        """
-        if not self.results:
-            return False
-        
-        # Mapeo de checks del criteria.yaml a resultados del evaluador
-        check_mappings = {
-            # Setup category
-            "requirements_txt": lambda: self.results.get("project_structure", {}).get("required_files", {}).get("requirements.txt", False),
-            "fastapi_dependency": lambda: self.results.get("project_structure", {}).get("required_packages", {}).get("fastapi", False),
-            "uvicorn_dependency": lambda: self.results.get("project_structure", {}).get("required_packages", {}).get("uvicorn", False),
-            "main_py_exists": lambda: self.results.get("project_structure", {}).get("required_files", {}).get("main.py", False),
-            "readme_exists": lambda: self.results.get("project_structure", {}).get("required_files", {}).get("README.md", False),
-            
-            # Functionality category
-            "app_import": lambda: self.results.get("fastapi_app", {}).get("has_fastapi_import", False) and self.results.get("fastapi_app", {}).get("has_app_instance", False),
-            "root_endpoint": lambda: self.results.get("endpoints", {}).get("root_working", False),
-            "docs_accessible": lambda: self.results.get("endpoints", {}).get("docs_accessible", False),
-            "parametric_endpoint": lambda: self.results.get("endpoints", {}).get("parametric_endpoint", False),
-            
-            # Documentation category
-            "json_responses": lambda: self.results.get("endpoints", {}).get("root_working", False),  # Si funciona el endpoint, devuelve JSON
-            "readme_reflection": lambda: self.results.get("documentation", {}).get("has_reflection", False),
-            "setup_commands": lambda: self.results.get("documentation", {}).get("has_setup_commands", False),
-            
-            # Deliverables category  
-            "project_structure": lambda: self.results.get("project_structure", {}).get("all_files_present", False),
-            "code_quality": lambda: self.results.get("code_quality", {}).get("overall_quality") in ["excellent", "good"],
-            
-            # Understanding category
-            "demonstrates_understanding": lambda: self.results.get("documentation", {}).get("week1_specific", {}).get("appears_complete", False),
-        }
-        
-        if check_name in check_mappings:
-            try:
-                return bool(check_mappings[check_name]())
-            except (KeyError, TypeError, AttributeError):
-                return False
-        
-        # Fallback al método del padre
-        return super()._get_check_result(check_name)
 
 def create_evaluator(student_repo_path: str) -> Week01Evaluator:
     """Factory function para crear el evaluador de Week 1"""
@@ -2,14 +2,17 @@
 Verificaciones de operaciones CRUD específicas para Week 2 - Versión autocontenida (análisis estático)
 """
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
+
 # Métodos HTTP que nos interesan
 HTTP_METHODS = {"get", "post", "put", "patch", "delete"}
 
 
-def _collect_code(repo_root: Path) -> Dict[str, str]:
+def _collect_code(repo_root: Path, repo_index: RepoIndex) -> Dict[str, str]:
     """Recolecta contenido de archivos potencialmente relevantes."""
     targets: List[Path] = []
     for name in ["main.py", "models.py", "schemas.py"]:
@@ -17,24 +20,28 @@ def _collect_code(repo_root: Path) -> Dict[str, str]:
         if p.exists():
             targets.append(p)
     for sub in ["routers", "routes"]:
-        d = repo_root / sub
-        if d.exists():
-            targets.extend(sorted(d.glob("*.py")))
+        targets.extend(repo_index.python_files(sub, recursive=False))
     contents = {}
     for p in targets:
         try:
-            contents[str(p.relative_to(repo_root))] = p.read_text(encoding="utf-8", errors="ignore")
+            contents[str(p.relative_to(repo_root))] = repo_index.read_text(p)
         except Exception:
             pass
     return contents
 
 
-def _parse_endpoints(all_code: str) -> List[Dict[str, Any]]:
-    """Extrae endpoints usando AST buscando decoradores @app.<method>("/path")."""
-    endpoints: List[Dict[str, Any]] = []
+def _parse_combined(all_code: str, repo_index: RepoIndex) -> Optional[ast.AST]:
+    """Parsea el código combinado una sola vez (compartido con checks.endpoints)."""
     try:
-        tree = ast.parse(all_code)
+        return repo_index.parse_source(all_code, "<week02-combined>")
     except SyntaxError:
+        return None
+
+
+def _parse_endpoints(tree: Optional[ast.AST]) -> List[Dict[str, Any]]:
+    """Extrae endpoints usando AST buscando decoradores @app.<method>("/path")."""
+    endpoints: List[Dict[str, Any]] = []
+    if tree is None:
         return endpoints
     for node in ast.walk(tree):
         if isinstance(node, ast.FunctionDef):
@@ -76,11 +83,9 @@ def _has_request_body_indicator(fn_src: str) -> bool:
     return any(token in fn_src for token in [":", "BaseModel", "dict", "Request"])
 
 
-def _split_functions_source(all_code: str) -> Dict[str, str]:
+def _split_functions_source(all_code: str, tree: Optional[ast.AST]) -> Dict[str, str]:
     mapping: Dict[str, str] = {}
-    try:
-        tree = ast.parse(all_code)
-    except SyntaxError:
+    if tree is None:
         return mapping
     for node in ast.walk(tree):
         if isinstance(node, ast.FunctionDef):
@@ -136,16 +141,20 @@ def _calculate_crud_score(presence: Dict[str, bool], indicators: Dict[str, bool]
     return endpoint_score + impl_score
 
 
-def check_crud_operations(repo_path: str) -> Dict[str, Any]:
+@depends_on("main.py", "models.py", "schemas.py", "routers/*.py", "routes/*.py")
+def check_crud_operations(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """Verifica operaciones CRUD mediante análisis estático (sin ejecutar código del estudiante)."""
     repo_root = Path(repo_path)
     if not repo_root.exists():
         return {"error": "Ruta no encontrada", "crud_score": 0}
 
-    contents = _collect_code(repo_root)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
+    contents = _collect_code(repo_root, repo_index)
     all_code = "\n".join(contents.values())
-    endpoints = _parse_endpoints(all_code)
-    functions_src = _split_functions_source(all_code)
+    tree = _parse_combined(all_code, repo_index)
+    endpoints = _parse_endpoints(tree)
+    functions_src = _split_functions_source(all_code, tree)
 
     presence = _classify_crud(endpoints)
 
@@ -2,35 +2,37 @@
 Verificaciones de endpoints específicas para Week 2 - Versión autocontenida (análisis estático)
 """
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
+
 HTTP_METHODS = {"get", "post", "put", "patch", "delete"}
 
 
-def _collect_source(repo_root: Path) -> Dict[str, str]:
+def _collect_source(repo_root: Path, repo_index: RepoIndex) -> Dict[str, str]:
     files: List[Path] = []
     for base in ["main.py", "models.py", "schemas.py"]:
         p = repo_root / base
         if p.exists():
             files.append(p)
     for sub in ["routers", "routes"]:
-        d = repo_root / sub
-        if d.exists():
-            files.extend(sorted(d.glob("*.py")))
+        files.extend(repo_index.python_files(sub, recursive=False))
     out = {}
     for f in files:
         try:
-            out[str(f.relative_to(repo_root))] = f.read_text(encoding="utf-8", errors="ignore")
+            out[str(f.relative_to(repo_root))] = repo_index.read_text(f)
         except Exception:
             pass
     return out
 
 
-def _parse_functions(all_code: str) -> List[Dict[str, Any]]:
+def _parse_functions(all_code: str, repo_index: RepoIndex) -> List[Dict[str, Any]]:
     endpoints: List[Dict[str, Any]] = []
     try:
-        tree = ast.parse(all_code)
+        # Misma etiqueta que checks.crud_operations: el árbol se comparte
+        tree = repo_index.parse_source(all_code, "<week02-combined>")
     except SyntaxError:
         return endpoints
     for node in ast.walk(tree):
@@ -104,17 +106,20 @@ def _endpoint_score(crud_flags: Dict[str, bool], docs: Dict[str, bool], validati
     return crud_score + val_score + docs_score
 
 
-def check_endpoints(repo_path: str) -> Dict[str, Any]:
+@depends_on("main.py", "models.py", "schemas.py", "routers/*.py", "routes/*.py")
+def check_endpoints(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     repo_root = Path(repo_path)
     if not repo_root.exists():
         return {"error": "Ruta no encontrada", "endpoint_score": 0, "app_importable": False}
 
-    sources = _collect_source(repo_root)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
+    sources = _collect_source(repo_root, repo_index)
     all_code = "\n".join(sources.values())
     if not all_code:
         return {"error": "No se encontraron archivos fuente", "endpoint_score": 0, "app_importable": False}
 
-    endpoints = _parse_functions(all_code)
+    endpoints = _parse_functions(all_code, repo_index)
     crud_flags = _classify_crud(endpoints)
     validation = _detect_validation(all_code)
     docs = _docs_indicators(all_code)
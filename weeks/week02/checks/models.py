@@ -6,18 +6,25 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_models(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("main.py", "models.py", "schemas.py")
+def check_models(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la implementación de modelos Pydantic para Week 2
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de modelos
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     
     # Archivos donde pueden estar los modelos
     model_files = ["main.py", "models.py", "schemas.py"]
@@ -35,17 +42,19 @@ def check_models(repo_path: str) -> Dict[str, Any]:
     
     all_code = ""
     models_in_files = {}
+    trees = []
     
     # Analizar cada archivo
     for file_name in model_files:
         file_path = repo_root / file_name
         if file_path.exists():
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
-                    all_code += code + "\n"
+                code = repo_index.read_text(file_path)
+                tree = repo_index.parse_result(file_path)["tree"]
+                all_code += code + "\n"
+                trees.append(tree)
                     
-                file_analysis = _analyze_file_for_models(code, file_name)
+                file_analysis = _analyze_file_for_models(code, file_name, tree)
                 models_in_files[file_name] = file_analysis
                 
             except Exception as e:
@@ -53,7 +62,7 @@ def check_models(repo_path: str) -> Dict[str, Any]:
     
     # Análisis global
     if all_code:
-        results.update(_analyze_pydantic_usage(all_code))
+        results.update(_analyze_pydantic_usage(all_code, trees))
         results["models_in_files"] = models_in_files
         results["models_score"] = _calculate_models_score(results)
         results["recommendations"] = _generate_model_recommendations(results)
@@ -61,9 +70,10 @@ def check_models(repo_path: str) -> Dict[str, Any]:
     return results
 
 
-def _analyze_file_for_models(code: str, file_name: str) -> Dict[str, Any]:
+def _analyze_file_for_models(code: str, file_name: str, tree: Optional[ast.AST]) -> Dict[str, Any]:
     """
-    Analiza un archivo específico en busca de modelos Pydantic
+    Analiza un archivo específico en busca de modelos Pydantic.
+    ``tree`` es el AST ya parseado del archivo (None si tiene errores de sintaxis).
     """
     analysis = {
         "has_pydantic_import": False,
@@ -85,12 +95,11 @@ def _analyze_file_for_models(code: str, file_name: str) -> Dict[str, Any]:
         
         analysis["has_basemodel"] = "BaseModel" in code
         
-        # Intentar parsear el AST para análisis más profundo
-        try:
-            tree = ast.parse(code)
+        # Usar el AST para análisis más profundo
+        if tree is not None:
             models = _extract_models_from_ast(tree)
             analysis["models"] = models
-        except SyntaxError:
+        else:
             analysis["syntax_valid"] = False
             # Fallback: búsqueda por patrones de texto
             analysis["models"] = _extract_models_by_pattern(code)
@@ -203,9 +212,10 @@ def _get_type_annotation(annotation) -> str:
         return "Unknown"
 
 
-def _analyze_pydantic_usage(code: str) -> Dict[str, Any]:
+def _analyze_pydantic_usage(code: str, trees: List[Optional[ast.AST]]) -> Dict[str, Any]:
     """
-    Analiza el uso general de Pydantic en todo el código
+    Analiza el uso general de Pydantic en todo el código.
+    ``trees`` contiene el AST de cada archivo (None si tiene errores de sintaxis).
     """
     analysis = {
         "pydantic_imported": False,
@@ -241,9 +251,8 @@ def _analyze_pydantic_usage(code: str) -> Dict[str, Any]:
     analysis["validation_used"] = any(pattern in code for pattern in validation_patterns)
     
     # Extraer todos los modelos encontrados
-    try:
-        tree = ast.parse(code)
-        all_models = _extract_models_from_ast(tree)
+    if trees and all(tree is not None for tree in trees):
+        all_models = [model for tree in trees for model in _extract_models_from_ast(tree)]
         analysis["models_found"] = [model["name"] for model in all_models]
         
         # Consolidar campos y tipos
@@ -251,7 +260,7 @@ def _analyze_pydantic_usage(code: str) -> Dict[str, Any]:
             analysis["model_fields"][model["name"]] = model["fields"]
             analysis["field_types"].update(model["field_types"])
             
-    except SyntaxError:
+    else:
         # Fallback para código con errores de sintaxis
         fallback_models = _extract_models_by_pattern(code)
         analysis["models_found"] = [model["name"] for model in fallback_models]
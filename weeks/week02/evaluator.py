@@ -3,27 +3,42 @@ Evaluador específico para Semana 2 - CRUD Básico con FastAPI (versión segura
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator
+from core import BaseEvaluator, RepoIndex
+from core.check_resolver import all_of
+from core.week_registry import lazy_check
 
-# Import checks using absolute imports
-current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
-
-from checks.crud_operations import check_crud_operations
-from checks.models import check_models
-from checks.endpoints import check_endpoints
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_crud_operations = lazy_check(2, "crud_operations")
+check_models = lazy_check(2, "models")
+check_endpoints = lazy_check(2, "endpoints")
 
 
 class Week02Evaluator(BaseEvaluator):
     """Evaluador para Semana 2 empleando únicamente análisis estático."""
 
-    def __init__(self, student_repo_path: str):
-        super().__init__(week_number=2, student_repo_path=student_repo_path)
+    CHECK_MAPPINGS = {
+        "requirements_complete": all_of(*[("requirements", pkg) for pkg in ["fastapi", "uvicorn", "pydantic"]]),
+        "project_structure": ("structure", "files", "main_py"),
+        "main_py_organized": ("structure", "files", "main_py"),
+        "create_endpoint": ("crud_operations", "create_operation"),
+        "read_all_endpoint": ("crud_operations", "read_all_operation"),
+        "read_one_endpoint": ("crud_operations", "read_operation"),
+        "update_endpoint": ("crud_operations", "update_operation"),
+        "delete_endpoint": ("crud_operations", "delete_operation"),
+        "pydantic_models": ("models", "basemodel_used"),
+        "request_validation": ("endpoints", "validation_in_endpoints", "has_request_validation"),
+        "response_models": ("endpoints", "validation_in_endpoints", "has_response_validation"),
+        "http_exceptions": ("endpoints", "validation_in_endpoints", "has_error_handling"),
+        "status_codes": ("endpoints", "validation_in_endpoints", "has_error_handling"),
+    }
+
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
+        super().__init__(week_number=2, student_repo_path=student_repo_path, repo_index=repo_index)
 
     def _run_common_checks(self) -> Dict[str, Any]:  # type: ignore[override]
         repo = self.repo_path
@@ -39,7 +54,7 @@ class Week02Evaluator(BaseEvaluator):
         reqs_present: Dict[str, bool] = {}
         if (repo / "requirements.txt").exists():
             try:
-                txt = (repo / "requirements.txt").read_text(encoding="utf-8", errors="ignore").lower()
+                txt = self.repo_index.read_text("requirements.txt").lower()
                 for pkg in ["fastapi", "uvicorn", "pydantic"]:
                     reqs_present[pkg] = pkg in txt
             except Exception:
@@ -47,7 +62,7 @@ class Week02Evaluator(BaseEvaluator):
         results["structure"] = structure
         results["requirements"] = reqs_present
         if (repo / "README.md").exists():
-            readme = (repo / "README.md").read_text(encoding="utf-8", errors="ignore")
+            readme = self.repo_index.read_text("README.md")
             results["readme"] = {
                 "length": len(readme.split()),
                 "has_install": any(k in readme.lower() for k in ["install", "requirements", "pip"]),
@@ -56,10 +71,12 @@ class Week02Evaluator(BaseEvaluator):
         return results
 
     def run_specific_checks(self) -> Dict[str, Any]:  # type: ignore[override]
-        results: Dict[str, Any] = {}
-        results["models"] = check_models(str(self.repo_path))
-        results["crud_operations"] = check_crud_operations(str(self.repo_path))
-        results["endpoints"] = check_endpoints(str(self.repo_path))
+        results: Dict[str, Any] = self.run_checks({
+            "models": lambda: self.run_check(check_models),
+            "crud_operations": lambda: self.run_check(check_crud_operations),
+            "endpoints": lambda: self.run_check(check_endpoints)
+        })
+        # Estos dependen de los resultados anteriores
         results["data_validation"] = self._check_data_validation(results)
         results["error_handling"] = self._check_error_handling(results)
         return results
@@ -182,30 +199,6 @@ class Week02Evaluator(BaseEvaluator):
         
         return combined_feedback
 
-    def _get_check_result(self, check_name: str) -> bool:  # type: ignore[override]
-        r = self.results
-        mapping = {
-            "requirements_complete": lambda: all(r.get("requirements", {}).get(pkg, False) for pkg in ["fastapi", "uvicorn", "pydantic"]),
-            "project_structure": lambda: r.get("structure", {}).get("files", {}).get("main_py", False),
-            "main_py_organized": lambda: r.get("structure", {}).get("files", {}).get("main_py", False),
-            "create_endpoint": lambda: r.get("crud_operations", {}).get("create_operation", False),
-            "read_all_endpoint": lambda: r.get("crud_operations", {}).get("read_all_operation", False),
-            "read_one_endpoint": lambda: r.get("crud_operations", {}).get("read_operation", False),
-            "update_endpoint": lambda: r.get("crud_operations", {}).get("update_operation", False),
-            "delete_endpoint": lambda: r.get("crud_operations", {}).get("delete_operation", False),
-            "pydantic_models": lambda: r.get("models", {}).get("basemodel_used", False),
-            "request_validation": lambda: r.get("endpoints", {}).get("validation_in_endpoints", {}).get("has_request_validation", False),
-            "response_models": lambda: r.get("endpoints", {}).get("validation_in_endpoints", {}).get("has_response_validation", False),
-            "http_exceptions": lambda: r.get("endpoints", {}).get("validation_in_endpoints", {}).get("has_error_handling", False),
-            "status_codes": lambda: r.get("endpoints", {}).get("validation_in_endpoints", {}).get("has_error_handling", False),
-        }
-        if check_name in mapping:
-            try:
-                return bool(mapping[check_name]())
-            except Exception:
-                return False
-        return super()._get_check_result(check_name)
-
     def get_week02_summary(self) -> Dict[str, Any]:
         if not self.results:
             return {"error": "No evaluation results"}
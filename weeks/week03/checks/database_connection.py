@@ -4,20 +4,56 @@ Verificaciones de database connection específicas para Week 3
 import ast
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.pattern_scanner import PatternScanner
+from core.repo_index import RepoIndex
 
-def check_database_connection(repo_path: str) -> Dict[str, Any]:
+
+# Patrones para detectar configuración de base de datos, agrupados por detalle
+DATABASE_CONNECTION_SCANNER = PatternScanner({
+    "connection_setup": [
+        r"create_engine\s*\(",
+        r"engine\s*=",
+        r"DATABASE_URL",
+        r"SQLALCHEMY_DATABASE_URL",
+        r"sqlite://",
+        r"postgresql://",
+        r"mysql://"
+    ],
+    "session_management": [
+        r"sessionmaker\s*\(",
+        r"Session\s*\(",
+        r"get_db\s*\(",
+        r"SessionLocal",
+        r"@contextmanager"
+    ],
+    "engine_configuration": [
+        r"create_engine\s*\(",
+        r"pool_size\s*=",
+        r"max_overflow\s*=",
+        r"pool_pre_ping\s*="
+    ],
+    "database_url": r"(sqlite://|postgresql://|mysql://)"
+}, re.IGNORECASE)
+
+
+@depends_on("**/*.py")
+def check_database_connection(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica database connection para Week 3
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de database connection
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     results = {
         "passed": False,
         "score": 0,
@@ -31,66 +67,19 @@ def check_database_connection(repo_path: str) -> Dict[str, Any]:
     }
     
     # Buscar archivos Python relevantes
-    python_files = list(repo_root.glob("**/*.py"))
-    
-    # Patrones para detectar configuración de base de datos
-    connection_patterns = [
-        r"create_engine\s*\(",
-        r"engine\s*=",
-        r"DATABASE_URL",
-        r"SQLALCHEMY_DATABASE_URL",
-        r"sqlite://",
-        r"postgresql://",
-        r"mysql://"
-    ]
-    
-    session_patterns = [
-        r"sessionmaker\s*\(",
-        r"Session\s*\(",
-        r"get_db\s*\(",
-        r"SessionLocal",
-        r"@contextmanager"
-    ]
-    
-    engine_patterns = [
-        r"create_engine\s*\(",
-        r"pool_size\s*=",
-        r"max_overflow\s*=",
-        r"pool_pre_ping\s*="
-    ]
+    python_files = repo_index.python_files()
     
     try:
-        for py_file in python_files:
-            if py_file.name.startswith('.') or '__pycache__' in str(py_file):
-                continue
-                
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                
-                # Verificar configuración de conexión
-                for pattern in connection_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["details"]["connection_setup"] = True
-                        break
-                
-                # Verificar manejo de sesiones
-                for pattern in session_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["details"]["session_management"] = True
-                        break
-                
-                # Verificar configuración de engine
-                for pattern in engine_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["details"]["engine_configuration"] = True
-                        break
-                
-                # Verificar URL de base de datos
-                if re.search(r"(sqlite://|postgresql://|mysql://)", content, re.IGNORECASE):
-                    results["details"]["database_url"] = True
-                
-            except Exception as e:
-                continue
+        relevant_files = [
+            py_file for py_file in python_files
+            if not py_file.name.startswith('.') and '__pycache__' not in str(py_file)
+        ]
+        
+        # Un solo recorrido por archivo para todos los grupos de patrones
+        hits = DATABASE_CONNECTION_SCANNER.scan_files(relevant_files, repo_index)
+        for detail in results["details"]:
+            if hits[detail]["count"]:
+                results["details"][detail] = True
     
     except Exception as e:
         results["feedback"].append(f"Error al analizar archivos: {str(e)}")
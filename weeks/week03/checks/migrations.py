@@ -3,20 +3,27 @@ Verificaciones de migrations específicas para Week 3
 """
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_migrations(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py", "alembic.ini", "alembic/**")
+def check_migrations(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica migrations para Week 3
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de migrations
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     results = {
         "passed": False,
         "score": 0,
@@ -31,7 +38,7 @@ def check_migrations(repo_path: str) -> Dict[str, Any]:
     }
     
     # Buscar archivos Python relevantes
-    python_files = list(repo_root.glob("**/*.py"))
+    python_files = repo_index.python_files()
     
     # Verificar si existe alembic
     alembic_dir = repo_root / "alembic"
@@ -41,7 +48,7 @@ def check_migrations(repo_path: str) -> Dict[str, Any]:
         results["details"]["alembic_present"] = True
     
     # Buscar archivos de migración
-    migration_files = list(repo_root.glob("**/versions/*.py")) or list(repo_root.glob("**/migrations/*.py"))
+    migration_files = repo_index.glob("**/versions/*.py") or repo_index.glob("**/migrations/*.py")
     if migration_files:
         results["details"]["migration_files"] = True
     
@@ -70,7 +77,7 @@ def check_migrations(repo_path: str) -> Dict[str, Any]:
                 continue
                 
             try:
-                content = py_file.read_text(encoding='utf-8')
+                content = repo_index.read_text(py_file)
                 
                 # Verificar creación de tablas
                 for pattern in create_table_patterns:
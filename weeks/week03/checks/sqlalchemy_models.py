@@ -4,20 +4,27 @@ Verificaciones de sqlalchemy models específicas para Week 3
 import ast
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_sqlalchemy_models(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_sqlalchemy_models(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica sqlalchemy models para Week 3
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de sqlalchemy models
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     results = {
         "passed": False,
         "score": 0,
@@ -34,7 +41,7 @@ def check_sqlalchemy_models(repo_path: str) -> Dict[str, Any]:
     }
     
     # Buscar archivos Python relevantes
-    python_files = list(repo_root.glob("**/*.py"))
+    python_files = repo_index.python_files()
     
     # Patrones para detectar modelos SQLAlchemy
     base_patterns = [
@@ -68,7 +75,7 @@ def check_sqlalchemy_models(repo_path: str) -> Dict[str, Any]:
                 continue
                 
             try:
-                content = py_file.read_text(encoding='utf-8')
+                content = repo_index.read_text(py_file)
                 
                 # Verificar Base declarativo
                 for pattern in base_patterns:
@@ -94,7 +101,7 @@ def check_sqlalchemy_models(repo_path: str) -> Dict[str, Any]:
                 
                 # Buscar clases que heredan de Base
                 try:
-                    tree = ast.parse(content)
+                    tree = repo_index.parse(py_file)
                     for node in ast.walk(tree):
                         if isinstance(node, ast.ClassDef):
                             # Verificar si hereda de Base o tiene __tablename__
@@ -3,30 +3,21 @@ Evaluador específico para Semana 3 - Base de Datos con SQLAlchemy (versión seg
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from core.base_evaluator import BaseEvaluator
 from core.common_checks import CommonChecks
+from core.repo_index import RepoIndex
+from core.week_registry import lazy_check
 
-# Import checks using absolute imports
-current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
-
-try:
-    from checks.database_connection import check_database_connection
-    from checks.sqlalchemy_models import check_sqlalchemy_models
-    from checks.crud_operations import check_crud_operations
-    from checks.migrations import check_migrations
-except ImportError as e:
-    print(f"Warning: Could not import some Week 3 checks: {e}")
-    # Fallback functions
-    def check_database_connection(repo_path): return {"error": "Module not available"}
-    def check_sqlalchemy_models(repo_path): return {"error": "Module not available"}
-    def check_crud_operations(repo_path): return {"error": "Module not available"}
-    def check_migrations(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_database_connection = lazy_check(3, "database_connection")
+check_sqlalchemy_models = lazy_check(3, "sqlalchemy_models")
+check_crud_operations = lazy_check(3, "crud_operations")
+check_migrations = lazy_check(3, "migrations")
 
 
 class Week03Evaluator(BaseEvaluator):
@@ -40,17 +31,18 @@ class Week03Evaluator(BaseEvaluator):
     - Session Management: Manejo de sesiones de BD
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=3,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
         
     def _run_common_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones comunes usando CommonChecks
         """
-        common_checks = CommonChecks(str(self.repo_path))
+        common_checks = CommonChecks(str(self.repo_path), self.repo_index)
         
         # Verificaciones básicas de estructura
         required_files = ["main.py", "requirements.txt", "README.md"]
@@ -82,29 +74,27 @@ class Week03Evaluator(BaseEvaluator):
         """
         Ejecuta verificaciones específicas de la Semana 3
         """
-        repo_path_str = str(self.repo_path)
-        
-        return {
-            "sqlalchemy_dependencies": self._check_sqlalchemy_dependencies(),
-            "database_connection": self._execute_check_safely(check_database_connection, repo_path_str),
-            "models_definition": self._execute_check_safely(check_sqlalchemy_models, repo_path_str),
-            "create_with_db": self._execute_check_safely(check_crud_operations, repo_path_str),
-            "read_with_db": self._execute_check_safely(check_crud_operations, repo_path_str),
-            "update_with_db": self._execute_check_safely(check_crud_operations, repo_path_str),
-            "delete_with_db": self._execute_check_safely(check_crud_operations, repo_path_str),
-            "relationships": self._execute_check_safely(check_sqlalchemy_models, repo_path_str),
-            "constraints": self._execute_check_safely(check_sqlalchemy_models, repo_path_str),
-            "migrations": self._execute_check_safely(check_migrations, repo_path_str),
-            "session_handling": self._execute_check_safely(check_database_connection, repo_path_str),
-            "connection_pooling": self._execute_check_safely(check_database_connection, repo_path_str)
-        }
+        return self.run_checks({
+            "sqlalchemy_dependencies": self._check_sqlalchemy_dependencies,
+            "database_connection": lambda: self._execute_check_safely(check_database_connection),
+            "models_definition": lambda: self._execute_check_safely(check_sqlalchemy_models),
+            "create_with_db": lambda: self._execute_check_safely(check_crud_operations),
+            "read_with_db": lambda: self._execute_check_safely(check_crud_operations),
+            "update_with_db": lambda: self._execute_check_safely(check_crud_operations),
+            "delete_with_db": lambda: self._execute_check_safely(check_crud_operations),
+            "relationships": lambda: self._execute_check_safely(check_sqlalchemy_models),
+            "constraints": lambda: self._execute_check_safely(check_sqlalchemy_models),
+            "migrations": lambda: self._execute_check_safely(check_migrations),
+            "session_handling": lambda: self._execute_check_safely(check_database_connection),
+            "connection_pooling": lambda: self._execute_check_safely(check_database_connection)
+        })
     
-    def _execute_check_safely(self, check_function, repo_path: str) -> Dict[str, Any]:
+    def _execute_check_safely(self, check_function) -> Dict[str, Any]:
         """
         Ejecuta una función de check de forma segura
         """
         try:
-            result = check_function(repo_path)
+            result = self.run_check(check_function)
             return {
                 "passed": result.get("passed", False),
                 "score": result.get("score", 0),
@@ -123,7 +113,7 @@ class Week03Evaluator(BaseEvaluator):
         """
         Verifica dependencias de SQLAlchemy
         """
-        common_checks = CommonChecks(str(self.repo_path))
+        common_checks = CommonChecks(str(self.repo_path), self.repo_index)
         
         # Verificar SQLAlchemy y driver de BD
         sqlalchemy_packages = ['sqlalchemy']
@@ -165,12 +155,12 @@ class Week03Evaluator(BaseEvaluator):
         Verifica si el proyecto usa SQLite basándose en el código
         """
         try:
-            for py_file in self.repo_path.glob("**/*.py"):
+            for py_file in self.repo_index.python_files():
                 if py_file.name.startswith('.') or '__pycache__' in str(py_file):
                     continue
                 
                 try:
-                    content = py_file.read_text(encoding='utf-8')
+                    content = self.repo_index.read_text(py_file)
                     if 'sqlite://' in content.lower():
                         return True
                 except Exception:
@@ -3,10 +3,70 @@ Check para verificar queries avanzadas con SQLAlchemy
 """
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.pattern_scanner import PatternScanner
+from core.repo_index import RepoIndex
 
-def check_advanced_queries(repo_path: str) -> Dict[str, Any]:
+
+# Patrones para detectar queries avanzadas, agrupados por indicador
+ADVANCED_QUERY_SCANNER = PatternScanner({
+    "query_indicators": [
+        r'session\.query',
+        r'db\.query',
+        r'select\s*\(',
+        r'\.all\s*\(',
+        r'\.first\s*\(',
+        r'\.one\s*\('
+    ],
+    "has_joins": [
+        r'\.join\s*\(',
+        r'\.outerjoin\s*\(',
+        r'\.left_join\s*\(',
+        r'joinedload',
+        r'selectinload'
+    ],
+    "has_filters": [
+        r'\.filter\s*\(',
+        r'\.filter_by\s*\(',
+        r'\.where\s*\(',
+        r'and_\s*\(',
+        r'or_\s*\('
+    ],
+    "has_aggregations": [
+        r'func\.count',
+        r'func\.sum',
+        r'func\.avg',
+        r'func\.max',
+        r'func\.min',
+        r'group_by',
+        r'having'
+    ],
+    "has_subqueries": [
+        r'\.subquery\s*\(',
+        r'exists\s*\(',
+        r'any_\s*\(',
+        r'\.scalar_subquery'
+    ],
+    "has_pagination": [
+        r'\.limit\s*\(',
+        r'\.offset\s*\(',
+        r'paginate',
+        r'skip.*take',
+        r'limit.*offset'
+    ],
+    "has_ordering": [
+        r'\.order_by\s*\(',
+        r'desc\s*\(',
+        r'asc\s*\(',
+        r'\.sort'
+    ]
+}, re.IGNORECASE)
+
+
+@depends_on("**/*.py")
+def check_advanced_queries(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica el uso de queries avanzadas con SQLAlchemy
     """
@@ -25,118 +85,21 @@ def check_advanced_queries(repo_path: str) -> Dict[str, Any]:
     
     try:
         repo_path = Path(repo_path)
+        if repo_index is None:
+            repo_index = RepoIndex(repo_path)
         
         # Buscar archivos Python
-        python_files = []
-        for py_file in repo_path.rglob("*.py"):
-            if "venv" not in str(py_file) and "__pycache__" not in str(py_file):
-                python_files.append(py_file)
-        
-        # Patrones para detectar queries avanzadas
-        join_patterns = [
-            r'\.join\s*\(',
-            r'\.outerjoin\s*\(',
-            r'\.left_join\s*\(',
-            r'joinedload',
-            r'selectinload'
-        ]
-        
-        filter_patterns = [
-            r'\.filter\s*\(',
-            r'\.filter_by\s*\(',
-            r'\.where\s*\(',
-            r'and_\s*\(',
-            r'or_\s*\('
-        ]
-        
-        aggregation_patterns = [
-            r'func\.count',
-            r'func\.sum',
-            r'func\.avg',
-            r'func\.max',
-            r'func\.min',
-            r'group_by',
-            r'having'
-        ]
-        
-        subquery_patterns = [
-            r'\.subquery\s*\(',
-            r'exists\s*\(',
-            r'any_\s*\(',
-            r'\.scalar_subquery'
-        ]
-        
-        pagination_patterns = [
-            r'\.limit\s*\(',
-            r'\.offset\s*\(',
-            r'paginate',
-            r'skip.*take',
-            r'limit.*offset'
-        ]
+        python_files = repo_index.python_files()
         
-        ordering_patterns = [
-            r'\.order_by\s*\(',
-            r'desc\s*\(',
-            r'asc\s*\(',
-            r'\.sort'
-        ]
+        def report_unreadable(py_file: Path, error: Exception):
+            results["errors"].append(f"❌ Error leyendo {py_file.name}: {str(error)}")
         
-        for py_file in python_files:
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                
-                # Contar queries básicas
-                query_indicators = [
-                    r'session\.query',
-                    r'db\.query',
-                    r'select\s*\(',
-                    r'\.all\s*\(',
-                    r'\.first\s*\(',
-                    r'\.one\s*\('
-                ]
-                
-                for pattern in query_indicators:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    results["query_count"] += len(matches)
-                
-                # Verificar joins
-                for pattern in join_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["has_joins"] = True
-                        break
-                
-                # Verificar filtros
-                for pattern in filter_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["has_filters"] = True
-                        break
-                
-                # Verificar agregaciones
-                for pattern in aggregation_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["has_aggregations"] = True
-                        break
-                
-                # Verificar subqueries
-                for pattern in subquery_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["has_subqueries"] = True
-                        break
-                
-                # Verificar paginación
-                for pattern in pagination_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["has_pagination"] = True
-                        break
-                
-                # Verificar ordenamiento
-                for pattern in ordering_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        results["has_ordering"] = True
-                        break
-                
-            except Exception as e:
-                results["errors"].append(f"❌ Error leyendo {py_file.name}: {str(e)}")
+        # Una sola lectura por archivo para todos los grupos de patrones
+        hits = ADVANCED_QUERY_SCANNER.scan_files(python_files, repo_index, on_error=report_unreadable)
+        results["query_count"] = hits["query_indicators"]["count"]
+        for key in ("has_joins", "has_filters", "has_aggregations",
+                    "has_subqueries", "has_pagination", "has_ordering"):
+            results[key] = hits[key]["count"] > 0
         
         # Calcular score basado en hallazgos
         if results["query_count"] > 0:
@@ -4,10 +4,14 @@ Check para verificar configuración y uso de Alembic para migraciones
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_alembic_migrations(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("alembic.ini", "alembic/**", "requirements.txt")
+def check_alembic_migrations(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica que Alembic esté configurado correctamente para migraciones
     """
@@ -25,6 +29,8 @@ def check_alembic_migrations(repo_path: str) -> Dict[str, Any]:
     
     try:
         repo_path = Path(repo_path)
+        if repo_index is None:
+            repo_index = RepoIndex(repo_path)
         
         # Verificar alembic.ini
         alembic_ini = repo_path / "alembic.ini"
@@ -59,7 +65,7 @@ def check_alembic_migrations(repo_path: str) -> Dict[str, Any]:
                 results["score"] += 2
                 
                 # Verificar archivos de migración
-                migration_files = list(versions_folder.glob("*.py"))
+                migration_files = repo_index.python_files("alembic/versions", recursive=False)
                 if migration_files:
                     results["has_migration_files"] = True
                     results["details"].append(f"✅ {len(migration_files)} archivo(s) de migración encontrado(s)")
@@ -75,7 +81,7 @@ def check_alembic_migrations(repo_path: str) -> Dict[str, Any]:
         requirements_file = repo_path / "requirements.txt"
         if requirements_file.exists():
             try:
-                content = requirements_file.read_text()
+                content = repo_index.read_text(requirements_file)
                 if re.search(r'alembic', content, re.IGNORECASE):
                     results["alembic_in_requirements"] = True
                     results["details"].append("✅ Alembic encontrado en requirements.txt")
@@ -3,10 +3,14 @@ Check para verificar organización profesional del código
 """
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_code_organization(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py", "models/**", "schemas/**", "routers/**", "services/**", "api/**")
+def check_code_organization(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la organización profesional del código en carpetas separadas
     """
@@ -25,6 +29,8 @@ def check_code_organization(repo_path: str) -> Dict[str, Any]:
     
     try:
         repo_path = Path(repo_path)
+        if repo_index is None:
+            repo_index = RepoIndex(repo_path)
         
         # Verificar carpeta models/
         models_dir = repo_path / "models"
@@ -34,7 +40,7 @@ def check_code_organization(repo_path: str) -> Dict[str, Any]:
             results["score"] += 2
             
             # Verificar archivos en models/
-            model_files = list(models_dir.glob("*.py"))
+            model_files = repo_index.python_files("models", recursive=False)
             if len(model_files) > 0:
                 results["models_separated"] = True
                 results["details"].append(f"✅ {len(model_files)} archivo(s) de modelos organizados")
@@ -52,7 +58,7 @@ def check_code_organization(repo_path: str) -> Dict[str, Any]:
             results["score"] += 2
             
             # Verificar archivos en schemas/
-            schema_files = list(schemas_dir.glob("*.py"))
+            schema_files = repo_index.python_files("schemas", recursive=False)
             if len(schema_files) > 0:
                 results["schemas_separated"] = True
                 results["details"].append(f"✅ {len(schema_files)} archivo(s) de schemas organizados")
@@ -83,7 +89,7 @@ def check_code_organization(repo_path: str) -> Dict[str, Any]:
         main_file = repo_path / "main.py"
         if main_file.exists():
             try:
-                content = main_file.read_text(encoding='utf-8')
+                content = repo_index.read_text(main_file)
                 
                 # Verificar que no esté todo en main.py (heurística)
                 lines = content.split('\n')
@@ -3,10 +3,14 @@ Check para verificar relaciones complejas entre modelos SQLAlchemy
 """
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_complex_relationships(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_complex_relationships(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica relaciones complejas entre modelos SQLAlchemy
     """
@@ -26,6 +30,8 @@ def check_complex_relationships(repo_path: str) -> Dict[str, Any]:
     
     try:
         repo_path = Path(repo_path)
+        if repo_index is None:
+            repo_index = RepoIndex(repo_path)
         
         # Buscar archivos Python que podrían contener modelos
         python_files = []
@@ -36,7 +42,7 @@ def check_complex_relationships(repo_path: str) -> Dict[str, Any]:
             results["models_organized"] = True
             results["details"].append("✅ Modelos organizados en carpeta models/")
             results["score"] += 2
-            python_files.extend(models_dir.glob("*.py"))
+            python_files.extend(repo_index.python_files("models", recursive=False))
         
         # También buscar en archivos principales
         for pattern in ["main.py", "models.py", "database.py", "app.py"]:
@@ -45,9 +51,7 @@ def check_complex_relationships(repo_path: str) -> Dict[str, Any]:
                 python_files.append(file_path)
         
         # Buscar recursivamente archivos .py
-        for py_file in repo_path.rglob("*.py"):
-            if "venv" not in str(py_file) and "__pycache__" not in str(py_file):
-                python_files.append(py_file)
+        python_files.extend(repo_index.python_files())
         
         # Remover duplicados
         python_files = list(set(python_files))
@@ -80,7 +84,7 @@ def check_complex_relationships(repo_path: str) -> Dict[str, Any]:
         
         for py_file in python_files:
             try:
-                content = py_file.read_text(encoding='utf-8')
+                content = repo_index.read_text(py_file)
                 
                 # Verificar relationships
                 for pattern in relationship_patterns:
@@ -3,10 +3,14 @@ Check para verificar constraints, índices y validaciones de base de datos
 """
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_database_constraints(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_database_constraints(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica constraints, índices y validaciones en la base de datos
     """
@@ -25,12 +29,11 @@ def check_database_constraints(repo_path: str) -> Dict[str, Any]:
     
     try:
         repo_path = Path(repo_path)
+        if repo_index is None:
+            repo_index = RepoIndex(repo_path)
         
         # Buscar archivos Python
-        python_files = []
-        for py_file in repo_path.rglob("*.py"):
-            if "venv" not in str(py_file) and "__pycache__" not in str(py_file):
-                python_files.append(py_file)
+        python_files = repo_index.python_files()
         
         # Patrones para detectar constraints
         constraint_patterns = [
@@ -73,7 +76,7 @@ def check_database_constraints(repo_path: str) -> Dict[str, Any]:
         
         for py_file in python_files:
             try:
-                content = py_file.read_text(encoding='utf-8')
+                content = repo_index.read_text(py_file)
                 
                 # Verificar constraints generales
                 for pattern in constraint_patterns:
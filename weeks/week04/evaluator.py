@@ -4,32 +4,22 @@ SQLAlchemy avanzado: migraciones, relaciones, consultas complejas
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from core.base_evaluator import BaseEvaluator
 from core.common_checks import CommonChecks
+from core.repo_index import RepoIndex
+from core.week_registry import lazy_check
 
-# Import checks using absolute imports
-current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
-
-try:
-    from checks.alembic_migrations import check_alembic_migrations
-    from checks.complex_relationships import check_complex_relationships
-    from checks.advanced_queries import check_advanced_queries
-    from checks.code_organization import check_code_organization
-    from checks.database_constraints import check_database_constraints
-except ImportError as e:
-    print(f"Warning: Could not import some Week 4 checks: {e}")
-    # Fallback functions
-    def check_alembic_migrations(repo_path): return {"error": "Module not available"}
-    def check_complex_relationships(repo_path): return {"error": "Module not available"}
-    def check_advanced_queries(repo_path): return {"error": "Module not available"}
-    def check_code_organization(repo_path): return {"error": "Module not available"}
-    def check_database_constraints(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_alembic_migrations = lazy_check(4, "alembic_migrations")
+check_complex_relationships = lazy_check(4, "complex_relationships")
+check_advanced_queries = lazy_check(4, "advanced_queries")
+check_code_organization = lazy_check(4, "code_organization")
+check_database_constraints = lazy_check(4, "database_constraints")
 
 
 class Week04Evaluator(BaseEvaluator):
@@ -43,33 +33,32 @@ class Week04Evaluator(BaseEvaluator):
     - Database Constraints: Validaciones y restricciones de base de datos
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=4,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 4 - Bases de Datos Avanzadas
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week04_structure()
-        
-        # Checks específicos de Week 4 - Bases de Datos Avanzadas
-        results["alembic_migrations"] = check_alembic_migrations(str(self.repo_path))
-        results["complex_relationships"] = check_complex_relationships(str(self.repo_path))
-        results["advanced_queries"] = check_advanced_queries(str(self.repo_path))
-        results["code_organization"] = check_code_organization(str(self.repo_path))
-        results["database_constraints"] = check_database_constraints(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week04_structure,
+        
+            # Checks específicos de Week 4 - Bases de Datos Avanzadas
+            "alembic_migrations": lambda: self.run_check(check_alembic_migrations),
+            "complex_relationships": lambda: self.run_check(check_complex_relationships),
+            "advanced_queries": lambda: self.run_check(check_advanced_queries),
+            "code_organization": lambda: self.run_check(check_code_organization),
+            "database_constraints": lambda: self.run_check(check_database_constraints),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week04_structure(self) -> Dict[str, Any]:
         """
@@ -108,13 +97,8 @@ class Week04Evaluator(BaseEvaluator):
         
         python_files = ["main.py"]
         # Buscar archivos Python en models/ y schemas/
-        models_path = self.repo_path / "models"
-        schemas_path = self.repo_path / "schemas"
-        
-        if models_path.exists():
-            python_files.extend([f"models/{f.name}" for f in models_path.glob("*.py")])
-        if schemas_path.exists():
-            python_files.extend([f"schemas/{f.name}" for f in schemas_path.glob("*.py")])
+        for folder in ("models", "schemas"):
+            python_files.extend([f"{folder}/{f.name}" for f in self.repo_index.python_files(folder, recursive=False)])
         
         syntax_checks = {}
         for py_file in python_files:
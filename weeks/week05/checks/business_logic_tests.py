@@ -3,22 +3,29 @@ Verificaciones de tests de lógica de negocio para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 import re
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_business_logic_tests(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_business_logic_tests(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica los tests de lógica de negocio
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de tests de lógica de negocio
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     tests_dir = repo_root / 'tests'
     
     if not tests_dir.exists():
@@ -45,8 +52,7 @@ def check_business_logic_tests(repo_path: str) -> Dict[str, Any]:
     ]
     
     for pattern in business_test_patterns:
-        business_test_files.extend(list(tests_dir.glob(pattern)))
-        business_test_files.extend(list(tests_dir.rglob(pattern)))
+        business_test_files.extend(repo_index.glob(f"tests/**/{pattern}"))
     
     # Remover duplicados
     business_test_files = list(set(business_test_files))
@@ -65,7 +71,7 @@ def check_business_logic_tests(repo_path: str) -> Dict[str, Any]:
     business_modules = []
     business_keywords = ['service', 'business', 'logic', 'crud', 'repository', 'manager']
     
-    for py_file in repo_root.rglob('*.py'):
+    for py_file in repo_index.python_files():
         if any(term in py_file.name.lower() for term in business_keywords):
             if 'test' not in py_file.name.lower() and py_file.name != 'main.py':
                 business_modules.append(py_file)
@@ -73,77 +79,75 @@ def check_business_logic_tests(repo_path: str) -> Dict[str, Any]:
     # Analizar contenido de archivos de test
     for test_file in business_test_files:
         try:
-            with open(test_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            content = repo_index.read_text(test_file)
+            tree = repo_index.parse(test_file)
                 
-                # Contar funciones de test
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                        total_business_test_functions += 1
+            # Contar funciones de test
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                    total_business_test_functions += 1
+                    
+                    # Categorizar tests por contenido
+                    func_content = ast.get_source_segment(content, node) or ""
+                    func_content_lower = func_content.lower()
+                    
+                    # Tests de operaciones CRUD
+                    if any(term in func_content_lower for term in ['create', 'read', 'update', 'delete', 'crud', 'get_by']):
+                        test_analysis["crud_operations_tests"] += 1
+                    
+                    # Tests de reglas de negocio
+                    if any(term in func_content_lower for term in ['rule', 'policy', 'constraint', 'business', 'logic']):
+                        test_analysis["business_rules_tests"] += 1
+                        
+                    # Tests de capa de servicio
+                    if any(term in func_content_lower for term in ['service', 'manager', 'handler']):
+                        test_analysis["service_layer_tests"] += 1
                         
-                        # Categorizar tests por contenido
-                        func_content = ast.get_source_segment(content, node) or ""
-                        func_content_lower = func_content.lower()
+                    # Tests de workflows
+                    if any(term in func_content_lower for term in ['workflow', 'process', 'pipeline', 'flow']):
+                        test_analysis["workflow_tests"] += 1
                         
-                        # Tests de operaciones CRUD
-                        if any(term in func_content_lower for term in ['create', 'read', 'update', 'delete', 'crud', 'get_by']):
-                            test_analysis["crud_operations_tests"] += 1
+                    # Tests de lógica compleja
+                    if any(term in func_content_lower for term in ['complex', 'algorithm', 'calculation', 'compute']):
+                        test_analysis["complex_logic_tests"] += 1
                         
-                        # Tests de reglas de negocio
-                        if any(term in func_content_lower for term in ['rule', 'policy', 'constraint', 'business', 'logic']):
-                            test_analysis["business_rules_tests"] += 1
-                            
-                        # Tests de capa de servicio
-                        if any(term in func_content_lower for term in ['service', 'manager', 'handler']):
-                            test_analysis["service_layer_tests"] += 1
-                            
-                        # Tests de workflows
-                        if any(term in func_content_lower for term in ['workflow', 'process', 'pipeline', 'flow']):
-                            test_analysis["workflow_tests"] += 1
-                            
-                        # Tests de lógica compleja
-                        if any(term in func_content_lower for term in ['complex', 'algorithm', 'calculation', 'compute']):
-                            test_analysis["complex_logic_tests"] += 1
-                            
         except Exception as e:
             continue
     
     # También buscar en archivos de test generales por funciones de negocio
-    general_test_files = list(tests_dir.glob('test*.py'))
+    general_test_files = repo_index.glob('tests/test*.py')
     for test_file in general_test_files:
         if test_file not in business_test_files:
             try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(test_file)
                     
-                    # Buscar funciones que indiquen tests de lógica de negocio
-                    business_patterns = [
-                        r'def test.*create.*',
-                        r'def test.*update.*',
-                        r'def test.*delete.*',
-                        r'def test.*service.*',
-                        r'def test.*business.*',
-                        r'def test.*logic.*',
-                        r'def test.*process.*'
-                    ]
+                # Buscar funciones que indiquen tests de lógica de negocio
+                business_patterns = [
+                    r'def test.*create.*',
+                    r'def test.*update.*',
+                    r'def test.*delete.*',
+                    r'def test.*service.*',
+                    r'def test.*business.*',
+                    r'def test.*logic.*',
+                    r'def test.*process.*'
+                ]
                     
-                    for pattern in business_patterns:
-                        if re.search(pattern, content.lower()):
-                            tree = ast.parse(content)
-                            for node in ast.walk(tree):
-                                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                                    func_name_lower = node.name.lower()
-                                    if any(term in func_name_lower for term in ['create', 'update', 'delete', 'service', 'business']):
-                                        total_business_test_functions += 1
-                                        
-                                        if any(term in func_name_lower for term in ['create', 'update', 'delete']):
-                                            test_analysis["crud_operations_tests"] += 1
-                                        elif 'service' in func_name_lower:
-                                            test_analysis["service_layer_tests"] += 1
-                                        elif 'business' in func_name_lower:
-                                            test_analysis["business_rules_tests"] += 1
-                            break
+                for pattern in business_patterns:
+                    if re.search(pattern, content.lower()):
+                        tree = repo_index.parse(test_file)
+                        for node in ast.walk(tree):
+                            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                                func_name_lower = node.name.lower()
+                                if any(term in func_name_lower for term in ['create', 'update', 'delete', 'service', 'business']):
+                                    total_business_test_functions += 1
+                                    
+                                    if any(term in func_name_lower for term in ['create', 'update', 'delete']):
+                                        test_analysis["crud_operations_tests"] += 1
+                                    elif 'service' in func_name_lower:
+                                        test_analysis["service_layer_tests"] += 1
+                                    elif 'business' in func_name_lower:
+                                        test_analysis["business_rules_tests"] += 1
+                        break
             except Exception as e:
                 continue
     
@@ -3,22 +3,29 @@ Verificaciones de tests de endpoints para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 import re
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_endpoint_tests(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_endpoint_tests(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica los tests de todos los endpoints principales
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de tests de endpoints
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     tests_dir = repo_root / 'tests'
     
     if not tests_dir.exists():
@@ -43,8 +50,7 @@ def check_endpoint_tests(repo_path: str) -> Dict[str, Any]:
     ]
     
     for pattern in endpoint_test_patterns:
-        endpoint_test_files.extend(list(tests_dir.glob(pattern)))
-        endpoint_test_files.extend(list(tests_dir.rglob(pattern)))
+        endpoint_test_files.extend(repo_index.glob(f"tests/**/{pattern}"))
     
     # Remover duplicados
     endpoint_test_files = list(set(endpoint_test_files))
@@ -65,77 +71,75 @@ def check_endpoint_tests(repo_path: str) -> Dict[str, Any]:
     # Analizar contenido de archivos de test
     for test_file in endpoint_test_files:
         try:
-            with open(test_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            content = repo_index.read_text(test_file)
+            tree = repo_index.parse(test_file)
                 
-                # Verificar uso de TestClient
-                if 'testclient' in content.lower() or 'client' in content.lower():
-                    test_analysis["client_usage"] += 1
+            # Verificar uso de TestClient
+            if 'testclient' in content.lower() or 'client' in content.lower():
+                test_analysis["client_usage"] += 1
                 
-                # Contar funciones de test
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                        total_endpoint_test_functions += 1
+            # Contar funciones de test
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                    total_endpoint_test_functions += 1
+                    
+                    # Categorizar tests por contenido
+                    func_content = ast.get_source_segment(content, node) or ""
+                    func_content_lower = func_content.lower()
+                    
+                    # Tests de métodos HTTP
+                    if 'client.get' in func_content_lower or '.get(' in func_content_lower:
+                        test_analysis["get_endpoint_tests"] += 1
+                        http_methods_tested.add('GET')
+                    
+                    if 'client.post' in func_content_lower or '.post(' in func_content_lower:
+                        test_analysis["post_endpoint_tests"] += 1
+                        http_methods_tested.add('POST')
                         
-                        # Categorizar tests por contenido
-                        func_content = ast.get_source_segment(content, node) or ""
-                        func_content_lower = func_content.lower()
+                    if 'client.put' in func_content_lower or '.put(' in func_content_lower:
+                        test_analysis["put_endpoint_tests"] += 1
+                        http_methods_tested.add('PUT')
                         
-                        # Tests de métodos HTTP
-                        if 'client.get' in func_content_lower or '.get(' in func_content_lower:
-                            test_analysis["get_endpoint_tests"] += 1
-                            http_methods_tested.add('GET')
+                    if 'client.delete' in func_content_lower or '.delete(' in func_content_lower:
+                        test_analysis["delete_endpoint_tests"] += 1
+                        http_methods_tested.add('DELETE')
+                    
+                    # Tests de códigos de estado
+                    if any(term in func_content_lower for term in ['status_code', '.status', '200', '201', '404', '422']):
+                        test_analysis["status_code_tests"] += 1
                         
-                        if 'client.post' in func_content_lower or '.post(' in func_content_lower:
-                            test_analysis["post_endpoint_tests"] += 1
-                            http_methods_tested.add('POST')
-                            
-                        if 'client.put' in func_content_lower or '.put(' in func_content_lower:
-                            test_analysis["put_endpoint_tests"] += 1
-                            http_methods_tested.add('PUT')
-                            
-                        if 'client.delete' in func_content_lower or '.delete(' in func_content_lower:
-                            test_analysis["delete_endpoint_tests"] += 1
-                            http_methods_tested.add('DELETE')
+                    # Tests de datos de respuesta
+                    if any(term in func_content_lower for term in ['.json()', 'response.data', 'assert', 'json']):
+                        test_analysis["response_data_tests"] += 1
                         
-                        # Tests de códigos de estado
-                        if any(term in func_content_lower for term in ['status_code', '.status', '200', '201', '404', '422']):
-                            test_analysis["status_code_tests"] += 1
-                            
-                        # Tests de datos de respuesta
-                        if any(term in func_content_lower for term in ['.json()', 'response.data', 'assert', 'json']):
-                            test_analysis["response_data_tests"] += 1
-                            
         except Exception as e:
             continue
     
     # También buscar en archivos de test generales
-    general_test_files = list(tests_dir.glob('test*.py'))
+    general_test_files = repo_index.glob('tests/test*.py')
     for test_file in general_test_files:
         if test_file not in endpoint_test_files:
             try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(test_file)
                     
-                    # Buscar indicios de tests de API
-                    if any(term in content.lower() for term in ['client.get', 'client.post', 'testclient', '/api/']):
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                                func_content = ast.get_source_segment(content, node) or ""
-                                func_content_lower = func_content.lower()
+                # Buscar indicios de tests de API
+                if any(term in content.lower() for term in ['client.get', 'client.post', 'testclient', '/api/']):
+                    tree = repo_index.parse(test_file)
+                    for node in ast.walk(tree):
+                        if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                            func_content = ast.get_source_segment(content, node) or ""
+                            func_content_lower = func_content.lower()
+                            
+                            if any(term in func_content_lower for term in ['client.', 'response', 'status']):
+                                total_endpoint_test_functions += 1
                                 
-                                if any(term in func_content_lower for term in ['client.', 'response', 'status']):
-                                    total_endpoint_test_functions += 1
-                                    
-                                    # Detectar métodos HTTP
-                                    if 'get' in func_content_lower:
-                                        test_analysis["get_endpoint_tests"] += 1
-                                        http_methods_tested.add('GET')
-                                    if 'post' in func_content_lower:
-                                        test_analysis["post_endpoint_tests"] += 1
-                                        http_methods_tested.add('POST')
+                                # Detectar métodos HTTP
+                                if 'get' in func_content_lower:
+                                    test_analysis["get_endpoint_tests"] += 1
+                                    http_methods_tested.add('GET')
+                                if 'post' in func_content_lower:
+                                    test_analysis["post_endpoint_tests"] += 1
+                                    http_methods_tested.add('POST')
             except Exception as e:
                 continue
     
@@ -148,25 +152,23 @@ def check_endpoint_tests(repo_path: str) -> Dict[str, Any]:
     for main_file in main_files:
         if main_file.exists():
             try:
-                with open(main_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(main_file)
                     
-                    # Buscar decoradores de FastAPI
-                    http_decorators = re.findall(r'@app\.(get|post|put|delete|patch)', content.lower())
-                    endpoints_defined.update(method.upper() for method in http_decorators)
+                # Buscar decoradores de FastAPI
+                http_decorators = re.findall(r'@app\.(get|post|put|delete|patch)', content.lower())
+                endpoints_defined.update(method.upper() for method in http_decorators)
                     
             except Exception as e:
                 continue
     
     # Buscar en archivos de routers
     if routers_dir.exists():
-        for router_file in routers_dir.glob('*.py'):
+        for router_file in repo_index.python_files('routers', recursive=False):
             try:
-                with open(router_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(router_file)
                     
-                    http_decorators = re.findall(r'@router\.(get|post|put|delete|patch)', content.lower())
-                    endpoints_defined.update(method.upper() for method in http_decorators)
+                http_decorators = re.findall(r'@router\.(get|post|put|delete|patch)', content.lower())
+                endpoints_defined.update(method.upper() for method in http_decorators)
                     
             except Exception as e:
                 continue
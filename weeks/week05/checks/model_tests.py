@@ -3,22 +3,29 @@ Verificaciones de tests de modelos para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 import re
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_model_tests(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_model_tests(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica los tests de modelos Pydantic y SQLAlchemy
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de tests de modelos
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     tests_dir = repo_root / 'tests'
     
     if not tests_dir.exists():
@@ -43,8 +50,7 @@ def check_model_tests(repo_path: str) -> Dict[str, Any]:
     ]
     
     for pattern in model_test_patterns:
-        model_test_files.extend(list(tests_dir.glob(pattern)))
-        model_test_files.extend(list(tests_dir.rglob(pattern)))
+        model_test_files.extend(repo_index.glob(f"tests/**/{pattern}"))
     
     # Remover duplicados
     model_test_files = list(set(model_test_files))
@@ -62,62 +68,60 @@ def check_model_tests(repo_path: str) -> Dict[str, Any]:
     # Analizar contenido de archivos de test
     for test_file in model_test_files:
         try:
-            with open(test_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            content = repo_index.read_text(test_file)
+            tree = repo_index.parse(test_file)
                 
-                # Contar funciones de test
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                        total_model_test_functions += 1
+            # Contar funciones de test
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                    total_model_test_functions += 1
+                    
+                    # Categorizar tests por contenido
+                    func_content = ast.get_source_segment(content, node) or ""
+                    func_content_lower = func_content.lower()
+                    
+                    # Tests de Pydantic
+                    if any(term in func_content_lower for term in ['pydantic', 'basemodel', 'validation', 'validator']):
+                        test_analysis["pydantic_tests"] += 1
+                    
+                    # Tests de SQLAlchemy  
+                    if any(term in func_content_lower for term in ['sqlalchemy', 'session', 'query', 'model', 'table']):
+                        test_analysis["sqlalchemy_tests"] += 1
+                        
+                    # Tests de validación
+                    if any(term in func_content_lower for term in ['valid', 'invalid', 'error', 'exception']):
+                        test_analysis["validation_tests"] += 1
                         
-                        # Categorizar tests por contenido
-                        func_content = ast.get_source_segment(content, node) or ""
-                        func_content_lower = func_content.lower()
+                    # Tests de serialización
+                    if any(term in func_content_lower for term in ['json', 'dict', 'serialize', 'parse']):
+                        test_analysis["serialization_tests"] += 1
                         
-                        # Tests de Pydantic
-                        if any(term in func_content_lower for term in ['pydantic', 'basemodel', 'validation', 'validator']):
-                            test_analysis["pydantic_tests"] += 1
+                    # Tests de relaciones
+                    if any(term in func_content_lower for term in ['relationship', 'foreign', 'join']):
+                        test_analysis["relationship_tests"] += 1
                         
-                        # Tests de SQLAlchemy  
-                        if any(term in func_content_lower for term in ['sqlalchemy', 'session', 'query', 'model', 'table']):
-                            test_analysis["sqlalchemy_tests"] += 1
-                            
-                        # Tests de validación
-                        if any(term in func_content_lower for term in ['valid', 'invalid', 'error', 'exception']):
-                            test_analysis["validation_tests"] += 1
-                            
-                        # Tests de serialización
-                        if any(term in func_content_lower for term in ['json', 'dict', 'serialize', 'parse']):
-                            test_analysis["serialization_tests"] += 1
-                            
-                        # Tests de relaciones
-                        if any(term in func_content_lower for term in ['relationship', 'foreign', 'join']):
-                            test_analysis["relationship_tests"] += 1
-                            
         except Exception as e:
             continue
     
     # También buscar en archivos de test generales
-    general_test_files = list(tests_dir.glob('test*.py'))
+    general_test_files = repo_index.glob('tests/test*.py')
     for test_file in general_test_files:
         if test_file not in model_test_files:
             try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(test_file)
                     
-                    # Buscar funciones de test de modelos en archivos generales
-                    if re.search(r'def test.*model', content.lower()) or re.search(r'def test.*schema', content.lower()):
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                                func_content = ast.get_source_segment(content, node) or ""
-                                if any(term in func_content.lower() for term in ['model', 'schema', 'pydantic', 'sqlalchemy']):
-                                    total_model_test_functions += 1
-                                    if 'pydantic' in func_content.lower():
-                                        test_analysis["pydantic_tests"] += 1
-                                    if 'sqlalchemy' in func_content.lower():
-                                        test_analysis["sqlalchemy_tests"] += 1
+                # Buscar funciones de test de modelos en archivos generales
+                if re.search(r'def test.*model', content.lower()) or re.search(r'def test.*schema', content.lower()):
+                    tree = repo_index.parse(test_file)
+                    for node in ast.walk(tree):
+                        if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                            func_content = ast.get_source_segment(content, node) or ""
+                            if any(term in func_content.lower() for term in ['model', 'schema', 'pydantic', 'sqlalchemy']):
+                                total_model_test_functions += 1
+                                if 'pydantic' in func_content.lower():
+                                    test_analysis["pydantic_tests"] += 1
+                                if 'sqlalchemy' in func_content.lower():
+                                    test_analysis["sqlalchemy_tests"] += 1
             except Exception as e:
                 continue
     
@@ -3,22 +3,29 @@ Verificaciones de configuración de pytest para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import configparser
 import toml
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_pytest_configuration(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini", "conftest.py", "tests/**")
+def check_pytest_configuration(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la configuración correcta de pytest
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de configuración pytest
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     issues = []
     config_found = False
     config_details = {}
@@ -37,13 +44,12 @@ def check_pytest_configuration(repo_path: str) -> Dict[str, Any]:
             config_found = True
             try:
                 if config_file == 'pyproject.toml':
-                    with open(config_path) as f:
-                        config = toml.load(f)
-                        if 'tool' in config and 'pytest' in config['tool']:
-                            config_details['pyproject.toml'] = config['tool']['pytest']
+                    config = toml.loads(repo_index.read_text(config_path))
+                    if 'tool' in config and 'pytest' in config['tool']:
+                        config_details['pyproject.toml'] = config['tool']['pytest']
                 else:
                     config = configparser.ConfigParser()
-                    config.read(config_path)
+                    config.read_string(repo_index.read_text(config_path), source=str(config_path))
                     if 'tool:pytest' in config:
                         config_details[config_file] = dict(config['tool:pytest'])
                     elif 'pytest' in config:
@@ -59,7 +65,7 @@ def check_pytest_configuration(repo_path: str) -> Dict[str, Any]:
         issues.append("No se encontró el directorio 'tests/'")
     else:
         # Verificar estructura básica de tests
-        test_files = list(tests_dir.glob('test_*.py')) + list(tests_dir.glob('*_test.py'))
+        test_files = repo_index.glob('tests/test_*.py') + repo_index.glob('tests/*_test.py')
         if not test_files:
             issues.append("No se encontraron archivos de test en el directorio 'tests/'")
     
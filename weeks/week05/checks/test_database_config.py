@@ -3,22 +3,29 @@ Verificaciones de configuración de base de datos de testing para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 import re
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_test_database_config(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("config.py", "database.py", "settings.py", "conftest.py", "requirements.txt", "tests/**")
+def check_test_database_config(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la configuración de base de datos separada para testing
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de configuración de BD de testing
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     issues = []
     config_found = False
     test_db_evidence = []
@@ -48,50 +55,49 @@ def check_test_database_config(repo_path: str) -> Dict[str, Any]:
         config_path = repo_root / config_file
         if config_path.exists():
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(config_path)
+                    
+                # Buscar patrones de configuración de testing DB
+                for pattern in db_config_patterns:
+                    matches = re.findall(pattern, content, re.IGNORECASE)
+                    if matches:
+                        test_db_evidence.append({
+                            'file': config_file,
+                            'pattern': pattern,
+                            'matches': matches
+                        })
+                        config_found = True
                     
-                    # Buscar patrones de configuración de testing DB
-                    for pattern in db_config_patterns:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            test_db_evidence.append({
-                                'file': config_file,
-                                'pattern': pattern,
-                                'matches': matches
-                            })
-                            config_found = True
+                # Análisis AST para configuraciones más complejas
+                try:
+                    tree = repo_index.parse(config_path)
+                    for node in ast.walk(tree):
+                        if isinstance(node, ast.FunctionDef):
+                            # Buscar funciones relacionadas con setup/teardown de DB
+                            if any(keyword in node.name.lower() for keyword in 
+                                  ['setup', 'teardown', 'fixture', 'test_db', 'test_session']):
+                                test_db_evidence.append({
+                                    'file': config_file,
+                                    'type': 'function',
+                                    'name': node.name
+                                })
+                                config_found = True
+                                
+                        elif isinstance(node, ast.Assign):
+                            # Buscar asignaciones de variables de testing
+                            for target in node.targets:
+                                if isinstance(target, ast.Name):
+                                    if any(keyword in target.id.lower() for keyword in 
+                                          ['test_db', 'test_database', 'testing_db']):
+                                        test_db_evidence.append({
+                                            'file': config_file,
+                                            'type': 'variable',
+                                            'name': target.id
+                                        })
+                                        config_found = True
+                except:
+                    pass
                     
-                    # Análisis AST para configuraciones más complejas
-                    try:
-                        tree = ast.parse(content)
-                        for node in ast.walk(tree):
-                            if isinstance(node, ast.FunctionDef):
-                                # Buscar funciones relacionadas con setup/teardown de DB
-                                if any(keyword in node.name.lower() for keyword in 
-                                      ['setup', 'teardown', 'fixture', 'test_db', 'test_session']):
-                                    test_db_evidence.append({
-                                        'file': config_file,
-                                        'type': 'function',
-                                        'name': node.name
-                                    })
-                                    config_found = True
-                                    
-                            elif isinstance(node, ast.Assign):
-                                # Buscar asignaciones de variables de testing
-                                for target in node.targets:
-                                    if isinstance(target, ast.Name):
-                                        if any(keyword in target.id.lower() for keyword in 
-                                              ['test_db', 'test_database', 'testing_db']):
-                                            test_db_evidence.append({
-                                                'file': config_file,
-                                                'type': 'variable',
-                                                'name': target.id
-                                            })
-                                            config_found = True
-                    except:
-                        pass
-                        
             except Exception as e:
                 issues.append(f"Error analizando {config_file}: {e}")
     
@@ -100,34 +106,32 @@ def check_test_database_config(repo_path: str) -> Dict[str, Any]:
     sqlite_in_requirements = False
     if requirements_file.exists():
         try:
-            with open(requirements_file, 'r') as f:
-                content = f.read().lower()
-                if 'sqlite' in content or 'aiosqlite' in content:
-                    sqlite_in_requirements = True
-                    test_db_evidence.append({
-                        'file': 'requirements.txt',
-                        'type': 'dependency',
-                        'evidence': 'SQLite dependency found'
-                    })
+            content = repo_index.read_text(requirements_file).lower()
+            if 'sqlite' in content or 'aiosqlite' in content:
+                sqlite_in_requirements = True
+                test_db_evidence.append({
+                    'file': 'requirements.txt',
+                    'type': 'dependency',
+                    'evidence': 'SQLite dependency found'
+                })
         except:
             pass
     
     # Buscar en tests específicamente
     tests_dir = repo_root / 'tests'
     if tests_dir.exists():
-        test_files = list(tests_dir.glob('**/*.py'))
+        test_files = repo_index.python_files('tests')
         for test_file in test_files:
             try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if any(pattern in content.lower() for pattern in 
-                          ['test_client', 'testclient', 'override_get_db', 'test_session']):
-                        test_db_evidence.append({
-                            'file': str(test_file.relative_to(repo_root)),
-                            'type': 'test_setup',
-                            'evidence': 'Test client or DB override found'
-                        })
-                        config_found = True
+                content = repo_index.read_text(test_file)
+                if any(pattern in content.lower() for pattern in 
+                      ['test_client', 'testclient', 'override_get_db', 'test_session']):
+                    test_db_evidence.append({
+                        'file': str(test_file.relative_to(repo_root)),
+                        'type': 'test_setup',
+                        'evidence': 'Test client or DB override found'
+                    })
+                    config_found = True
             except:
                 continue
     
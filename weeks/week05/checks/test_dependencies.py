@@ -3,20 +3,27 @@ Verificaciones de dependencias de testing para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_test_dependencies(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("requirements.txt")
+def check_test_dependencies(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica las dependencias necesarias para testing
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de dependencias de testing
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     requirements_file = repo_root / 'requirements.txt'
     
     if not requirements_file.exists():
@@ -42,19 +49,18 @@ def check_test_dependencies(repo_path: str) -> Dict[str, Any]:
     }
     
     try:
-        with open(requirements_file, 'r') as f:
-            content = f.read().lower()
+        content = repo_index.read_text(requirements_file).lower()
             
-            # Verificar dependencias requeridas
-            for dep in required_deps:
-                if dep in content:
-                    required_deps[dep] = True
+        # Verificar dependencias requeridas
+        for dep in required_deps:
+            if dep in content:
+                required_deps[dep] = True
             
-            # Verificar dependencias opcionales
-            for dep in optional_deps:
-                if dep in content:
-                    optional_deps[dep] = True
-                    
+        # Verificar dependencias opcionales
+        for dep in optional_deps:
+            if dep in content:
+                optional_deps[dep] = True
+                
     except Exception as e:
         return {
             "dependencies_found": {},
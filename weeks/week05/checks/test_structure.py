@@ -3,21 +3,28 @@ Verificaciones de estructura de tests para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_test_structure(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("tests/**")
+def check_test_structure(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica la estructura organizada de tests
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de estructura de tests
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     tests_dir = repo_root / 'tests'
     
     if not tests_dir.exists():
@@ -32,10 +39,8 @@ def check_test_structure(repo_path: str) -> Dict[str, Any]:
     
     # Buscar archivos de test
     test_files = []
-    test_files.extend(list(tests_dir.glob('test_*.py')))
-    test_files.extend(list(tests_dir.glob('*_test.py')))
-    test_files.extend(list(tests_dir.rglob('test_*.py')))
-    test_files.extend(list(tests_dir.rglob('*_test.py')))
+    test_files.extend(repo_index.glob('tests/**/test_*.py'))
+    test_files.extend(repo_index.glob('tests/**/*_test.py'))
     
     # Remover duplicados
     test_files = list(set(test_files))
@@ -56,23 +61,22 @@ def check_test_structure(repo_path: str) -> Dict[str, Any]:
     test_function_count = 0
     for test_file in test_files:
         try:
-            with open(test_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            content = repo_index.read_text(test_file)
+            tree = repo_index.parse(test_file)
                 
-                # Contar funciones de test
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                        test_function_count += 1
+            # Contar funciones de test
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                    test_function_count += 1
+                    
+                    # Categorizar tests por nombre
+                    if 'unit' in test_file.name or 'model' in node.name or 'util' in node.name:
+                        structure_analysis["test_categories"].add('unit')
+                    elif 'integration' in test_file.name or 'api' in node.name or 'endpoint' in node.name:
+                        structure_analysis["test_categories"].add('integration')
+                    elif 'db' in node.name or 'database' in node.name:
+                        structure_analysis["test_categories"].add('database')
                         
-                        # Categorizar tests por nombre
-                        if 'unit' in test_file.name or 'model' in node.name or 'util' in node.name:
-                            structure_analysis["test_categories"].add('unit')
-                        elif 'integration' in test_file.name or 'api' in node.name or 'endpoint' in node.name:
-                            structure_analysis["test_categories"].add('integration')
-                        elif 'db' in node.name or 'database' in node.name:
-                            structure_analysis["test_categories"].add('database')
-                            
         except Exception as e:
             continue
     
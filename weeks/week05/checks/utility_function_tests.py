@@ -3,22 +3,29 @@ Verificaciones de tests de funciones utilitarias para Week 5
 """
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import ast
 import re
 
+from core.check_cache import depends_on
+from core.repo_index import RepoIndex
 
-def check_utility_function_tests(repo_path: str) -> Dict[str, Any]:
+
+@depends_on("**/*.py")
+def check_utility_function_tests(repo_path: str, repo_index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """
     Verifica los tests de funciones utilitarias
     
     Args:
         repo_path: Ruta al repositorio del estudiante
+        repo_index: Índice de archivos compartido (opcional)
         
     Returns:
         Dict con resultados de verificación de tests de funciones utilitarias
     """
     repo_root = Path(repo_path)
+    if repo_index is None:
+        repo_index = RepoIndex(repo_root)
     tests_dir = repo_root / 'tests'
     
     if not tests_dir.exists():
@@ -42,8 +49,7 @@ def check_utility_function_tests(repo_path: str) -> Dict[str, Any]:
     ]
     
     for pattern in utility_test_patterns:
-        utility_test_files.extend(list(tests_dir.glob(pattern)))
-        utility_test_files.extend(list(tests_dir.rglob(pattern)))
+        utility_test_files.extend(repo_index.glob(f"tests/**/{pattern}"))
     
     # Remover duplicados
     utility_test_files = list(set(utility_test_files))
@@ -60,7 +66,7 @@ def check_utility_function_tests(repo_path: str) -> Dict[str, Any]:
     
     # Buscar módulos de utilidades en el proyecto
     utility_modules = []
-    for py_file in repo_root.rglob('*.py'):
+    for py_file in repo_index.python_files():
         if any(term in py_file.name.lower() for term in ['util', 'helper', 'tool', 'auth', 'security']):
             if 'test' not in py_file.name.lower():
                 utility_modules.append(py_file)
@@ -68,66 +74,64 @@ def check_utility_function_tests(repo_path: str) -> Dict[str, Any]:
     # Analizar contenido de archivos de test
     for test_file in utility_test_files:
         try:
-            with open(test_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                tree = ast.parse(content)
+            content = repo_index.read_text(test_file)
+            tree = repo_index.parse(test_file)
                 
-                # Contar funciones de test
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                        total_utility_test_functions += 1
+            # Contar funciones de test
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                    total_utility_test_functions += 1
+                    
+                    # Categorizar tests por contenido
+                    func_content = ast.get_source_segment(content, node) or ""
+                    func_content_lower = func_content.lower()
+                    
+                    # Tests de utilidades de autenticación
+                    if any(term in func_content_lower for term in ['auth', 'login', 'token', 'password', 'hash']):
+                        test_analysis["auth_utils_tests"] += 1
+                    
+                    # Tests de utilidades de datos
+                    if any(term in func_content_lower for term in ['data', 'format', 'convert', 'parse', 'transform']):
+                        test_analysis["data_utils_tests"] += 1
+                        
+                    # Tests de validación
+                    if any(term in func_content_lower for term in ['valid', 'check', 'verify', 'sanitize']):
+                        test_analysis["validation_utils_tests"] += 1
                         
-                        # Categorizar tests por contenido
-                        func_content = ast.get_source_segment(content, node) or ""
-                        func_content_lower = func_content.lower()
+                    # Tests de formateo
+                    if any(term in func_content_lower for term in ['format', 'clean', 'normalize']):
+                        test_analysis["formatting_utils_tests"] += 1
                         
-                        # Tests de utilidades de autenticación
-                        if any(term in func_content_lower for term in ['auth', 'login', 'token', 'password', 'hash']):
-                            test_analysis["auth_utils_tests"] += 1
+                    # Tests de seguridad
+                    if any(term in func_content_lower for term in ['security', 'encrypt', 'decrypt', 'safe']):
+                        test_analysis["security_utils_tests"] += 1
                         
-                        # Tests de utilidades de datos
-                        if any(term in func_content_lower for term in ['data', 'format', 'convert', 'parse', 'transform']):
-                            test_analysis["data_utils_tests"] += 1
-                            
-                        # Tests de validación
-                        if any(term in func_content_lower for term in ['valid', 'check', 'verify', 'sanitize']):
-                            test_analysis["validation_utils_tests"] += 1
-                            
-                        # Tests de formateo
-                        if any(term in func_content_lower for term in ['format', 'clean', 'normalize']):
-                            test_analysis["formatting_utils_tests"] += 1
-                            
-                        # Tests de seguridad
-                        if any(term in func_content_lower for term in ['security', 'encrypt', 'decrypt', 'safe']):
-                            test_analysis["security_utils_tests"] += 1
-                            
         except Exception as e:
             continue
     
     # También buscar en archivos de test generales
-    general_test_files = list(tests_dir.glob('test*.py'))
+    general_test_files = repo_index.glob('tests/test*.py')
     for test_file in general_test_files:
         if test_file not in utility_test_files:
             try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_index.read_text(test_file)
                     
-                    # Buscar funciones de test de utilidades
-                    utility_keywords = ['util', 'helper', 'auth', 'hash', 'validate', 'format']
-                    for keyword in utility_keywords:
-                        if re.search(rf'def test.*{keyword}', content.lower()):
-                            tree = ast.parse(content)
-                            for node in ast.walk(tree):
-                                if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
-                                    if keyword in node.name.lower():
-                                        total_utility_test_functions += 1
-                                        if keyword in ['auth', 'hash']:
-                                            test_analysis["auth_utils_tests"] += 1
-                                        elif keyword in ['validate']:
-                                            test_analysis["validation_utils_tests"] += 1
-                                        elif keyword in ['format']:
-                                            test_analysis["formatting_utils_tests"] += 1
-                            break
+                # Buscar funciones de test de utilidades
+                utility_keywords = ['util', 'helper', 'auth', 'hash', 'validate', 'format']
+                for keyword in utility_keywords:
+                    if re.search(rf'def test.*{keyword}', content.lower()):
+                        tree = repo_index.parse(test_file)
+                        for node in ast.walk(tree):
+                            if isinstance(node, ast.FunctionDef) and node.name.startswith('test_'):
+                                if keyword in node.name.lower():
+                                    total_utility_test_functions += 1
+                                    if keyword in ['auth', 'hash']:
+                                        test_analysis["auth_utils_tests"] += 1
+                                    elif keyword in ['validate']:
+                                        test_analysis["validation_utils_tests"] += 1
+                                    elif keyword in ['format']:
+                                        test_analysis["formatting_utils_tests"] += 1
+                        break
             except Exception as e:
                 continue
     
@@ -6,68 +6,48 @@ import sys
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex, PatternScanner
+from core.week_registry import lazy_check
 
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_pytest_configuration = lazy_check(5, "pytest_config", "check_pytest_configuration")
+check_test_dependencies = lazy_check(5, "test_dependencies")
+check_test_structure = lazy_check(5, "test_structure")
+check_test_database_config = lazy_check(5, "test_database_config")
+check_model_tests = lazy_check(5, "model_tests")
+check_utility_function_tests = lazy_check(5, "utility_function_tests")
+check_business_logic_tests = lazy_check(5, "business_logic_tests")
+check_endpoint_tests = lazy_check(5, "endpoint_tests")
 
-# Agregar checks al path
-checks_dir = current_dir / "checks"
-sys.path.insert(0, str(checks_dir))
 
-# Importar checks específicos directamente
-try:
-    from pytest_config import check_pytest_configuration
-except ImportError as e:
-    print(f"Warning: Could not import pytest_config check: {e}")
-    def check_pytest_configuration(repo_path): return {"error": "Module not available"}
+# Patrones de tests de integración con base de datos
+DB_INTEGRATION_TEST_SCANNER = PatternScanner({
+    "db_tests": [
+        r'def test.*db',
+        r'def test.*database',
+        r'def test.*session',
+        r'def test.*commit',
+        r'def test.*transaction'
+    ]
+}, re.IGNORECASE)
 
-try:
-    from test_dependencies import check_test_dependencies
-except ImportError as e:
-    print(f"Warning: Could not import test_dependencies check: {e}")
-    def check_test_dependencies(repo_path): return {"error": "Module not available"}
-
-try:
-    from test_structure import check_test_structure
-except ImportError as e:
-    print(f"Warning: Could not import test_structure check: {e}")
-    def check_test_structure(repo_path): return {"error": "Module not available"}
-
-try:
-    from test_database_config import check_test_database_config
-except ImportError as e:
-    print(f"Warning: Could not import test_database_config check: {e}")
-    def check_test_database_config(repo_path): return {"error": "Module not available"}
-
-try:
-    from model_tests import check_model_tests
-except ImportError as e:
-    print(f"Warning: Could not import model_tests check: {e}")
-    def check_model_tests(repo_path): return {"error": "Module not available"}
-
-try:
-    from utility_function_tests import check_utility_function_tests
-except ImportError as e:
-    print(f"Warning: Could not import utility_function_tests check: {e}")
-    def check_utility_function_tests(repo_path): return {"error": "Module not available"}
-
-try:
-    from business_logic_tests import check_business_logic_tests
-except ImportError as e:
-    print(f"Warning: Could not import business_logic_tests check: {e}")
-    def check_business_logic_tests(repo_path): return {"error": "Module not available"}
-
-try:
-    from endpoint_tests import check_endpoint_tests
-except ImportError as e:
-    print(f"Warning: Could not import endpoint_tests check: {e}")
-    def check_endpoint_tests(repo_path): return {"error": "Module not available"}
+# Patrones de tests de manejo de errores
+ERROR_HANDLING_TEST_SCANNER = PatternScanner({
+    "error_tests": [
+        r'def test.*error',
+        r'def test.*exception',
+        r'def test.*invalid',
+        r'def test.*fail',
+        r'pytest\.raises',
+        r'status_code.*4\d\d',
+        r'status_code.*5\d\d'
+    ]
+}, re.IGNORECASE)
 
 
 class Week05Evaluator(BaseEvaluator):
@@ -81,41 +61,40 @@ class Week05Evaluator(BaseEvaluator):
     - Api Versioning
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=5,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 5
         """
-        results = {}
-        
-        # Testing Setup (35 points total)
-        results["pytest_configuration"] = check_pytest_configuration(str(self.repo_path))
-        results["test_dependencies"] = check_test_dependencies(str(self.repo_path))
-        results["test_structure"] = check_test_structure(str(self.repo_path))
-        results["test_database_config"] = check_test_database_config(str(self.repo_path))
-        
-        # Unit Testing (25 points total)
-        results["model_tests"] = check_model_tests(str(self.repo_path))
-        results["utility_function_tests"] = check_utility_function_tests(str(self.repo_path))
-        results["business_logic_tests"] = check_business_logic_tests(str(self.repo_path))
-        
-        # Integration Testing (25 points total)
-        results["endpoint_tests"] = check_endpoint_tests(str(self.repo_path))
-        results["database_integration_tests"] = self._check_database_integration_tests()
-        results["error_handling_tests"] = self._check_error_handling_tests()
-        
-        # Documentation (15 points total)
-        results["openapi_customization"] = self._check_openapi_customization()
-        results["api_examples"] = self._check_api_examples()
-        results["deployment_readme"] = self._check_deployment_readme()
-        
-        return results
+        return self.run_checks({
+            # Testing Setup (35 points total)
+            "pytest_configuration": lambda: self.run_check(check_pytest_configuration),
+            "test_dependencies": lambda: self.run_check(check_test_dependencies),
+            "test_structure": lambda: self.run_check(check_test_structure),
+            "test_database_config": lambda: self.run_check(check_test_database_config),
+        
+            # Unit Testing (25 points total)
+            "model_tests": lambda: self.run_check(check_model_tests),
+            "utility_function_tests": lambda: self.run_check(check_utility_function_tests),
+            "business_logic_tests": lambda: self.run_check(check_business_logic_tests),
+        
+            # Integration Testing (25 points total)
+            "endpoint_tests": lambda: self.run_check(check_endpoint_tests),
+            "database_integration_tests": self._check_database_integration_tests,
+            "error_handling_tests": self._check_error_handling_tests,
+        
+            # Documentation (15 points total)
+            "openapi_customization": self._check_openapi_customization,
+            "api_examples": self._check_api_examples,
+            "deployment_readme": self._check_deployment_readme
+        })
     
     def _check_database_integration_tests(self) -> Dict[str, Any]:
         """
@@ -131,29 +110,11 @@ class Week05Evaluator(BaseEvaluator):
                 "recommendations": ["Crear tests de integración de base de datos"]
             }
         
-        db_test_count = 0
-        test_files = list(tests_dir.rglob('test*.py'))
+        test_files = self.repo_index.glob('tests/**/test*.py')
         
-        for test_file in test_files:
-            try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Buscar indicios de tests de integración de DB
-                    db_patterns = [
-                        r'def test.*db',
-                        r'def test.*database',
-                        r'def test.*session',
-                        r'def test.*commit',
-                        r'def test.*transaction'
-                    ]
-                    
-                    for pattern in db_patterns:
-                        if re.search(pattern, content.lower()):
-                            db_test_count += len(re.findall(pattern, content.lower()))
-                            
-            except Exception:
-                continue
+        # Buscar indicios de tests de integración de DB
+        hits = DB_INTEGRATION_TEST_SCANNER.scan_files(test_files, self.repo_index)
+        db_test_count = hits["db_tests"]["count"]
         
         score = min(db_test_count * 2, 8)
         
@@ -182,31 +143,11 @@ class Week05Evaluator(BaseEvaluator):
                 "recommendations": ["Crear tests de manejo de errores"]
             }
         
-        error_test_count = 0
-        test_files = list(tests_dir.rglob('test*.py'))
+        test_files = self.repo_index.glob('tests/**/test*.py')
         
-        for test_file in test_files:
-            try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Buscar indicios de tests de manejo de errores
-                    error_patterns = [
-                        r'def test.*error',
-                        r'def test.*exception',
-                        r'def test.*invalid',
-                        r'def test.*fail',
-                        r'pytest\.raises',
-                        r'status_code.*4\d\d',
-                        r'status_code.*5\d\d'
-                    ]
-                    
-                    for pattern in error_patterns:
-                        matches = re.findall(pattern, content.lower())
-                        error_test_count += len(matches)
-                            
-            except Exception:
-                continue
+        # Buscar indicios de tests de manejo de errores
+        hits = ERROR_HANDLING_TEST_SCANNER.scan_files(test_files, self.repo_index)
+        error_test_count = hits["error_tests"]["count"]
         
         score = min(error_test_count * 1.5, 7)
         
@@ -233,26 +174,25 @@ class Week05Evaluator(BaseEvaluator):
             file_path = self.repo_path / main_file
             if file_path.exists():
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content = self.repo_index.read_text(file_path)
+                        
+                    # Buscar personalizaciones de OpenAPI
+                    if 'title=' in content and 'FastAPI' not in content:
+                        customizations.append("Custom title")
+                        customization_found = True
+                        
+                    if 'description=' in content:
+                        customizations.append("Custom description")
+                        customization_found = True
+                        
+                    if 'version=' in content:
+                        customizations.append("Custom version")
+                        customization_found = True
+                        
+                    if 'tags_metadata' in content:
+                        customizations.append("Tags metadata")
+                        customization_found = True
                         
-                        # Buscar personalizaciones de OpenAPI
-                        if 'title=' in content and 'FastAPI' not in content:
-                            customizations.append("Custom title")
-                            customization_found = True
-                            
-                        if 'description=' in content:
-                            customizations.append("Custom description")
-                            customization_found = True
-                            
-                        if 'version=' in content:
-                            customizations.append("Custom version")
-                            customization_found = True
-                            
-                        if 'tags_metadata' in content:
-                            customizations.append("Tags metadata")
-                            customization_found = True
-                            
                 except Exception:
                     continue
         
@@ -270,30 +210,29 @@ class Week05Evaluator(BaseEvaluator):
         """
         Verificaciones de ejemplos en documentación de API
         """
-        python_files = list(self.repo_path.rglob('*.py'))
+        python_files = self.repo_index.python_files()
         examples_found = False
         example_types = []
         
         for py_file in python_files:
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self.repo_index.read_text(py_file)
+                    
+                # Buscar ejemplos en Pydantic models
+                if 'example=' in content or 'examples=' in content:
+                    example_types.append("Pydantic examples")
+                    examples_found = True
+                    
+                # Buscar ejemplos en FastAPI endpoints
+                if 'response_model_example' in content:
+                    example_types.append("Response examples")
+                    examples_found = True
+                    
+                # Buscar documentación en docstrings
+                if '"""' in content and 'example' in content.lower():
+                    example_types.append("Docstring examples")
+                    examples_found = True
                     
-                    # Buscar ejemplos en Pydantic models
-                    if 'example=' in content or 'examples=' in content:
-                        example_types.append("Pydantic examples")
-                        examples_found = True
-                        
-                    # Buscar ejemplos en FastAPI endpoints
-                    if 'response_model_example' in content:
-                        example_types.append("Response examples")
-                        examples_found = True
-                        
-                    # Buscar documentación en docstrings
-                    if '"""' in content and 'example' in content.lower():
-                        example_types.append("Docstring examples")
-                        examples_found = True
-                        
             except Exception:
                 continue
         
@@ -323,37 +262,36 @@ class Week05Evaluator(BaseEvaluator):
             }
         
         try:
-            with open(readme_file, 'r', encoding='utf-8') as f:
-                content = f.read().lower()
+            content = self.repo_index.read_text(readme_file).lower()
                 
-                deployment_sections = []
+            deployment_sections = []
                 
-                # Buscar secciones relacionadas con deployment
-                if 'install' in content or 'instalación' in content:
-                    deployment_sections.append("Installation")
-                    
-                if 'run' in content or 'ejecutar' in content:
-                    deployment_sections.append("Run instructions")
-                    
-                if 'docker' in content:
-                    deployment_sections.append("Docker")
-                    
-                if 'environment' in content or 'env' in content:
-                    deployment_sections.append("Environment variables")
-                    
-                if 'deploy' in content or 'production' in content:
-                    deployment_sections.append("Deployment")
+            # Buscar secciones relacionadas con deployment
+            if 'install' in content or 'instalación' in content:
+                deployment_sections.append("Installation")
+                
+            if 'run' in content or 'ejecutar' in content:
+                deployment_sections.append("Run instructions")
+                
+            if 'docker' in content:
+                deployment_sections.append("Docker")
+                
+            if 'environment' in content or 'env' in content:
+                deployment_sections.append("Environment variables")
                 
-                has_deployment_info = len(deployment_sections) >= 2
-                score = 5 if has_deployment_info else 2 if deployment_sections else 0
+            if 'deploy' in content or 'production' in content:
+                deployment_sections.append("Deployment")
                 
-                return {
-                    "deployment_readme": has_deployment_info,
-                    "deployment_sections": deployment_sections,
-                    "score": score,
-                    "max_score": 5,
-                    "recommendations": ["Agregar más información sobre deployment en README.md"] if not has_deployment_info else []
-                }
+            has_deployment_info = len(deployment_sections) >= 2
+            score = 5 if has_deployment_info else 2 if deployment_sections else 0
+                
+            return {
+                "deployment_readme": has_deployment_info,
+                "deployment_sections": deployment_sections,
+                "score": score,
+                "max_score": 5,
+                "recommendations": ["Agregar más información sobre deployment en README.md"] if not has_deployment_info else []
+            }
                 
         except Exception:
             return {
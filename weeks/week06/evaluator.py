@@ -3,59 +3,20 @@ Evaluador específico para Semana 6 - Background Tasks y WebSockets
 Tareas en segundo plano y comunicación en tiempo real
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.week_registry import lazy_check
 
-def import_check_module(module_name: str, file_path: str):
-    """Helper para importar módulos de checks"""
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"Warning: Could not import {module_name} check: {e}")
-        return None
-
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
-
-# Importar checks específicos
-
-try:
-    background_tasks_module = import_check_module("background_tasks", str(current_dir / "checks" / "background_tasks.py"))
-    check_background_tasks = background_tasks_module.check_background_tasks if background_tasks_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import background_tasks check: {e}")
-    def check_background_tasks(repo_path): return {"error": "Module not available"}
-
-try:
-    websocket_endpoints_module = import_check_module("websocket_endpoints", str(current_dir / "checks" / "websocket_endpoints.py"))
-    check_websocket_endpoints = websocket_endpoints_module.check_websocket_endpoints if websocket_endpoints_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import websocket_endpoints check: {e}")
-    def check_websocket_endpoints(repo_path): return {"error": "Module not available"}
-
-try:
-    task_queues_module = import_check_module("task_queues", str(current_dir / "checks" / "task_queues.py"))
-    check_task_queues = task_queues_module.check_task_queues if task_queues_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import task_queues check: {e}")
-    def check_task_queues(repo_path): return {"error": "Module not available"}
-
-try:
-    real_time_features_module = import_check_module("real_time_features", str(current_dir / "checks" / "real_time_features.py"))
-    check_real_time_features = real_time_features_module.check_real_time_features if real_time_features_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import real_time_features check: {e}")
-    def check_real_time_features(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_background_tasks = lazy_check(6, "background_tasks")
+check_websocket_endpoints = lazy_check(6, "websocket_endpoints")
+check_task_queues = lazy_check(6, "task_queues")
+check_real_time_features = lazy_check(6, "real_time_features")
 
 
 class Week06Evaluator(BaseEvaluator):
@@ -69,30 +30,29 @@ class Week06Evaluator(BaseEvaluator):
     - Task Queues
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=6,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 6
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week06_structure()
-        results["background_tasks"] = check_background_tasks(str(self.repo_path))
-        results["websocket_endpoints"] = check_websocket_endpoints(str(self.repo_path))
-        results["task_queues"] = check_task_queues(str(self.repo_path))
-        results["real_time_features"] = check_real_time_features(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week06_structure,
+            "background_tasks": lambda: self.run_check(check_background_tasks),
+            "websocket_endpoints": lambda: self.run_check(check_websocket_endpoints),
+            "task_queues": lambda: self.run_check(check_task_queues),
+            "real_time_features": lambda: self.run_check(check_real_time_features),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week06_structure(self) -> Dict[str, Any]:
         """
@@ -3,59 +3,20 @@ Evaluador específico para Semana 7 - Deployment y Docker
 Containerización y despliegue en producción
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.week_registry import lazy_check
 
-def import_check_module(module_name: str, file_path: str):
-    """Helper para importar módulos de checks"""
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"Warning: Could not import {module_name} check: {e}")
-        return None
-
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
-
-# Importar checks específicos
-
-try:
-    dockerfile_module = import_check_module("dockerfile", str(current_dir / "checks" / "dockerfile.py"))
-    check_dockerfile = dockerfile_module.check_dockerfile if dockerfile_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import dockerfile check: {e}")
-    def check_dockerfile(repo_path): return {"error": "Module not available"}
-
-try:
-    docker_compose_module = import_check_module("docker_compose", str(current_dir / "checks" / "docker_compose.py"))
-    check_docker_compose = docker_compose_module.check_docker_compose if docker_compose_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import docker_compose check: {e}")
-    def check_docker_compose(repo_path): return {"error": "Module not available"}
-
-try:
-    production_settings_module = import_check_module("production_settings", str(current_dir / "checks" / "production_settings.py"))
-    check_production_settings = production_settings_module.check_production_settings if production_settings_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import production_settings check: {e}")
-    def check_production_settings(repo_path): return {"error": "Module not available"}
-
-try:
-    health_checks_module = import_check_module("health_checks", str(current_dir / "checks" / "health_checks.py"))
-    check_health_checks = health_checks_module.check_health_checks if health_checks_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import health_checks check: {e}")
-    def check_health_checks(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_dockerfile = lazy_check(7, "dockerfile")
+check_docker_compose = lazy_check(7, "docker_compose")
+check_production_settings = lazy_check(7, "production_settings")
+check_health_checks = lazy_check(7, "health_checks")
 
 
 class Week07Evaluator(BaseEvaluator):
@@ -69,30 +30,29 @@ class Week07Evaluator(BaseEvaluator):
     - Monitoring
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=7,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 7
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week07_structure()
-        results["dockerfile"] = check_dockerfile(str(self.repo_path))
-        results["docker_compose"] = check_docker_compose(str(self.repo_path))
-        results["production_settings"] = check_production_settings(str(self.repo_path))
-        results["health_checks"] = check_health_checks(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week07_structure,
+            "dockerfile": lambda: self.run_check(check_dockerfile),
+            "docker_compose": lambda: self.run_check(check_docker_compose),
+            "production_settings": lambda: self.run_check(check_production_settings),
+            "health_checks": lambda: self.run_check(check_health_checks),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week07_structure(self) -> Dict[str, Any]:
         """
@@ -3,59 +3,20 @@ Evaluador específico para Semana 8 - Microservicios y APIs
 Arquitectura de microservicios y comunicación entre APIs
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.week_registry import lazy_check
 
-def import_check_module(module_name: str, file_path: str):
-    """Helper para importar módulos de checks"""
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"Warning: Could not import {module_name} check: {e}")
-        return None
-
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
-
-# Importar checks específicos
-
-try:
-    service_architecture_module = import_check_module("service_architecture", str(current_dir / "checks" / "service_architecture.py"))
-    check_service_architecture = service_architecture_module.check_service_architecture if service_architecture_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import service_architecture check: {e}")
-    def check_service_architecture(repo_path): return {"error": "Module not available"}
-
-try:
-    api_communication_module = import_check_module("api_communication", str(current_dir / "checks" / "api_communication.py"))
-    check_api_communication = api_communication_module.check_api_communication if api_communication_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import api_communication check: {e}")
-    def check_api_communication(repo_path): return {"error": "Module not available"}
-
-try:
-    error_handling_module = import_check_module("error_handling", str(current_dir / "checks" / "error_handling.py"))
-    check_error_handling = error_handling_module.check_error_handling if error_handling_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import error_handling check: {e}")
-    def check_error_handling(repo_path): return {"error": "Module not available"}
-
-try:
-    service_discovery_module = import_check_module("service_discovery", str(current_dir / "checks" / "service_discovery.py"))
-    check_service_discovery = service_discovery_module.check_service_discovery if service_discovery_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import service_discovery check: {e}")
-    def check_service_discovery(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_service_architecture = lazy_check(8, "service_architecture")
+check_api_communication = lazy_check(8, "api_communication")
+check_error_handling = lazy_check(8, "error_handling")
+check_service_discovery = lazy_check(8, "service_discovery")
 
 
 class Week08Evaluator(BaseEvaluator):
@@ -69,30 +30,29 @@ class Week08Evaluator(BaseEvaluator):
     - Load Balancing
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=8,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 8
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week08_structure()
-        results["service_architecture"] = check_service_architecture(str(self.repo_path))
-        results["api_communication"] = check_api_communication(str(self.repo_path))
-        results["error_handling"] = check_error_handling(str(self.repo_path))
-        results["service_discovery"] = check_service_discovery(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week08_structure,
+            "service_architecture": lambda: self.run_check(check_service_architecture),
+            "api_communication": lambda: self.run_check(check_api_communication),
+            "error_handling": lambda: self.run_check(check_error_handling),
+            "service_discovery": lambda: self.run_check(check_service_discovery),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week08_structure(self) -> Dict[str, Any]:
         """
@@ -3,59 +3,20 @@ Evaluador específico para Semana 9 - Performance y Caching
 Optimización de rendimiento y estrategias de caché
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.week_registry import lazy_check
 
-def import_check_module(module_name: str, file_path: str):
-    """Helper para importar módulos de checks"""
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"Warning: Could not import {module_name} check: {e}")
-        return None
-
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
-
-# Importar checks específicos
-
-try:
-    caching_implementation_module = import_check_module("caching_implementation", str(current_dir / "checks" / "caching_implementation.py"))
-    check_caching_implementation = caching_implementation_module.check_caching_implementation if caching_implementation_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import caching_implementation check: {e}")
-    def check_caching_implementation(repo_path): return {"error": "Module not available"}
-
-try:
-    performance_metrics_module = import_check_module("performance_metrics", str(current_dir / "checks" / "performance_metrics.py"))
-    check_performance_metrics = performance_metrics_module.check_performance_metrics if performance_metrics_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import performance_metrics check: {e}")
-    def check_performance_metrics(repo_path): return {"error": "Module not available"}
-
-try:
-    query_optimization_module = import_check_module("query_optimization", str(current_dir / "checks" / "query_optimization.py"))
-    check_query_optimization = query_optimization_module.check_query_optimization if query_optimization_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import query_optimization check: {e}")
-    def check_query_optimization(repo_path): return {"error": "Module not available"}
-
-try:
-    monitoring_setup_module = import_check_module("monitoring_setup", str(current_dir / "checks" / "monitoring_setup.py"))
-    check_monitoring_setup = monitoring_setup_module.check_monitoring_setup if monitoring_setup_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import monitoring_setup check: {e}")
-    def check_monitoring_setup(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_caching_implementation = lazy_check(9, "caching_implementation")
+check_performance_metrics = lazy_check(9, "performance_metrics")
+check_query_optimization = lazy_check(9, "query_optimization")
+check_monitoring_setup = lazy_check(9, "monitoring_setup")
 
 
 class Week09Evaluator(BaseEvaluator):
@@ -69,30 +30,29 @@ class Week09Evaluator(BaseEvaluator):
     - Optimization
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=9,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 9
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week09_structure()
-        results["caching_implementation"] = check_caching_implementation(str(self.repo_path))
-        results["performance_metrics"] = check_performance_metrics(str(self.repo_path))
-        results["query_optimization"] = check_query_optimization(str(self.repo_path))
-        results["monitoring_setup"] = check_monitoring_setup(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week09_structure,
+            "caching_implementation": lambda: self.run_check(check_caching_implementation),
+            "performance_metrics": lambda: self.run_check(check_performance_metrics),
+            "query_optimization": lambda: self.run_check(check_query_optimization),
+            "monitoring_setup": lambda: self.run_check(check_monitoring_setup),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week09_structure(self) -> Dict[str, Any]:
         """
@@ -3,59 +3,20 @@ Evaluador específico para Semana 10 - GraphQL y Advanced APIs
 Implementación de GraphQL y APIs avanzadas
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.week_registry import lazy_check
 
-def import_check_module(module_name: str, file_path: str):
-    """Helper para importar módulos de checks"""
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"Warning: Could not import {module_name} check: {e}")
-        return None
-
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
-
-# Importar checks específicos
-
-try:
-    graphql_schema_module = import_check_module("graphql_schema", str(current_dir / "checks" / "graphql_schema.py"))
-    check_graphql_schema = graphql_schema_module.check_graphql_schema if graphql_schema_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import graphql_schema check: {e}")
-    def check_graphql_schema(repo_path): return {"error": "Module not available"}
-
-try:
-    resolvers_module = import_check_module("resolvers", str(current_dir / "checks" / "resolvers.py"))
-    check_resolvers = resolvers_module.check_resolvers if resolvers_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import resolvers check: {e}")
-    def check_resolvers(repo_path): return {"error": "Module not available"}
-
-try:
-    mutations_module = import_check_module("mutations", str(current_dir / "checks" / "mutations.py"))
-    check_mutations = mutations_module.check_mutations if mutations_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import mutations check: {e}")
-    def check_mutations(repo_path): return {"error": "Module not available"}
-
-try:
-    subscriptions_module = import_check_module("subscriptions", str(current_dir / "checks" / "subscriptions.py"))
-    check_subscriptions = subscriptions_module.check_subscriptions if subscriptions_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import subscriptions check: {e}")
-    def check_subscriptions(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_graphql_schema = lazy_check(10, "graphql_schema")
+check_resolvers = lazy_check(10, "resolvers")
+check_mutations = lazy_check(10, "mutations")
+check_subscriptions = lazy_check(10, "subscriptions")
 
 
 class Week10Evaluator(BaseEvaluator):
@@ -69,30 +30,29 @@ class Week10Evaluator(BaseEvaluator):
     - Resolvers
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=10,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 10
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week10_structure()
-        results["graphql_schema"] = check_graphql_schema(str(self.repo_path))
-        results["resolvers"] = check_resolvers(str(self.repo_path))
-        results["mutations"] = check_mutations(str(self.repo_path))
-        results["subscriptions"] = check_subscriptions(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week10_structure,
+            "graphql_schema": lambda: self.run_check(check_graphql_schema),
+            "resolvers": lambda: self.run_check(check_resolvers),
+            "mutations": lambda: self.run_check(check_mutations),
+            "subscriptions": lambda: self.run_check(check_subscriptions),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week10_structure(self) -> Dict[str, Any]:
         """
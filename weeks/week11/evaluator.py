@@ -3,59 +3,20 @@ Evaluador específico para Semana 11 - Proyecto Final
 Integración de todos los conceptos en un proyecto completo
 """
 import sys
-import importlib.util
-import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Agregar el directorio padre al path para importar core
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from core import BaseEvaluator, CommonChecks
+from core import BaseEvaluator, CommonChecks, RepoIndex
+from core.week_registry import lazy_check
 
-def import_check_module(module_name: str, file_path: str):
-    """Helper para importar módulos de checks"""
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"Warning: Could not import {module_name} check: {e}")
-        return None
-
-# Obtener directorio actual del evaluador
-current_dir = Path(__file__).parent
-
-# Importar checks específicos
-
-try:
-    complete_application_module = import_check_module("complete_application", str(current_dir / "checks" / "complete_application.py"))
-    check_complete_application = complete_application_module.check_complete_application if complete_application_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import complete_application check: {e}")
-    def check_complete_application(repo_path): return {"error": "Module not available"}
-
-try:
-    best_practices_module = import_check_module("best_practices", str(current_dir / "checks" / "best_practices.py"))
-    check_best_practices = best_practices_module.check_best_practices if best_practices_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import best_practices check: {e}")
-    def check_best_practices(repo_path): return {"error": "Module not available"}
-
-try:
-    documentation_module = import_check_module("documentation", str(current_dir / "checks" / "documentation.py"))
-    check_documentation = documentation_module.check_documentation if documentation_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import documentation check: {e}")
-    def check_documentation(repo_path): return {"error": "Module not available"}
-
-try:
-    deployment_ready_module = import_check_module("deployment_ready", str(current_dir / "checks" / "deployment_ready.py"))
-    check_deployment_ready = deployment_ready_module.check_deployment_ready if deployment_ready_module else lambda repo_path: {"error": "Module not available"}
-except Exception as e:
-    print(f"Warning: Could not import deployment_ready check: {e}")
-    def check_deployment_ready(repo_path): return {"error": "Module not available"}
+# Checks de la semana (se importan al ejecutarse por primera vez)
+check_complete_application = lazy_check(11, "complete_application")
+check_best_practices = lazy_check(11, "best_practices")
+check_documentation = lazy_check(11, "documentation")
+check_deployment_ready = lazy_check(11, "deployment_ready")
 
 
 class Week11Evaluator(BaseEvaluator):
@@ -69,30 +30,29 @@ class Week11Evaluator(BaseEvaluator):
     - Production Ready
     """
     
-    def __init__(self, student_repo_path: str):
+    def __init__(self, student_repo_path: str, repo_index: Optional[RepoIndex] = None):
         super().__init__(
             week_number=11,
-            student_repo_path=student_repo_path
+            student_repo_path=student_repo_path,
+            repo_index=repo_index
         )
-        self.common_checks = CommonChecks(self.repo_path)
+        self.common_checks = CommonChecks(self.repo_path, self.repo_index)
     
     def run_specific_checks(self) -> Dict[str, Any]:
         """
         Ejecuta verificaciones específicas de la Semana 11
         """
-        results = {}
-        
-        # Checks básicos de estructura
-        results["project_structure"] = self._check_week11_structure()
-        results["complete_application"] = check_complete_application(str(self.repo_path))
-        results["best_practices"] = check_best_practices(str(self.repo_path))
-        results["documentation"] = check_documentation(str(self.repo_path))
-        results["deployment_ready"] = check_deployment_ready(str(self.repo_path))
-        
-        # Checks de calidad de código
-        results["code_quality"] = self._check_code_quality()
-        
-        return results
+        return self.run_checks({
+            # Checks básicos de estructura
+            "project_structure": self._check_week11_structure,
+            "complete_application": lambda: self.run_check(check_complete_application),
+            "best_practices": lambda: self.run_check(check_best_practices),
+            "documentation": lambda: self.run_check(check_documentation),
+            "deployment_ready": lambda: self.run_check(check_deployment_ready),
+        
+            # Checks de calidad de código
+            "code_quality": self._check_code_quality
+        })
     
     def _check_week11_structure(self) -> Dict[str, Any]:
         """